@@ -3,6 +3,7 @@
 Uses in-memory storage with automatic expiration cleanup.
 """
 
+import itertools
 import threading
 from datetime import UTC, datetime
 from typing import ClassVar
@@ -58,18 +59,25 @@ class TokenBlacklist:
             return False
 
     @classmethod
-    def cleanup_expired(cls) -> int:
+    def cleanup_expired(cls, limit: int | None = None) -> int:
         """Remove expired entries from store.
 
+        :param limit: Most entries to remove (None for all), bounding how long
+            the lock is held
         :return: Number of entries removed
         """
         with cls._memory_lock:
             now = datetime.now(UTC)
-            expired = [
-                jti
-                for jti, exp in cls._memory_store.items()
-                if (exp.replace(tzinfo=UTC) if exp.tzinfo is None else exp) <= now
-            ]
+            expired = list(
+                itertools.islice(
+                    (
+                        jti
+                        for jti, exp in cls._memory_store.items()
+                        if (exp.replace(tzinfo=UTC) if exp.tzinfo is None else exp) <= now
+                    ),
+                    limit,
+                )
+            )
             for jti in expired:
                 del cls._memory_store[jti]
             return len(expired)
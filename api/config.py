@@ -101,6 +101,15 @@ class Settings(BaseSettings):
     # role while migrations run as a privileged role.
     migration_database_url: str | None = None
 
+    # Read replicas for read-only endpoints (lists, results, exports, photo
+    # lookups). Empty keeps every query on database_url. After a user commits a
+    # write, their reads stay on the primary for replica_sticky_seconds so they
+    # see their own changes despite replication lag; a replica that fails a
+    # health probe or drops a connection is skipped for replica_retry_seconds.
+    database_replica_urls: list[str] = []
+    replica_sticky_seconds: float = Field(default=5.0, ge=0)
+    replica_retry_seconds: float = Field(default=30.0, gt=0)
+
     # Auth
     secret_key: str  # Required, load from .env
     access_token_expire_minutes: int = 15  # Short-lived access token
@@ -117,6 +126,35 @@ class Settings(BaseSettings):
     # Observability (Sentry error tracking; disabled when unset)
     sentry_dsn: str | None = None
 
+    # Bearer token required to scrape GET /metrics; the endpoint is open when unset,
+    # which only the dev and test profiles allow.
+    metrics_token: str | None = None
+
+    # Rate limiter storage: "memory" keeps per-worker counters in process; "sql"
+    # shares them across workers through the rate_limit_buckets table.
+    rate_limit_backend: Literal["memory", "sql"] = "memory"
+
+    # Project result aggregation: "python" loads every opinion and runs the
+    # calculator; "database" computes mean and median in one SQL query
+    # (PostgreSQL, or SQLite 3.25+) and returns only the final triples.
+    calculation_backend: Literal["python", "database"] = "python"
+
+    # Background maintenance (expired password reset tokens, token blacklist
+    # entries): every maintenance_interval_seconds each job deletes expired rows
+    # in batches of maintenance_batch_size, pausing maintenance_batch_pause_seconds
+    # between batches. Database jobs run on one worker at a time (a lease in
+    # maintenance_leases). 0 disables the scheduler.
+    maintenance_interval_seconds: float = Field(default=300.0, ge=0)
+    maintenance_batch_size: int = Field(default=1000, gt=0)
+    maintenance_batch_pause_seconds: float = Field(default=0.1, ge=0)
+
+    # Per-request profiling (X-Profile header): open outside production; in
+    # production only requests sending this secret as X-Profile-Secret qualify.
+    # Profiles are kept in PROFILING_DIR (a temp directory when unset), newest N only.
+    profiling_secret: str | None = None
+    profiling_dir: str | None = None
+    profiling_max_profiles: int = Field(default=50, ge=1)
+
     # Better Stack log shipping (disabled unless both are set)
     betterstack_source_token: str | None = None
     betterstack_ingesting_host: str | None = None
@@ -202,7 +240,8 @@ class Settings(BaseSettings):
         """Reject insecure development defaults when running in production.
 
         :return: The validated settings instance.
-        :raises ValueError: If production uses an insecure secret or SQLite.
+        :raises ValueError: If production uses an insecure secret or SQLite, or
+            leaves the metrics endpoint without a token.
         """
         if self.environment is Environment.PROD:
             if (
@@ -215,6 +254,8 @@ class Settings(BaseSettings):
                 )
             if self.database_url.startswith("sqlite"):
                 raise ValueError("SQLite is not allowed in production; use PostgreSQL")
+            if not self.metrics_token:
+                raise ValueError("metrics_token must be set in production to protect /metrics")
         return self
 
 
@@ -12,7 +12,7 @@ from sqlmodel import SQLModel, create_engine
 from api.config import get_settings
 
 
-def _create_engine() -> Engine:
+def _create_engine(database_url: str | None = None) -> Engine:
     """Create database engine based on settings.
 
     SQLite uses check_same_thread=False for FastAPI compatibility. PostgreSQL
@@ -20,13 +20,15 @@ def _create_engine() -> Engine:
     a connect timeout, an application name, and per-session statement and
     idle-in-transaction timeouts.
 
+    :param database_url: Database to connect to (default: ``DATABASE_URL``)
     :return: Configured SQLAlchemy Engine instance
     """
     settings = get_settings()
+    url = database_url or settings.database_url
     connect_args: dict[str, object] = {}
     pool_kwargs: dict[str, object] = {}
 
-    if settings.database_url.startswith("sqlite"):
+    if url.startswith("sqlite"):
         connect_args["check_same_thread"] = False
     else:
         # Harden the PostgreSQL connection: require TLS on deployed databases
@@ -51,7 +53,7 @@ def _create_engine() -> Engine:
         }
 
     return create_engine(
-        settings.database_url,
+        url,
         echo=settings.debug,
         connect_args=connect_args,
         **pool_kwargs,
@@ -70,6 +72,17 @@ def get_engine() -> Engine:
     return _create_engine()
 
 
+@lru_cache(maxsize=1)
+def get_replica_engines() -> tuple[Engine, ...]:
+    """Get or create one engine per read replica (``DATABASE_REPLICA_URLS``).
+
+    Replicas share the primary's connect arguments and pool settings.
+
+    :return: Replica engines, empty when no replica is configured
+    """
+    return tuple(_create_engine(url) for url in get_settings().database_replica_urls)
+
+
 def create_db_and_tables() -> None:
     """Create tables for SQLite and ephemeral test databases.
 
@@ -6,7 +6,7 @@ from typing import Optional, Self
 from uuid import UUID, uuid4
 
 from pydantic import model_validator
-from sqlalchemy import CheckConstraint, UniqueConstraint
+from sqlalchemy import CheckConstraint, Index, UniqueConstraint, text
 from sqlmodel import Field, Relationship, SQLModel
 
 from api.db.utils import EMAIL_REGEX, utc_now
@@ -37,6 +37,11 @@ class User(SQLModel, table=True):
     # endpoint; None when unset. The public URL is built at serialization time.
     photo_url: str | None = Field(default=None, max_length=500)
     created_at: datetime = Field(default_factory=utc_now)
+    # Versions member and opinion listings, which embed the user's profile.
+    updated_at: datetime = Field(
+        default_factory=utc_now,
+        sa_column_kwargs={"onupdate": utc_now},
+    )
 
     owned_projects: list["Project"] = Relationship(
         back_populates="admin",
@@ -68,7 +73,11 @@ class Project(SQLModel, table=True):
     """A project for group decision-making."""
 
     __tablename__ = "projects"
-    __table_args__ = (CheckConstraint("scale_min < scale_max", name="ck_projects_scale_order"),)
+    __table_args__ = (
+        CheckConstraint("scale_min < scale_max", name="ck_projects_scale_order"),
+        # Owned projects in creation order (data export, admin_id RESTRICT checks).
+        Index("ix_projects_admin_id_created_at", "admin_id", "created_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     name: str = Field(max_length=255)
@@ -104,6 +113,11 @@ class Project(SQLModel, table=True):
         back_populates="project",
         sa_relationship_kwargs={"uselist": False, "cascade": _CASCADE_ALL_DELETE_ORPHAN},
     )
+    # Passive: deleting a project must not load every published blob first.
+    snapshots: list["ResultSnapshot"] = Relationship(
+        back_populates="project",
+        sa_relationship_kwargs={"cascade": _CASCADE_ALL_DELETE_ORPHAN, "passive_deletes": True},
+    )
 
     @model_validator(mode="after")
     def validate_scale_range(self) -> Self:
@@ -121,11 +135,17 @@ class ProjectMember(SQLModel, table=True):
     """
 
     __tablename__ = "project_members"
-    __table_args__ = (UniqueConstraint("project_id", "user_id"),)
+    # Composite indexes lead with each foreign key, so they also serve FK lookups
+    # and cascades: members of a project and a user's memberships, by join time.
+    __table_args__ = (
+        UniqueConstraint("project_id", "user_id"),
+        Index("ix_project_members_project_id_joined_at", "project_id", "joined_at"),
+        Index("ix_project_members_user_id_joined_at", "user_id", "joined_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    project_id: UUID = Field(foreign_key=_PROJECTS_FK, index=True, ondelete="CASCADE")
-    user_id: UUID = Field(foreign_key=_USERS_FK, index=True, ondelete="CASCADE")
+    project_id: UUID = Field(foreign_key=_PROJECTS_FK, ondelete="CASCADE")
+    user_id: UUID = Field(foreign_key=_USERS_FK, ondelete="CASCADE")
     role: MemberRole = Field(default=MemberRole.EXPERT)
     joined_at: datetime = Field(default_factory=utc_now)
 
@@ -140,11 +160,16 @@ class Invitation(SQLModel, table=True):
     """
 
     __tablename__ = "invitations"
-    __table_args__ = (UniqueConstraint("project_id", "invitee_id"),)
+    # A project's invitations and a user's pending invitations, by creation time.
+    __table_args__ = (
+        UniqueConstraint("project_id", "invitee_id"),
+        Index("ix_invitations_project_id_created_at", "project_id", "created_at"),
+        Index("ix_invitations_invitee_id_created_at", "invitee_id", "created_at"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    project_id: UUID = Field(foreign_key=_PROJECTS_FK, index=True, ondelete="CASCADE")
-    invitee_id: UUID = Field(foreign_key=_USERS_FK, index=True, ondelete="CASCADE")
+    project_id: UUID = Field(foreign_key=_PROJECTS_FK, ondelete="CASCADE")
+    invitee_id: UUID = Field(foreign_key=_USERS_FK, ondelete="CASCADE")
     inviter_id: UUID = Field(foreign_key=_USERS_FK, ondelete="CASCADE")
     created_at: datetime = Field(default_factory=utc_now)
 
@@ -170,11 +195,15 @@ class ExpertOpinion(SQLModel, table=True):
             "lower_bound <= peak AND peak <= upper_bound",
             name="ck_expert_opinions_fuzzy_order",
         ),
+        # A project's opinions in submission order (listing, recalculation; id
+        # breaks timestamp ties) and a user's opinions (data export).
+        Index("ix_expert_opinions_project_id_created_at", "project_id", "created_at", "id"),
+        Index("ix_expert_opinions_user_id_created_at", "user_id", "created_at"),
     )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
-    project_id: UUID = Field(foreign_key=_PROJECTS_FK, index=True, ondelete="CASCADE")
-    user_id: UUID = Field(foreign_key=_USERS_FK, index=True, ondelete="CASCADE")
+    project_id: UUID = Field(foreign_key=_PROJECTS_FK, ondelete="CASCADE")
+    user_id: UUID = Field(foreign_key=_USERS_FK, ondelete="CASCADE")
     position: str = Field(max_length=255)
     lower_bound: float
     peak: float
@@ -210,13 +239,24 @@ class PasswordResetToken(SQLModel, table=True):
     """
 
     __tablename__ = "password_reset_tokens"
+    # Only outstanding tokens are looked up by user (to invalidate them on a new
+    # request); the partial index stays small as used tokens accumulate.
+    __table_args__ = (
+        Index(
+            "ix_password_reset_tokens_user_id_unused",
+            "user_id",
+            postgresql_where=text("used_at IS NULL"),
+            sqlite_where=text("used_at IS NULL"),
+        ),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True)
     user_id: UUID = Field(foreign_key=_USERS_FK, index=True, ondelete="CASCADE")
     # SHA-256 hex digest of the raw token (exactly 64 chars); the raw token is never stored.
     token_hash: str = Field(unique=True, index=True, min_length=64, max_length=64)
     created_at: datetime = Field(default_factory=utc_now)
-    expires_at: datetime
+    # Indexed for the batched purge of expired tokens (background maintenance).
+    expires_at: datetime = Field(index=True)
     used_at: datetime | None = Field(default=None)
 
     user: User = Relationship(back_populates="reset_tokens")
@@ -290,3 +330,55 @@ class CalculationResult(SQLModel, table=True):
                 msg = f"{name}: must satisfy lower <= peak <= upper. Got: {lower}, {peak}, {upper}"
                 raise ValueError(msg)
         return self
+
+
+class ResultSnapshot(SQLModel, table=True):
+    """Published, immutable copy of a project's result and opinions.
+
+    Served without authentication under its unguessable ``id``. ``content`` is
+    the gzip-compressed JSON document, rendered once at publication and never
+    changed; publishing again stores a new row with the next ``version``.
+    """
+
+    __tablename__ = "result_snapshots"
+    __table_args__ = (UniqueConstraint("project_id", "version"),)
+
+    id: str = Field(primary_key=True, max_length=32)
+    project_id: UUID = Field(foreign_key=_PROJECTS_FK, ondelete="CASCADE")
+    version: int
+    published_by: UUID | None = Field(default=None, foreign_key=_USERS_FK, ondelete="SET NULL")
+    published_at: datetime = Field(default_factory=utc_now)
+    content: bytes
+
+    project: Project = Relationship(back_populates="snapshots")
+
+
+class RateLimitBucket(SQLModel, table=True):
+    """Shared rate limiter state: one GCRA bucket per limit key.
+
+    Written by :class:`~api.middleware.rate_limit_storage.GCRASQLStorage` so every
+    worker enforces the same counters. ``tat`` is the bucket's theoretical arrival
+    time in epoch seconds; rows whose ``tat`` has passed hold no state and are
+    swept periodically, which the ``tat`` index keeps cheap.
+    """
+
+    __tablename__ = "rate_limit_buckets"
+
+    bucket_key: str = Field(primary_key=True, max_length=512)
+    tat: float = Field(index=True)
+
+
+class MaintenanceLease(SQLModel, table=True):
+    """Lease electing the worker that runs a background maintenance job.
+
+    Written by :class:`~api.services.maintenance.LeaseElection`: a worker runs a
+    job only while it holds the job's row, renewing it before every batch.
+    ``expires_at`` is in epoch seconds; an expired lease may be taken over by
+    any worker, so a job resumes elsewhere when its leader exits.
+    """
+
+    __tablename__ = "maintenance_leases"
+
+    job: str = Field(primary_key=True, max_length=100)
+    holder: str = Field(max_length=64)
+    expires_at: float
@@ -0,0 +1,223 @@
+"""Read-replica routing for read-only sessions.
+
+Write paths keep using :func:`api.db.session.get_session` on the primary.
+Read-only dependencies (project lists, results, exports, photo lookups) use
+:func:`api.db.session.get_read_session`, whose :class:`RoutingSession` asks
+:class:`ReplicaRouter` for an engine on its first query:
+
+* **Read-your-writes.** Every commit on a primary session marks the acting
+  user (from :mod:`api.logging_context`) as sticky for a short window; their
+  reads go to the primary until it ends, so replication lag never hides their
+  own change. Anonymous reads are never sticky.
+* **Health.** A replica is probed with ``SELECT 1`` before its first use. A
+  failed probe, or a dropped connection during a query, takes it out of
+  rotation for a retry window, after which it is probed again. With no
+  healthy replica left, reads fall back to the primary.
+* **Balancing.** Healthy replicas take turns (round robin).
+
+The engine is chosen lazily, at the first query rather than when the
+dependency is resolved, so the authenticated user is already known whatever
+order FastAPI resolves the dependencies in. A session keeps the engine it
+picked for its whole lifetime.
+"""
+
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import Engine, event, text
+from sqlalchemy.engine import ExceptionContext
+from sqlalchemy.exc import SQLAlchemyError
+from sqlmodel import Session
+
+from api.config import get_settings
+from api.db.engine import get_engine, get_replica_engines
+from api.logging_context import get_user_id
+from api.metrics import DB_READ_ROUTES
+
+logger = logging.getLogger("api.db")
+
+
+class ReplicaRouter:
+    """Chooses the engine for read-only sessions."""
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Sequence[Engine],
+        sticky_seconds: float = 5.0,
+        retry_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize with every replica unverified.
+
+        :param primary: Engine of the primary database (writes, fallback)
+        :param replicas: Engines of the read replicas
+        :param sticky_seconds: Seconds a user's reads stay on the primary after a write
+        :param retry_seconds: Seconds an unhealthy replica is skipped before a new probe
+        :param clock: Monotonic clock (seconds)
+        """
+        self._primary = primary
+        self._replicas = tuple(replicas)
+        self._sticky_seconds = sticky_seconds
+        self._retry_seconds = retry_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._turn = itertools.count()
+        # Sticky deadlines in insertion order; with a fixed window that is also
+        # deadline order, so expired entries are always at the front.
+        self._sticky: OrderedDict[str, float] = OrderedDict()
+        self._healthy: set[Engine] = set()
+        self._down_until: dict[Engine, float] = {}
+        for replica in self._replicas:
+            event.listen(replica, "handle_error", self._on_error)
+
+    @property
+    def primary(self) -> Engine:
+        """Engine of the primary database."""
+        return self._primary
+
+    @property
+    def has_replicas(self) -> bool:
+        """Whether any replica is configured."""
+        return bool(self._replicas)
+
+    def mark_write(self, key: str | None) -> None:
+        """Keep a user's reads on the primary for the sticky window.
+
+        :param key: Acting user ID; anonymous writes (None) are not tracked
+        """
+        if key is None or not self._replicas:
+            return
+        now = self._clock()
+        with self._lock:
+            self._sticky.pop(key, None)
+            self._sticky[key] = now + self._sticky_seconds
+            while self._sticky and next(iter(self._sticky.values())) <= now:
+                self._sticky.popitem(last=False)
+
+    def is_sticky(self, key: str | None) -> bool:
+        """Check whether a user wrote within the sticky window.
+
+        :param key: Acting user ID, or None for anonymous requests
+        :return: True if their reads must go to the primary
+        """
+        if key is None:
+            return False
+        with self._lock:
+            deadline = self._sticky.get(key)
+        return deadline is not None and deadline > self._clock()
+
+    def read_engine(self, key: str | None) -> Engine:
+        """Pick the engine for a read-only session.
+
+        :param key: Acting user ID, or None for anonymous requests
+        :return: A healthy replica, or the primary when the user is sticky or
+            no replica is healthy
+        """
+        if not self._replicas:
+            return self._primary
+        if self.is_sticky(key):
+            DB_READ_ROUTES.labels(target="sticky").inc()
+            return self._primary
+        start = next(self._turn)
+        for offset in range(len(self._replicas)):
+            replica = self._replicas[(start + offset) % len(self._replicas)]
+            if self._usable(replica):
+                DB_READ_ROUTES.labels(target="replica").inc()
+                return replica
+        DB_READ_ROUTES.labels(target="fallback").inc()
+        return self._primary
+
+    def mark_unhealthy(self, engine: Engine) -> None:
+        """Take a replica out of rotation for the retry window.
+
+        :param engine: Replica engine that failed
+        """
+        now = self._clock()
+        with self._lock:
+            already_down = self._down_until.get(engine, float("-inf")) > now
+            self._healthy.discard(engine)
+            self._down_until[engine] = now + self._retry_seconds
+        if already_down:
+            return
+        logger.warning(
+            "Read replica unavailable; reads fall back",
+            extra={"event": "replica_unhealthy", "replica": engine.url.render_as_string()},
+        )
+
+    def _usable(self, engine: Engine) -> bool:
+        """Check a replica's health, probing it when unverified.
+
+        :param engine: Replica engine
+        :return: True if reads may use it
+        """
+        with self._lock:
+            if engine in self._healthy:
+                return True
+            if self._clock() < self._down_until.get(engine, float("-inf")):
+                return False
+        try:
+            with engine.connect() as connection:
+                connection.execute(text("SELECT 1"))
+        except SQLAlchemyError:
+            self.mark_unhealthy(engine)
+            return False
+        with self._lock:
+            self._healthy.add(engine)
+            self._down_until.pop(engine, None)
+        return True
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        """Mark a replica down when connecting fails or its connection drops.
+
+        SQLAlchemy ``handle_error`` listener; statement errors (bad SQL,
+        constraint violations) leave the replica in rotation.
+
+        :param context: Details of the failed operation
+        """
+        if context.engine is not None and (context.is_disconnect or context.connection is None):
+            self.mark_unhealthy(context.engine)
+
+
+class RoutingSession(Session):
+    """Read-only session bound to the engine its router picks at first use."""
+
+    def __init__(self, router: ReplicaRouter, **kwargs: Any) -> None:
+        """Initialize without a bound engine.
+
+        :param router: Router choosing replica or primary
+        :param kwargs: Further :class:`~sqlmodel.Session` options
+        """
+        super().__init__(**kwargs)
+        self._router = router
+        self._read_engine: Engine | None = None
+
+    def get_bind(self, *args: Any, **kwargs: Any) -> Engine:
+        """Return the engine for this session, choosing it on the first call.
+
+        :return: Replica or primary engine
+        """
+        if self._read_engine is None:
+            self._read_engine = self._router.read_engine(get_user_id())
+        return self._read_engine
+
+
+@lru_cache(maxsize=1)
+def get_replica_router() -> ReplicaRouter:
+    """Get or create the router over the primary and replica engines.
+
+    :return: Router singleton
+    """
+    settings = get_settings()
+    return ReplicaRouter(
+        get_engine(),
+        get_replica_engines(),
+        sticky_seconds=settings.replica_sticky_seconds,
+        retry_seconds=settings.replica_retry_seconds,
+    )
@@ -6,17 +6,43 @@ following the Dependency Inversion Principle (DIP).
 
 from collections.abc import Generator
 
+from sqlalchemy import event
 from sqlmodel import Session
 
 from api.db.engine import get_engine
+from api.db.routing import RoutingSession, get_replica_router
+from api.logging_context import get_user_id
 
 
 def get_session() -> Generator[Session]:
     """Yield a database session for request handling.
 
-    Uses lazy-loaded engine from engine module.
+    Uses lazy-loaded engine from engine module. With read replicas configured,
+    each commit keeps the acting user's reads on the primary for a short while
+    (see :mod:`api.db.routing`).
 
     :yields: SQLModel Session instance
     """
     with Session(get_engine()) as session:
+        router = get_replica_router()
+        if router.has_replicas:
+            event.listen(session, "after_commit", lambda _: router.mark_write(get_user_id()))
+        yield session
+
+
+def get_read_session() -> Generator[Session]:
+    """Yield a session for read-only request handling.
+
+    Routed to a read replica when one is configured and healthy, unless the
+    acting user has just written; the primary's engine otherwise. Never commit
+    through it.
+
+    :yields: SQLModel Session instance
+    """
+    router = get_replica_router()
+    if not router.has_replicas:
+        with Session(get_engine()) as session:
+            yield session
+        return
+    with RoutingSession(router) as session:
         yield session
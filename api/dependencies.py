@@ -10,15 +10,16 @@ from enum import StrEnum
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from sqlmodel import Session
 
 from api.auth.dependencies import CurrentUser
 from api.config import get_settings
 from api.db.models import Project
-from api.db.session import get_session
+from api.db.session import get_read_session, get_session
 from api.services.calculation_service import CalculationService
 from api.services.data_export_service import DataExportService
+from api.services.database_aggregation import DatabaseAggregator
 from api.services.email.base import EmailSender
 from api.services.email.console_email_sender import ConsoleEmailSender
 from api.services.email.resend_email_sender import ResendEmailSender
@@ -29,11 +30,14 @@ from api.services.password_reset_service import PasswordResetService
 from api.services.project_membership_service import ProjectMembershipService
 from api.services.project_query_service import ProjectQueryService
 from api.services.project_service import ProjectService
+from api.services.result_snapshot_service import ResultSnapshotService
 from api.services.storage.base import StorageService
 from api.services.storage.exceptions import StorageConfigurationError
 from api.services.storage.railway_bucket_storage_service import RailwayBucketStorageService
 from api.services.user_service import UserService
+from api.services.what_if_service import WhatIfService
 from src.calculators.become_calculator import BeCoMeCalculator
+from src.models.statistics_summary import Statistic
 
 logger = logging.getLogger("api.security")
 
@@ -51,6 +55,34 @@ def get_calculator() -> BeCoMeCalculator:
     return BeCoMeCalculator()
 
 
+def get_statistics_include(
+    include: Annotated[
+        str | None,
+        Query(
+            description="Comma-separated extra statistics: "
+            + ", ".join(statistic.value for statistic in Statistic)
+        ),
+    ] = None,
+) -> frozenset[Statistic]:
+    """Parse the ``include`` query parameter into the statistics to compute.
+
+    :param include: Comma-separated statistic names, or None
+    :return: Requested statistics (empty when none were asked for)
+    :raises HTTPException: 422 if a name is not a known statistic
+    """
+    names = {name.strip() for name in (include or "").split(",") if name.strip()}
+    unknown = sorted(names - set(Statistic))
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=f"Unknown statistics: {', '.join(unknown)}",
+        )
+    return frozenset(Statistic(name) for name in names)
+
+
+StatisticsInclude = Annotated[frozenset[Statistic], Depends(get_statistics_include)]
+
+
 # --- Service Factories ---
 
 
@@ -71,10 +103,15 @@ def get_project_membership_service(
     return ProjectMembershipService(session)
 
 
+def get_user_reader(session: Annotated[Session, Depends(get_read_session)]) -> UserService:
+    """Create a UserService for lookups only (may read from a replica)."""
+    return UserService(session)
+
+
 def get_project_query_service(
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
 ) -> ProjectQueryService:
-    """Create ProjectQueryService instance."""
+    """Create ProjectQueryService instance (may read from a replica)."""
     return ProjectQueryService(session)
 
 
@@ -86,21 +123,34 @@ def get_opinion_service(session: Annotated[Session, Depends(get_session)]) -> Op
 def get_calculation_service(
     session: Annotated[Session, Depends(get_session)],
 ) -> CalculationService:
-    """Create CalculationService instance."""
+    """Create CalculationService instance.
+
+    Aggregates in the database when ``CALCULATION_BACKEND=database``.
+    """
+    aggregator = (
+        DatabaseAggregator(session) if get_settings().calculation_backend == "database" else None
+    )
+    return CalculationService(session, aggregator=aggregator)
+
+
+def get_calculation_reader(
+    session: Annotated[Session, Depends(get_read_session)],
+) -> CalculationService:
+    """Create a CalculationService for reading results only (may read from a replica)."""
     return CalculationService(session)
 
 
 def get_data_export_service(
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
 ) -> DataExportService:
-    """Create DataExportService instance."""
+    """Create DataExportService instance (may read from a replica)."""
     return DataExportService(session)
 
 
 def get_result_export_service(
-    session: Annotated[Session, Depends(get_session)],
+    session: Annotated[Session, Depends(get_read_session)],
 ) -> ResultExportService:
-    """Create ResultExportService instance."""
+    """Create ResultExportService instance (may read from a replica)."""
     return ResultExportService(session)
 
 
@@ -109,6 +159,27 @@ def get_invitation_service(session: Annotated[Session, Depends(get_session)]) ->
     return InvitationService(session)
 
 
+def get_result_snapshot_service(
+    session: Annotated[Session, Depends(get_session)],
+) -> ResultSnapshotService:
+    """Create ResultSnapshotService instance.
+
+    Uses the primary: the public read path touches the database only on a
+    cache miss, typically right after publishing, before a replica may have
+    the new row.
+    """
+    return ResultSnapshotService(session)
+
+
+def get_what_if_service(session: Annotated[Session, Depends(get_session)]) -> WhatIfService:
+    """Create WhatIfService instance.
+
+    Uses the primary: an index is built only after the opinions change, when
+    a replica may not have the change yet, and is then served from the cache.
+    """
+    return WhatIfService(session)
+
+
 def get_password_reset_service(
     session: Annotated[Session, Depends(get_session)],
 ) -> PasswordResetService:
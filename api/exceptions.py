@@ -91,6 +91,15 @@ class ScaleRangeError(ValidationError):
     """Raised when scale_min >= scale_max."""
 
 
+# Snapshot-related exceptions
+class ResultNotAvailableError(BeCoMeAPIError):
+    """Raised when publishing a snapshot of a project that has no result yet."""
+
+
+class SnapshotNotFoundError(NotFoundError):
+    """Raised when a published snapshot does not exist."""
+
+
 # Password-reset exceptions
 class InvalidResetTokenError(ValidationError):
     """Raised when a password reset token is unknown or already used."""
@@ -12,18 +12,34 @@ from slowapi.errors import RateLimitExceeded
 from api.config import Settings, get_settings
 from api.db.engine import create_db_and_tables
 from api.logging_config import setup_logging
+from api.metrics import install_query_counter, mark_worker_stopped
 from api.middleware.exception_handlers import register_exception_handlers
+from api.middleware.metrics import MetricsMiddleware
+from api.middleware.profiling import ProfilingMiddleware
 from api.middleware.rate_limit import limiter, rate_limit_handler
 from api.middleware.request_logging import RequestLoggingMiddleware
 from api.middleware.security_headers import SecurityHeadersMiddleware
-from api.routes import auth, calculate, health, invitations, opinions, projects, users
+from api.profiling import install_db_timer
+from api.routes import (
+    auth,
+    calculate,
+    health,
+    invitations,
+    metrics,
+    opinions,
+    profiles,
+    projects,
+    snapshots,
+    users,
+)
+from api.services.maintenance import create_maintenance_scheduler
 
 logger = logging.getLogger("api.main")
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
-    """Initialize database tables and log the application lifecycle.
+    """Initialize database tables, run background maintenance and log the lifecycle.
 
     The startup and shutdown records carry the running version and active
     profile so the journal pins which build and environment served the run.
@@ -32,8 +48,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     lifecycle = {"api_version": settings.api_version, "environment": settings.environment.value}
 
     create_db_and_tables()
+    maintenance = create_maintenance_scheduler(settings)
+    if maintenance is not None:
+        maintenance.start()
     logger.info("Application started", extra={"event": "app_startup", **lifecycle})
     yield
+    if maintenance is not None:
+        await maintenance.stop()
+    mark_worker_stopped()
     logger.info("Application stopped", extra={"event": "app_shutdown", **lifecycle})
 
 
@@ -63,6 +85,8 @@ def create_app() -> FastAPI:
     settings = get_settings()
     setup_logging(settings)
     _init_sentry(settings)
+    install_query_counter()
+    install_db_timer()
 
     app = FastAPI(
         title="BeCoMe API",
@@ -90,10 +114,18 @@ def create_app() -> FastAPI:
             "Accept",
             "Accept-Language",
             "X-Request-ID",
+            "If-None-Match",  # Conditional GETs (ETag/304)
         ],
+        expose_headers=["ETag"],  # Not CORS-safelisted; the client echoes it back
         max_age=600,  # Cache preflight requests for 10 minutes
     )
 
+    # Prometheus latency, in-flight and per-request DB query metrics
+    app.add_middleware(MetricsMiddleware)
+
+    # Opt-in per-request profiling (X-Profile header), inside the correlation ID
+    app.add_middleware(ProfilingMiddleware)
+
     # Request/response logging with correlation IDs (outermost: wraps everything)
     app.add_middleware(RequestLoggingMiddleware)
 
@@ -102,12 +134,15 @@ def create_app() -> FastAPI:
 
     # Register routers
     app.include_router(health.router)
+    app.include_router(metrics.router)
+    app.include_router(profiles.router)
     app.include_router(calculate.router)
     app.include_router(auth.router)
     app.include_router(users.router)
     app.include_router(projects.router)
     app.include_router(invitations.router)
     app.include_router(opinions.router)
+    app.include_router(snapshots.router)
 
     return app
 
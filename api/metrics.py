@@ -0,0 +1,221 @@
+"""Prometheus metrics for the API process.
+
+Defines the request, database, calculation, recalculation, export, snapshot,
+storage and maintenance instruments in one place and renders them in the
+Prometheus text format for ``GET /metrics``.
+
+When ``PROMETHEUS_MULTIPROC_DIR`` is set (it must be set before the workers
+start, and the directory emptied on each deploy), ``prometheus_client`` stores
+every sample in per-process files under that directory and :func:`render_latest`
+aggregates them, so each uvicorn worker contributes to the same counters and
+histograms instead of reporting only its own share. Without it the in-process
+default registry is used, which is exact for a single worker.
+
+Database queries are counted per request through a SQLAlchemy
+``before_cursor_execute`` listener and a context variable holding the active
+request's counter, in the same way :mod:`api.logging_context` carries the
+request ID without threading it through every function signature.
+"""
+
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from time import perf_counter
+from typing import Any
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from sqlalchemy import Engine, event
+
+_MULTIPROC_DIR_VAR = "PROMETHEUS_MULTIPROC_DIR"
+
+# Route label for requests that matched no route (keeps label cardinality bounded).
+UNMATCHED_ROUTE = "unmatched"
+
+# Latency buckets (seconds) spanning sub-millisecond handlers to slow exports.
+_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+REQUEST_DURATION = Histogram(
+    "become_http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=_LATENCY_BUCKETS,
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "become_http_requests_in_flight",
+    "HTTP requests currently being served",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+RESULT_STREAMS = Gauge(
+    "become_result_streams",
+    "Open server-sent event streams of project results",
+    multiprocess_mode="livesum",
+)
+REQUEST_DB_QUERIES = Histogram(
+    "become_http_request_db_queries",
+    "Database statements executed per HTTP request",
+    ["method", "route"],
+    buckets=_QUERY_COUNT_BUCKETS,
+)
+DB_READ_ROUTES = Counter(
+    "become_db_read_routes_total",
+    "Read-only sessions by target (replica, sticky primary or fallback primary)",
+    ["target"],
+)
+CALCULATION_DURATION = Histogram(
+    "become_calculation_duration_seconds",
+    "BeCoMeCalculator.calculate_compromise duration",
+    ["source"],
+    buckets=_LATENCY_BUCKETS,
+)
+EXPORT_RENDER_DURATION = Histogram(
+    "become_export_render_duration_seconds",
+    "Result export rendering duration by file format",
+    ["format"],
+    buckets=_LATENCY_BUCKETS,
+)
+RECALCULATION_LOCK_WAIT = Histogram(
+    "become_recalculation_lock_wait_seconds",
+    "Time a recalculation trigger waited for its project's single-flight lock",
+    buckets=_LATENCY_BUCKETS,
+)
+RECALCULATIONS = Counter(
+    "become_recalculations_total",
+    "Recalculation triggers by outcome (fresh, superseded or coalesced)",
+    ["outcome"],
+)
+SNAPSHOT_READS = Counter(
+    "become_snapshot_reads_total",
+    "Published snapshot reads by source (in-process cache or database)",
+    ["source"],
+)
+WHAT_IF_INDEX_READS = Counter(
+    "become_what_if_index_reads_total",
+    "What-if index lookups by source (in-process cache or database)",
+    ["source"],
+)
+MAINTENANCE_ROWS_PURGED = Counter(
+    "become_maintenance_rows_purged_total",
+    "Expired rows or entries removed by background maintenance, by job",
+    ["job"],
+)
+MAINTENANCE_RUNS = Counter(
+    "become_maintenance_runs_total",
+    "Maintenance job runs by outcome (completed, skipped on another worker's lease, failed)",
+    ["job", "outcome"],
+)
+MAINTENANCE_JOB_DURATION = Histogram(
+    "become_maintenance_job_duration_seconds",
+    "Duration of a maintenance job run, batch pauses included",
+    ["job"],
+    buckets=_LATENCY_BUCKETS,
+)
+STORAGE_DURATION = Histogram(
+    "become_storage_operation_duration_seconds",
+    "Object storage call duration by operation and outcome",
+    ["operation", "outcome"],
+    buckets=_LATENCY_BUCKETS,
+)
+
+
+class QueryCounter:
+    """Mutable per-request count of executed database statements.
+
+    A single instance is bound for the whole request, so increments made in
+    threadpool workers (which run on a copy of the request context) are still
+    visible to the middleware that reads the total.
+    """
+
+    __slots__ = ("count",)
+
+    def __init__(self) -> None:
+        """Start the count at zero."""
+        self.count = 0
+
+
+_query_counter_var: ContextVar[QueryCounter | None] = ContextVar("query_counter", default=None)
+
+
+def start_query_count() -> tuple[QueryCounter, Token[QueryCounter | None]]:
+    """Bind a fresh query counter to the current context.
+
+    :return: The bound counter and a reset token for :func:`stop_query_count`.
+    """
+    counter = QueryCounter()
+    return counter, _query_counter_var.set(counter)
+
+
+def stop_query_count(token: Token[QueryCounter | None]) -> None:
+    """Unbind the query counter bound by :func:`start_query_count`.
+
+    :param token: Token returned by :func:`start_query_count`.
+    """
+    _query_counter_var.reset(token)
+
+
+def _count_query(*_args: Any, **_kwargs: Any) -> None:
+    """Increment the active request's query counter, if any (SQLAlchemy listener)."""
+    counter = _query_counter_var.get()
+    if counter is not None:
+        counter.count += 1
+
+
+def install_query_counter() -> None:
+    """Count statements on every engine of the process (idempotent).
+
+    Listening on the :class:`~sqlalchemy.Engine` class covers the lazily built
+    application engine as well as engines created by tests.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _count_query):
+        event.listen(Engine, "before_cursor_execute", _count_query)
+
+
+@contextmanager
+def observe_seconds(histogram: Histogram, **labels: str) -> Iterator[None]:
+    """Time the wrapped block into ``histogram``, also when it raises.
+
+    :param histogram: Histogram to observe the elapsed seconds into.
+    :param labels: Label values for the observation.
+    """
+    start = perf_counter()
+    try:
+        yield
+    finally:
+        histogram.labels(**labels).observe(perf_counter() - start)
+
+
+def multiprocess_enabled() -> bool:
+    """Report whether samples are shared across worker processes.
+
+    :return: True when ``PROMETHEUS_MULTIPROC_DIR`` is set.
+    """
+    return bool(os.environ.get(_MULTIPROC_DIR_VAR))
+
+
+def render_latest() -> tuple[bytes, str]:
+    """Render all metrics in the Prometheus text exposition format.
+
+    :return: Encoded payload and its content type.
+    """
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)  # type: ignore[no-untyped-call]
+        return generate_latest(registry), CONTENT_TYPE_LATEST
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
+
+
+def mark_worker_stopped() -> None:
+    """Drop this worker's live gauge samples when it exits (multiprocess mode only)."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(os.getpid())  # type: ignore[no-untyped-call]
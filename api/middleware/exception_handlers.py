@@ -24,7 +24,9 @@ from api.exceptions import (
     OpinionNotFoundError,
     ProjectNotFoundError,
     ResetTokenExpiredError,
+    ResultNotAvailableError,
     ScaleRangeError,
+    SnapshotNotFoundError,
     UserAlreadyMemberError,
     UserExistsError,
     ValidationError,
@@ -48,6 +50,7 @@ EXCEPTION_MAP: dict[type[BeCoMeAPIError], tuple[int, str | None]] = {
         "You have not submitted an opinion for this project",
     ),
     InvitationNotFoundError: (status.HTTP_404_NOT_FOUND, "Invitation not found"),
+    SnapshotNotFoundError: (status.HTTP_404_NOT_FOUND, "Snapshot not found"),
     # 400 Bad Request
     InvitationExpiredError: (status.HTTP_400_BAD_REQUEST, "Invitation has expired"),
     InvitationAlreadyUsedError: (
@@ -69,6 +72,10 @@ EXCEPTION_MAP: dict[type[BeCoMeAPIError], tuple[int, str | None]] = {
         "Transfer ownership or delete those projects first.",
     ),
     UserExistsError: (status.HTTP_409_CONFLICT, "Email already registered"),
+    ResultNotAvailableError: (
+        status.HTTP_409_CONFLICT,
+        "The project has no result to publish yet",
+    ),
     UserAlreadyMemberError: (
         status.HTTP_409_CONFLICT,
         "You are already a member of this project",
@@ -0,0 +1,90 @@
+"""Prometheus request metrics middleware."""
+
+from time import perf_counter
+
+from starlette.routing import BaseRoute
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.metrics import (
+    REQUEST_DB_QUERIES,
+    REQUEST_DURATION,
+    REQUESTS_IN_FLIGHT,
+    UNMATCHED_ROUTE,
+    start_query_count,
+    stop_query_count,
+)
+
+# The scrape endpoint itself is not measured.
+_SKIP_PATHS = frozenset({"/metrics"})
+
+
+def _route_template(scope: Scope) -> str:
+    """Return the matched route's path template, e.g. ``/api/v1/projects/{project_id}``.
+
+    The router records the matched route on the scope, so the label is the
+    template rather than the raw path and stays bounded in cardinality.
+
+    :param scope: ASGI scope after the app has handled it.
+    :return: Route template, or ``"unmatched"`` when no route matched.
+    """
+    route = scope.get("route")
+    if isinstance(route, BaseRoute):
+        path = getattr(route, "path", None)
+        if isinstance(path, str):
+            return path
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Record latency, in-flight count and DB query count for each HTTP request.
+
+    Pure ASGI like :class:`~api.middleware.request_logging.RequestLoggingMiddleware`.
+    Latency and query count are labelled by method and route template; the
+    latency histogram also carries the response status. A request that raises
+    before a response starts is recorded with status 500.
+
+    :param app: Downstream ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application.
+
+        :param app: Downstream ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Time the request and record its metrics once the response completes.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        if scope["type"] != "http" or scope["path"] in _SKIP_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method: str = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_flight = REQUESTS_IN_FLIGHT.labels(method=method)
+        in_flight.inc()
+        counter, token = start_query_count()
+        start = perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            duration = perf_counter() - start
+            stop_query_count(token)
+            in_flight.dec()
+            route = _route_template(scope)
+            REQUEST_DURATION.labels(method=method, route=route, status=str(status_code)).observe(
+                duration
+            )
+            REQUEST_DB_QUERIES.labels(method=method, route=route).observe(counter.count)
@@ -0,0 +1,127 @@
+"""Opt-in per-request profiling middleware."""
+
+import logging
+import time
+from uuid import uuid4
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from api.config import get_settings
+from api.logging_context import get_request_id
+from api.profiling import (
+    PROFILE_HEADER,
+    PROFILE_ID_HEADER,
+    PROFILE_SECRET_HEADER,
+    PROFILE_STATUS_HEADER,
+    ProfileStore,
+    RequestProfiler,
+    profile_id,
+    profiling_allowed,
+    release_profiling_slot,
+    requested_modes,
+    try_acquire_profiling_slot,
+)
+
+logger = logging.getLogger("api.profiling")
+
+
+class ProfilingMiddleware:
+    """Profile requests that ask for it with the ``X-Profile`` header.
+
+    Pure ASGI like :class:`~api.middleware.request_logging.RequestLoggingMiddleware`,
+    which must wrap it so the correlation ID is bound before profiling starts.
+    Requests without the header, or not allowed to profile (see
+    :func:`~api.profiling.profiling_allowed`), pass straight through. A profiled
+    response carries ``X-Profile-ID``, the correlation ID reduced by
+    :func:`~api.profiling.profile_id` to the ID the profile is stored under;
+    when another request on the same worker is already being profiled the
+    request runs unprofiled and the response says ``X-Profile-Status: busy``.
+
+    :param app: Downstream ASGI application.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application.
+
+        :param app: Downstream ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Run the request under the requested profilers and store the profile.
+
+        :param scope: ASGI connection scope.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        modes = requested_modes(headers.get(PROFILE_HEADER))
+        if not modes:
+            await self.app(scope, receive, send)
+            return
+        settings = get_settings()
+        if not profiling_allowed(settings, headers.get(PROFILE_SECRET_HEADER)):
+            await self.app(scope, receive, send)
+            return
+
+        if not try_acquire_profiling_slot():
+
+            async def send_busy(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    message.setdefault("headers", []).append(
+                        (PROFILE_STATUS_HEADER.lower().encode("latin-1"), b"busy")
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_busy)
+            return
+
+        request_id = get_request_id() or str(uuid4())
+        status_code = 500
+
+        async def send_with_profile_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message.setdefault("headers", []).append(
+                    (
+                        PROFILE_ID_HEADER.lower().encode("latin-1"),
+                        profile_id(request_id).encode("latin-1"),
+                    )
+                )
+            await send(message)
+
+        profiler = RequestProfiler(modes)
+        started_ns = time.time_ns()
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.stop()
+            release_profiling_slot()
+            profile = profiler.report(
+                request_id=request_id,
+                started_ns=started_ns,
+                method=scope["method"],
+                path=scope["path"],
+                status=status_code,
+            )
+            try:
+                ProfileStore.from_settings(settings).save(request_id, profile)
+            except OSError:
+                logger.exception("Failed to store profile", extra={"event": "profile_store_failed"})
+            else:
+                logger.info(
+                    "Request profiled",
+                    extra={
+                        "event": "request_profiled",
+                        "modes": sorted(modes),
+                        "wall_ms": profile["wall_ms"],
+                        "db_ms": profile["db_ms"],
+                    },
+                )
@@ -8,13 +8,32 @@ from slowapi.errors import RateLimitExceeded
 from starlette.responses import Response
 
 from api.config import get_settings
+from api.middleware.rate_limit_storage import MOVING_WINDOW  # also registers the gcra-* schemes
 from api.utils.client_ip import get_client_ip
 
 logger = logging.getLogger("api.ratelimit")
 
+# limits storage URI per RATE_LIMIT_BACKEND value (see api.middleware.rate_limit_storage).
+_STORAGE_URIS = {
+    "memory": "gcra-memory://",
+    "sql": "gcra-sql://",
+}
+
+_settings = get_settings()
+
 # Disable rate limiting only while the automated test suite runs (TESTING flag).
-# Deployed profiles, including staging, keep limiting enabled.
-limiter = Limiter(key_func=get_client_ip, enabled=not get_settings().testing)
+# Deployed profiles, including staging, keep limiting enabled. The GCRA storages
+# serve the moving-window strategy with one float per key; if the shared SQL
+# backend fails, slowapi falls back to in-process counters until it recovers.
+# The storages are told the strategy and refuse any other at startup.
+limiter = Limiter(
+    key_func=get_client_ip,
+    enabled=not _settings.testing,
+    strategy=MOVING_WINDOW,
+    storage_uri=_STORAGE_URIS[_settings.rate_limit_backend],
+    storage_options={"strategy": MOVING_WINDOW},
+    in_memory_fallback_enabled=_settings.rate_limit_backend == "sql",
+)
 
 # Rate limit constants for different endpoint types
 LIMIT_AUTH_ENDPOINTS = "5/minute"  # Login, register - strict to prevent brute-force
@@ -22,6 +41,7 @@ LIMIT_PWD_RESET = "3/minute"  # noqa: S105 -- password-reset rate window, not a
 LIMIT_STANDARD = "60/minute"  # Normal API endpoints
 LIMIT_UPLOAD = "10/minute"  # File uploads - prevent abuse
 LIMIT_PHOTO = "120/minute"  # Public photo proxy reads (browser-cached avatars)
+LIMIT_INTERACTIVE = "600/minute"  # What-if previews while dragging sliders
 
 
 def rate_limit_handler(request: Request, exc: RateLimitExceeded) -> Response:
@@ -0,0 +1,357 @@
+"""Rate limiter storage backends built on the generic cell rate algorithm (GCRA).
+
+slowapi delegates counting to a ``limits`` storage. The stock ``memory://``
+storage keeps one timestamp per hit for the moving window and a separate copy
+in every uvicorn worker, so a limit of 5/minute admits 5 per worker and idle
+keys are only dropped by a background timer.
+
+GCRA gives the same sliding-window guarantee with a single float per key: the
+*theoretical arrival time* (TAT). A limit of ``N`` per ``W`` seconds spaces hits
+``W / N`` apart; a hit at ``now`` is admitted when pushing the TAT forward by
+that interval keeps it within ``W`` of ``now``, which allows bursts of up to
+``N`` and then one hit per interval. A key whose TAT lies in the past carries
+no state and can be dropped.
+
+Two backends register with ``limits`` under their own URI schemes:
+
+- ``gcra-memory://``: per-process and lock-free (see :class:`GCRAMemoryStorage`).
+- ``gcra-sql://``: shared by every worker through the application database, one
+  atomic upsert per hit (see :class:`GCRASQLStorage`).
+
+Both implement only ``limits``' moving-window interface. They take the
+limiter's strategy as a storage option and refuse to be built for any other, so
+a misconfigured limiter fails at startup instead of on every request.
+"""
+
+import heapq
+import math
+import time
+from typing import Any
+
+from limits.errors import ConfigurationError
+from limits.storage.base import MovingWindowSupport, Storage
+from sqlalchemy import Engine, case, delete, select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from api.db.engine import get_engine
+from api.db.models import RateLimitBucket
+from api.services.query_helpers import InsertStatement
+
+# Slack for float rounding when N hits of W / N seconds should exactly fill W.
+_EPSILON = 1e-9
+
+# Expired keys are swept once every this many hits (amortised O(1) per hit).
+_SWEEP_EVERY = 1024
+
+# Default cap on keys held by the in-process backend.
+_DEFAULT_MAX_KEYS = 100_000
+
+_BUCKETS = RateLimitBucket.__table__  # type: ignore[attr-defined]
+
+# The only ``limits`` strategy the GCRA storages can serve.
+MOVING_WINDOW = "moving-window"
+_MOVING_WINDOW_ONLY = f"GCRA storages support only the {MOVING_WINDOW} strategy"
+
+
+def _require_moving_window(strategy: str) -> None:
+    """Reject a limiter strategy other than the moving window.
+
+    :param strategy: Strategy the limiter runs the storage with.
+    :raises ConfigurationError: If it is not ``moving-window``.
+    """
+    if strategy != MOVING_WINDOW:
+        raise ConfigurationError(f"{_MOVING_WINDOW_ONLY}, not {strategy!r}")
+
+
+def _admit(tat: float | None, now: float, limit: int, expiry: int, amount: int) -> float | None:
+    """Apply one GCRA step.
+
+    :param tat: Stored theoretical arrival time, or None for an unseen key.
+    :param now: Current time in seconds since the epoch.
+    :param limit: Hits allowed per window.
+    :param expiry: Window length in seconds.
+    :param amount: Cost of this hit.
+    :return: New theoretical arrival time if the hit is admitted, otherwise None.
+    """
+    if amount > limit:
+        return None
+    base = now if tat is None or tat < now else tat
+    new_tat = base + amount * expiry / limit
+    if new_tat - now > expiry + _EPSILON:
+        return None
+    return new_tat
+
+
+def _window(tat: float | None, now: float, limit: int, expiry: int) -> tuple[float, int]:
+    """Translate a theoretical arrival time into ``limits``' moving-window view.
+
+    ``limits`` reports ``start + expiry`` as the reset time, so ``start`` is
+    chosen to make that the moment the next hit becomes admissible.
+
+    :param tat: Stored theoretical arrival time, or None for an unseen key.
+    :param now: Current time in seconds since the epoch.
+    :param limit: Hits allowed per window.
+    :param expiry: Window length in seconds.
+    :return: Tuple of (window start, hits currently counted against the limit).
+    """
+    if tat is None or tat <= now:
+        return now, 0
+    interval = expiry / limit
+    used = min(limit, math.ceil((tat - now) / interval - _EPSILON))
+    return tat + interval - 2 * expiry, used
+
+
+class _MovingWindowOnly:
+    """Fixed-window counter methods, which ``limits.storage.Storage`` declares abstract.
+
+    GCRA storages keep no counters; construction already rejects the
+    strategies that would call these, so they only raise the same error.
+    """
+
+    def incr(self, key: str, expiry: int, amount: int = 1) -> int:
+        """Refuse: fixed-window counters are not kept."""
+        raise ConfigurationError(_MOVING_WINDOW_ONLY)
+
+    def get(self, key: str) -> int:
+        """Refuse: fixed-window counters are not kept."""
+        raise ConfigurationError(_MOVING_WINDOW_ONLY)
+
+    def get_expiry(self, key: str) -> float:
+        """Refuse: fixed-window counters are not kept."""
+        raise ConfigurationError(_MOVING_WINDOW_ONLY)
+
+
+class GCRAMemoryStorage(_MovingWindowOnly, Storage, MovingWindowSupport):
+    """Per-process GCRA storage holding one float per key, without locks.
+
+    Each hit is a dict read and a dict write, both atomic under the GIL. Two
+    threads racing on the same key can both read the old TAT and both be
+    admitted, so a burst may overshoot by the number of concurrent threads;
+    that is the price of not serialising every request on a lock, and it never
+    under-admits. Expired keys are swept every ``_SWEEP_EVERY`` hits and the
+    table is capped at ``max_keys`` by evicting the keys closest to expiry.
+
+    Counters are not shared between workers; use :class:`GCRASQLStorage` for
+    that.
+    """
+
+    STORAGE_SCHEME = ["gcra-memory"]  # noqa: RUF012 -- limits registers storages by this list
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        max_keys: int = _DEFAULT_MAX_KEYS,
+        strategy: str = MOVING_WINDOW,
+        **options: Any,
+    ) -> None:
+        """Create an empty key table.
+
+        :param uri: Storage URI (``gcra-memory://``).
+        :param wrap_exceptions: Wrap backend errors in ``limits``' StorageError.
+        :param max_keys: Maximum number of keys kept before eviction.
+        :param strategy: Strategy of the limiter using the storage.
+        :param options: Extra ``limits`` storage options (ignored).
+        :raises ConfigurationError: If ``strategy`` is not ``moving-window``.
+        """
+        _require_moving_window(strategy)
+        self._tats: dict[str, float] = {}
+        self._max_keys = max_keys
+        self._hits = 0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        """Errors raised by this backend (none beyond programming errors)."""
+        return ValueError
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        """Admit a hit if the key has room in its window.
+
+        :param key: Rate limit key.
+        :param limit: Hits allowed per window.
+        :param expiry: Window length in seconds.
+        :param amount: Cost of this hit.
+        :return: True if the hit was admitted and recorded.
+        """
+        now = time.time()
+        self._hits += 1
+        if self._hits % _SWEEP_EVERY == 0 or len(self._tats) >= self._max_keys:
+            self._sweep(now)
+        new_tat = _admit(self._tats.get(key), now, limit, expiry, amount)
+        if new_tat is None:
+            return False
+        self._tats[key] = new_tat
+        return True
+
+    def get_moving_window(self, key: str, limit: int, expiry: int) -> tuple[float, int]:
+        """Report the key's window start and used hits.
+
+        :param key: Rate limit key.
+        :param limit: Hits allowed per window.
+        :param expiry: Window length in seconds.
+        :return: Tuple of (window start, hits counted against the limit).
+        """
+        return _window(self._tats.get(key), time.time(), limit, expiry)
+
+    def _sweep(self, now: float) -> None:
+        """Drop expired keys, then evict down to three quarters of the cap if still full.
+
+        :param now: Current time in seconds since the epoch.
+        """
+        snapshot = list(self._tats.items())
+        for key, tat in snapshot:
+            if tat <= now:
+                self._tats.pop(key, None)
+        excess = len(self._tats) - (self._max_keys * 3) // 4
+        if excess > 0:
+            for key, _ in heapq.nsmallest(
+                excess, list(self._tats.items()), key=lambda item: item[1]
+            ):
+                self._tats.pop(key, None)
+
+    def __len__(self) -> int:
+        """Return the number of keys currently held."""
+        return len(self._tats)
+
+    def check(self) -> bool:
+        """Report health; the in-process table is always available."""
+        return True
+
+    def reset(self) -> int | None:
+        """Forget every key.
+
+        :return: Number of keys removed.
+        """
+        removed = len(self._tats)
+        self._tats.clear()
+        return removed
+
+    def clear(self, key: str) -> None:
+        """Forget one key.
+
+        :param key: Rate limit key.
+        """
+        self._tats.pop(key, None)
+
+
+class GCRASQLStorage(_MovingWindowOnly, Storage, MovingWindowSupport):
+    """GCRA storage shared by every worker through the application database.
+
+    Each key is one row of ``rate_limit_buckets``. A hit is a single
+    ``INSERT ... ON CONFLICT DO UPDATE ... WHERE ... RETURNING`` statement on
+    PostgreSQL and SQLite: the database applies the GCRA step under its own row
+    lock and returns the new TAT only when the hit is admitted, so workers
+    never race and a rejected hit writes nothing. Rows whose TAT has passed are
+    deleted every ``_SWEEP_EVERY`` hits per worker.
+
+    The engine is resolved on first use, so the storage can be built at import
+    time before the database is configured.
+    """
+
+    STORAGE_SCHEME = ["gcra-sql"]  # noqa: RUF012 -- limits registers storages by this list
+
+    def __init__(
+        self,
+        uri: str | None = None,
+        wrap_exceptions: bool = False,
+        engine: Engine | None = None,
+        strategy: str = MOVING_WINDOW,
+        **options: Any,
+    ) -> None:
+        """Bind the storage to an engine, or to the application engine lazily.
+
+        :param uri: Storage URI (``gcra-sql://``).
+        :param wrap_exceptions: Wrap backend errors in ``limits``' StorageError.
+        :param engine: Engine to use; defaults to :func:`api.db.engine.get_engine`.
+        :param strategy: Strategy of the limiter using the storage.
+        :param options: Extra ``limits`` storage options (ignored).
+        :raises ConfigurationError: If ``strategy`` is not ``moving-window``.
+        """
+        _require_moving_window(strategy)
+        self._engine = engine
+        self._hits = 0
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+
+    @property
+    def base_exceptions(self) -> type[Exception] | tuple[type[Exception], ...]:
+        """Errors raised by the database driver through SQLAlchemy."""
+        return SQLAlchemyError
+
+    @property
+    def engine(self) -> Engine:
+        """Engine the buckets live in, resolved on first use."""
+        if self._engine is None:
+            self._engine = get_engine()
+        return self._engine
+
+    def acquire_entry(self, key: str, limit: int, expiry: int, amount: int = 1) -> bool:
+        """Admit a hit atomically in the shared table.
+
+        :param key: Rate limit key.
+        :param limit: Hits allowed per window.
+        :param expiry: Window length in seconds.
+        :param amount: Cost of this hit.
+        :return: True if the hit was admitted and recorded.
+        """
+        if amount > limit:
+            return False
+        table = _BUCKETS
+        now = time.time()
+        cost = amount * expiry / limit
+        new_tat = case((table.c.tat > now, table.c.tat), else_=now) + cost
+
+        insert = InsertStatement.build(self.engine, table).values(bucket_key=key, tat=now + cost)
+        stmt = insert.on_conflict_do_update(
+            index_elements=[table.c.bucket_key],
+            set_={"tat": new_tat},
+            where=new_tat - now <= expiry + _EPSILON,
+        ).returning(table.c.tat)
+
+        self._hits += 1
+        with self.engine.begin() as conn:
+            if self._hits % _SWEEP_EVERY == 0:
+                conn.execute(delete(table).where(table.c.tat <= now))
+            return conn.execute(stmt).first() is not None
+
+    def get_moving_window(self, key: str, limit: int, expiry: int) -> tuple[float, int]:
+        """Report the key's window start and used hits.
+
+        :param key: Rate limit key.
+        :param limit: Hits allowed per window.
+        :param expiry: Window length in seconds.
+        :return: Tuple of (window start, hits counted against the limit).
+        """
+        table = _BUCKETS
+        with self.engine.connect() as conn:
+            tat = conn.execute(select(table.c.tat).where(table.c.bucket_key == key)).scalar()
+        return _window(tat, time.time(), limit, expiry)
+
+    def check(self) -> bool:
+        """Report whether the database answers.
+
+        :return: True if a trivial query succeeds.
+        """
+        try:
+            with self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        except SQLAlchemyError:
+            return False
+        return True
+
+    def reset(self) -> int | None:
+        """Delete every bucket.
+
+        :return: Number of rows removed.
+        """
+        with self.engine.begin() as conn:
+            return conn.execute(delete(_BUCKETS)).rowcount
+
+    def clear(self, key: str) -> None:
+        """Delete one bucket.
+
+        :param key: Rate limit key.
+        """
+        table = _BUCKETS
+        with self.engine.begin() as conn:
+            conn.execute(delete(table).where(table.c.bucket_key == key))
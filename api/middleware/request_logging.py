@@ -2,12 +2,11 @@
 
 import logging
 import uuid
-from collections.abc import Awaitable, Callable
 from time import perf_counter
 
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.requests import Request
-from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from api.logging_context import reset_request_id, set_request_id
 from api.utils.client_ip import get_client_ip
@@ -23,7 +22,7 @@ _SLOW_REQUEST_MS = 1000.0
 _SKIP_PATHS = frozenset({"/api/v1/health"})
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """Assign a correlation ID, log each request/response, and time it.
 
     A request ID is taken from the inbound ``X-Request-ID`` header or generated,
@@ -31,62 +30,87 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     logging context so every ``api.*`` record of this request carries it, and
     echoed back on the response. Request bodies and the ``Authorization`` header
     are never logged.
+
+    Implemented as pure ASGI rather than ``BaseHTTPMiddleware``: the downstream
+    app runs in the same task and the response is passed through message by
+    message, so there is no per-request task group or memory stream and
+    streaming responses are not buffered. The duration covers the whole
+    response, including a streamed body.
+
+    :param app: Downstream ASGI application.
     """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application.
+
+        :param app: Downstream ASGI application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Log the request, delegate, then log the timed response.
 
-        :param request: Incoming request; its ``X-Request-ID`` header is reused
+        Non-HTTP scopes (lifespan, websocket) are passed through untouched.
+
+        :param scope: ASGI connection scope; its ``X-Request-ID`` header is reused
             as the correlation ID when present, otherwise a new one is generated.
-        :param call_next: Downstream handler that produces the response.
-        :return: The downstream response with the ``X-Request-ID`` header set.
+        :param receive: ASGI receive channel.
+        :param send: ASGI send channel; the ``X-Request-ID`` header is added to
+            the response start message.
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         request_id = request.headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
         request.state.request_id = request_id
-        path = request.url.path
+        status_code = 0
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        path: str = scope["path"]
         token = set_request_id(request_id)
         try:
             if path in _SKIP_PATHS:
-                response = await call_next(request)
-                response.headers[REQUEST_ID_HEADER] = request_id
-                return response
+                await self.app(scope, receive, send_with_request_id)
+                return
 
+            method: str = scope["method"]
             logger.info(
                 "%s %s",
-                request.method,
+                method,
                 path,
                 extra={
                     "request_id": request_id,
-                    "method": request.method,
+                    "method": method,
                     "path": path,
                     "ip": get_client_ip(request),
                 },
             )
 
             start = perf_counter()
-            response = await call_next(request)
+            await self.app(scope, receive, send_with_request_id)
             duration_ms = (perf_counter() - start) * 1000.0
 
             level = logging.WARNING if duration_ms > _SLOW_REQUEST_MS else logging.INFO
             logger.log(
                 level,
                 "%s %s %d %.0fms",
-                request.method,
+                method,
                 path,
-                response.status_code,
+                status_code,
                 duration_ms,
                 extra={
                     "request_id": request_id,
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                     "duration_ms": round(duration_ms, 1),
                 },
             )
-
-            response.headers[REQUEST_ID_HEADER] = request_id
-            return response
         finally:
             reset_request_id(token)
@@ -1,13 +1,46 @@
 """Security headers middleware for HTTP response hardening."""
 
-from collections.abc import Awaitable, Callable
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import Response
+_SECURITY_HEADERS: tuple[tuple[str, str], ...] = (
+    # Prevent clickjacking - page cannot be embedded in iframe
+    ("X-Frame-Options", "DENY"),
+    # Prevent MIME type sniffing
+    ("X-Content-Type-Options", "nosniff"),
+    # XSS protection for older browsers
+    ("X-XSS-Protection", "1; mode=block"),
+    # Control referrer information sent with requests
+    ("Referrer-Policy", "strict-origin-when-cross-origin"),
+    # Disable unnecessary browser features
+    (
+        "Permissions-Policy",
+        "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
+        "magnetometer=(), microphone=(), payment=(), usb=()",
+    ),
+    # Content Security Policy - restrict resource loading
+    # Note: 'unsafe-inline' for style-src is required by Tailwind CSS
+    # For stricter CSP, configure nonce-based styles in Vite build
+    (
+        "Content-Security-Policy",
+        "default-src 'self'; "
+        "img-src 'self' data:; "
+        "style-src 'self' 'unsafe-inline'; "
+        "script-src 'self'; "
+        "connect-src 'self'; "
+        "frame-ancestors 'none'; "
+        "base-uri 'self'; "
+        "form-action 'self'; "
+        "upgrade-insecure-requests",
+    ),
+)
 
+# HTTP Strict Transport Security - only for HTTPS requests
+# Sending HSTS on HTTP can cause issues in dev/staging
+_HSTS_HEADER = ("Strict-Transport-Security", "max-age=31536000; includeSubDomains; preload")
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+
+class SecurityHeadersMiddleware:
     """Add security headers to all HTTP responses.
 
     Headers protect against:
@@ -15,54 +48,35 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
     - MIME sniffing (X-Content-Type-Options)
     - XSS in older browsers (X-XSS-Protection)
     - Information leakage (Referrer-Policy, Permissions-Policy)
-    """
 
-    async def dispatch(
-        self,
-        request: Request,
-        call_next: Callable[[Request], Awaitable[Response]],
-    ) -> Response:
-        """Process request and add security headers to response."""
-        response: Response = await call_next(request)
+    Pure ASGI: the headers are set on the ``http.response.start`` message as it
+    passes through, so the body is never buffered and streaming responses work.
 
-        # Prevent clickjacking - page cannot be embedded in iframe
-        response.headers["X-Frame-Options"] = "DENY"
-
-        # Prevent MIME type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
+    :param app: Downstream ASGI application.
+    """
 
-        # XSS protection for older browsers
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+    def __init__(self, app: ASGIApp) -> None:
+        """Wrap the downstream ASGI application.
 
-        # HTTP Strict Transport Security - only for HTTPS requests
-        # Sending HSTS on HTTP can cause issues in dev/staging
-        if request.url.scheme == "https":
-            response.headers["Strict-Transport-Security"] = (
-                "max-age=31536000; includeSubDomains; preload"
-            )
+        :param app: Downstream ASGI application.
+        """
+        self.app = app
 
-        # Control referrer information sent with requests
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process request and add security headers to the response start message."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Disable unnecessary browser features
-        response.headers["Permissions-Policy"] = (
-            "accelerometer=(), camera=(), geolocation=(), gyroscope=(), "
-            "magnetometer=(), microphone=(), payment=(), usb=()"
-        )
+        is_https = scope.get("scheme") == "https"
 
-        # Content Security Policy - restrict resource loading
-        # Note: 'unsafe-inline' for style-src is required by Tailwind CSS
-        # For stricter CSP, configure nonce-based styles in Vite build
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "img-src 'self' data:; "
-            "style-src 'self' 'unsafe-inline'; "
-            "script-src 'self'; "
-            "connect-src 'self'; "
-            "frame-ancestors 'none'; "
-            "base-uri 'self'; "
-            "form-action 'self'; "
-            "upgrade-insecure-requests"
-        )
+        async def send_with_headers(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                for name, value in _SECURITY_HEADERS:
+                    headers[name] = value
+                if is_https:
+                    headers[_HSTS_HEADER[0]] = _HSTS_HEADER[1]
+            await send(message)
 
-        return response
+        await self.app(scope, receive, send_with_headers)
@@ -0,0 +1,467 @@
+"""Opt-in per-request profiling: CPU samples, allocations and DB time.
+
+A request that carries ``X-Profile: cpu``, ``X-Profile: alloc`` or both
+(``cpu,alloc``) is run under the requested profilers by
+:class:`~api.middleware.profiling.ProfilingMiddleware`, and the result is saved
+under the request's correlation ID (see :mod:`api.logging_context`). Profiling
+is allowed on non-production profiles, and in production only when the request
+also presents ``PROFILING_SECRET`` in ``X-Profile-Secret``.
+
+- ``cpu``: a background thread samples the Python stacks of the process every
+  few milliseconds and folds them into a call tree plus a flat list of the
+  functions seen most often at the top of the stack. Sampling covers the event
+  loop and the threadpool alike, so sync endpoints are profiled too; idle
+  threads (waiting on a lock, queue or selector) are skipped.
+- ``alloc``: ``tracemalloc`` snapshots before and after the request; the
+  report lists the source lines whose live allocations grew the most, and the
+  traced peak.
+- Every profile records the wall time split into database time (measured
+  around each cursor execute, like the per-request query count in
+  :mod:`api.metrics`) and the remaining Python time.
+
+Only one request per worker is profiled at a time: tracemalloc and the sampler
+are process-wide, so concurrent profiles would measure each other. Profiles are
+written as JSON to a directory that keeps only the newest ``PROFILING_MAX_PROFILES``
+files (a ring buffer on disk) and are served back by ``GET /api/v1/debug/profiles``.
+"""
+
+import hmac
+import json
+import os
+import sys
+import tempfile
+import threading
+import tracemalloc
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from pathlib import Path
+from time import perf_counter
+from types import FrameType
+from typing import Any
+
+from sqlalchemy import Engine, event
+
+from api.config import Environment, Settings
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_SECRET_HEADER = "X-Profile-Secret"  # noqa: S105 -- header name, not a credential
+PROFILE_ID_HEADER = "X-Profile-ID"
+PROFILE_STATUS_HEADER = "X-Profile-Status"
+
+PROFILE_MODES = frozenset({"cpu", "alloc"})
+
+# Sampling period of the CPU profiler.
+_SAMPLE_INTERVAL_S = 0.002
+
+# Deepest stack kept per sample, and the share of samples a call-tree node needs
+# to be reported (keeps the JSON readable for deep framework stacks).
+_MAX_STACK_DEPTH = 128
+_MIN_TREE_SHARE = 0.01
+_TOP_ENTRIES = 25
+
+# Leaf functions of threads parked waiting for work; such samples are not CPU time.
+_IDLE_LEAVES = frozenset({"wait", "select", "poll", "epoll", "get", "_worker", "acquire"})
+_IDLE_FILES = ("threading.py", "selectors.py", "queue.py", "thread.py", "_base.py")
+
+# Serialises profiled requests within a worker (tracemalloc and the sampler are global).
+_PROFILE_LOCK = threading.Lock()
+
+
+def requested_modes(header_value: str | None) -> frozenset[str]:
+    """Parse the ``X-Profile`` header into the known profiler modes.
+
+    :param header_value: Raw header value, e.g. ``"cpu,alloc"``.
+    :return: The requested modes; empty when the header is absent or unknown.
+    """
+    if not header_value:
+        return frozenset()
+    return frozenset(part.strip().lower() for part in header_value.split(",")) & PROFILE_MODES
+
+
+def profiling_allowed(settings: Settings, secret: str | None) -> bool:
+    """Decide whether a request may be profiled or read stored profiles.
+
+    :param settings: Application settings.
+    :param secret: Value of the ``X-Profile-Secret`` header, if sent.
+    :return: True on non-production profiles, or with the matching admin secret.
+    """
+    if settings.environment is not Environment.PROD:
+        return True
+    return bool(settings.profiling_secret and secret) and hmac.compare_digest(
+        secret or "", settings.profiling_secret or ""
+    )
+
+
+@dataclass
+class DBTimer:
+    """Accumulated database time and statement count for one profiled request.
+
+    Bound through a context variable for the whole request, so statements run
+    in threadpool workers (on a copy of the request context) add to it too.
+    """
+
+    seconds: float = 0.0
+    queries: int = 0
+    _starts: list[float] = field(default_factory=list)
+
+
+_db_timer_var: ContextVar[DBTimer | None] = ContextVar("profile_db_timer", default=None)
+
+
+def _before_execute(*_args: Any, **_kwargs: Any) -> None:
+    """Mark the start of a statement for the active profile (SQLAlchemy listener)."""
+    timer = _db_timer_var.get()
+    if timer is not None:
+        timer._starts.append(perf_counter())
+
+
+def _after_execute(*_args: Any, **_kwargs: Any) -> None:
+    """Add the statement's duration to the active profile (SQLAlchemy listener)."""
+    timer = _db_timer_var.get()
+    if timer is not None and timer._starts:
+        timer.seconds += perf_counter() - timer._starts.pop()
+        timer.queries += 1
+
+
+def install_db_timer() -> None:
+    """Time statements on every engine of the process for profiled requests (idempotent)."""
+    if not event.contains(Engine, "before_cursor_execute", _before_execute):
+        event.listen(Engine, "before_cursor_execute", _before_execute)
+        event.listen(Engine, "after_cursor_execute", _after_execute)
+
+
+def _frame_label(frame: FrameType) -> str:
+    """Render a frame as ``function (file:line)`` with a shortened path."""
+    code = frame.f_code
+    return f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+def _is_idle(frame: FrameType) -> bool:
+    """Report whether a thread's leaf frame is parked waiting rather than running."""
+    code = frame.f_code
+    return code.co_name in _IDLE_LEAVES and code.co_filename.endswith(_IDLE_FILES)
+
+
+class StackSampler:
+    """Sample the Python stacks of every thread in a background thread.
+
+    Each sample is stored as a root-to-leaf tuple of frame labels and counted,
+    so memory grows with the number of distinct stacks, not with duration.
+
+    :param interval: Seconds between samples.
+    """
+
+    def __init__(self, interval: float = _SAMPLE_INTERVAL_S) -> None:
+        """Prepare an idle sampler.
+
+        :param interval: Seconds between samples.
+        """
+        self.interval = interval
+        self.stacks: Counter[tuple[str, ...]] = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="become-profiler", daemon=True)
+
+    def start(self) -> None:
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop.set()
+        self._thread.join()
+
+    def sample_once(self) -> None:
+        """Record one sample of every busy thread except the sampler itself."""
+        own = threading.get_ident()
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own or _is_idle(frame):
+                continue
+            stack: list[str] = []
+            current: FrameType | None = frame
+            while current is not None and len(stack) < _MAX_STACK_DEPTH:
+                stack.append(_frame_label(current))
+                current = current.f_back
+            self.stacks[tuple(reversed(stack))] += 1
+        self.samples += 1
+
+    def _run(self) -> None:
+        """Sample until stopped."""
+        while not self._stop.wait(self.interval):
+            self.sample_once()
+
+    def report(self) -> dict[str, Any]:
+        """Fold the samples into a call tree and a top-of-stack ranking.
+
+        :return: JSON-serialisable CPU profile.
+        """
+        total = sum(self.stacks.values())
+        root: dict[str, Any] = {"name": "<all>", "samples": total, "children": {}}
+        leaves: Counter[str] = Counter()
+        for stack, count in self.stacks.items():
+            node = root
+            for label in stack:
+                child = node["children"].setdefault(
+                    label, {"name": label, "samples": 0, "children": {}}
+                )
+                child["samples"] += count
+                node = child
+            if stack:
+                leaves[stack[-1]] += count
+        threshold = max(1, int(total * _MIN_TREE_SHARE))
+        return {
+            "interval_ms": self.interval * 1000.0,
+            "ticks": self.samples,
+            "samples": total,
+            "top": [
+                {"frame": label, "samples": n} for label, n in leaves.most_common(_TOP_ENTRIES)
+            ],
+            "call_tree": _prune(root, threshold),
+        }
+
+
+def _prune(node: dict[str, Any], threshold: int) -> dict[str, Any]:
+    """Turn a call-tree node into a list-based tree without rarely-seen branches."""
+    children = [
+        _prune(child, threshold)
+        for child in sorted(node["children"].values(), key=lambda c: -c["samples"])
+        if child["samples"] >= threshold
+    ]
+    return {"name": node["name"], "samples": node["samples"], "children": children}
+
+
+class AllocationTracer:
+    """Diff ``tracemalloc`` snapshots around a request.
+
+    Tracing is started if it is not already on and stopped again afterwards,
+    so a process launched with ``PYTHONTRACEMALLOC`` keeps tracing.
+    """
+
+    def __init__(self) -> None:
+        """Prepare an idle tracer."""
+        self._started_here = False
+        self._before: tracemalloc.Snapshot | None = None
+        self._result: dict[str, Any] = {}
+
+    def start(self) -> None:
+        """Start tracing (if needed) and take the baseline snapshot."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_here = True
+        tracemalloc.reset_peak()
+        self._before = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        """Take the closing snapshot, record the diff, and stop tracing if started here."""
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+        if self._started_here:
+            tracemalloc.stop()
+        before = self._before or after
+        filters = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        diff = after.filter_traces(filters).compare_to(before.filter_traces(filters), "lineno")
+        self._result = {
+            "peak_kb": round(peak / 1024, 1),
+            "top": [
+                {
+                    "location": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+                    "size_diff_kb": round(stat.size_diff / 1024, 1),
+                    "count_diff": stat.count_diff,
+                }
+                for stat in diff[:_TOP_ENTRIES]
+            ],
+        }
+
+    def report(self) -> dict[str, Any]:
+        """Return the allocation diff recorded by :meth:`stop`."""
+        return self._result
+
+
+class RequestProfiler:
+    """Run the requested profilers around one request and assemble the profile.
+
+    :param modes: Requested modes from :data:`PROFILE_MODES`.
+    """
+
+    def __init__(self, modes: frozenset[str]) -> None:
+        """Prepare the profilers for ``modes``.
+
+        :param modes: Requested modes from :data:`PROFILE_MODES`.
+        """
+        self.modes = modes
+        self._sampler = StackSampler() if "cpu" in modes else None
+        self._tracer = AllocationTracer() if "alloc" in modes else None
+        self._timer = DBTimer()
+        self._token: Token[DBTimer | None] | None = None
+        self._start = 0.0
+        self.wall_seconds = 0.0
+
+    def start(self) -> None:
+        """Bind the DB timer and start the profilers."""
+        self._token = _db_timer_var.set(self._timer)
+        if self._tracer is not None:
+            self._tracer.start()
+        if self._sampler is not None:
+            self._sampler.start()
+        self._start = perf_counter()
+
+    def stop(self) -> None:
+        """Stop the profilers and unbind the DB timer."""
+        self.wall_seconds = perf_counter() - self._start
+        if self._sampler is not None:
+            self._sampler.stop()
+        if self._tracer is not None:
+            self._tracer.stop()
+        if self._token is not None:
+            _db_timer_var.reset(self._token)
+
+    def report(self, **request: Any) -> dict[str, Any]:
+        """Assemble the stored profile document.
+
+        :param request: Request metadata (request ID, method, path, status, ...).
+        :return: JSON-serialisable profile.
+        """
+        wall_ms = self.wall_seconds * 1000.0
+        db_ms = self._timer.seconds * 1000.0
+        profile: dict[str, Any] = {
+            **request,
+            "modes": sorted(self.modes),
+            "wall_ms": round(wall_ms, 3),
+            "db_ms": round(db_ms, 3),
+            "python_ms": round(max(0.0, wall_ms - db_ms), 3),
+            "db_queries": self._timer.queries,
+        }
+        if self._sampler is not None:
+            profile["cpu"] = self._sampler.report()
+        if self._tracer is not None:
+            profile["alloc"] = self._tracer.report()
+        return profile
+
+
+def try_acquire_profiling_slot() -> bool:
+    """Claim this worker's single profiling slot without waiting.
+
+    :return: True if claimed; release it with :func:`release_profiling_slot`.
+    """
+    return _PROFILE_LOCK.acquire(blocking=False)
+
+
+def release_profiling_slot() -> None:
+    """Release the slot claimed by :func:`try_acquire_profiling_slot`."""
+    _PROFILE_LOCK.release()
+
+
+def profile_id(request_id: str) -> str:
+    """Reduce a correlation ID to the ID its profile is stored and fetched under.
+
+    Keeps ASCII letters, digits, ``-`` and ``_`` (at most 64), so the ID is a
+    safe file name, header value and URL path segment.
+
+    :param request_id: Correlation ID, possibly client-supplied.
+    :return: Sanitised profile ID (``request`` if nothing is left).
+    """
+    kept = (ch for ch in request_id if (ch.isascii() and ch.isalnum()) or ch in "-_")
+    return "".join(kept)[:64] or "request"
+
+
+class ProfileStore:
+    """Ring buffer of profile files on disk, newest ``capacity`` kept.
+
+    Files are named ``<epoch-ns>-<request-id>.json`` so the directory listing
+    sorts by age; each write is atomic (temp file and rename), and the oldest
+    files beyond ``capacity`` are removed after every write. Several workers
+    may share the directory.
+
+    :param directory: Directory holding the profiles.
+    :param capacity: Number of profiles kept.
+    """
+
+    def __init__(self, directory: Path, capacity: int) -> None:
+        """Bind the store to a directory.
+
+        :param directory: Directory holding the profiles.
+        :param capacity: Number of profiles kept.
+        """
+        self.directory = directory
+        self.capacity = capacity
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> "ProfileStore":
+        """Build the store configured by ``PROFILING_DIR`` and ``PROFILING_MAX_PROFILES``.
+
+        :param settings: Application settings.
+        :return: Configured store.
+        """
+        directory = settings.profiling_dir or os.path.join(tempfile.gettempdir(), "become-profiles")
+        return cls(Path(directory), settings.profiling_max_profiles)
+
+    def _files(self) -> list[Path]:
+        """List stored profile files, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        return sorted(self.directory.glob("*.json"))
+
+    def save(self, request_id: str, profile: dict[str, Any]) -> Path:
+        """Write a profile and evict the oldest beyond capacity.
+
+        :param request_id: Correlation ID the profile is stored under.
+        :param profile: Profile document.
+        :return: Path of the written file.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{profile['started_ns']:020d}-{profile_id(request_id)}.json"
+        with tempfile.NamedTemporaryFile(
+            "w", dir=self.directory, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as tmp:
+            json.dump(profile, tmp)
+        os.replace(tmp.name, path)
+        for stale in self._files()[: -self.capacity or None]:
+            stale.unlink(missing_ok=True)
+        return path
+
+    def list(self) -> list[dict[str, Any]]:
+        """Summarise stored profiles, newest first.
+
+        :return: One summary per profile (request ID, route, timings).
+        """
+        summaries = []
+        for path in reversed(self._files()):
+            profile = self._read(path)
+            if profile is not None:
+                summaries.append(
+                    {
+                        key: profile.get(key)
+                        for key in (
+                            "request_id",
+                            "method",
+                            "path",
+                            "status",
+                            "modes",
+                            "wall_ms",
+                            "db_ms",
+                        )
+                    }
+                )
+        return summaries
+
+    def get(self, request_id: str) -> dict[str, Any] | None:
+        """Load the newest profile stored under ``request_id``.
+
+        :param request_id: Correlation ID, raw or as returned in ``X-Profile-ID``.
+        :return: The profile, or None if it was never stored or has been evicted.
+        """
+        wanted = profile_id(request_id)
+        for path in reversed(self._files()):
+            if path.stem.split("-", 1)[1] == wanted:
+                return self._read(path)
+        return None
+
+    @staticmethod
+    def _read(path: Path) -> dict[str, Any] | None:
+        """Read one profile file, tolerating a concurrent eviction."""
+        try:
+            data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return data
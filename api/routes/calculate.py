@@ -8,13 +8,16 @@ from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 
-from api.dependencies import get_calculator
+from api.dependencies import StatisticsInclude, get_calculator
+from api.metrics import CALCULATION_DURATION, observe_seconds
 from api.middleware.rate_limit import LIMIT_STANDARD, limiter
-from api.schemas.calculation import CalculateRequest, CalculateResponse, FuzzyNumberOutput
+from api.schemas.calculation import CalculateRequest, CalculateResponse
 from src.calculators.become_calculator import BeCoMeCalculator
+from src.calculators.statistics_engine import StatisticsEngine
 from src.exceptions import BeCoMeError
 from src.models.expert_opinion import ExpertOpinion
 from src.models.fuzzy_number import FuzzyTriangleNumber
+from src.models.statistics_summary import Statistic
 
 router = APIRouter(prefix="/api/v1", tags=["calculation"])
 
@@ -28,12 +31,17 @@ def calculate(
     request: Request,
     payload: CalculateRequest,
     calculator: Annotated[BeCoMeCalculator, Depends(get_calculator)],
+    include: StatisticsInclude,
 ) -> CalculateResponse:
     """Calculate BeCoMe result from expert opinions.
 
+    With ``include``, the BeCoMe result and the extra statistics come from
+    one :class:`StatisticsEngine` pass instead of the calculator.
+
     :param request: FastAPI request (for rate limiting)
     :param payload: Expert opinions to aggregate
     :param calculator: Injected BeCoMeCalculator instance
+    :param include: Extra statistics to compute
     :return: Calculation result with fuzzy numbers
     """
     opinions = [
@@ -49,14 +57,18 @@ def calculate(
     ]
 
     try:
-        result = calculator.calculate_compromise(opinions)
+        with observe_seconds(CALCULATION_DURATION, source="stateless"):
+            summary = (
+                StatisticsEngine(include | {Statistic.BECOME}).summarize(opinions)
+                if include
+                else None
+            )
+            result = (
+                summary.become
+                if summary is not None and summary.become is not None
+                else calculator.calculate_compromise(opinions)
+            )
     except BeCoMeError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
 
-    return CalculateResponse(
-        best_compromise=FuzzyNumberOutput.from_domain(result.best_compromise),
-        arithmetic_mean=FuzzyNumberOutput.from_domain(result.arithmetic_mean),
-        median=FuzzyNumberOutput.from_domain(result.median),
-        max_error=result.max_error,
-        num_experts=result.num_experts,
-    )
+    return CalculateResponse.from_domain(result, summary)
@@ -8,7 +8,11 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from api.auth.dependencies import CurrentUser
 from api.dependencies import ProjectAdmin, ProjectMember, get_invitation_service
 from api.exceptions import AlreadyInvitedError, UserNotFoundForInvitationError
+from api.schemas.internal import BulkInviteStatus
 from api.schemas.invitation import (
+    BulkInviteItemResponse,
+    BulkInviteRequest,
+    BulkInviteResponse,
     InvitationListItemResponse,
     InvitationResponse,
     InviteByEmailRequest,
@@ -61,6 +65,44 @@ def invite_by_email(
     return InvitationResponse.from_model(invitation, invitee)
 
 
+@router.post("/projects/{project_id}/invite/bulk", summary="Invite users by email in bulk")
+def invite_many(
+    project_id: UUID,
+    project: ProjectAdmin,
+    request: BulkInviteRequest,
+    current_user: CurrentUser,
+    invitation_service: Annotated[InvitationService, Depends(get_invitation_service)],
+) -> BulkInviteResponse:
+    """Invite many registered users to a project at once. Only admin can invite.
+
+    Emails that cannot be invited are reported rather than failing the
+    request: each distinct email comes back as ``invited``, ``not_found``,
+    ``already_member`` or ``already_invited``.
+
+    :param project: Project (verified admin)
+    :param request: Emails of users to invite
+    :param current_user: Authenticated admin user
+    :param invitation_service: Invitation service
+    :return: Number of invitations created and the outcome per email
+    """
+    outcomes = invitation_service.invite_many(
+        project_id=project.id,
+        inviter_id=current_user.id,
+        invitee_emails=request.emails,
+    )
+    return BulkInviteResponse(
+        invited=sum(outcome.status is BulkInviteStatus.INVITED for outcome in outcomes),
+        results=[
+            BulkInviteItemResponse(
+                email=outcome.email,
+                status=outcome.status,
+                invitation_id=str(outcome.invitation_id) if outcome.invitation_id else None,
+            )
+            for outcome in outcomes
+        ],
+    )
+
+
 @router.get(
     "/projects/{project_id}/invitations",
     summary="List pending invitations for a project",
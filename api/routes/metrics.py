@@ -0,0 +1,36 @@
+"""Prometheus metrics scrape endpoint."""
+
+import hmac
+from typing import Annotated
+
+from fastapi import APIRouter, Header, HTTPException, Response, status
+
+from api.config import get_settings
+from api.metrics import render_latest
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics(authorization: Annotated[str | None, Header()] = None) -> Response:
+    """Expose process metrics in the Prometheus text format.
+
+    When ``METRICS_TOKEN`` is configured the scraper must send it as a bearer
+    token. Only the dev and test profiles may leave it unset (the endpoint is
+    then open); production refuses to start without it.
+
+    :param authorization: ``Authorization`` header carrying the scrape token.
+    :return: Prometheus exposition payload.
+    :raises HTTPException: 401 if a token is configured and not presented.
+    """
+    token = get_settings().metrics_token
+    if token:
+        expected = f"Bearer {token}"
+        if not authorization or not hmac.compare_digest(authorization, expected):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid metrics token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+    payload, content_type = render_latest()
+    return Response(content=payload, media_type=content_type)
@@ -4,25 +4,61 @@ Exception handling follows OCP: all exceptions are handled
 by centralized middleware, routes focus on business logic only.
 """
 
+import asyncio
+from collections.abc import AsyncIterator
 from typing import Annotated
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
 
 from api.auth.dependencies import CurrentUser
+from api.db.session import get_session
 from api.dependencies import (
+    ProjectAdmin,
     ProjectMember,
+    StatisticsInclude,
+    get_calculation_reader,
     get_calculation_service,
     get_opinion_service,
     get_result_export_service,
+    get_what_if_service,
 )
-from api.middleware.rate_limit import LIMIT_STANDARD, limiter
-from api.schemas.calculation import CalculationResultResponse, FuzzyNumberOutput
-from api.schemas.opinion import OpinionCreate, OpinionResponse
+from api.middleware.rate_limit import LIMIT_INTERACTIVE, LIMIT_STANDARD, LIMIT_UPLOAD, limiter
+from api.schemas.calculation import (
+    CalculateResponse,
+    CalculationResultResponse,
+    ExpertInfluenceOutput,
+    FactionsResponse,
+    InfluenceResponse,
+    WhatIfQuery,
+    WhatIfResponse,
+)
+from api.schemas.opinion import OpinionCreate, OpinionImportResponse, OpinionResponse
 from api.services.calculation_service import CalculationService
 from api.services.export.data import ExportFormat, ReportLang
 from api.services.export.result_export_service import ResultExportService
+from api.services.opinion_import import (
+    MAX_IMPORT_BYTES,
+    ImportFormat,
+    ImportResult,
+    parse_import,
+)
 from api.services.opinion_service import OpinionService
+from api.services.result_events import ResultSubscription, result_hub
+from api.services.what_if_service import WhatIfService
+from api.utils.conditional import check_not_modified, weak_etag
+from src.calculators.faction_clustering import MAX_CLUSTERS
+from src.models.fuzzy_number import FuzzyTriangleNumber
+
+# Seconds between SSE comments that keep idle proxies from closing the stream.
+RESULT_EVENTS_HEARTBEAT = 15.0
+# Seconds a stream stays open; the client reconnects and membership is re-checked.
+RESULT_EVENTS_LIFETIME = 900.0
+# Milliseconds an EventSource waits before reconnecting.
+_RESULT_EVENTS_RETRY_MS = 5000
 
 router = APIRouter(prefix="/api/v1/projects", tags=["opinions"])
 
@@ -31,14 +67,27 @@ router = APIRouter(prefix="/api/v1/projects", tags=["opinions"])
 def list_opinions(
     project_id: UUID,
     project: ProjectMember,
+    request: Request,
+    response: Response,
     opinion_service: Annotated[OpinionService, Depends(get_opinion_service)],
 ) -> list[OpinionResponse]:
     """Get all opinions for a project. Only members can access.
 
+    Answers 304 when ``If-None-Match`` holds the current ETag.
+
     :param project: Project (verified membership)
+    :param request: Incoming request (conditional headers)
+    :param response: Response receiving the validators
     :param opinion_service: Opinion service
     :return: List of opinions with user details
     """
+    version = opinion_service.get_opinions_version(project.id)
+    check_not_modified(
+        request,
+        response,
+        weak_etag("opinions", project.id, version.count, version.last_modified),
+        version.last_modified,
+    )
     opinions = opinion_service.get_opinions_for_project(project.id)
     return [OpinionResponse.from_model(item.opinion, item.user) for item in opinions]
 
@@ -58,7 +107,9 @@ def submit_opinion(
 ) -> OpinionResponse:
     """Submit or update own opinion for a project.
 
-    If opinion already exists, it will be updated. Auto-triggers recalculation.
+    If opinion already exists, it will be updated. Auto-triggers recalculation;
+    the opinion and the new result are written in one transaction, reusing the
+    project loaded by the membership check.
     ValuesOutOfRangeError is handled by centralized exception middleware.
 
     :param project: Project (verified membership)
@@ -79,11 +130,73 @@ def submit_opinion(
         lower_bound=request.lower_bound,
         peak=request.peak,
         upper_bound=request.upper_bound,
+        commit=False,
     )
+    # Build the response before the commit expires the loaded rows.
+    response = OpinionResponse.from_model(result.opinion, current_user)
 
-    calculation_service.recalculate(project.id)
+    calculation_service.recalculate(project.id, in_transaction=True)
+
+    return response
+
+
+@router.post("/{project_id}/opinions/import", summary="Import opinions in bulk")
+@limiter.limit(LIMIT_UPLOAD)
+async def import_opinions(
+    request: Request,
+    project_id: UUID,
+    project: ProjectAdmin,
+    opinion_service: Annotated[OpinionService, Depends(get_opinion_service)],
+    calculation_service: Annotated[CalculationService, Depends(get_calculation_service)],
+) -> OpinionImportResponse:
+    """Create or update many members' opinions from one file. Admin only.
+
+    The body is CSV (``text/csv`` with a header row), a JSON array
+    (``application/json``) or NDJSON (``application/x-ndjson``) of records
+    with ``email``, ``position``, ``lower_bound``, ``peak`` and
+    ``upper_bound``; each email must belong to a project member. The import
+    is all or nothing: any invalid record yields 422 with a ``detail`` list
+    of ``{"row", "message"}`` entries and nothing is stored. Otherwise the
+    project is recalculated once.
+
+    :param request: FastAPI request (body and rate limiting).
+    :param project_id: Project UUID from the path.
+    :param project: Project (verified admin).
+    :param opinion_service: Opinion service.
+    :param calculation_service: Calculation service.
+    :return: Numbers of created and updated opinions.
+    """
+    import_format = ImportFormat.from_content_type(request.headers.get("Content-Type"))
+    if import_format is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Content-Type must be one of: {', '.join(ImportFormat)}",
+        )
+    too_large = HTTPException(
+        status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+        detail=f"Import is limited to {MAX_IMPORT_BYTES} bytes",
+    )
+    # Refuse an announced oversized body before reading it into memory.
+    declared = request.headers.get("Content-Length", "")
+    if declared.isdigit() and int(declared) > MAX_IMPORT_BYTES:
+        raise too_large
+    content = await request.body()
+    if len(content) > MAX_IMPORT_BYTES:
+        raise too_large
 
-    return OpinionResponse.from_model(result.opinion, current_user)
+    def run_import() -> ImportResult:
+        result = opinion_service.import_opinions(project, parse_import(content, import_format))
+        if not result.errors and result.created + result.updated:
+            calculation_service.recalculate(project.id)
+        return result
+
+    result = await run_in_threadpool(run_import)
+    if result.errors:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=[{"row": error.row, "message": error.message} for error in result.errors],
+        )
+    return OpinionImportResponse(created=result.created, updated=result.updated)
 
 
 @router.delete(
@@ -115,42 +228,204 @@ def delete_opinion(
 def get_result(
     project_id: UUID,
     project: ProjectMember,
-    calculation_service: Annotated[CalculationService, Depends(get_calculation_service)],
+    request: Request,
+    response: Response,
+    calculation_service: Annotated[CalculationService, Depends(get_calculation_reader)],
+    include: StatisticsInclude,
 ) -> CalculationResultResponse | None:
     """Get BeCoMe calculation result for a project.
 
-    Returns None if no opinions have been submitted yet.
+    Returns None if no opinions have been submitted yet. Answers 304 when
+    ``If-None-Match`` holds the current ETag. Statistics named in ``include``
+    are computed from the current opinions and returned under ``statistics``.
 
     :param project: Project (verified membership)
+    :param request: Incoming request (conditional headers)
+    :param response: Response receiving the validators
     :param calculation_service: Calculation service
+    :param include: Extra statistics to compute
     :return: Calculation result or None
     """
+    calculated_at = calculation_service.get_result_version(project.id)
+    check_not_modified(
+        request,
+        response,
+        weak_etag("result", project.id, calculated_at, *sorted(include)),
+        calculated_at,
+    )
     result = calculation_service.get_result(project.id)
     if not result:
         return None
+    summary = calculation_service.summarize(project.id, include) if include else None
+    return CalculationResultResponse.from_model(result, summary)
 
-    return CalculationResultResponse(
-        best_compromise=FuzzyNumberOutput.from_bounds(
-            result.best_compromise_lower,
-            result.best_compromise_peak,
-            result.best_compromise_upper,
-        ),
-        arithmetic_mean=FuzzyNumberOutput.from_bounds(
-            result.arithmetic_mean_lower,
-            result.arithmetic_mean_peak,
-            result.arithmetic_mean_upper,
-        ),
-        median=FuzzyNumberOutput.from_bounds(
-            result.median_lower,
-            result.median_peak,
-            result.median_upper,
+
+@router.get("/{project_id}/result/events", summary="Stream calculation results")
+async def stream_result(
+    project_id: UUID,
+    project: ProjectMember,
+    session: Annotated[Session, Depends(get_session)],
+    calculation_service: Annotated[CalculationService, Depends(get_calculation_service)],
+) -> StreamingResponse:
+    """Push the project's result as server-sent events instead of polling.
+
+    The first ``result`` event carries the current result (``null`` when
+    there is none); another follows every recalculation. Comment lines keep
+    idle connections alive, and the stream ends after a fixed lifetime so the
+    client reconnects through the membership check again.
+
+    :param project_id: Project UUID from the path.
+    :param project: Project (verified membership).
+    :param session: Request database session, released before streaming.
+    :param calculation_service: Calculation service.
+    :return: ``text/event-stream`` response.
+    """
+    # Subscribe before reading so no recalculation slips between the two.
+    subscription = result_hub.subscribe(project.id)
+
+    def load_current() -> str:
+        try:
+            result = calculation_service.get_result(project.id)
+            if result is None:
+                return "null"
+            return CalculationResultResponse.from_model(result).model_dump_json()
+        finally:
+            # Give the pooled connection back; the stream itself needs no database.
+            session.close()
+
+    try:
+        current = await run_in_threadpool(load_current)
+    except BaseException:
+        subscription.close()
+        raise
+    return StreamingResponse(
+        _result_events(subscription, current),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def _result_events(subscription: ResultSubscription, current: str) -> AsyncIterator[str]:
+    """Format a subscription as server-sent events.
+
+    :param subscription: Live subscription, closed when the stream ends
+    :param current: Serialised result at the time of subscribing
+    :return: Iterator of SSE frames
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + RESULT_EVENTS_LIFETIME
+    try:
+        yield f"retry: {_RESULT_EVENTS_RETRY_MS}\nevent: result\ndata: {current}\n\n"
+        while (remaining := deadline - loop.time()) > 0:
+            try:
+                payload = await asyncio.wait_for(
+                    subscription.get(), timeout=min(RESULT_EVENTS_HEARTBEAT, remaining)
+                )
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield f"event: result\ndata: {payload}\n\n"
+    finally:
+        subscription.close()
+
+
+@router.get("/{project_id}/result/influence", summary="Rank experts by influence")
+@limiter.limit(LIMIT_STANDARD)
+def get_influence(
+    request: Request,
+    project_id: UUID,
+    project: ProjectAdmin,
+    calculation_service: Annotated[CalculationService, Depends(get_calculation_reader)],
+) -> InfluenceResponse | None:
+    """Rank experts by how much each one moves the best compromise.
+
+    Each entry carries the result the project would have without that expert
+    and the signed shifts it causes. Admin only. Returns None with fewer than
+    two opinions, where leaving one out is undefined.
+
+    :param request: FastAPI request (for rate limiting).
+    :param project_id: Project UUID from the path.
+    :param project: Project (verified admin).
+    :param calculation_service: Calculation service.
+    :return: Baseline result and ranked influence table, or None.
+    """
+    report = calculation_service.analyze_influence(project.id)
+    if report is None:
+        return None
+    return InfluenceResponse(
+        baseline=CalculateResponse.from_domain(report.baseline),
+        experts=[ExpertInfluenceOutput.from_domain(entry) for entry in report.experts],
+    )
+
+
+@router.get("/{project_id}/result/factions", summary="Split experts into factions")
+@limiter.limit(LIMIT_STANDARD)
+def get_factions(
+    request: Request,
+    project_id: UUID,
+    project: ProjectAdmin,
+    calculation_service: Annotated[CalculationService, Depends(get_calculation_reader)],
+    clusters: Annotated[
+        int | None,
+        Query(ge=1, le=MAX_CLUSTERS, description="Number of factions (default: chosen by BIC)"),
+    ] = None,
+) -> FactionsResponse | None:
+    """Split experts into factions of neighbouring opinions, each with its own result.
+
+    A polarised panel can agree on a best compromise that no camp holds; the
+    factions show the camps. Admin only. Returns None when there are no
+    opinions.
+
+    :param request: FastAPI request (for rate limiting).
+    :param project_id: Project UUID from the path.
+    :param project: Project (verified admin).
+    :param calculation_service: Calculation service.
+    :param clusters: Number of factions, or None to choose it automatically.
+    :return: Factions by ascending centroid, or None.
+    """
+    report = calculation_service.analyze_factions(project.id, clusters)
+    if report is None:
+        return None
+    return FactionsResponse.from_domain(report)
+
+
+@router.get("/{project_id}/result/what-if", summary="Preview the result with a changed opinion")
+@limiter.limit(LIMIT_INTERACTIVE)
+def get_what_if(
+    request: Request,
+    project_id: UUID,
+    project: ProjectMember,
+    current_user: CurrentUser,
+    opinion: Annotated[WhatIfQuery, Query()],
+    opinion_service: Annotated[OpinionService, Depends(get_opinion_service)],
+    what_if_service: Annotated[WhatIfService, Depends(get_what_if_service)],
+) -> WhatIfResponse:
+    """Preview the project result with the caller's opinion replaced, without saving it.
+
+    A member without an opinion previews adding one. Answers from a cached
+    index of the project's opinions in O(log n); the opinions are loaded only
+    after they change. Rate-limited for slider-drag frequencies.
+
+    :param request: FastAPI request (for rate limiting).
+    :param project_id: Project UUID from the path.
+    :param project: Project (verified membership).
+    :param current_user: Authenticated user.
+    :param opinion: Opinion to preview, from the query string.
+    :param opinion_service: Opinion service (for the scale check).
+    :param what_if_service: What-if service.
+    :return: Current and previewed results.
+    """
+    opinion_service.validate_values_in_range(
+        project, opinion.lower_bound, opinion.peak, opinion.upper_bound
+    )
+    index = what_if_service.get_index(project.id)
+    preview = index.replace(
+        str(current_user.id),
+        FuzzyTriangleNumber(
+            lower_bound=opinion.lower_bound, peak=opinion.peak, upper_bound=opinion.upper_bound
         ),
-        max_error=result.max_error,
-        num_experts=result.num_experts,
-        likert_value=result.likert_value,
-        likert_decision=result.likert_decision,
-        calculated_at=result.calculated_at,
     )
+    return WhatIfResponse.from_domain(index.current, preview)
 
 
 @router.get(
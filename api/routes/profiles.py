@@ -0,0 +1,52 @@
+"""Stored request profiles (see :mod:`api.profiling`)."""
+
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Header, HTTPException, status
+
+from api.config import get_settings
+from api.profiling import ProfileStore, profiling_allowed
+
+router = APIRouter(prefix="/api/v1/debug", tags=["debug"])
+
+
+def _store(secret: str | None) -> ProfileStore:
+    """Return the profile store, or 404 when the caller may not read profiles.
+
+    A 404 rather than 401/403 keeps the endpoints invisible in production.
+    """
+    settings = get_settings()
+    if not profiling_allowed(settings, secret):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    return ProfileStore.from_settings(settings)
+
+
+@router.get("/profiles", include_in_schema=False)
+def list_profiles(
+    x_profile_secret: Annotated[str | None, Header()] = None,
+) -> list[dict[str, Any]]:
+    """List the stored profiles, newest first.
+
+    :param x_profile_secret: Profiling secret, required in production.
+    :return: Summary (request ID, route, timings) of each stored profile.
+    :raises HTTPException: 404 if profiling is not allowed for the caller.
+    """
+    return _store(x_profile_secret).list()
+
+
+@router.get("/profiles/{request_id}", include_in_schema=False)
+def get_profile(
+    request_id: str,
+    x_profile_secret: Annotated[str | None, Header()] = None,
+) -> dict[str, Any]:
+    """Return one stored profile: call tree, top allocations, DB vs Python time.
+
+    :param request_id: Correlation ID of the profiled request (``X-Profile-ID``).
+    :param x_profile_secret: Profiling secret, required in production.
+    :return: The profile document.
+    :raises HTTPException: 404 if not allowed, never stored, or already evicted.
+    """
+    profile = _store(x_profile_secret).get(request_id)
+    if profile is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Profile not found")
+    return profile
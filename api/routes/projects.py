@@ -7,7 +7,7 @@ by centralized middleware, routes focus on business logic only.
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from api.auth.dependencies import CurrentUser
 from api.dependencies import (
@@ -28,6 +28,7 @@ from api.schemas.project import (
 from api.services.project_membership_service import ProjectMembershipService
 from api.services.project_query_service import ProjectQueryService
 from api.services.project_service import ProjectService
+from api.utils.conditional import check_not_modified, weak_etag
 
 router = APIRouter(prefix="/api/v1/projects", tags=["projects"])
 
@@ -78,6 +79,8 @@ def get_project(
     project_id: UUID,
     project: ProjectMember,
     current_user: CurrentUser,
+    request: Request,
+    response: Response,
     project_service: Annotated[ProjectService, Depends(get_project_service)],
     membership_service: Annotated[
         ProjectMembershipService, Depends(get_project_membership_service)
@@ -85,8 +88,12 @@ def get_project(
 ) -> ProjectWithRoleResponse:
     """Get project details. Only members can access.
 
+    Answers 304 when ``If-None-Match`` holds the current ETag.
+
     :param project: Project (verified membership)
     :param current_user: Authenticated user
+    :param request: Incoming request (conditional headers)
+    :param response: Response receiving the validators
     :param project_service: Project service
     :param membership_service: Membership service
     :return: Project details with user's role
@@ -97,11 +104,14 @@ def get_project(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Membership not found for this project.",
         )
-    return ProjectWithRoleResponse.from_model_with_role(
-        project,
-        project_service.get_member_count(project.id),
-        role.value,
+    member_count = project_service.get_member_count(project.id)
+    check_not_modified(
+        request,
+        response,
+        weak_etag("project", project.id, project.updated_at, member_count, role.value),
+        project.updated_at,
     )
+    return ProjectWithRoleResponse.from_model_with_role(project, member_count, role.value)
 
 
 @router.patch("/{project_id}", summary="Update project")
@@ -178,16 +188,30 @@ def transfer_ownership(
 def list_members(
     project_id: UUID,
     project: ProjectMember,
+    request: Request,
+    response: Response,
     membership_service: Annotated[
         ProjectMembershipService, Depends(get_project_membership_service)
     ],
 ) -> list[MemberResponse]:
     """List all members of a project. Only members can access.
 
+    Answers 304 when ``If-None-Match`` holds the current ETag.
+
     :param project: Project (verified membership)
+    :param request: Incoming request (conditional headers)
+    :param response: Response receiving the validators
     :param membership_service: Membership service
     :return: List of members with their roles
     """
+    version = membership_service.get_members_version(project.id)
+    # Roles change only on ownership transfer, which moves admin_id.
+    check_not_modified(
+        request,
+        response,
+        weak_etag("members", project.id, project.admin_id, version.count, version.last_modified),
+        version.last_modified,
+    )
     members = membership_service.get_members(project.id)
     return [MemberResponse.from_model(member.membership, member.user) for member in members]
 
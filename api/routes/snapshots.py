@@ -0,0 +1,115 @@
+"""Published result snapshot routes: publish, list and public read."""
+
+import gzip
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Path, Request, Response, status
+
+from api.auth.dependencies import CurrentUser
+from api.dependencies import ProjectAdmin, ProjectMember, get_result_snapshot_service
+from api.schemas.snapshot import ResultSnapshotResponse, SnapshotDocument
+from api.services.result_snapshot_service import ResultSnapshotService
+from api.utils.conditional import etag_matches
+
+router = APIRouter(prefix="/api/v1", tags=["snapshots"])
+
+# A snapshot never changes, so any cache may keep it for a year without revalidating.
+SNAPSHOT_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+@router.post(
+    "/projects/{project_id}/snapshots",
+    status_code=status.HTTP_201_CREATED,
+    summary="Publish a result snapshot",
+)
+def publish_snapshot(
+    project_id: UUID,
+    project: ProjectAdmin,
+    current_user: CurrentUser,
+    snapshot_service: Annotated[ResultSnapshotService, Depends(get_result_snapshot_service)],
+) -> ResultSnapshotResponse:
+    """Publish the current result and opinions under a new public link. Only admin can publish.
+
+    Earlier snapshots stay published unchanged; each publication is a new version.
+
+    :param project: Project (verified admin)
+    :param current_user: Authenticated admin user
+    :param snapshot_service: Snapshot service
+    :return: Published snapshot with its public URL
+    :raises HTTPException: 409 if the project has no result yet
+    """
+    snapshot = snapshot_service.publish(project, current_user.id)
+    return ResultSnapshotResponse.from_model(snapshot)
+
+
+@router.get("/projects/{project_id}/snapshots", summary="List published result snapshots")
+def list_snapshots(
+    project_id: UUID,
+    project: ProjectMember,
+    snapshot_service: Annotated[ResultSnapshotService, Depends(get_result_snapshot_service)],
+) -> list[ResultSnapshotResponse]:
+    """List the project's published snapshots, newest first. Accessible to project members.
+
+    :param project: Project (verified member access)
+    :param snapshot_service: Snapshot service
+    :return: Published snapshots with their public URLs
+    """
+    snapshots = snapshot_service.list_snapshots(project.id)
+    return [ResultSnapshotResponse.from_model(snapshot) for snapshot in snapshots]
+
+
+@router.get(
+    "/snapshots/{snapshot_id}",
+    summary="Get a published result snapshot",
+    response_class=Response,
+    responses={
+        200: {
+            "content": {"application/json": {"schema": SnapshotDocument.model_json_schema()}},
+            "description": "Snapshot document (gzip-encoded when the client accepts it)",
+        },
+        304: {"description": "The client's copy is current"},
+        404: {"description": "No snapshot with this id"},
+    },
+)
+def get_snapshot(
+    request: Request,
+    snapshot_id: Annotated[str, Path(max_length=32)],
+    snapshot_service: Annotated[ResultSnapshotService, Depends(get_result_snapshot_service)],
+) -> Response:
+    """Serve a published snapshot. Public: the unguessable id is the credential.
+
+    The stored gzip blob is sent as is, with headers that let browsers and
+    CDNs keep it for a year; clients that do not accept gzip get it
+    decompressed. No authentication runs, and the database is read only when
+    this worker has not cached the blob yet.
+
+    :param request: Incoming request (conditional and encoding headers)
+    :param snapshot_id: Snapshot id from the public link
+    :param snapshot_service: Snapshot service
+    :return: The snapshot document
+    :raises HTTPException: 404 if no snapshot has this id
+    """
+    etag = f'"{snapshot_id}"'
+    headers = {"ETag": etag, "Cache-Control": SNAPSHOT_CACHE_CONTROL, "Vary": "Accept-Encoding"}
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    blob = snapshot_service.get_content(snapshot_id)
+    if _accepts_gzip(request.headers.get("Accept-Encoding")):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=blob, media_type="application/json", headers=headers)
+    return Response(content=gzip.decompress(blob), media_type="application/json", headers=headers)
+
+
+def _accepts_gzip(accept_encoding: str | None) -> bool:
+    """Tell whether an ``Accept-Encoding`` header admits gzip.
+
+    :param accept_encoding: Header value, e.g. ``gzip, deflate, br;q=0.8``
+    :return: True if gzip (or ``*``) is listed without ``q=0``
+    """
+    for item in (accept_encoding or "").split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() in ("gzip", "*"):
+            quality = params.strip().removeprefix("q=").strip()
+            return quality not in ("0", "0.0", "0.00", "0.000")
+    return False
@@ -4,7 +4,18 @@ from contextlib import suppress
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, HTTPException, Request, Response, UploadFile, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+    status,
+)
+from fastapi.responses import StreamingResponse
 
 from api.auth.dependencies import CurrentUser
 from api.auth.logging import log_account_deletion, log_data_export, log_password_change
@@ -12,6 +23,7 @@ from api.dependencies import (
     get_data_export_service,
     get_project_service,
     get_storage_service,
+    get_user_reader,
     get_user_service,
 )
 from api.exceptions import AccountHasOwnedProjectsError
@@ -24,7 +36,7 @@ from api.middleware.rate_limit import (
 )
 from api.schemas.auth import ChangePasswordRequest, UpdateUserRequest, UserResponse
 from api.schemas.data_export import DataExportResponse
-from api.services.data_export_service import DataExportService
+from api.services.data_export_service import DataExportFormat, DataExportService
 from api.services.project_service import ProjectService
 from api.services.storage import validation
 from api.services.storage.base import StorageService
@@ -46,6 +58,7 @@ def get_current_user_profile(current_user: CurrentUser) -> UserResponse:
 
 @router.get(
     "/me/export",
+    response_model=DataExportResponse,
     summary="Export current user's personal data (GDPR Article 20)",
 )
 @limiter.limit(LIMIT_STANDARD)
@@ -53,21 +66,49 @@ def export_current_user_data(
     request: Request,
     current_user: CurrentUser,
     service: Annotated[DataExportService, Depends(get_data_export_service)],
-) -> DataExportResponse:
+    export_format: Annotated[
+        DataExportFormat, Query(alias="format", description="Export layout")
+    ] = DataExportFormat.JSON,
+) -> DataExportResponse | StreamingResponse:
     """Return all of the authenticated user's data in machine-readable form.
 
     Serves the GDPR Article 20 right to data portability: profile, owned
     projects with results, memberships, submitted opinions, and pending
     invitations. Password material is never included.
 
+    ``format=json`` (default) returns the document in one response;
+    ``json-stream`` streams the same document as a download, and ``zip`` a
+    ZIP archive with one NDJSON file per section, both read and written in
+    chunks for accounts too large to export in memory.
+
     :param request: FastAPI request (for rate limiting and audit logging)
     :param current_user: User from JWT token
     :param service: Data export service
+    :param export_format: Requested layout (the ``format`` query parameter)
     :return: The user's full data export
     """
-    export = service.build_export(current_user)
+    if export_format == DataExportFormat.JSON:
+        export = service.build_export(current_user)
+        log_data_export(current_user.id, request)
+        return export
     log_data_export(current_user.id, request)
-    return export
+    if export_format == DataExportFormat.ZIP:
+        content, media_type, filename = (
+            service.stream_zip(current_user),
+            "application/zip",
+            "become-data-export.zip",
+        )
+    else:
+        content, media_type, filename = (
+            service.stream_json(current_user),
+            "application/json",
+            "become-data-export.json",
+        )
+    return StreamingResponse(
+        content,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
 
 
 @router.put("/me", summary="Update current user profile")
@@ -274,7 +315,7 @@ def delete_photo(
 def get_user_photo(
     request: Request,
     user_id: UUID,
-    user_service: Annotated[UserService, Depends(get_user_service)],
+    user_service: Annotated[UserService, Depends(get_user_reader)],
     storage_service: Annotated[StorageService | None, Depends(get_storage_service)],
 ) -> Response:
     """Stream a user's profile photo from private storage.
@@ -2,11 +2,18 @@
 
 from datetime import datetime
 from typing import Self
+from uuid import UUID
 
 from pydantic import BaseModel, Field, model_validator
 
+from api.db.models import CalculationResult
 from api.schemas.validators import validate_fuzzy_constraints
+from src.models.become_result import BeCoMeResult
+from src.models.dispersion_result import DispersionReport
+from src.models.faction_result import Faction, FactionReport
 from src.models.fuzzy_number import FuzzyTriangleNumber, triangular_centroid
+from src.models.influence_result import ExpertInfluence
+from src.models.statistics_summary import StatisticsSummary
 
 
 class ExpertInput(BaseModel):
@@ -70,6 +77,115 @@ class FuzzyNumberOutput(BaseModel):
         )
 
 
+class QuartilesOutput(BaseModel):
+    """Quartiles of the expert centroids (inclusive interpolation)."""
+
+    q1: float
+    q2: float
+    q3: float
+
+
+class DeviationOutput(BaseModel):
+    """Population standard deviation of each opinion component."""
+
+    lower: float
+    peak: float
+    upper: float
+    centroid: float
+
+
+class OutlierOutput(BaseModel):
+    """Expert whose centroid lies far from the panel's median."""
+
+    expert_id: str = Field(..., description="Expert name, or user ID on project results")
+    centroid: float
+    score: float = Field(..., description="Robust z-score (|centroid - median| in MAD units)")
+
+
+class DispersionOutput(BaseModel):
+    """How far apart the experts are."""
+
+    mean_pairwise_distance: float = Field(
+        ..., description="Mean absolute centroid distance over all pairs of experts"
+    )
+    overlapping_pairs: float = Field(
+        ..., description="Share of pairs whose [lower, upper] ranges intersect"
+    )
+    mean_support_overlap: float = Field(
+        ..., description="Mean length shared by the ranges of two experts"
+    )
+    median_centroid: float
+    mad: float = Field(..., description="Median absolute deviation of the centroids")
+    outliers: list[OutlierOutput] = Field(..., description="Flagged experts by ascending centroid")
+
+    @classmethod
+    def from_domain(cls, report: DispersionReport) -> "DispersionOutput":
+        """Create from a domain DispersionReport.
+
+        :param report: Dispersion metrics.
+        :return: DispersionOutput with every metric and the flagged experts.
+        """
+        return cls(
+            mean_pairwise_distance=report.mean_pairwise_distance,
+            overlapping_pairs=report.overlapping_pairs,
+            mean_support_overlap=report.mean_support_overlap,
+            median_centroid=report.median_centroid,
+            mad=report.mad,
+            outliers=[
+                OutlierOutput(
+                    expert_id=outlier.expert_id, centroid=outlier.centroid, score=outlier.score
+                )
+                for outlier in report.outliers
+            ],
+        )
+
+
+class StatisticsOutput(BaseModel):
+    """Statistics requested with ``include=``; the others are null."""
+
+    quartiles: QuartilesOutput | None = None
+    trimmed_mean: float | None = Field(
+        None, description="Mean centroid without the lowest and highest 10%"
+    )
+    minimum: FuzzyNumberOutput | None = None
+    maximum: FuzzyNumberOutput | None = None
+    std_dev: DeviationOutput | None = None
+    dispersion: DispersionOutput | None = None
+
+    @classmethod
+    def from_domain(cls, summary: StatisticsSummary) -> "StatisticsOutput":
+        """Create from a domain StatisticsSummary.
+
+        :param summary: Computed statistics.
+        :return: StatisticsOutput with the summary's statistics.
+        """
+        quartiles = summary.quartiles
+        std_dev = summary.std_dev
+        return cls(
+            quartiles=(
+                QuartilesOutput(q1=quartiles.q1, q2=quartiles.q2, q3=quartiles.q3)
+                if quartiles
+                else None
+            ),
+            trimmed_mean=summary.trimmed_mean,
+            minimum=FuzzyNumberOutput.from_domain(summary.minimum) if summary.minimum else None,
+            maximum=FuzzyNumberOutput.from_domain(summary.maximum) if summary.maximum else None,
+            std_dev=(
+                DeviationOutput(
+                    lower=std_dev.lower_bound,
+                    peak=std_dev.peak,
+                    upper=std_dev.upper_bound,
+                    centroid=std_dev.centroid,
+                )
+                if std_dev
+                else None
+            ),
+            dispersion=(
+                DispersionOutput.from_domain(summary.dispersion) if summary.dispersion else None
+            ),
+        )
+
+
 class CalculateResponse(BaseModel):
     """Response from calculation endpoint."""
 
@@ -78,6 +194,28 @@ class CalculateResponse(BaseModel):
     median: FuzzyNumberOutput
     max_error: float
     num_experts: int
+    statistics: StatisticsOutput | None = Field(
+        None, description="Additional statistics, present when requested with include="
+    )
+
+    @classmethod
+    def from_domain(
+        cls, result: BeCoMeResult, summary: StatisticsSummary | None = None
+    ) -> "CalculateResponse":
+        """Create from a domain BeCoMeResult.
+
+        :param result: Calculation result.
+        :param summary: Additional statistics, if any were requested.
+        :return: CalculateResponse with all three fuzzy numbers.
+        """
+        return cls(
+            best_compromise=FuzzyNumberOutput.from_domain(result.best_compromise),
+            arithmetic_mean=FuzzyNumberOutput.from_domain(result.arithmetic_mean),
+            median=FuzzyNumberOutput.from_domain(result.median),
+            max_error=result.max_error,
+            num_experts=result.num_experts,
+            statistics=StatisticsOutput.from_domain(summary) if summary else None,
+        )
 
 
 class CalculationResultResponse(CalculateResponse):
@@ -89,3 +227,176 @@ class CalculationResultResponse(CalculateResponse):
     likert_value: int | None = Field(None, ge=0, le=100)
     likert_decision: str | None = None
     calculated_at: datetime
+
+    @classmethod
+    def from_model(
+        cls, result: CalculationResult, summary: StatisticsSummary | None = None
+    ) -> "CalculationResultResponse":
+        """Create from a stored CalculationResult row.
+
+        :param result: Stored calculation result.
+        :param summary: Additional statistics, if any were requested.
+        :return: CalculationResultResponse with centroids computed from the bounds.
+        """
+        return cls(
+            best_compromise=FuzzyNumberOutput.from_bounds(
+                result.best_compromise_lower,
+                result.best_compromise_peak,
+                result.best_compromise_upper,
+            ),
+            arithmetic_mean=FuzzyNumberOutput.from_bounds(
+                result.arithmetic_mean_lower,
+                result.arithmetic_mean_peak,
+                result.arithmetic_mean_upper,
+            ),
+            median=FuzzyNumberOutput.from_bounds(
+                result.median_lower,
+                result.median_peak,
+                result.median_upper,
+            ),
+            max_error=result.max_error,
+            num_experts=result.num_experts,
+            likert_value=result.likert_value,
+            likert_decision=result.likert_decision,
+            calculated_at=result.calculated_at,
+            statistics=StatisticsOutput.from_domain(summary) if summary else None,
+        )
+
+
+class ExpertInfluenceOutput(BaseModel):
+    """One expert's leave-one-out influence on the project result.
+
+    Shifts are (result with the expert) minus (result without): a positive
+    ``compromise_shift`` means the expert pulls the best compromise up.
+    """
+
+    rank: int = Field(..., ge=1, description="1 = most influential")
+    user_id: UUID
+    influence: float = Field(..., description="Absolute shift of the best compromise centroid")
+    compromise_shift: float
+    lower_shift: float
+    peak_shift: float
+    upper_shift: float
+    max_error_shift: float
+    result_without: CalculateResponse
+
+    @classmethod
+    def from_domain(cls, entry: ExpertInfluence) -> "ExpertInfluenceOutput":
+        """Create from a domain ExpertInfluence keyed by user ID.
+
+        :param entry: Influence entry whose expert ID is the user's UUID.
+        :return: ExpertInfluenceOutput for the response.
+        """
+        return cls(
+            rank=entry.rank,
+            user_id=UUID(entry.expert_id),
+            influence=entry.influence,
+            compromise_shift=entry.compromise_shift,
+            lower_shift=entry.lower_shift,
+            peak_shift=entry.peak_shift,
+            upper_shift=entry.upper_shift,
+            max_error_shift=entry.max_error_shift,
+            result_without=CalculateResponse.from_domain(entry.result_without),
+        )
+
+
+class InfluenceResponse(BaseModel):
+    """Leave-one-out influence analysis of a project's experts."""
+
+    baseline: CalculateResponse
+    experts: list[ExpertInfluenceOutput] = Field(
+        ..., description="Experts ranked by descending influence"
+    )
+
+
+class FactionOutput(BaseModel):
+    """Experts with neighbouring opinions and their own BeCoMe result."""
+
+    user_ids: list[UUID] = Field(..., description="Experts in the faction, by submission")
+    lowest_centroid: float
+    highest_centroid: float
+    result: CalculateResponse
+
+    @classmethod
+    def from_domain(cls, faction: Faction) -> "FactionOutput":
+        """Create from a domain Faction keyed by user ID.
+
+        :param faction: Faction whose expert IDs are user UUIDs.
+        :return: FactionOutput for the response.
+        """
+        return cls(
+            user_ids=[UUID(expert_id) for expert_id in faction.expert_ids],
+            lowest_centroid=faction.lowest_centroid,
+            highest_centroid=faction.highest_centroid,
+            result=CalculateResponse.from_domain(faction.result),
+        )
+
+
+class FactionsResponse(BaseModel):
+    """Split of a project's experts into factions by opinion centroid."""
+
+    selected: bool = Field(..., description="Whether the number of factions was chosen by BIC")
+    explained_variance: float = Field(
+        ..., description="Share of the centroid variance explained by the split"
+    )
+    within_sum_of_squares: float
+    factions: list[FactionOutput] = Field(..., description="Factions by ascending centroid")
+
+    @classmethod
+    def from_domain(cls, report: FactionReport) -> "FactionsResponse":
+        """Create from a domain FactionReport.
+
+        :param report: Faction analysis keyed by user ID.
+        :return: FactionsResponse with every faction.
+        """
+        return cls(
+            selected=report.selected,
+            explained_variance=report.explained_variance,
+            within_sum_of_squares=report.within_sum_of_squares,
+            factions=[FactionOutput.from_domain(faction) for faction in report.factions],
+        )
+
+
+class WhatIfQuery(BaseModel):
+    """Opinion to preview in place of the caller's own."""
+
+    lower_bound: float = Field(..., description="Lower bound (pessimistic estimate)")
+    peak: float = Field(..., description="Peak value (most likely)")
+    upper_bound: float = Field(..., description="Upper bound (optimistic estimate)")
+
+    @model_validator(mode="after")
+    def validate_fuzzy(self) -> Self:
+        """Validate fuzzy number constraints."""
+        validate_fuzzy_constraints(self.lower_bound, self.peak, self.upper_bound)
+        return self
+
+
+class WhatIfResponse(BaseModel):
+    """Project result if the caller's opinion were replaced, beside the current one."""
+
+    current: CalculateResponse | None = Field(
+        ..., description="Result of the submitted opinions (null without any)"
+    )
+    preview: CalculateResponse = Field(..., description="Result with the previewed opinion")
+    compromise_shift: float = Field(
+        ..., description="Preview minus current best compromise centroid (0 without a current)"
+    )
+
+    @classmethod
+    def from_domain(cls, current: BeCoMeResult | None, preview: BeCoMeResult) -> "WhatIfResponse":
+        """Create from the current and the previewed domain results.
+
+        :param current: Result of the project's opinions, or None.
+        :param preview: Result with the caller's opinion replaced.
+        :return: WhatIfResponse with both results and the centroid shift.
+        """
+        shift = (
+            preview.best_compromise.centroid - current.best_compromise.centroid
+            if current is not None
+            else 0.0
+        )
+        return cls(
+            current=CalculateResponse.from_domain(current) if current is not None else None,
+            preview=CalculateResponse.from_domain(preview),
+            compromise_shift=shift,
+        )
@@ -7,6 +7,7 @@ work with well-defined types instead of anonymous tuples.
 
 from dataclasses import dataclass
 from datetime import datetime
+from enum import StrEnum
 from uuid import UUID
 
 from api.db.models import (
@@ -168,3 +169,44 @@ class UpsertResult:
     def was_updated(self) -> bool:
         """Check if existing opinion was updated."""
         return not self.is_new
+
+
+@dataclass(frozen=True)
+class ListingVersion:
+    """Version of a project listing, read without loading its rows.
+
+    Any insert or update moves ``last_modified`` and any delete lowers
+    ``count``, so together they change whenever the listing does.
+    """
+
+    count: int
+    last_modified: datetime | None
+
+    @classmethod
+    def of(cls, count: int, *timestamps: datetime | None) -> "ListingVersion":
+        """Build a version from a row count and per-column newest timestamps.
+
+        :param count: Number of rows in the listing
+        :param timestamps: Newest value of each versioned column (None if no rows)
+        :return: Version holding the newest of the timestamps
+        """
+        present = [stamp for stamp in timestamps if stamp is not None]
+        return cls(count=count, last_modified=max(present, default=None))
+
+
+class BulkInviteStatus(StrEnum):
+    """Outcome of one email in a bulk invitation."""
+
+    INVITED = "invited"
+    NOT_FOUND = "not_found"
+    ALREADY_MEMBER = "already_member"
+    ALREADY_INVITED = "already_invited"
+
+
+@dataclass(frozen=True)
+class BulkInviteOutcome:
+    """What a bulk invitation did for one email."""
+
+    email: str
+    status: BulkInviteStatus
+    invitation_id: UUID | None = None
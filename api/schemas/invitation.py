@@ -5,9 +5,13 @@ from typing import TYPE_CHECKING
 
 from pydantic import BaseModel, EmailStr, Field
 
+from api.schemas.internal import BulkInviteStatus
+
 if TYPE_CHECKING:
     from api.db.models import Invitation, Project, User
 
+MAX_BULK_INVITES = 500
+
 
 class InviteByEmailRequest(BaseModel):
     """Request to invite a user by email."""
@@ -15,6 +19,32 @@ class InviteByEmailRequest(BaseModel):
     email: EmailStr = Field(..., description="Email of user to invite")
 
 
+class BulkInviteRequest(BaseModel):
+    """Request to invite many users by email."""
+
+    emails: list[EmailStr] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BULK_INVITES,
+        description="Emails of users to invite",
+    )
+
+
+class BulkInviteItemResponse(BaseModel):
+    """Outcome of one email in a bulk invitation."""
+
+    email: str
+    status: BulkInviteStatus
+    invitation_id: str | None = None
+
+
+class BulkInviteResponse(BaseModel):
+    """Per-email report of a bulk invitation."""
+
+    invited: int = Field(..., description="Invitations created")
+    results: list[BulkInviteItemResponse]
+
+
 class InvitationResponse(BaseModel):
     """Response after creating an invitation."""
 
@@ -76,3 +76,10 @@ class OpinionResponse(BaseModel):
             created_at=opinion.created_at,
             updated_at=opinion.updated_at,
         )
+
+
+class OpinionImportResponse(BaseModel):
+    """Outcome of a bulk opinion import."""
+
+    created: int = Field(..., description="Opinions created")
+    updated: int = Field(..., description="Existing opinions overwritten")
@@ -0,0 +1,114 @@
+"""Published result snapshot schemas."""
+
+from datetime import datetime
+from typing import TYPE_CHECKING
+
+from pydantic import BaseModel
+
+from api.config import get_settings
+from api.schemas.calculation import CalculationResultResponse
+from src.models.fuzzy_number import triangular_centroid
+
+if TYPE_CHECKING:
+    from api.db.models import CalculationResult, ExpertOpinion, Project, ResultSnapshot
+
+
+class SnapshotProject(BaseModel):
+    """Project details shown with a published snapshot."""
+
+    name: str
+    description: str | None = None
+    scale_min: float
+    scale_max: float
+    scale_unit: str
+
+
+class SnapshotOpinion(BaseModel):
+    """One row of a snapshot's opinions table.
+
+    Carries the expert's stated position but no account details: the
+    snapshot is readable by anyone holding its link.
+    """
+
+    position: str
+    lower_bound: float
+    peak: float
+    upper_bound: float
+    centroid: float
+
+
+class SnapshotDocument(BaseModel):
+    """Public body of a published snapshot, rendered once at publication."""
+
+    id: str
+    version: int
+    published_at: datetime
+    project: SnapshotProject
+    result: CalculationResultResponse
+    opinions: list[SnapshotOpinion]
+
+    @classmethod
+    def from_models(
+        cls,
+        snapshot: "ResultSnapshot",
+        project: "Project",
+        result: "CalculationResult",
+        opinions: "list[ExpertOpinion]",
+    ) -> "SnapshotDocument":
+        """Create the document from database models.
+
+        :param snapshot: Snapshot being published (content not yet set)
+        :param project: Published project
+        :param result: Project's current calculation result
+        :param opinions: Project's opinions, in table order
+        :return: SnapshotDocument instance
+        """
+        return cls(
+            id=snapshot.id,
+            version=snapshot.version,
+            published_at=snapshot.published_at,
+            project=SnapshotProject(
+                name=project.name,
+                description=project.description,
+                scale_min=project.scale_min,
+                scale_max=project.scale_max,
+                scale_unit=project.scale_unit,
+            ),
+            result=CalculationResultResponse.from_model(result),
+            opinions=[
+                SnapshotOpinion(
+                    position=opinion.position,
+                    lower_bound=opinion.lower_bound,
+                    peak=opinion.peak,
+                    upper_bound=opinion.upper_bound,
+                    centroid=triangular_centroid(
+                        opinion.lower_bound, opinion.peak, opinion.upper_bound
+                    ),
+                )
+                for opinion in opinions
+            ],
+        )
+
+
+class ResultSnapshotResponse(BaseModel):
+    """Published snapshot as listed to project members."""
+
+    id: str
+    version: int
+    published_at: datetime
+    url: str
+
+    @classmethod
+    def from_model(cls, snapshot: "ResultSnapshot") -> "ResultSnapshotResponse":
+        """Create response from database model.
+
+        :param snapshot: Snapshot database model
+        :return: ResultSnapshotResponse with the snapshot's public URL
+        """
+        base = get_settings().api_public_url.rstrip("/")
+        return cls(
+            id=snapshot.id,
+            version=snapshot.version,
+            published_at=snapshot.published_at,
+            url=f"{base}/api/v1/snapshots/{snapshot.id}",
+        )
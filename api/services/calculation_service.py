@@ -1,19 +1,36 @@
 """BeCoMe calculation business logic service."""
 
 import logging
+from datetime import datetime
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlmodel import Session, col, select
 
 from api.db.models import CalculationResult, ExpertOpinion, Project
+from api.metrics import CALCULATION_DURATION, observe_seconds
+from api.schemas.calculation import CalculationResultResponse
 from api.services.base import BaseService
 from api.services.mappers import BeCoMeResultMapper
-from api.services.protocols import CalculatorProtocol, LikertInterpreterProtocol
+from api.services.protocols import (
+    CalculatorProtocol,
+    LikertInterpreterProtocol,
+    ResultAggregatorProtocol,
+    ResultPublisherProtocol,
+)
+from api.services.query_helpers import UpsertStatement
+from api.services.recalculation import RecalculationCoordinator, recalculation_coordinator
+from api.services.result_events import result_hub
 from src.calculators.become_calculator import BeCoMeCalculator
+from src.calculators.faction_clustering import FactionAnalyzer
+from src.calculators.influence_analyzer import InfluenceAnalyzer
+from src.calculators.statistics_engine import StatisticsEngine
 from src.interpreters.likert_interpreter import LikertDecisionInterpreter
 from src.models.become_result import BeCoMeResult
 from src.models.expert_opinion import ExpertOpinion as DomainExpertOpinion
+from src.models.faction_result import FactionReport
 from src.models.fuzzy_number import FuzzyTriangleNumber
+from src.models.influence_result import InfluenceReport
+from src.models.statistics_summary import Statistic, StatisticsSummary
 
 logger = logging.getLogger("api.service.calculation")
 
@@ -28,6 +45,9 @@ class CalculationService(BaseService):
         likert_interpreter: LikertInterpreterProtocol | None = None,
         likert_scale_min: float = 0.0,
         likert_scale_max: float = 100.0,
+        publisher: ResultPublisherProtocol | None = None,
+        coordinator: RecalculationCoordinator | None = None,
+        aggregator: ResultAggregatorProtocol | None = None,
     ) -> None:
         """Initialize with database session and optional dependencies.
 
@@ -36,6 +56,10 @@ class CalculationService(BaseService):
         :param likert_interpreter: Interpreter implementing LikertInterpreterProtocol
         :param likert_scale_min: Minimum value for Likert scale (default: 0.0)
         :param likert_scale_max: Maximum value for Likert scale (default: 100.0)
+        :param publisher: Receiver of committed results (default: the live result hub)
+        :param coordinator: Per-project single-flight guard (default: the process-wide one)
+        :param aggregator: Database-side aggregation replacing the calculator for
+            project results (default: None, load opinions and use the calculator)
         """
         super().__init__(session)
         self._calculator: CalculatorProtocol = calculator or BeCoMeCalculator()
@@ -44,6 +68,9 @@ class CalculationService(BaseService):
         )
         self._likert_scale_min = likert_scale_min
         self._likert_scale_max = likert_scale_max
+        self._publisher: ResultPublisherProtocol = publisher or result_hub
+        self._coordinator = coordinator or recalculation_coordinator
+        self._aggregator = aggregator
 
     def get_result(self, project_id: UUID) -> CalculationResult | None:
         """Get calculation result for a project.
@@ -54,39 +81,78 @@ class CalculationService(BaseService):
         statement = select(CalculationResult).where(CalculationResult.project_id == project_id)
         return self._session.exec(statement).first()
 
-    def recalculate(self, project_id: UUID) -> CalculationResult | None:
+    def get_result_version(self, project_id: UUID) -> datetime | None:
+        """Get when a project's result was last calculated, without loading it.
+
+        :param project_id: Project UUID
+        :return: Calculation timestamp, or None if there is no result
+        """
+        statement = select(CalculationResult.calculated_at).where(
+            CalculationResult.project_id == project_id
+        )
+        return self._session.exec(statement).first()
+
+    def recalculate(
+        self, project_id: UUID, in_transaction: bool = False
+    ) -> CalculationResult | None:
         """Recalculate BeCoMe result for a project.
 
-        Fetches all opinions, runs calculation, and saves result.
+        Concurrent triggers for the same project are coalesced: one
+        computation over the latest opinions serves every trigger whose
+        change was committed before it started, and this call returns once a
+        result covering its own change is stored.
+
+        With ``in_transaction`` the triggering change is still uncommitted in
+        this session. When no other recalculation of the project is running,
+        the change and the new result are committed together in one
+        transaction; otherwise the change is committed first and the trigger
+        is coalesced like any other.
+
+        :param project_id: Project UUID
+        :param in_transaction: The triggering change awaits commit in this session
+        :return: CalculationResult if opinions exist, None otherwise
+        """
+        computed: list[CalculationResult | None] = []
+        if self._coordinator.run(
+            project_id,
+            lambda: computed.append(self._recalculate_now(project_id)),
+            commit_pending=self._session.commit if in_transaction else None,
+        ):
+            return computed[0]
+        logger.info(
+            "Recalculation coalesced",
+            extra={"event": "recalculation_coalesced", "project_id": str(project_id)},
+        )
+        return self.get_result(project_id)
+
+    def _recalculate_now(self, project_id: UUID) -> CalculationResult | None:
+        """Run the calculation over the current opinions and store the outcome.
+
+        Locks the project row first, so recalculations of the project in other
+        workers queue behind this one and read the opinions only after its
+        result is committed; a slower run over older opinions can never
+        overwrite a newer result. Aggregates the opinions (in the database
+        when an aggregator is configured, otherwise with the calculator), and
+        saves result.
         If no opinions exist, deletes any existing result and returns None.
+        Once committed, the new result (or ``null``) is published to live
+        subscribers of the project.
 
         :param project_id: Project UUID
         :return: CalculationResult if opinions exist, None otherwise
         """
-        opinions = self._get_opinions(project_id)
+        self._lock_project(project_id)
+        result = self._aggregate(project_id)
 
-        if not opinions:
+        if result is None:
             self._delete_result(project_id)
+            self._publisher.publish(project_id, "null")
             logger.info(
                 "Recalculation cleared",
                 extra={"event": "recalculation_cleared", "project_id": str(project_id)},
             )
             return None
 
-        domain_opinions = [
-            DomainExpertOpinion(
-                expert_id=str(op.user_id),
-                opinion=FuzzyTriangleNumber(
-                    lower_bound=op.lower_bound,
-                    peak=op.peak,
-                    upper_bound=op.upper_bound,
-                ),
-            )
-            for op in opinions
-        ]
-
-        result = self._calculator.calculate_compromise(domain_opinions)
-
         project = self._session.get(Project, project_id)
         likert_value = None
         likert_decision = None
@@ -102,19 +168,128 @@ class CalculationService(BaseService):
             likert_value=likert_value,
             likert_decision=likert_decision,
         )
+        # Serialise before commit expires the returned row.
+        payload = CalculationResultResponse.from_model(saved).model_dump_json()
+        self._session.commit()
+        self._publisher.publish(project_id, payload)
         logger.info(
             "Recalculation completed",
             extra={
                 "event": "recalculation_completed",
                 "project_id": str(project_id),
-                "num_experts": len(opinions),
+                "num_experts": result.num_experts,
             },
         )
         return saved
 
+    def _lock_project(self, project_id: UUID) -> None:
+        """Hold the project row until this transaction ends.
+
+        ``FOR NO KEY UPDATE`` on PostgreSQL: it queues other recalculations
+        and snapshot publishes but not opinion inserts, whose foreign key only
+        takes a key-share lock. SQLite admits one writer at a time and fails a
+        write from a stale read, so there it is a plain read.
+
+        :param project_id: Project UUID
+        """
+        self._session.exec(
+            select(Project.id).where(Project.id == project_id).with_for_update(key_share=True)
+        ).first()
+
+    def _aggregate(self, project_id: UUID) -> BeCoMeResult | None:
+        """Compute a project's result from its current opinions.
+
+        :param project_id: Project UUID
+        :return: Result, or None if the project has no opinions
+        """
+        if self._aggregator is not None:
+            with observe_seconds(CALCULATION_DURATION, source="database"):
+                return self._aggregator.aggregate(project_id)
+
+        opinions = self._get_opinions(project_id)
+        if not opinions:
+            return None
+        with observe_seconds(CALCULATION_DURATION, source="project"):
+            return self._calculator.calculate_compromise(self._to_domain(opinions))
+
+    def analyze_influence(self, project_id: UUID) -> InfluenceReport | None:
+        """Rank a project's experts by how much each one moves the best compromise.
+
+        Runs a leave-one-out analysis over the current opinions in O(n log n).
+
+        :param project_id: Project UUID
+        :return: Baseline and ranked influence table, or None with fewer than two opinions
+        """
+        opinions = self._get_opinions(project_id)
+        if len(opinions) < 2:
+            return None
+
+        with observe_seconds(CALCULATION_DURATION, source="influence"):
+            return InfluenceAnalyzer().analyze(self._to_domain(opinions))
+
+    def analyze_factions(
+        self, project_id: UUID, clusters: int | None = None
+    ) -> FactionReport | None:
+        """Split a project's experts into factions by opinion centroid.
+
+        The clustering is optimal for the given number of factions; without
+        one, the number is chosen by BIC.
+
+        :param project_id: Project UUID
+        :param clusters: Number of factions (default: chosen automatically)
+        :return: Faction report, or None if the project has no opinions
+        """
+        opinions = self._get_opinions(project_id)
+        if not opinions:
+            return None
+
+        with observe_seconds(CALCULATION_DURATION, source="factions"):
+            return FactionAnalyzer().analyze(self._to_domain(opinions), clusters)
+
+    def summarize(
+        self, project_id: UUID, statistics: frozenset[Statistic]
+    ) -> StatisticsSummary | None:
+        """Compute extra statistics over a project's current opinions.
+
+        All requested statistics come from one pass and at most one sort.
+
+        :param project_id: Project UUID
+        :param statistics: Statistics to compute
+        :return: Summary, or None if the project has no opinions
+        """
+        opinions = self._get_opinions(project_id)
+        if not opinions:
+            return None
+
+        with observe_seconds(CALCULATION_DURATION, source="statistics"):
+            return StatisticsEngine(statistics).summarize(self._to_domain(opinions))
+
+    @staticmethod
+    def _to_domain(opinions: list[ExpertOpinion]) -> list[DomainExpertOpinion]:
+        """Map stored opinions to domain opinions keyed by user ID."""
+        return [
+            DomainExpertOpinion(
+                expert_id=str(op.user_id),
+                opinion=FuzzyTriangleNumber(
+                    lower_bound=op.lower_bound,
+                    peak=op.peak,
+                    upper_bound=op.upper_bound,
+                ),
+            )
+            for op in opinions
+        ]
+
     def _get_opinions(self, project_id: UUID) -> list[ExpertOpinion]:
-        """Get all opinions for a project."""
-        statement = select(ExpertOpinion).where(ExpertOpinion.project_id == project_id)
+        """Get all opinions for a project in submission order.
+
+        The order decides ties between equal centroids in the median, so it
+        matches the ranking of :class:`DatabaseAggregator`.
+        """
+        statement = (
+            select(ExpertOpinion)
+            .where(ExpertOpinion.project_id == project_id)
+            .order_by(col(ExpertOpinion.created_at), col(ExpertOpinion.id))
+        )
         return list(self._session.exec(statement).all())
 
     def _is_likert_scale(self, project: Project) -> bool:
@@ -131,17 +306,19 @@ class CalculationService(BaseService):
         likert_value: int | None,
         likert_decision: str | None,
     ) -> CalculationResult:
-        """Save or update calculation result using mapper."""
-        existing = self.get_result(project_id)
-
-        if existing:
-            BeCoMeResultMapper.update_db_model(existing, result, likert_value, likert_decision)
-            return self._save_and_refresh(existing)
-
-        db_result = BeCoMeResultMapper.to_db_model(
-            project_id, result, likert_value, likert_decision
+        """Create or overwrite the project's result with one upsert, left uncommitted."""
+        values = BeCoMeResultMapper.to_values(project_id, result, likert_value, likert_decision)
+        statement = (
+            UpsertStatement.build(
+                self._session,
+                CalculationResult,
+                ("project_id",),
+                [name for name in values if name not in ("id", "project_id")],
+            )
+            .values(**values)
+            .returning(CalculationResult)
         )
-        return self._save_and_refresh(db_result)
+        return self._session.scalars(statement, execution_options={"populate_existing": True}).one()
 
     def _delete_result(self, project_id: UUID) -> None:
         """Delete calculation result if exists."""
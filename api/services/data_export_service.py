@@ -1,9 +1,30 @@
-"""GDPR data export business logic service (Article 20 - data portability)."""
+"""GDPR data export business logic service (Article 20 - data portability).
 
+Besides the in-memory :class:`DataExportResponse`, an export can be streamed
+for large accounts, in one of two layouts:
+
+* ``json-stream``: the same JSON document, written section by section.
+* ``zip``: a ZIP archive with ``export_metadata.json``, ``profile.json`` and
+  one NDJSON file per list section (``owned_projects.ndjson``, ...), one item
+  per line.
+
+Streamed sections are read with ``yield_per`` (a server-side cursor on
+PostgreSQL) and written in chunks of about :data:`STREAM_CHUNK_SIZE` bytes,
+so memory stays flat however many projects or opinions the account has.
+"""
+
+import json
 import logging
+import zipfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from enum import StrEnum
+from typing import Any
 from uuid import UUID
 
+from pydantic import BaseModel
 from sqlmodel import col, select
+from sqlmodel.sql.expression import Select
 
 from api.db.models import (
     CalculationResult,
@@ -29,6 +50,124 @@ from api.services.base import BaseService
 
 logger = logging.getLogger("api.service.data_export")
 
+# Rows fetched per round trip while streaming a section.
+STREAM_BATCH_SIZE = 500
+
+# Approximate size of the chunks a streamed export is written in (bytes).
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class DataExportFormat(StrEnum):
+    """Layout of a data export download."""
+
+    JSON = "json"
+    JSON_STREAM = "json-stream"
+    ZIP = "zip"
+
+
+@dataclass(frozen=True)
+class _ExportSection:
+    """One list section of the export: its query and how a row becomes an item.
+
+    :ivar name: Field name in :class:`DataExportResponse` (and NDJSON file stem)
+    :ivar statement: Builds the section's query for a user ID
+    :ivar to_item: Maps one result row (unpacked) to an export item
+    """
+
+    name: str
+    statement: Callable[[UUID], Select[Any]]
+    to_item: Callable[..., BaseModel]
+
+
+def _owned_projects_statement(user_id: UUID) -> Select[Any]:
+    """Projects the user administers with their cached results, oldest first."""
+    return (
+        select(Project, CalculationResult)
+        .join(CalculationResult, col(CalculationResult.project_id) == Project.id, isouter=True)
+        .where(Project.admin_id == user_id)
+        .order_by(col(Project.created_at))
+    )
+
+
+def _memberships_statement(user_id: UUID) -> Select[Any]:
+    """The user's memberships with their projects, by join date."""
+    return (
+        select(ProjectMember, Project)
+        .join(Project, col(ProjectMember.project_id) == Project.id)
+        .where(ProjectMember.user_id == user_id)
+        .order_by(col(ProjectMember.joined_at))
+    )
+
+
+def _opinions_statement(user_id: UUID) -> Select[Any]:
+    """Opinions the user submitted with their projects, by creation date."""
+    return (
+        select(ExpertOpinion, Project)
+        .join(Project, col(ExpertOpinion.project_id) == Project.id)
+        .where(ExpertOpinion.user_id == user_id)
+        .order_by(col(ExpertOpinion.created_at))
+    )
+
+
+def _received_invitations_statement(user_id: UUID) -> Select[Any]:
+    """Pending invitations addressed to the user with project and inviter, oldest first."""
+    return (
+        select(Invitation, Project, User)
+        .join(Project, col(Invitation.project_id) == Project.id)
+        .join(User, col(Invitation.inviter_id) == User.id)
+        .where(Invitation.invitee_id == user_id)
+        .order_by(col(Invitation.created_at))
+    )
+
+
+# In DataExportResponse field order, so a streamed document matches the schema.
+_SECTIONS = (
+    _ExportSection("owned_projects", _owned_projects_statement, ExportOwnedProject.from_model),
+    _ExportSection("memberships", _memberships_statement, ExportMembership.from_model),
+    _ExportSection("opinions", _opinions_statement, ExportOpinion.from_model),
+    _ExportSection(
+        "received_invitations",
+        _received_invitations_statement,
+        ExportReceivedInvitation.from_model,
+    ),
+)
+
+
+class _ChunkSink:
+    """Write-only byte sink drained between writes.
+
+    It has no ``tell``/``seek``, so :class:`zipfile.ZipFile` writes a
+    streamable archive (sizes in data descriptors after each entry).
+    """
+
+    def __init__(self) -> None:
+        """Initialize empty."""
+        self._chunks: list[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        """Buffer bytes.
+
+        :param data: Bytes to append
+        :return: Number of bytes written
+        """
+        self._chunks.append(bytes(data))
+        self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        """Nothing to flush; :meth:`drain` hands the bytes out."""
+
+    def drain(self) -> bytes:
+        """Take the buffered bytes.
+
+        :return: Everything written since the last drain
+        """
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
 
 class DataExportService(BaseService):
     """Assemble a full GDPR data export for a single user account.
@@ -45,90 +184,111 @@ class DataExportService(BaseService):
         :return: DataExportResponse with profile, owned projects, memberships,
             opinions, and received invitations.
         """
-        response = DataExportResponse(
-            export_metadata=ExportMetadata(
-                format_version=EXPORT_FORMAT_VERSION,
-                generated_at=utc_now(),
-                description=EXPORT_DESCRIPTION,
-            ),
-            profile=ExportProfile.from_user(user),
-            owned_projects=self._owned_projects(user.id),
-            memberships=self._memberships(user.id),
-            opinions=self._opinions(user.id),
-            received_invitations=self._received_invitations(user.id),
+        sections = {
+            section.name: [
+                section.to_item(*row)
+                for row in self._session.exec(section.statement(user.id)).all()
+            ]
+            for section in _SECTIONS
+        }
+        response = DataExportResponse.model_validate(
+            {
+                "export_metadata": self._metadata(),
+                "profile": ExportProfile.from_user(user),
+                **sections,
+            }
         )
-        logger.info(
-            "Data export generated",
-            extra={
-                "event": "data_export_generated",
-                "user_id": str(user.id),
-                "owned_projects": len(response.owned_projects),
-                "memberships": len(response.memberships),
-                "opinions": len(response.opinions),
-            },
+        self._log_generated(
+            user, DataExportFormat.JSON, {name: len(items) for name, items in sections.items()}
         )
         return response
 
-    def _owned_projects(self, user_id: UUID) -> list[ExportOwnedProject]:
-        """Load projects the user administers with their cached results.
+    def stream_json(self, user: User) -> Iterator[bytes]:
+        """Write the export document incrementally as JSON.
+
+        The output parses to the same document :meth:`build_export` returns.
 
-        :param user_id: The account holder's ID.
-        :return: Owned projects ordered by creation date, each with its result.
+        :param user: The authenticated account holder.
+        :return: Iterator of JSON chunks
         """
-        statement = (
-            select(Project, CalculationResult)
-            .join(CalculationResult, col(CalculationResult.project_id) == Project.id, isouter=True)
-            .where(Project.admin_id == user_id)
-            .order_by(col(Project.created_at))
-        )
-        rows = self._session.exec(statement).all()
-        return [ExportOwnedProject.from_model(project, result) for project, result in rows]
+        counts: dict[str, int] = {}
+        buffer = bytearray(b'{"export_metadata":')
+        buffer += self._metadata().model_dump_json().encode()
+        buffer += b',"profile":' + ExportProfile.from_user(user).model_dump_json().encode()
+        for section in _SECTIONS:
+            buffer += f",{json.dumps(section.name)}:[".encode()
+            separator = b""
+            for item in self._stream_section(section, user.id, counts):
+                buffer += separator + item.model_dump_json().encode()
+                separator = b","
+                if len(buffer) >= STREAM_CHUNK_SIZE:
+                    yield bytes(buffer)
+                    buffer.clear()
+            buffer += b"]"
+        yield bytes(buffer + b"}")
+        self._log_generated(user, DataExportFormat.JSON_STREAM, counts)
 
-    def _memberships(self, user_id: UUID) -> list[ExportMembership]:
-        """Load the user's project memberships with their projects.
+    def stream_zip(self, user: User) -> Iterator[bytes]:
+        """Write the export as a ZIP archive with one NDJSON file per section.
 
-        :param user_id: The account holder's ID.
-        :return: Memberships ordered by join date.
+        :param user: The authenticated account holder.
+        :return: Iterator of ZIP archive chunks
         """
-        statement = (
-            select(ProjectMember, Project)
-            .join(Project, col(ProjectMember.project_id) == Project.id)
-            .where(ProjectMember.user_id == user_id)
-            .order_by(col(ProjectMember.joined_at))
-        )
-        rows = self._session.exec(statement).all()
-        return [ExportMembership.from_model(member, project) for member, project in rows]
+        counts: dict[str, int] = {}
+        sink = _ChunkSink()
+        with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_DEFLATED) as archive:  # type: ignore[call-overload]
+            archive.writestr("export_metadata.json", self._metadata().model_dump_json())
+            archive.writestr("profile.json", ExportProfile.from_user(user).model_dump_json())
+            for section in _SECTIONS:
+                with archive.open(f"{section.name}.ndjson", "w") as entry:
+                    for item in self._stream_section(section, user.id, counts):
+                        entry.write(item.model_dump_json().encode() + b"\n")
+                        if sink.size >= STREAM_CHUNK_SIZE:
+                            yield sink.drain()
+        yield sink.drain()
+        self._log_generated(user, DataExportFormat.ZIP, counts)
 
-    def _opinions(self, user_id: UUID) -> list[ExportOpinion]:
-        """Load the opinions the user submitted with their projects.
+    def _stream_section(
+        self, section: _ExportSection, user_id: UUID, counts: dict[str, int]
+    ) -> Iterator[BaseModel]:
+        """Read a section batch by batch and map its rows to export items.
 
-        :param user_id: The account holder's ID.
-        :return: Opinions ordered by creation date.
+        :param section: Section to read
+        :param user_id: The account holder's ID
+        :param counts: Receives the number of items under the section's name
+        :return: Iterator of export items
         """
-        statement = (
-            select(ExpertOpinion, Project)
-            .join(Project, col(ExpertOpinion.project_id) == Project.id)
-            .where(ExpertOpinion.user_id == user_id)
-            .order_by(col(ExpertOpinion.created_at))
+        counts[section.name] = 0
+        statement = section.statement(user_id).execution_options(yield_per=STREAM_BATCH_SIZE)
+        for row in self._session.exec(statement):
+            counts[section.name] += 1
+            yield section.to_item(*row)
+
+    @staticmethod
+    def _metadata() -> ExportMetadata:
+        """Describe the export format and when it was generated."""
+        return ExportMetadata(
+            format_version=EXPORT_FORMAT_VERSION,
+            generated_at=utc_now(),
+            description=EXPORT_DESCRIPTION,
         )
-        rows = self._session.exec(statement).all()
-        return [ExportOpinion.from_model(opinion, project) for opinion, project in rows]
 
-    def _received_invitations(self, user_id: UUID) -> list[ExportReceivedInvitation]:
-        """Load pending invitations addressed to the user with project and inviter.
+    @staticmethod
+    def _log_generated(user: User, export_format: DataExportFormat, counts: dict[str, int]) -> None:
+        """Record that an export was generated, with its section sizes.
 
-        :param user_id: The account holder's ID.
-        :return: Received invitations ordered by creation date.
+        :param user: The account holder
+        :param export_format: Layout the export was written in
+        :param counts: Number of items per section name
         """
-        statement = (
-            select(Invitation, Project, User)
-            .join(Project, col(Invitation.project_id) == Project.id)
-            .join(User, col(Invitation.inviter_id) == User.id)
-            .where(Invitation.invitee_id == user_id)
-            .order_by(col(Invitation.created_at))
+        logger.info(
+            "Data export generated",
+            extra={
+                "event": "data_export_generated",
+                "user_id": str(user.id),
+                "format": export_format.value,
+                "owned_projects": counts["owned_projects"],
+                "memberships": counts["memberships"],
+                "opinions": counts["opinions"],
+            },
         )
-        rows = self._session.exec(statement).all()
-        return [
-            ExportReceivedInvitation.from_model(invitation, project, inviter)
-            for invitation, project, inviter in rows
-        ]
@@ -0,0 +1,140 @@
+"""Database-side BeCoMe aggregation.
+
+Computes a project's arithmetic mean and median with one SQL statement, so
+only the two final triples and the opinion count leave the database instead
+of every opinion row. The best compromise and maximum error follow from those
+triples exactly as in :meth:`BeCoMeResult.from_calculations`.
+
+The median reproduces :class:`OddMedianStrategy` / :class:`EvenMedianStrategy`,
+tie-breaking included:
+
+1. Opinions are ranked by centroid ``(lower_bound + peak + upper_bound) / 3``;
+   equal centroids keep the order the Python path reads them in
+   (``created_at``, then ``id``), like its stable sort.
+2. The median centroid is the centroid of the middle rank, or the mean of the
+   two middle ranks' centroids for an even count.
+3. The opinions closest to the median centroid, earliest rank first on equal
+   distance, are picked: one for an odd count, two (averaged) for an even one.
+
+The statement uses only window functions and aggregates that PostgreSQL and
+SQLite (3.25+) share, so the same query serves both. Means are SQL ``AVG``,
+which may differ from the Python ``statistics.mean`` in the last bits; the
+median picks the same opinions and is exact.
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Float, Select, and_, func, literal, select, true
+from sqlmodel import Session, col
+
+from api.db.models import ExpertOpinion
+from src.models.become_result import BeCoMeResult
+from src.models.fuzzy_number import FuzzyTriangleNumber
+
+
+class DatabaseAggregator:
+    """Aggregates a project's opinions inside the database."""
+
+    def __init__(self, session: Session) -> None:
+        """Initialize with the session whose database runs the aggregation.
+
+        :param session: SQLModel session for database operations
+        """
+        self._session = session
+
+    def aggregate(self, project_id: UUID) -> BeCoMeResult | None:
+        """Compute a project's BeCoMe result in one query.
+
+        :param project_id: Project UUID
+        :return: Result, or None if the project has no opinions
+        """
+        row = self._session.execute(self.statement(project_id)).one()
+        if not row.num_experts:
+            return None
+        return BeCoMeResult.from_calculations(
+            arithmetic_mean=FuzzyTriangleNumber(row.mean_lower, row.mean_peak, row.mean_upper),
+            median=FuzzyTriangleNumber(row.median_lower, row.median_peak, row.median_upper),
+            num_experts=row.num_experts,
+        )
+
+    @staticmethod
+    def statement(project_id: UUID) -> Select[Any]:
+        """Build the aggregation query for a project.
+
+        :param project_id: Project UUID
+        :return: Select yielding one row: count, mean triple and median triple
+        """
+        lower, peak, upper = (
+            col(ExpertOpinion.lower_bound),
+            col(ExpertOpinion.peak),
+            col(ExpertOpinion.upper_bound),
+        )
+        centroid = (lower + peak + upper) / literal(3.0, Float)
+        ranked = (
+            select(
+                lower.label("lower_bound"),
+                peak.label("peak"),
+                upper.label("upper_bound"),
+                centroid.label("centroid"),
+                func.row_number()
+                .over(
+                    order_by=(
+                        centroid,
+                        col(ExpertOpinion.created_at),
+                        col(ExpertOpinion.id),
+                    )
+                )
+                .label("rank"),
+                func.count().over().label("n"),
+            )
+            .where(col(ExpertOpinion.project_id) == project_id)
+            .cte("ranked")
+        )
+        # The middle rank of an odd count satisfies 2 * rank == n + 1; the two
+        # middle ranks of an even count satisfy 2 * rank == n and n + 2.
+        middle = (
+            select(
+                ((func.min(ranked.c.centroid) + func.max(ranked.c.centroid)) / 2.0).label(
+                    "centroid"
+                )
+            )
+            .where(and_(2 * ranked.c.rank >= ranked.c.n, 2 * ranked.c.rank <= ranked.c.n + 2))
+            .cte("middle")
+        )
+        picked = (
+            select(
+                ranked.c.lower_bound,
+                ranked.c.peak,
+                ranked.c.upper_bound,
+                ranked.c.n,
+                func.row_number()
+                .over(order_by=(func.abs(ranked.c.centroid - middle.c.centroid), ranked.c.rank))
+                .label("pick"),
+            )
+            .select_from(ranked.join(middle, true()))
+            .cte("picked")
+        )
+        # Min and max of one or two values average exactly like FuzzyTriangleNumber.average.
+        median_rows = (
+            select(
+                ((func.min(picked.c.lower_bound) + func.max(picked.c.lower_bound)) / 2.0).label(
+                    "median_lower"
+                ),
+                ((func.min(picked.c.peak) + func.max(picked.c.peak)) / 2.0).label("median_peak"),
+                ((func.min(picked.c.upper_bound) + func.max(picked.c.upper_bound)) / 2.0).label(
+                    "median_upper"
+                ),
+            )
+            .where(picked.c.pick <= 2 - picked.c.n % 2)
+            .cte("median")
+        )
+        return select(
+            func.count().label("num_experts"),
+            func.avg(ranked.c.lower_bound).label("mean_lower"),
+            func.avg(ranked.c.peak).label("mean_peak"),
+            func.avg(ranked.c.upper_bound).label("mean_upper"),
+            func.max(median_rows.c.median_lower).label("median_lower"),
+            func.max(median_rows.c.median_peak).label("median_peak"),
+            func.max(median_rows.c.median_upper).label("median_upper"),
+        ).select_from(ranked.join(median_rows, true()))
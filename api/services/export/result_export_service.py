@@ -8,6 +8,7 @@ from sqlmodel import select
 
 from api.db.models import CalculationResult, Project, User
 from api.db.utils import utc_now
+from api.metrics import EXPORT_RENDER_DURATION, observe_seconds
 from api.services.base import BaseService
 from api.services.export.data import (
     ExportedFile,
@@ -49,7 +50,8 @@ class ResultExportService(BaseService):
             return None
         data = self._assemble(project, result)
         renderer = get_renderer(export_format)
-        content = renderer.render(data, get_labels(lang))
+        with observe_seconds(EXPORT_RENDER_DURATION, format=export_format.value):
+            content = renderer.render(data, get_labels(lang))
         filename = f"{self._slug(project.name)}-results.{renderer.extension}"
         logger.info(
             "Result export generated",
@@ -1,20 +1,23 @@
 """Invitation business logic service for email-based invitations."""
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlmodel import col, select
 
 from api.db.models import Invitation, MemberRole, Project, ProjectMember, User
+from api.db.utils import utc_now
 from api.exceptions import (
     AlreadyInvitedError,
     InvitationNotFoundError,
     UserAlreadyMemberError,
     UserNotFoundForInvitationError,
 )
+from api.schemas.internal import BulkInviteOutcome, BulkInviteStatus
 from api.services.base import BaseService
-from api.services.query_helpers import MemberCountSubquery
+from api.services.query_helpers import InsertStatement, MemberCountSubquery
 
 logger = logging.getLogger("api.service.invitation")
 
@@ -90,22 +93,122 @@ class InvitationService(BaseService):
         )
         return saved, invitee
 
+    def invite_many(
+        self,
+        project_id: UUID,
+        inviter_id: UUID,
+        invitee_emails: Sequence[str],
+    ) -> list[BulkInviteOutcome]:
+        """Invite many registered users to a project at once.
+
+        Emails are resolved, and existing memberships and pending invitations
+        found, by one query each over the whole list; the new invitations are
+        then stored by a single ``INSERT``. Unlike :meth:`invite_by_email`,
+        an email that cannot be invited is reported instead of raising, so one
+        unknown address does not fail the batch. An invitation created
+        concurrently for the same user is skipped by the insert and reported
+        as already invited.
+
+        :param project_id: ID of the project to invite to
+        :param inviter_id: ID of the user sending the invitations
+        :param invitee_emails: Emails of the users to invite (case-insensitive)
+        :return: One outcome per distinct email, in request order
+        """
+        emails = list(dict.fromkeys(email.lower() for email in invitee_emails))
+        users = dict(
+            self._session.exec(select(User.email, User.id).where(col(User.email).in_(emails))).all()
+        )
+        user_ids = list(users.values())
+        members = set(
+            self._session.exec(
+                select(ProjectMember.user_id).where(
+                    ProjectMember.project_id == project_id,
+                    col(ProjectMember.user_id).in_(user_ids),
+                )
+            ).all()
+        )
+        invited = set(
+            self._session.exec(
+                select(Invitation.invitee_id).where(
+                    Invitation.project_id == project_id,
+                    col(Invitation.invitee_id).in_(user_ids),
+                )
+            ).all()
+        )
+        taken = members | invited
+        candidates = [
+            users[email] for email in emails if email in users and users[email] not in taken
+        ]
+        created = self._insert_invitations(project_id, inviter_id, candidates)
+
+        outcomes = []
+        for email in emails:
+            user_id = users.get(email)
+            if user_id is None:
+                outcome = BulkInviteOutcome(email, BulkInviteStatus.NOT_FOUND)
+            elif user_id in members:
+                outcome = BulkInviteOutcome(email, BulkInviteStatus.ALREADY_MEMBER)
+            elif user_id in created:
+                outcome = BulkInviteOutcome(email, BulkInviteStatus.INVITED, created[user_id])
+            else:
+                outcome = BulkInviteOutcome(email, BulkInviteStatus.ALREADY_INVITED)
+            outcomes.append(outcome)
+        logger.info(
+            "Invitations created in bulk",
+            extra={
+                "event": "invitations_bulk_created",
+                "project_id": str(project_id),
+                "inviter_id": str(inviter_id),
+                "requested_count": len(emails),
+                "invited_count": len(created),
+            },
+        )
+        return outcomes
+
+    def _insert_invitations(
+        self, project_id: UUID, inviter_id: UUID, invitee_ids: list[UUID]
+    ) -> dict[UUID, UUID]:
+        """Store invitations for many users with one statement and commit.
+
+        :param project_id: ID of the project to invite to
+        :param inviter_id: ID of the user sending the invitations
+        :param invitee_ids: Users to invite, none a member or invited when read
+        :return: New invitation ID per invitee actually inserted
+        """
+        if not invitee_ids:
+            return {}
+        now = utc_now()
+        rows = [
+            {
+                "id": uuid4(),
+                "project_id": project_id,
+                "invitee_id": invitee_id,
+                "inviter_id": inviter_id,
+                "created_at": now,
+            }
+            for invitee_id in invitee_ids
+        ]
+        table = Invitation.__table__  # type: ignore[attr-defined]
+        statement = (
+            InsertStatement.build(self._session, table)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["project_id", "invitee_id"])
+            .returning(table.c.invitee_id, table.c.id)
+        )
+        created: dict[UUID, UUID] = dict(self._session.execute(statement).tuples().all())
+        self._session.commit()
+        return created
+
     def get_user_invitations(self, user_id: UUID) -> list[InvitationWithDetails]:
         """Get all pending invitations for a user.
 
         :param user_id: ID of the user
         :return: List of invitations with project and inviter details
         """
-        member_count_subquery = MemberCountSubquery.build()
-
         statement = (
-            select(Invitation, Project, User, member_count_subquery.c.member_count)
+            select(Invitation, Project, User, MemberCountSubquery.build())
             .join(Project, Invitation.project_id == Project.id)  # type: ignore[arg-type]
             .join(User, Invitation.inviter_id == User.id)  # type: ignore[arg-type]
-            .join(
-                member_count_subquery,
-                member_count_subquery.c.project_id == Project.id,
-            )
             .where(Invitation.invitee_id == user_id)
             .order_by(col(Invitation.created_at).desc())
         )
@@ -0,0 +1,282 @@
+"""Background maintenance: periodic, batched purges of expired data.
+
+Expired password reset tokens and token blacklist entries are never read
+again, but nothing else removes them. :class:`MaintenanceScheduler` runs from
+the application lifespan and, every interval, gives each
+:class:`MaintenanceJob` a turn:
+
+* **Batched and rate limited.** A job deletes at most ``batch_size`` rows per
+  call and is called again, after a pause, only while it keeps filling whole
+  batches; each statement holds its locks briefly and the backlog of a long
+  outage drains without starving request traffic.
+* **Leader election.** A job over shared data (database tables) runs on one
+  worker at a time. Before every batch the worker takes or renews the job's
+  lease in ``maintenance_leases`` (:class:`LeaseElection`), an atomic upsert
+  that succeeds only when the lease is free, expired or already its own.
+  Other workers skip the run; when the leader exits its lease expires and
+  another worker takes over. Jobs over per-process state (the in-memory token
+  blacklist) run in every worker.
+* **Observable.** Rows purged, run outcomes and run durations are exported as
+  Prometheus metrics, and every run that purged rows or failed is logged.
+
+A new kind of TTL data becomes one more entry in :func:`default_jobs`.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from sqlalchemy import Engine, delete
+from sqlmodel import Session
+
+from api.auth.token_blacklist import TokenBlacklist
+from api.config import Settings
+from api.db.engine import get_engine
+from api.db.models import MaintenanceLease
+from api.metrics import MAINTENANCE_JOB_DURATION, MAINTENANCE_ROWS_PURGED, MAINTENANCE_RUNS
+from api.services.password_reset_service import PasswordResetService
+from api.services.query_helpers import InsertStatement
+
+logger = logging.getLogger("api.service.maintenance")
+
+_LEASES = MaintenanceLease.__table__  # type: ignore[attr-defined]
+
+
+@dataclass(frozen=True)
+class MaintenanceJob:
+    """A periodic purge.
+
+    :ivar name: Job name (metric label, lease key)
+    :ivar purge: Deletes up to the given number of expired rows, returns how many it deleted
+    :ivar shared: Whether the data is shared by all workers (run by the lease
+        holder only) rather than held per process (run by every worker)
+    """
+
+    name: str
+    purge: Callable[[int], int]
+    shared: bool = True
+
+
+class LeaseElection:
+    """Per-job leases in the database deciding which worker runs a job."""
+
+    def __init__(
+        self,
+        lease_seconds: float,
+        engine: Engine | None = None,
+        holder: str | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize for this worker.
+
+        :param lease_seconds: How long a taken or renewed lease lasts
+        :param engine: Engine holding ``maintenance_leases``; the application
+            engine when omitted
+        :param holder: Identity of this worker (random when omitted)
+        :param clock: Wall clock in epoch seconds, shared by all workers
+        """
+        self._lease_seconds = lease_seconds
+        self._engine = engine
+        self.holder = holder or uuid.uuid4().hex
+        self._clock = clock
+        self._held: set[str] = set()
+
+    @property
+    def engine(self) -> Engine:
+        """Engine the leases live in, resolved on first use."""
+        if self._engine is None:
+            self._engine = get_engine()
+        return self._engine
+
+    def acquire(self, job: str) -> bool:
+        """Take or renew a job's lease.
+
+        :param job: Job name
+        :return: True if this worker holds the lease until it next expires
+        """
+        now = self._clock()
+        stmt = InsertStatement.build(self.engine, _LEASES).values(
+            job=job, holder=self.holder, expires_at=now + self._lease_seconds
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[_LEASES.c.job],
+            set_={"holder": stmt.excluded.holder, "expires_at": stmt.excluded.expires_at},
+            where=(_LEASES.c.expires_at <= now) | (_LEASES.c.holder == self.holder),
+        )
+        with self.engine.begin() as conn:
+            acquired = conn.execute(stmt).rowcount == 1
+        if acquired:
+            self._held.add(job)
+        else:
+            self._held.discard(job)
+        return acquired
+
+    def release(self) -> None:
+        """Give up every lease this worker holds, so another can take over at once."""
+        if not self._held:
+            return
+        with self.engine.begin() as conn:
+            conn.execute(delete(_LEASES).where(_LEASES.c.holder == self.holder))
+        self._held.clear()
+
+
+class MaintenanceScheduler:
+    """Runs maintenance jobs periodically on the event loop.
+
+    Job calls block on the database, so they run in worker threads.
+    """
+
+    def __init__(
+        self,
+        jobs: list[MaintenanceJob],
+        election: LeaseElection,
+        interval: float,
+        batch_size: int,
+        batch_pause: float,
+    ) -> None:
+        """Initialize stopped.
+
+        :param jobs: Jobs to run, in order, every interval
+        :param election: Leases for jobs over shared data
+        :param interval: Seconds between runs (the first run waits one interval)
+        :param batch_size: Most rows a job deletes per call
+        :param batch_pause: Seconds to wait between two batches of one job
+        """
+        self._jobs = jobs
+        self._election = election
+        self._interval = interval
+        self._batch_size = batch_size
+        self._batch_pause = batch_pause
+        self._stopping = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the periodic loop on the running event loop."""
+        self._stopping.clear()
+        self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        """Stop the loop, waiting for an in-flight batch, and release held leases."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        try:
+            await asyncio.to_thread(self._election.release)
+        except Exception:
+            logger.warning(
+                "Could not release maintenance leases; they expire on their own",
+                extra={"event": "maintenance_lease_release_failed"},
+                exc_info=True,
+            )
+
+    async def run_once(self) -> dict[str, int]:
+        """Give every job one run.
+
+        :return: Rows purged per job name
+        """
+        return {job.name: await self._run(job) for job in self._jobs}
+
+    async def _loop(self) -> None:
+        """Run all jobs every interval until stopped."""
+        while not await self._wait(self._interval):
+            await self.run_once()
+
+    async def _run(self, job: MaintenanceJob) -> int:
+        """Purge one job's expired rows batch by batch.
+
+        Never raises: a failing job is logged and counted, and the scheduler
+        moves on to the next one.
+
+        :param job: Job to run
+        :return: Rows purged in this run
+        """
+        started = time.perf_counter()
+        purged = 0
+        outcome = "completed"
+        try:
+            while True:
+                if job.shared and not await asyncio.to_thread(self._election.acquire, job.name):
+                    outcome = "skipped"
+                    break
+                removed = await asyncio.to_thread(job.purge, self._batch_size)
+                purged += removed
+                MAINTENANCE_ROWS_PURGED.labels(job=job.name).inc(removed)
+                if removed < self._batch_size or await self._wait(self._batch_pause):
+                    break
+        except Exception:
+            outcome = "failed"
+            logger.exception(
+                "Maintenance job failed",
+                extra={"event": "maintenance_job_failed", "job": job.name, "purged": purged},
+            )
+        MAINTENANCE_RUNS.labels(job=job.name, outcome=outcome).inc()
+        duration = time.perf_counter() - started
+        MAINTENANCE_JOB_DURATION.labels(job=job.name).observe(duration)
+        if purged:
+            logger.info(
+                "Maintenance job purged expired rows",
+                extra={
+                    "event": "maintenance_job_completed",
+                    "job": job.name,
+                    "purged": purged,
+                    "duration_ms": round(duration * 1000, 1),
+                },
+            )
+        return purged
+
+    async def _wait(self, seconds: float) -> bool:
+        """Sleep, waking early on stop.
+
+        :param seconds: Time to wait
+        :return: True if the scheduler is stopping
+        """
+        with contextlib.suppress(TimeoutError):
+            await asyncio.wait_for(self._stopping.wait(), timeout=seconds)
+        return self._stopping.is_set()
+
+
+def _purge_reset_tokens(limit: int) -> int:
+    """Delete a batch of expired password reset tokens.
+
+    :param limit: Most tokens to delete
+    :return: Number of tokens deleted
+    """
+    with Session(get_engine()) as session:
+        return PasswordResetService(session).purge_expired(limit)
+
+
+def default_jobs() -> list[MaintenanceJob]:
+    """List the application's maintenance jobs.
+
+    :return: Jobs purging expired reset tokens and token blacklist entries
+    """
+    return [
+        MaintenanceJob("password_reset_tokens", _purge_reset_tokens),
+        MaintenanceJob("token_blacklist", TokenBlacklist.cleanup_expired, shared=False),
+    ]
+
+
+def create_maintenance_scheduler(settings: Settings) -> MaintenanceScheduler | None:
+    """Build the scheduler configured by the settings.
+
+    :param settings: Application settings
+    :return: Scheduler over :func:`default_jobs`, or None when maintenance is disabled
+    """
+    interval = settings.maintenance_interval_seconds
+    if not interval:
+        return None
+    # A leader that stops renewing is replaced after two missed runs.
+    election = LeaseElection(lease_seconds=2 * interval)
+    return MaintenanceScheduler(
+        default_jobs(),
+        election,
+        interval=interval,
+        batch_size=settings.maintenance_batch_size,
+        batch_pause=settings.maintenance_batch_pause_seconds,
+    )
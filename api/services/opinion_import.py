@@ -0,0 +1,245 @@
+"""Parsing and validation of bulk opinion imports (CSV, JSON, NDJSON).
+
+Admins bring offline survey data as one file with a record per expert:
+``email``, ``position``, ``lower_bound``, ``peak`` and ``upper_bound``. The
+file is parsed into :class:`ImportRow` records, and every problem is reported
+against its 1-based record number (row 1 is the first record after the CSV
+header, the first array element, or the first non-blank NDJSON line) so the
+admin can fix all of them in one pass. Value checks run over the whole file
+at once as array operations.
+"""
+
+import csv
+import io
+import json
+import math
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from enum import StrEnum
+
+import numpy as np
+
+from api.utils.sanitization import sanitize_text
+
+# Largest import accepted in one request.
+MAX_IMPORT_ROWS = 10_000
+MAX_IMPORT_BYTES = 4 * 1024 * 1024
+
+IMPORT_FIELDS = ("email", "position", "lower_bound", "peak", "upper_bound")
+_POSITION_MAX_LENGTH = 255
+
+
+class ImportFormat(StrEnum):
+    """File format of a bulk opinion import, keyed by its media type."""
+
+    CSV = "text/csv"
+    JSON = "application/json"
+    NDJSON = "application/x-ndjson"
+
+    @classmethod
+    def from_content_type(cls, content_type: str | None) -> "ImportFormat | None":
+        """Resolve a ``Content-Type`` header, ignoring parameters such as charset.
+
+        :param content_type: Header value
+        :return: Matching format, or None if unsupported
+        """
+        media_type = (content_type or "").split(";", 1)[0].strip().lower()
+        if media_type == "application/jsonl":
+            return cls.NDJSON
+        try:
+            return cls(media_type)
+        except ValueError:
+            return None
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRow:
+    """One parsed opinion record of an import file."""
+
+    row: int
+    email: str
+    position: str
+    lower_bound: float
+    peak: float
+    upper_bound: float
+
+
+@dataclass(frozen=True, slots=True)
+class ImportRowError:
+    """A problem with one record (row 0 means the file as a whole)."""
+
+    row: int
+    message: str
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedImport:
+    """Records parsed from an import file and the records that could not be."""
+
+    rows: list[ImportRow]
+    errors: list[ImportRowError]
+
+
+@dataclass(frozen=True, slots=True)
+class ImportResult:
+    """Outcome of a bulk import: counts when stored, errors when rejected."""
+
+    created: int
+    updated: int
+    errors: list[ImportRowError]
+
+
+def parse_import(content: bytes, import_format: ImportFormat) -> ParsedImport:
+    """Parse an import file into opinion records.
+
+    :param content: Raw file content (UTF-8)
+    :param import_format: Format of the content
+    :return: Parsed records and per-record errors
+    """
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        return _file_error("File must be UTF-8 encoded")
+
+    errors: list[ImportRowError] = []
+    if import_format is ImportFormat.CSV:
+        reader = csv.DictReader(io.StringIO(text))
+        missing = [name for name in IMPORT_FIELDS if name not in (reader.fieldnames or ())]
+        if missing:
+            return _file_error(f"CSV header is missing columns: {', '.join(missing)}")
+        records: list[tuple[int, object]] = list(enumerate(reader, start=1))
+    elif import_format is ImportFormat.JSON:
+        try:
+            document = json.loads(text)
+        except json.JSONDecodeError as exc:
+            return _file_error(f"Invalid JSON: {exc.msg}")
+        if not isinstance(document, list):
+            return _file_error("JSON import must be an array of objects")
+        records = list(enumerate(document, start=1))
+    else:
+        records = []
+        for number, line in enumerate(
+            (line for line in text.splitlines() if line.strip()), start=1
+        ):
+            try:
+                records.append((number, json.loads(line)))
+            except json.JSONDecodeError as exc:
+                errors.append(ImportRowError(number, f"Invalid JSON: {exc.msg}"))
+
+    return _collect(records, errors)
+
+
+def validate_rows(
+    rows: Sequence[ImportRow], scale_min: float, scale_max: float
+) -> list[ImportRowError]:
+    """Check every record's fuzzy number against the project scale at once.
+
+    Applies the rules of ``validate_fuzzy_constraints`` and
+    ``OpinionService.validate_values_in_range`` to all records as array
+    operations instead of one record at a time.
+
+    :param rows: Parsed records
+    :param scale_min: Project scale minimum
+    :param scale_max: Project scale maximum
+    :return: One error per failing record, in record order
+    """
+    if not rows:
+        return []
+    values = np.array(
+        [(row.lower_bound, row.peak, row.upper_bound) for row in rows], dtype=np.float64
+    )
+    finite = np.isfinite(values).all(axis=1)
+    ordered = (values[:, 0] <= values[:, 1]) & (values[:, 1] <= values[:, 2])
+    in_scale = ((values >= scale_min) & (values <= scale_max)).all(axis=1)
+
+    failing = np.flatnonzero(~(finite & ordered & in_scale)).tolist()
+    errors = []
+    for row in (rows[index] for index in failing):
+        bounds = (row.lower_bound, row.peak, row.upper_bound)
+        if not all(math.isfinite(value) for value in bounds):
+            message = "Values must be finite (no NaN or infinity)"
+        elif not row.lower_bound <= row.peak <= row.upper_bound:
+            message = (
+                f"Must satisfy: lower <= peak <= upper. "
+                f"Got: {row.lower_bound}, {row.peak}, {row.upper_bound}"
+            )
+        else:
+            message = f"All values must be within project scale [{scale_min}, {scale_max}]"
+        errors.append(ImportRowError(row.row, message))
+    return errors
+
+
+def _file_error(message: str) -> ParsedImport:
+    """Build a parse result that rejects the whole file."""
+    return ParsedImport(rows=[], errors=[ImportRowError(0, message)])
+
+
+def _collect(records: list[tuple[int, object]], errors: list[ImportRowError]) -> ParsedImport:
+    """Turn decoded records into rows, sanitising each distinct position once.
+
+    :param records: (record number, decoded record) pairs
+    :param errors: Errors already found while decoding records
+    :return: Parsed rows and all errors, sorted by record number
+    """
+    if len(records) + len(errors) > MAX_IMPORT_ROWS:
+        return _file_error(f"Import is limited to {MAX_IMPORT_ROWS} records")
+
+    parsed = ParsedImport(rows=[], errors=errors)
+
+    # Survey files repeat a handful of positions; HTML stripping is the slow step.
+    sanitized: dict[str, str] = {}
+    for number, record in records:
+        row = _parse_record(number, record, sanitized)
+        if isinstance(row, ImportRowError):
+            parsed.errors.append(row)
+        else:
+            parsed.rows.append(row)
+    parsed.errors.sort(key=lambda error: error.row)
+    return parsed
+
+
+def _parse_record(
+    number: int, record: object, sanitized: dict[str, str]
+) -> ImportRow | ImportRowError:
+    """Parse one decoded record.
+
+    :param number: 1-based record number
+    :param record: Decoded record (dict from CSV or JSON)
+    :param sanitized: Cache of sanitised positions
+    :return: Parsed row, or the reason it was rejected
+    """
+    if not isinstance(record, Mapping):
+        return ImportRowError(number, "Record must be an object")
+    missing = [name for name in IMPORT_FIELDS if record.get(name) in (None, "")]
+    if missing:
+        return ImportRowError(number, f"Missing fields: {', '.join(missing)}")
+
+    email, position = record["email"], record["position"]
+    if not isinstance(email, str) or not isinstance(position, str):
+        return ImportRowError(number, "email and position must be strings")
+    if position not in sanitized:
+        sanitized[position] = sanitize_text(position).strip()
+    clean_position = sanitized[position]
+    if not clean_position:
+        return ImportRowError(number, "Position must not be empty after sanitization")
+    if len(clean_position) > _POSITION_MAX_LENGTH:
+        return ImportRowError(number, f"Position must be at most {_POSITION_MAX_LENGTH} characters")
+
+    numbers = []
+    for name in ("lower_bound", "peak", "upper_bound"):
+        value = record[name]
+        if isinstance(value, bool) or not isinstance(value, str | int | float):
+            return ImportRowError(number, f"{name} must be a number")
+        try:
+            numbers.append(float(value))
+        except (ValueError, OverflowError):
+            return ImportRowError(number, f"{name} must be a number")
+
+    return ImportRow(
+        row=number,
+        email=email.strip().lower(),
+        position=clean_position,
+        lower_bound=numbers[0],
+        peak=numbers[1],
+        upper_bound=numbers[2],
+    )
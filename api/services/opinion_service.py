@@ -1,18 +1,30 @@
 """Expert opinion business logic service."""
 
 import logging
-from uuid import UUID
+from uuid import UUID, uuid4
 
 from sqlalchemy import func
 from sqlmodel import col, select
 
-from api.db.models import ExpertOpinion, Project, User
+from api.db.models import ExpertOpinion, Project, ProjectMember, User
+from api.db.utils import utc_now
 from api.exceptions import OpinionNotFoundError, ValuesOutOfRangeError
-from api.schemas.internal import OpinionWithUser, UpsertResult
+from api.schemas.internal import ListingVersion, OpinionWithUser, UpsertResult
 from api.services.base import BaseService
+from api.services.opinion_import import (
+    ImportResult,
+    ImportRowError,
+    ParsedImport,
+    validate_rows,
+)
+from api.services.query_helpers import UpsertStatement
 
 logger = logging.getLogger("api.service.opinion")
 
+# Unique key of an opinion and the columns an upsert overwrites.
+_OPINION_KEY_COLUMNS = ("project_id", "user_id")
+_OPINION_VALUE_COLUMNS = ("position", "lower_bound", "peak", "upper_bound", "updated_at")
+
 
 class OpinionService(BaseService):
     """Service for expert opinion operations."""
@@ -32,6 +44,26 @@ class OpinionService(BaseService):
         results = self._session.exec(statement).all()
         return [OpinionWithUser(opinion=opinion, user=user) for opinion, user in results]
 
+    def get_opinions_version(self, project_id: UUID) -> ListingVersion:
+        """Get the version of a project's opinion listing in one aggregate query.
+
+        Covers the opinions and the profiles of their authors.
+
+        :param project_id: Project UUID
+        :return: Opinion count and newest opinion or author update
+        """
+        statement = (
+            select(
+                func.count(),
+                func.max(ExpertOpinion.updated_at),
+                func.max(User.updated_at),
+            )
+            .select_from(ExpertOpinion)
+            .join(User, ExpertOpinion.user_id == User.id)  # type: ignore[arg-type]
+            .where(ExpertOpinion.project_id == project_id)
+        )
+        return ListingVersion.of(*self._session.exec(statement).one())
+
     def get_user_opinion(self, project_id: UUID, user_id: UUID) -> ExpertOpinion | None:
         """Get user's opinion for a project.
 
@@ -53,35 +85,48 @@ class OpinionService(BaseService):
         lower_bound: float,
         peak: float,
         upper_bound: float,
+        commit: bool = True,
     ) -> UpsertResult:
         """Create or update user's opinion for a project.
 
+        Issues a single ``INSERT ... ON CONFLICT DO UPDATE ... RETURNING``. A
+        created opinion is recognised by its untouched ``created_at``, which
+        an update keeps while stamping ``updated_at``.
+
         :param project_id: Project UUID
         :param user_id: User UUID
         :param position: Expert's position/role
         :param lower_bound: Fuzzy number lower bound
         :param peak: Fuzzy number peak
         :param upper_bound: Fuzzy number upper bound
+        :param commit: Commit at once; pass False to leave the write in the
+            open transaction for the recalculation to commit
         :return: UpsertResult with opinion and creation flag
         """
-        existing = self.get_user_opinion(project_id, user_id)
-
-        if existing:
-            existing.position = position
-            existing.lower_bound = lower_bound
-            existing.peak = peak
-            existing.upper_bound = upper_bound
-            result = UpsertResult(opinion=self._save_and_refresh(existing), is_new=False)
-        else:
-            opinion = ExpertOpinion(
+        now = utc_now()
+        statement = (
+            UpsertStatement.build(
+                self._session, ExpertOpinion, _OPINION_KEY_COLUMNS, _OPINION_VALUE_COLUMNS
+            )
+            .values(
+                id=uuid4(),
                 project_id=project_id,
                 user_id=user_id,
                 position=position,
                 lower_bound=lower_bound,
                 peak=peak,
                 upper_bound=upper_bound,
+                created_at=now,
+                updated_at=now,
             )
-            result = UpsertResult(opinion=self._save_and_refresh(opinion), is_new=True)
+            .returning(ExpertOpinion)
+        )
+        opinion = self._session.scalars(
+            statement, execution_options={"populate_existing": True}
+        ).one()
+        result = UpsertResult(opinion=opinion, is_new=opinion.created_at == opinion.updated_at)
+        if commit:
+            self._session.commit()
 
         logger.info(
             "Opinion upserted",
@@ -94,6 +139,90 @@ class OpinionService(BaseService):
         )
         return result
 
+    def import_opinions(self, project: Project, parsed: ParsedImport) -> ImportResult:
+        """Create or update many members' opinions in one transaction.
+
+        All rows are checked first -- values against the project scale, each
+        email against the project's members, no email twice -- and nothing is
+        written if any row, or the parsing before, failed. Otherwise every row
+        is upserted by a single ``INSERT ... ON CONFLICT`` statement executed
+        as one batch.
+
+        :param project: Project receiving the opinions
+        :param parsed: Parsed import file
+        :return: Created/updated counts, or all row errors if rejected
+        """
+        rows = parsed.rows
+        errors = [
+            *parsed.errors,
+            *validate_rows(rows, project.scale_min, project.scale_max),
+        ]
+        members = dict(
+            self._session.exec(
+                select(User.email, User.id)
+                .join(ProjectMember, ProjectMember.user_id == User.id)  # type: ignore[arg-type]
+                .where(ProjectMember.project_id == project.id)
+            ).all()
+        )
+        first_rows: dict[str, int] = {}
+        for row in rows:
+            if row.email not in members:
+                errors.append(
+                    ImportRowError(row.row, f"{row.email} is not a member of this project")
+                )
+            elif row.email in first_rows:
+                errors.append(ImportRowError(row.row, f"Duplicate of row {first_rows[row.email]}"))
+            else:
+                first_rows[row.email] = row.row
+        if errors:
+            return ImportResult(
+                created=0, updated=0, errors=sorted(errors, key=lambda error: error.row)
+            )
+
+        existing = set(
+            self._session.exec(
+                select(ExpertOpinion.user_id).where(ExpertOpinion.project_id == project.id)
+            ).all()
+        )
+        now = utc_now()
+        values = [
+            {
+                "id": uuid4(),
+                "project_id": project.id,
+                "user_id": members[row.email],
+                "position": row.position,
+                "lower_bound": row.lower_bound,
+                "peak": row.peak,
+                "upper_bound": row.upper_bound,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for row in rows
+        ]
+        if values:
+            # The Core table skips the ORM bulk-insert bookkeeping for every row.
+            table = ExpertOpinion.__table__  # type: ignore[attr-defined]
+            self._session.execute(
+                UpsertStatement.build(
+                    self._session, table, _OPINION_KEY_COLUMNS, _OPINION_VALUE_COLUMNS
+                ),
+                values,
+            )
+            self._session.commit()
+
+        updated = sum(1 for value in values if value["user_id"] in existing)
+        result = ImportResult(created=len(values) - updated, updated=updated, errors=[])
+        logger.info(
+            "Opinions imported",
+            extra={
+                "event": "opinions_imported",
+                "project_id": str(project.id),
+                "created_count": result.created,
+                "updated_count": result.updated,
+            },
+        )
+        return result
+
     def delete_opinion(self, project_id: UUID, user_id: UUID) -> None:
         """Delete user's opinion for a project.
 
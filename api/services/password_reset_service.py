@@ -7,7 +7,7 @@ import logging
 import secrets
 from datetime import timedelta
 
-from sqlmodel import col, select
+from sqlmodel import col, delete, select
 
 from api.auth.password import hash_password
 from api.config import get_settings
@@ -117,6 +117,26 @@ class PasswordResetService(BaseService):
         )
         return user
 
+    def purge_expired(self, limit: int) -> int:
+        """Delete up to ``limit`` expired tokens, used or not.
+
+        Called by background maintenance in batches, so each statement holds
+        its locks only briefly however many tokens have accumulated.
+
+        :param limit: Most tokens to delete.
+        :return: Number of tokens deleted.
+        """
+        expired = (
+            select(PasswordResetToken.id)
+            .where(col(PasswordResetToken.expires_at) <= utc_now())
+            .limit(limit)
+        )
+        result = self._session.exec(
+            delete(PasswordResetToken).where(col(PasswordResetToken.id).in_(expired))
+        )
+        self._session.commit()
+        return result.rowcount
+
     def _get_user_by_email(self, email: str) -> User | None:
         """Find a user by normalized email.
 
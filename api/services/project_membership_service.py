@@ -3,11 +3,12 @@
 import logging
 from uuid import UUID
 
+from sqlalchemy import func
 from sqlmodel import col, select
 
 from api.db.models import MemberRole, ProjectMember, User
 from api.exceptions import MemberNotFoundError
-from api.schemas.internal import MemberWithUser
+from api.schemas.internal import ListingVersion, MemberWithUser
 from api.services.base import BaseService
 
 logger = logging.getLogger("api.service.membership")
@@ -34,6 +35,23 @@ class ProjectMembershipService(BaseService):
         results = self._session.exec(statement).all()
         return [MemberWithUser(membership=membership, user=user) for membership, user in results]
 
+    def get_members_version(self, project_id: UUID) -> ListingVersion:
+        """Get the version of a project's member listing in one aggregate query.
+
+        Covers memberships and member profiles. Roles only change on ownership
+        transfer, which callers version through ``Project.admin_id``.
+
+        :param project_id: Project ID
+        :return: Member count and newest join or profile update
+        """
+        statement = (
+            select(func.count(), func.max(ProjectMember.joined_at), func.max(User.updated_at))
+            .select_from(ProjectMember)
+            .join(User)
+            .where(ProjectMember.project_id == project_id)
+        )
+        return ListingVersion.of(*self._session.exec(statement).one())
+
     def remove_member(self, project_id: UUID, user_id: UUID) -> None:
         """Remove a member from project.
 
@@ -24,15 +24,9 @@ class ProjectQueryService(BaseService):
         :param user_id: User ID
         :return: List of ProjectWithMemberCount instances
         """
-        member_count_subquery = MemberCountSubquery.build()
-
         statement = (
-            select(Project, member_count_subquery.c.member_count)
+            select(Project, MemberCountSubquery.build())
             .join(ProjectMember, col(ProjectMember.project_id) == Project.id)
-            .join(
-                member_count_subquery,
-                member_count_subquery.c.project_id == Project.id,
-            )
             .where(ProjectMember.user_id == user_id)
             .order_by(col(Project.created_at).desc())
         )
@@ -50,15 +44,9 @@ class ProjectQueryService(BaseService):
         :param user_id: User ID
         :return: List of ProjectWithMemberCountAndRole instances
         """
-        member_count_subquery = MemberCountSubquery.build()
-
         statement = (
-            select(Project, member_count_subquery.c.member_count, ProjectMember.role)
+            select(Project, MemberCountSubquery.build(), ProjectMember.role)
             .join(ProjectMember, col(ProjectMember.project_id) == Project.id)
-            .join(
-                member_count_subquery,
-                member_count_subquery.c.project_id == Project.id,
-            )
             .where(ProjectMember.user_id == user_id)
             .order_by(col(Project.created_at).desc())
         )
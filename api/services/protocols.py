@@ -6,6 +6,7 @@ This follows the Dependency Inversion Principle (DIP).
 """
 
 from typing import Protocol
+from uuid import UUID
 
 from src.interpreters.likert_interpreter import LikertDecision
 from src.models.become_result import BeCoMeResult
@@ -45,6 +46,18 @@ class CalculatorProtocol(Protocol):
         ...
 
 
+class ResultAggregatorProtocol(Protocol):
+    """Protocol for computing a project's result where its opinions are stored."""
+
+    def aggregate(self, project_id: UUID) -> BeCoMeResult | None:
+        """Aggregate a project's current opinions.
+
+        :param project_id: Project UUID
+        :return: Complete calculation result, or None without opinions
+        """
+        ...
+
+
 class LikertInterpreterProtocol(Protocol):
     """Protocol for Likert scale interpreters.
 
@@ -59,3 +72,15 @@ class LikertInterpreterProtocol(Protocol):
         :return: LikertDecision with interpretation results
         """
         ...
+
+
+class ResultPublisherProtocol(Protocol):
+    """Protocol for pushing project result updates to live subscribers."""
+
+    def publish(self, project_id: UUID, payload: str) -> None:
+        """Publish a project's new result.
+
+        :param project_id: Project whose result changed
+        :param payload: Serialised result (JSON, ``null`` when cleared)
+        """
+        ...
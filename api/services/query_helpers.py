@@ -1,9 +1,15 @@
 """Query helpers for reusable database query patterns."""
 
-from sqlalchemy.sql.selectable import Subquery
-from sqlmodel import col, func, select
+from collections.abc import Sequence
+from typing import Any
 
-from api.db.models import ProjectMember
+from sqlalchemy import Engine
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import Label
+from sqlmodel import Session, col, func, select
+
+from api.db.models import Project, ProjectMember
 
 
 class MemberCountSubquery:
@@ -13,13 +19,72 @@ class MemberCountSubquery:
     """
 
     @staticmethod
-    def build() -> Subquery:
-        """Build subquery for counting project members.
+    def build() -> Label[int]:
+        """Build a correlated count of each selected project's members.
+
+        Evaluated per project row through the project_members indexes, so only
+        the listed projects' members are counted (a grouped subquery would
+        aggregate the whole table on every call).
 
-        :return: Subquery that can be joined with Project table
+        :return: Scalar subquery labelled ``member_count``, correlated to Project
         """
+        member = aliased(ProjectMember)
         return (
-            select(ProjectMember.project_id, func.count().label("member_count"))
-            .group_by(col(ProjectMember.project_id))
-            .subquery()
+            select(func.count())
+            .where(col(member.project_id) == Project.id)
+            .correlate(Project)
+            .scalar_subquery()
+            .label("member_count")
+        )
+
+
+class InsertStatement:
+    """Helper for building dialect-specific inserts.
+
+    ``ON CONFLICT`` clauses and ``RETURNING`` on batches are only exposed on
+    the per-dialect insert constructs, so the insert is built for the
+    database behind the session or engine.
+    """
+
+    @staticmethod
+    def build(bind: Session | Engine, target: Any) -> postgresql.Insert | sqlite.Insert:
+        """Build an insert for the database the statement will run on.
+
+        :param bind: Session or engine whose database dialect is targeted
+        :param target: Model class or Core table to insert into
+        :return: Insert statement awaiting ``.values()``
+        """
+        engine = bind.get_bind() if isinstance(bind, Session) else bind
+        dialect = postgresql if engine.dialect.name == "postgresql" else sqlite
+        statement: postgresql.Insert | sqlite.Insert = dialect.insert(target)
+        return statement
+
+
+class UpsertStatement:
+    """Helper for building native upserts (``INSERT ... ON CONFLICT DO UPDATE``).
+
+    Both supported databases share the syntax, but SQLAlchemy exposes it per
+    dialect, so the insert is built for the session's database.
+    """
+
+    @staticmethod
+    def build(
+        session: Session,
+        target: Any,
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str],
+    ) -> postgresql.Insert | sqlite.Insert:
+        """Build an insert that updates the existing row on a unique conflict.
+
+        :param session: Session whose database dialect is targeted
+        :param target: Model class (ORM rows via RETURNING) or Core table (batches)
+        :param conflict_columns: Columns of the unique constraint that may conflict
+        :param update_columns: Columns overwritten with the new values on conflict
+        :return: Upsert statement awaiting ``.values()``
+        """
+        statement = InsertStatement.build(session, target)
+        upsert: postgresql.Insert | sqlite.Insert = statement.on_conflict_do_update(
+            index_elements=list(conflict_columns),
+            set_={name: statement.excluded[name] for name in update_columns},
         )
+        return upsert
@@ -0,0 +1,164 @@
+"""Per-project coalescing of result recalculations (single flight).
+
+Every opinion write triggers a recalculation of its project. During a burst
+(a workshop where dozens of experts submit within seconds) those triggers
+would each recompute the same result and race to store it, although only the
+last computation matters. :class:`RecalculationCoordinator` collapses them:
+
+* Each trigger takes the next value of the project's version counter. Callers
+  trigger after their write has committed, so version ``v`` stands for "every
+  write up to trigger ``v`` is visible".
+* One computation per project runs at a time. Before computing, the holder
+  snapshots the latest version; once the computation has read the opinions,
+  it covers every trigger up to that snapshot.
+* A trigger whose version is already covered when it gets the lock returns
+  without computing; its write is part of the stored result.
+* When the previous trigger of a project still in progress arrived within
+  the debounce window, a burst is under way and the holder waits that window
+  before snapshotting, so the stragglers join this computation instead of
+  the next one. A lone trigger never waits, and neither do triggers that
+  arrive one after another without overlapping.
+
+A caller may also trigger with its write still uncommitted. If the project
+is idle, the computation reads that write in the same transaction and commits
+write and result together; if a computation is running, the write is
+committed on its own first and the trigger is coalesced as above.
+
+Every trigger still returns only once a result covering its own write is
+stored, so callers keep read-your-writes. Coalescing is per process; with
+several workers each one coalesces its own triggers, and
+:class:`~api.services.calculation_service.CalculationService` orders their
+computations with a lock on the project row, so the stored result always
+comes from the latest committed opinions.
+"""
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from uuid import UUID
+
+from api.metrics import RECALCULATION_LOCK_WAIT, RECALCULATIONS
+
+# Seconds a burst waits for further triggers before computing.
+RECALCULATION_DEBOUNCE = 0.05
+
+
+@dataclass
+class _ProjectFlight:
+    """Coordination state of one project while it has triggers in progress."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    requested: int = 0
+    covered: int = 0
+    last_trigger: float = float("-inf")
+    active: int = 0
+
+
+class RecalculationCoordinator:
+    """Single-flight guard with a debounce window, keyed by project."""
+
+    def __init__(
+        self,
+        debounce: float = RECALCULATION_DEBOUNCE,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        """Initialize without tracked projects.
+
+        :param debounce: Seconds between triggers that count as a burst
+        :param clock: Monotonic clock (seconds)
+        :param sleep: Blocking sleep used for the debounce wait
+        """
+        self._debounce = debounce
+        self._clock = clock
+        self._sleep = sleep
+        self._guard = threading.Lock()
+        self._flights: dict[UUID, _ProjectFlight] = {}
+
+    def run(
+        self,
+        project_id: UUID,
+        compute: Callable[[], None],
+        commit_pending: Callable[[], None] | None = None,
+    ) -> bool:
+        """Recalculate a project, or wait for a computation that covers this trigger.
+
+        :param project_id: Project whose opinions changed
+        :param compute: Reads the project's opinions, stores the result and commits
+        :param commit_pending: Commits the caller's change if it is still
+            uncommitted (None when it already is); skipped when the project is
+            idle, so ``compute`` commits change and result together
+        :return: True if this call computed, False if it was coalesced
+        """
+        with self._guard:
+            flight = self._flights.setdefault(project_id, _ProjectFlight())
+            flight.active += 1
+
+        try:
+            if commit_pending is not None:
+                if flight.lock.acquire(blocking=False):
+                    try:
+                        # Idle project: the uncommitted change is read and
+                        # committed by this computation's own transaction.
+                        self._register(flight)
+                        return self._compute(flight, compute)
+                    finally:
+                        flight.lock.release()
+                commit_pending()
+
+            version, burst = self._register(flight)
+            started = time.perf_counter()
+            with flight.lock:
+                RECALCULATION_LOCK_WAIT.observe(time.perf_counter() - started)
+                if flight.covered >= version:
+                    RECALCULATIONS.labels(outcome="coalesced").inc()
+                    return False
+                if burst:
+                    self._sleep(self._debounce)
+                return self._compute(flight, compute)
+        finally:
+            with self._guard:
+                flight.active -= 1
+                if not flight.active:
+                    del self._flights[project_id]
+
+    def _register(self, flight: _ProjectFlight) -> tuple[int, bool]:
+        """Assign a committed trigger its version.
+
+        :param flight: State of the triggered project
+        :return: The trigger's version and whether it continues a burst
+        """
+        with self._guard:
+            flight.requested += 1
+            now = self._clock()
+            burst = now - flight.last_trigger < self._debounce
+            flight.last_trigger = now
+            return flight.requested, burst
+
+    def _compute(self, flight: _ProjectFlight, compute: Callable[[], None]) -> bool:
+        """Run a computation covering every registered trigger; the lock must be held.
+
+        :param flight: State of the project being recalculated
+        :param compute: Reads the opinions, stores the result and commits
+        :return: Always True (this call computed)
+        """
+        with self._guard:
+            target = flight.requested
+        compute()
+        with self._guard:
+            flight.covered = target
+            superseded = flight.requested > target
+        RECALCULATIONS.labels(outcome="superseded" if superseded else "fresh").inc()
+        return True
+
+    def tracked_projects(self) -> int:
+        """Count projects with triggers in progress.
+
+        :return: Number of projects currently tracked
+        """
+        with self._guard:
+            return len(self._flights)
+
+
+recalculation_coordinator = RecalculationCoordinator()
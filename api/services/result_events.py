@@ -0,0 +1,213 @@
+"""Fan-out of project result updates to live subscribers (server-sent events).
+
+``CalculationService.recalculate`` publishes the serialised result of a
+project after it commits. A :class:`ResultBroker` carries the message to every
+worker; each worker's :class:`ResultHub` hands it to the connections streaming
+that project. Only :class:`InProcessBroker` ships here: it delivers within the
+publishing worker, which is exact for a single worker. A multi-worker
+deployment swaps in a shared broker (Redis pub/sub, PostgreSQL
+``LISTEN/NOTIFY``) behind the same two-method protocol.
+
+An idle connection costs one small bounded queue and one suspended coroutine;
+nothing polls. Publishing is thread-safe: ``recalculate`` runs in the
+threadpool, so delivery is handed to each subscriber's event loop with a single
+``call_soon_threadsafe`` per loop, however many connections it serves. A slow
+client never blocks the publisher: when its queue is full the oldest pending
+update is dropped, since only the latest result matters.
+"""
+
+import asyncio
+import contextlib
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Protocol
+from uuid import UUID
+
+from api.metrics import RESULT_STREAMS
+
+# Pending updates kept per connection before the oldest is dropped.
+_QUEUE_SIZE = 4
+
+ResultListener = Callable[[UUID, str], None]
+
+
+class ResultBroker(Protocol):
+    """Transport of result updates between workers."""
+
+    def publish(self, project_id: UUID, payload: str) -> None:
+        """Send an update to every subscribed worker.
+
+        :param project_id: Project whose result changed
+        :param payload: Serialised result (JSON)
+        """
+        ...
+
+    def subscribe(self, listener: ResultListener) -> None:
+        """Register this worker's listener for updates of every project.
+
+        :param listener: Callback receiving (project_id, payload)
+        """
+        ...
+
+
+class InProcessBroker:
+    """Broker that delivers updates within the current process only."""
+
+    def __init__(self) -> None:
+        """Start without listeners."""
+        self._listeners: list[ResultListener] = []
+
+    def publish(self, project_id: UUID, payload: str) -> None:
+        """Call every registered listener synchronously.
+
+        :param project_id: Project whose result changed
+        :param payload: Serialised result (JSON)
+        """
+        for listener in self._listeners:
+            listener(project_id, payload)
+
+    def subscribe(self, listener: ResultListener) -> None:
+        """Register a listener.
+
+        :param listener: Callback receiving (project_id, payload)
+        """
+        self._listeners.append(listener)
+
+
+class ResultSubscription:
+    """One connection's stream of result updates for a project.
+
+    Created by :meth:`ResultHub.subscribe`; call :meth:`close` when the
+    connection ends.
+
+    :param hub: Hub the subscription is registered with
+    :param project_id: Project being followed
+    """
+
+    def __init__(self, hub: "ResultHub", project_id: UUID) -> None:
+        """Bind the subscription to the running event loop.
+
+        :param hub: Hub the subscription is registered with
+        :param project_id: Project being followed
+        """
+        self.project_id = project_id
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[str] = asyncio.Queue(maxsize=_QUEUE_SIZE)
+        self._hub = hub
+
+    def offer(self, payload: str) -> None:
+        """Queue an update, dropping the oldest one when full (event loop only).
+
+        :param payload: Serialised result (JSON)
+        """
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(payload)
+
+    async def get(self) -> str:
+        """Wait for the next update.
+
+        :return: Serialised result (JSON)
+        """
+        return await self.queue.get()
+
+    def close(self) -> None:
+        """Stop receiving updates."""
+        self._hub.unsubscribe(self)
+
+
+class ResultHub:
+    """Registry of live result subscriptions in one worker.
+
+    :param broker: Transport between workers (default: in-process)
+    """
+
+    def __init__(self, broker: ResultBroker | None = None) -> None:
+        """Create an empty hub listening on ``broker``.
+
+        :param broker: Transport between workers (default: in-process)
+        """
+        self._broker: ResultBroker = broker or InProcessBroker()
+        self._lock = threading.Lock()
+        self._subscriptions: dict[UUID, set[ResultSubscription]] = defaultdict(set)
+        self._broker.subscribe(self._deliver)
+
+    def publish(self, project_id: UUID, payload: str) -> None:
+        """Broadcast a project's new result to all workers.
+
+        :param project_id: Project whose result changed
+        :param payload: Serialised result (JSON, ``null`` when cleared)
+        """
+        self._broker.publish(project_id, payload)
+
+    def listen(self, listener: ResultListener) -> None:
+        """Call ``listener`` in this worker on every project's result update.
+
+        For in-process state derived from the opinions, such as caches, that
+        must be dropped when they change. The listener runs on the publishing
+        thread and must not block.
+
+        :param listener: Callback receiving (project_id, payload)
+        """
+        self._broker.subscribe(listener)
+
+    def subscribe(self, project_id: UUID) -> ResultSubscription:
+        """Start following a project's results (must run on an event loop).
+
+        :param project_id: Project to follow
+        :return: Subscription to read updates from and close afterwards
+        """
+        subscription = ResultSubscription(self, project_id)
+        with self._lock:
+            self._subscriptions[project_id].add(subscription)
+        RESULT_STREAMS.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: ResultSubscription) -> None:
+        """Stop delivering to a subscription (idempotent).
+
+        :param subscription: Subscription returned by :meth:`subscribe`
+        """
+        with self._lock:
+            followers = self._subscriptions.get(subscription.project_id)
+            if followers is None or subscription not in followers:
+                return
+            followers.discard(subscription)
+            if not followers:
+                del self._subscriptions[subscription.project_id]
+        RESULT_STREAMS.dec()
+
+    def subscriber_count(self, project_id: UUID) -> int:
+        """Count live subscriptions of a project.
+
+        :param project_id: Project UUID
+        :return: Number of connections following it in this worker
+        """
+        with self._lock:
+            return len(self._subscriptions.get(project_id, ()))
+
+    def _deliver(self, project_id: UUID, payload: str) -> None:
+        """Hand an update to each subscriber's event loop (any thread).
+
+        :param project_id: Project whose result changed
+        :param payload: Serialised result (JSON)
+        """
+        with self._lock:
+            followers = list(self._subscriptions.get(project_id, ()))
+        by_loop: dict[asyncio.AbstractEventLoop, list[ResultSubscription]] = defaultdict(list)
+        for subscription in followers:
+            by_loop[subscription.loop].append(subscription)
+        for loop, subscriptions in by_loop.items():
+            # A loop that has shut down has no live connections left to serve.
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(_fan_out, subscriptions, payload)
+
+
+def _fan_out(subscriptions: list[ResultSubscription], payload: str) -> None:
+    """Offer an update to subscriptions of one event loop (runs on that loop)."""
+    for subscription in subscriptions:
+        subscription.offer(payload)
+
+
+result_hub = ResultHub()
@@ -0,0 +1,204 @@
+"""Published result snapshots: immutable, public copies of a project's result.
+
+Publishing renders the project's result and opinions table to JSON once,
+gzip-compresses it and stores the blob under an unguessable id; the blob never
+changes, and publishing again stores a new version next to the old one. The
+public read path serves that blob as is. Each worker keeps the blobs it has
+served in a bounded in-process cache (:data:`snapshot_cache`), so a blob is
+read from the database at most once per worker while it stays cached. A blob
+never changes, but its row is deleted with its project, possibly through
+another worker; every cache hit therefore confirms the row still exists with
+a primary-key lookup, and drops the blob when it does not.
+"""
+
+import gzip
+import logging
+import secrets
+import threading
+from collections import OrderedDict
+from uuid import UUID
+
+from sqlalchemy.orm import defer
+from sqlmodel import Session, col, func, select
+
+from api.db.models import CalculationResult, ExpertOpinion, Project, ResultSnapshot
+from api.exceptions import ResultNotAvailableError, SnapshotNotFoundError
+from api.metrics import SNAPSHOT_READS
+from api.schemas.snapshot import SnapshotDocument
+from api.services.base import BaseService
+
+logger = logging.getLogger("api.service.result_snapshot")
+
+# 16 random bytes: 22 URL-safe characters, not enumerable.
+_ID_BYTES = 16
+_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+class SnapshotCache:
+    """Thread-safe LRU of compressed snapshot blobs, bounded by total size."""
+
+    def __init__(self, max_bytes: int = _CACHE_MAX_BYTES) -> None:
+        """Initialize empty.
+
+        :param max_bytes: Most blob bytes kept; least recently used blobs are evicted
+        """
+        self._max_bytes = max_bytes
+        self._blobs: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, snapshot_id: str) -> bytes | None:
+        """Look up a blob, marking it recently used.
+
+        :param snapshot_id: Snapshot id
+        :return: Compressed blob, or None when not cached
+        """
+        with self._lock:
+            blob = self._blobs.get(snapshot_id)
+            if blob is not None:
+                self._blobs.move_to_end(snapshot_id)
+            return blob
+
+    def put(self, snapshot_id: str, blob: bytes) -> None:
+        """Cache a blob, evicting the least recently used ones over the bound.
+
+        :param snapshot_id: Snapshot id
+        :param blob: Compressed blob (a blob larger than the bound is not cached)
+        """
+        if len(blob) > self._max_bytes:
+            return
+        with self._lock:
+            self._pop(snapshot_id)
+            self._blobs[snapshot_id] = blob
+            self._size += len(blob)
+            while self._size > self._max_bytes:
+                _, evicted = self._blobs.popitem(last=False)
+                self._size -= len(evicted)
+
+    def discard(self, snapshot_id: str) -> None:
+        """Drop a blob whose snapshot was deleted.
+
+        :param snapshot_id: Snapshot id
+        """
+        with self._lock:
+            self._pop(snapshot_id)
+
+    def clear(self) -> None:
+        """Drop every cached blob."""
+        with self._lock:
+            self._blobs.clear()
+            self._size = 0
+
+    def _pop(self, snapshot_id: str) -> None:
+        """Remove a blob (caller holds the lock)."""
+        previous = self._blobs.pop(snapshot_id, None)
+        if previous is not None:
+            self._size -= len(previous)
+
+
+snapshot_cache = SnapshotCache()
+
+
+class ResultSnapshotService(BaseService):
+    """Service publishing and serving result snapshots."""
+
+    def __init__(self, session: Session, cache: SnapshotCache = snapshot_cache) -> None:
+        """Initialize with database session and blob cache.
+
+        :param session: SQLModel session for database operations
+        :param cache: Cache of compressed blobs (the process-wide one by default)
+        """
+        super().__init__(session)
+        self._cache = cache
+
+    def publish(self, project: Project, published_by: UUID) -> ResultSnapshot:
+        """Publish the project's current result and opinions as a new snapshot.
+
+        :param project: Project to publish
+        :param published_by: ID of the admin publishing
+        :return: Stored snapshot
+        :raises ResultNotAvailableError: If the project has no result yet
+        """
+        result = self._session.exec(
+            select(CalculationResult).where(CalculationResult.project_id == project.id)
+        ).first()
+        if result is None:
+            raise ResultNotAvailableError("Project has no result to publish")
+        # Serialise publishes of the project so the next version stays free
+        # until this one commits (a row lock on PostgreSQL; SQLite admits one
+        # writer at a time anyway).
+        self._session.exec(
+            select(Project.id).where(Project.id == project.id).with_for_update()
+        ).one()
+        opinions = self._session.exec(
+            select(ExpertOpinion)
+            .where(ExpertOpinion.project_id == project.id)
+            .order_by(col(ExpertOpinion.created_at), col(ExpertOpinion.id))
+        ).all()
+        latest = self._session.exec(
+            select(func.max(ResultSnapshot.version)).where(ResultSnapshot.project_id == project.id)
+        ).one()
+
+        snapshot = ResultSnapshot(
+            id=secrets.token_urlsafe(_ID_BYTES),
+            project_id=project.id,
+            version=(latest or 0) + 1,
+            published_by=published_by,
+            content=b"",
+        )
+        document = SnapshotDocument.from_models(snapshot, project, result, list(opinions))
+        # mtime=0 keeps the blob a pure function of the document.
+        snapshot.content = gzip.compress(document.model_dump_json().encode(), mtime=0)
+        saved = self._save_and_refresh(snapshot)
+        self._cache.put(saved.id, saved.content)
+        logger.info(
+            "Result snapshot published",
+            extra={
+                "event": "result_snapshot_published",
+                "project_id": str(project.id),
+                "snapshot_id": saved.id,
+                "version": saved.version,
+                "size_bytes": len(saved.content),
+            },
+        )
+        return saved
+
+    def list_snapshots(self, project_id: UUID) -> list[ResultSnapshot]:
+        """List a project's snapshots, newest first, without their blobs.
+
+        :param project_id: Project UUID
+        :return: Snapshots ordered by descending version
+        """
+        statement = (
+            select(ResultSnapshot)
+            .options(defer(ResultSnapshot.content))  # type: ignore[arg-type]
+            .where(ResultSnapshot.project_id == project_id)
+            .order_by(col(ResultSnapshot.version).desc())
+        )
+        return list(self._session.exec(statement).all())
+
+    def get_content(self, snapshot_id: str) -> bytes:
+        """Get a snapshot's compressed document, from the cache when possible.
+
+        :param snapshot_id: Snapshot id
+        :return: Gzip-compressed JSON document
+        :raises SnapshotNotFoundError: If no snapshot has this id
+        """
+        blob = self._cache.get(snapshot_id)
+        if blob is not None:
+            exists = self._session.exec(
+                select(ResultSnapshot.id).where(ResultSnapshot.id == snapshot_id)
+            ).first()
+            if exists is None:
+                self._cache.discard(snapshot_id)
+                raise SnapshotNotFoundError("Snapshot not found")
+            SNAPSHOT_READS.labels(source="cache").inc()
+            return blob
+        blob = self._session.exec(
+            select(ResultSnapshot.content).where(ResultSnapshot.id == snapshot_id)
+        ).first()
+        if blob is None:
+            raise SnapshotNotFoundError("Snapshot not found")
+        SNAPSHOT_READS.labels(source="database").inc()
+        self._cache.put(snapshot_id, blob)
+        return blob
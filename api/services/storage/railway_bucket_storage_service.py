@@ -7,6 +7,7 @@ from time import perf_counter
 from typing import TYPE_CHECKING, Any
 from uuid import uuid4
 
+from api.metrics import STORAGE_DURATION
 from api.services.storage.base import StorageService
 from api.services.storage.exceptions import (
     StorageConfigurationError,
@@ -24,13 +25,13 @@ logger = logging.getLogger("api.service.storage")
 _NOT_FOUND_CODES = frozenset({"NoSuchKey", "NoSuchBucket", "404", "NotFound"})
 
 
-def _elapsed_ms(start: float) -> float:
-    """Return milliseconds elapsed since ``start``, rounded to one decimal.
+def _elapsed_ms(elapsed: float) -> float:
+    """Convert an elapsed time for logging.
 
-    :param start: ``perf_counter`` reading taken before the operation.
-    :return: Elapsed time in milliseconds.
+    :param elapsed: Elapsed time in seconds.
+    :return: Elapsed time in milliseconds, rounded to one decimal.
     """
-    return round((perf_counter() - start) * 1000.0, 1)
+    return round(elapsed * 1000.0, 1)
 
 
 class RailwayBucketStorageService(StorageService):
@@ -101,6 +102,8 @@ class RailwayBucketStorageService(StorageService):
                 Bucket=self._bucket, Key=key, Body=content, ContentType=content_type
             )
         except Exception as exc:
+            elapsed = perf_counter() - start
+            STORAGE_DURATION.labels(operation="upload", outcome="error").observe(elapsed)
             logger.error(
                 "S3 upload failed",
                 exc_info=exc,
@@ -108,10 +111,12 @@ class RailwayBucketStorageService(StorageService):
                     "event": "s3_upload_failed",
                     "user_id": user_id,
                     "key": key,
-                    "duration_ms": _elapsed_ms(start),
+                    "duration_ms": _elapsed_ms(elapsed),
                 },
             )
             raise StorageUploadError(f"Failed to upload file: {exc}") from exc
+        elapsed = perf_counter() - start
+        STORAGE_DURATION.labels(operation="upload", outcome="ok").observe(elapsed)
         logger.info(
             "S3 upload",
             extra={
@@ -119,7 +124,7 @@ class RailwayBucketStorageService(StorageService):
                 "user_id": user_id,
                 "key": key,
                 "size_bytes": len(content),
-                "duration_ms": _elapsed_ms(start),
+                "duration_ms": _elapsed_ms(elapsed),
             },
         )
         return key
@@ -135,35 +140,40 @@ class RailwayBucketStorageService(StorageService):
         try:
             response = self._client.get_object(Bucket=self._bucket, Key=key)
         except Exception as exc:
+            elapsed = perf_counter() - start
             if self._is_not_found(exc):
+                STORAGE_DURATION.labels(operation="open", outcome="miss").observe(elapsed)
                 logger.info(
                     "S3 object missing",
                     extra={
                         "event": "s3_open_miss",
                         "key": key,
-                        "duration_ms": _elapsed_ms(start),
+                        "duration_ms": _elapsed_ms(elapsed),
                     },
                 )
                 return None
+            STORAGE_DURATION.labels(operation="open", outcome="error").observe(elapsed)
             logger.error(
                 "S3 read failed",
                 exc_info=exc,
                 extra={
                     "event": "s3_open_failed",
                     "key": key,
-                    "duration_ms": _elapsed_ms(start),
+                    "duration_ms": _elapsed_ms(elapsed),
                 },
             )
             raise StorageError(f"Failed to read file: {exc}") from exc
         body: bytes = response["Body"].read()
         content_type: str = response.get("ContentType") or "application/octet-stream"
+        elapsed = perf_counter() - start
+        STORAGE_DURATION.labels(operation="open", outcome="ok").observe(elapsed)
         logger.info(
             "S3 open",
             extra={
                 "event": "s3_open",
                 "key": key,
                 "size_bytes": len(body),
-                "duration_ms": _elapsed_ms(start),
+                "duration_ms": _elapsed_ms(elapsed),
             },
         )
         return body, content_type
@@ -179,19 +189,27 @@ class RailwayBucketStorageService(StorageService):
         try:
             self._client.delete_object(Bucket=self._bucket, Key=key)
         except Exception as exc:
+            elapsed = perf_counter() - start
+            STORAGE_DURATION.labels(operation="delete", outcome="error").observe(elapsed)
             logger.error(
                 "S3 delete failed",
                 exc_info=exc,
                 extra={
                     "event": "s3_delete_failed",
                     "key": key,
-                    "duration_ms": _elapsed_ms(start),
+                    "duration_ms": _elapsed_ms(elapsed),
                 },
             )
             raise StorageDeleteError(f"Failed to delete file: {exc}") from exc
+        elapsed = perf_counter() - start
+        STORAGE_DURATION.labels(operation="delete", outcome="ok").observe(elapsed)
         logger.info(
             "S3 delete",
-            extra={"event": "s3_delete", "key": key, "duration_ms": _elapsed_ms(start)},
+            extra={
+                "event": "s3_delete",
+                "key": key,
+                "duration_ms": _elapsed_ms(elapsed),
+            },
         )
         return True
 
@@ -0,0 +1,175 @@
+"""What-if previews of a project's result from a cached per-project index.
+
+Experts moving sliders want to see where the best compromise would land
+before they submit. A preview replaces the caller's opinion in a
+:class:`WhatIfIndex` of the project (sorted centroids plus exact component
+sums) and answers in O(log n) without writing anything. Each worker keeps the
+indexes it has built in a bounded in-process cache (:data:`what_if_cache`), so
+the opinions are loaded once per change rather than once per slider step.
+
+Every opinion change ends in ``CalculationService.recalculate``, which stores
+a result with a new ``calculated_at`` before the change is acknowledged. Each
+index is cached with the ``calculated_at`` read before its opinions were
+loaded, and a hit is served only while the stored result still carries that
+timestamp: one unique-index lookup per preview, which catches changes made
+through any worker. The result hub additionally drops the index in the worker
+that published the result, freeing its memory straight away.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from uuid import UUID
+
+from sqlmodel import Session, col, select
+
+from api.db.models import CalculationResult, ExpertOpinion
+from api.metrics import WHAT_IF_INDEX_READS
+from api.services.base import BaseService
+from api.services.result_events import result_hub
+from src.calculators.what_if import WhatIfIndex
+from src.models.expert_opinion import ExpertOpinion as DomainExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+
+logger = logging.getLogger("api.service.what_if")
+
+# Opinions held by all cached indexes together, about 200 bytes each.
+_CACHE_MAX_OPINIONS = 1_000_000
+
+
+class WhatIfIndexCache:
+    """Thread-safe LRU of project what-if indexes, bounded by total opinions.
+
+    Each index is stored with the result version it was built against and
+    served only for that version.
+    """
+
+    def __init__(self, max_opinions: int = _CACHE_MAX_OPINIONS) -> None:
+        """Initialize empty.
+
+        :param max_opinions: Most opinions kept; least recently used indexes are evicted
+        """
+        self._max_opinions = max_opinions
+        self._indexes: OrderedDict[UUID, tuple[datetime | None, WhatIfIndex]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, project_id: UUID, version: datetime | None) -> WhatIfIndex | None:
+        """Look up an index of the given version, marking it recently used.
+
+        An index of another version is stale and dropped.
+
+        :param project_id: Project UUID
+        :param version: ``calculated_at`` of the project's stored result (None if none)
+        :return: Index, or None when not cached for this version
+        """
+        with self._lock:
+            entry = self._indexes.get(project_id)
+            if entry is None:
+                return None
+            if entry[0] != version:
+                self._pop(project_id)
+                return None
+            self._indexes.move_to_end(project_id)
+            return entry[1]
+
+    def put(self, project_id: UUID, index: WhatIfIndex, version: datetime | None) -> None:
+        """Cache an index built against a result version.
+
+        :param project_id: Project UUID
+        :param index: Index of the project's opinions
+        :param version: ``calculated_at`` read before the opinions were loaded
+        """
+        if index.num_experts > self._max_opinions:
+            return
+        with self._lock:
+            self._pop(project_id)
+            self._indexes[project_id] = (version, index)
+            self._size += index.num_experts
+            while self._size > self._max_opinions:
+                _, (_, evicted) = self._indexes.popitem(last=False)
+                self._size -= evicted.num_experts
+
+    def invalidate(self, project_id: UUID) -> None:
+        """Drop a project's index after its opinions changed.
+
+        :param project_id: Project UUID
+        """
+        with self._lock:
+            self._pop(project_id)
+
+    def clear(self) -> None:
+        """Drop every cached index."""
+        with self._lock:
+            self._indexes.clear()
+            self._size = 0
+
+    def _pop(self, project_id: UUID) -> None:
+        """Remove a project's index (caller holds the lock)."""
+        previous = self._indexes.pop(project_id, None)
+        if previous is not None:
+            self._size -= previous[1].num_experts
+
+
+what_if_cache = WhatIfIndexCache()
+result_hub.listen(lambda project_id, _payload: what_if_cache.invalidate(project_id))
+
+
+class WhatIfService(BaseService):
+    """Service answering what-if previews of project results."""
+
+    def __init__(self, session: Session, cache: WhatIfIndexCache = what_if_cache) -> None:
+        """Initialize with database session and index cache.
+
+        :param session: SQLModel session
+        :param cache: Cache of indexes (the process-wide one by default)
+        """
+        super().__init__(session)
+        self._cache = cache
+
+    def get_index(self, project_id: UUID) -> WhatIfIndex:
+        """Get a project's what-if index, from the cache when still current.
+
+        :param project_id: Project UUID
+        :return: Index of the project's current opinions keyed by user ID
+        """
+        # Read before the opinions: a change in between leaves the index newer
+        # than its version, so it is rebuilt once rather than served stale.
+        version = self._session.exec(
+            select(CalculationResult.calculated_at).where(
+                CalculationResult.project_id == project_id
+            )
+        ).first()
+        index = self._cache.get(project_id, version)
+        if index is not None:
+            WHAT_IF_INDEX_READS.labels(source="cache").inc()
+            return index
+
+        statement = (
+            select(ExpertOpinion)
+            .where(ExpertOpinion.project_id == project_id)
+            .order_by(col(ExpertOpinion.created_at), col(ExpertOpinion.id))
+        )
+        # Submission order decides ties between equal centroids, as in recalculate.
+        opinions = [
+            DomainExpertOpinion(
+                expert_id=str(op.user_id),
+                opinion=FuzzyTriangleNumber(
+                    lower_bound=op.lower_bound, peak=op.peak, upper_bound=op.upper_bound
+                ),
+            )
+            for op in self._session.exec(statement).all()
+        ]
+        index = WhatIfIndex(opinions)
+        WHAT_IF_INDEX_READS.labels(source="database").inc()
+        self._cache.put(project_id, index, version)
+        logger.debug(
+            "What-if index built",
+            extra={
+                "event": "what_if_index_built",
+                "project_id": str(project_id),
+                "num_experts": index.num_experts,
+            },
+        )
+        return index
@@ -0,0 +1,76 @@
+"""Conditional GET support: weak ETags, Last-Modified and 304 responses.
+
+Routes compute a version of the resource with a cheap query (timestamps and
+counts, never full rows), then call :func:`check_not_modified` before loading
+and serialising the body. The validators describe what the authenticated
+caller sees, so responses are marked ``private`` (no shared cache may store
+them) and ``no-cache`` (the browser revalidates every use, so a revoked
+membership or a newer version is never served from cache).
+"""
+
+import hashlib
+from datetime import UTC, datetime
+from email.utils import format_datetime
+
+from fastapi import HTTPException, Request, Response, status
+
+from api.db.utils import ensure_utc
+
+CACHE_CONTROL = "private, no-cache"
+
+
+def weak_etag(*parts: object) -> str:
+    """Build a weak entity tag from the parts that version a response.
+
+    :param parts: Values that change whenever the response body does
+    :return: Weak ETag, e.g. ``W/"3f2a..."``
+    """
+    digest = hashlib.blake2b(
+        "\x1f".join(str(part) for part in parts).encode(), digest_size=12
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Apply the weak comparison of ``If-None-Match`` (RFC 9110, 13.1.2).
+
+    :param if_none_match: Header value, a list of tags or ``*``
+    :param etag: Current ETag of the resource
+    :return: True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    for candidate in if_none_match.split(","):
+        tag = candidate.strip()
+        if tag == "*" or tag.removeprefix("W/") == opaque:
+            return True
+    return False
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+) -> None:
+    """Attach validators to the response, or end the request with 304.
+
+    Only ``If-None-Match`` is honoured: a deletion does not move the newest
+    timestamp, so ``If-Modified-Since`` alone cannot prove a listing is
+    unchanged. ``Last-Modified`` is still sent for clients that display it.
+
+    :param request: Incoming request carrying the client's validators
+    :param response: Response whose headers receive the validators
+    :param etag: Current ETag of the resource (see :func:`weak_etag`)
+    :param last_modified: Newest timestamp behind the resource, if any
+    :raises HTTPException: 304 Not Modified when ``If-None-Match`` matches
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL, "Vary": "Authorization"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            ensure_utc(last_modified).astimezone(UTC), usegmt=True
+        )
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        raise HTTPException(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
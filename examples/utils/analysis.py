@@ -40,3 +40,42 @@ def calculate_agreement_level(
         return labels.moderate
     else:
         return labels.low
+
+
+def calculate_consensus_level(
+    overlapping_pairs: float,
+    thresholds: tuple[float, float] = (0.8, 0.5),
+    labels: AnalysisLabels | None = None,
+) -> str:
+    """
+    Determine expert agreement level from how many opinions overlap.
+
+    Complements :func:`calculate_agreement_level`: ``max_error`` compares the
+    mean with the median, while this looks at the experts themselves -- the
+    share of expert pairs whose ranges [lower, upper] intersect, as reported
+    by ``DispersionAnalyzer`` (``DispersionReport.overlapping_pairs``).
+
+    :param overlapping_pairs: Share of expert pairs with intersecting ranges (0 to 1)
+    :param thresholds: Tuple of (good_threshold, moderate_threshold), descending
+    :param labels: Locale-specific labels. Defaults to English.
+    :return: Agreement level string: "good", "moderate", or "low"
+
+    >>> calculate_consensus_level(0.9)
+    'good'
+    >>> calculate_consensus_level(0.6)
+    'moderate'
+    >>> calculate_consensus_level(0.2)
+    'low'
+    """
+    if labels is None:
+        from .locales import EN_ANALYSIS
+
+        labels = EN_ANALYSIS
+
+    good_threshold, moderate_threshold = thresholds
+    if overlapping_pairs >= good_threshold:
+        return labels.good
+    elif overlapping_pairs >= moderate_threshold:
+        return labels.moderate
+    else:
+        return labels.low
@@ -0,0 +1,39 @@
+"""add rate limit buckets
+
+Revision ID: da365182d9ea
+Revises: b1d9f4a2c7e3
+Create Date: 2026-10-18 09:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "da365182d9ea"
+down_revision: str | Sequence[str] | None = "b1d9f4a2c7e3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Add the shared GCRA bucket table used when ``RATE_LIMIT_BACKEND=sql``, so
+    every uvicorn worker enforces the same rate limit counters.
+    """
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("bucket_key", sa.String(length=512), nullable=False),
+        sa.Column("tat", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("bucket_key"),
+    )
+    op.create_index(op.f("ix_rate_limit_buckets_tat"), "rate_limit_buckets", ["tat"], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_rate_limit_buckets_tat"), table_name="rate_limit_buckets")
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,34 @@
+"""add user updated_at
+
+Revision ID: 4e8c1b7a9f20
+Revises: da365182d9ea
+Create Date: 2026-10-18 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4e8c1b7a9f20"
+down_revision: str | Sequence[str] | None = "da365182d9ea"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Add ``users.updated_at`` so ETags of member and opinion listings change
+    when an embedded profile does. Existing rows start at ``created_at``.
+    """
+    op.add_column("users", sa.Column("updated_at", sa.DateTime(), nullable=True))
+    op.execute("UPDATE users SET updated_at = created_at")
+    op.alter_column("users", "updated_at", nullable=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "updated_at")
@@ -0,0 +1,89 @@
+"""add composite query indexes
+
+Revision ID: 7c2e9a4f1b3d
+Revises: 4e8c1b7a9f20
+Create Date: 2026-10-18 11:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7c2e9a4f1b3d"
+down_revision: str | Sequence[str] | None = "4e8c1b7a9f20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (name, table, columns) of the composite indexes serving the hot filtered and
+# ordered queries; each leads with a foreign key, so it also covers FK lookups.
+_COMPOSITE_INDEXES = (
+    ("ix_projects_admin_id_created_at", "projects", ["admin_id", "created_at"]),
+    (
+        "ix_project_members_project_id_joined_at",
+        "project_members",
+        ["project_id", "joined_at"],
+    ),
+    ("ix_project_members_user_id_joined_at", "project_members", ["user_id", "joined_at"]),
+    ("ix_invitations_project_id_created_at", "invitations", ["project_id", "created_at"]),
+    ("ix_invitations_invitee_id_created_at", "invitations", ["invitee_id", "created_at"]),
+    (
+        "ix_expert_opinions_project_id_created_at",
+        "expert_opinions",
+        ["project_id", "created_at", "id"],
+    ),
+    ("ix_expert_opinions_user_id_created_at", "expert_opinions", ["user_id", "created_at"]),
+)
+
+# Single-column indexes made redundant by a composite index with the same
+# leading column (kept only as a write cost).
+_REPLACED_INDEXES = (
+    ("ix_project_members_project_id", "project_members", ["project_id"]),
+    ("ix_project_members_user_id", "project_members", ["user_id"]),
+    ("ix_invitations_project_id", "invitations", ["project_id"]),
+    ("ix_invitations_invitee_id", "invitations", ["invitee_id"]),
+    ("ix_expert_opinions_project_id", "expert_opinions", ["project_id"]),
+    ("ix_expert_opinions_user_id", "expert_opinions", ["user_id"]),
+)
+
+_UNUSED_RESET_TOKENS_INDEX = "ix_password_reset_tokens_user_id_unused"
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Add composite indexes for the filter-and-order queries (opinions, members,
+    invitations, owned projects) and a partial index on outstanding password
+    reset tokens, then drop the single-column indexes they supersede. Indexes
+    are built and dropped ``CONCURRENTLY`` outside a transaction, so writes to
+    these tables are not blocked during the deploy.
+    """
+    with op.get_context().autocommit_block():
+        for name, table, columns in _COMPOSITE_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        op.create_index(
+            _UNUSED_RESET_TOKENS_INDEX,
+            "password_reset_tokens",
+            ["user_id"],
+            unique=False,
+            postgresql_where=sa.text("used_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+        for name, table, _columns in _REPLACED_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for name, table, columns in _REPLACED_INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+        op.drop_index(
+            _UNUSED_RESET_TOKENS_INDEX,
+            table_name="password_reset_tokens",
+            postgresql_concurrently=True,
+        )
+        for name, table, _columns in _COMPOSITE_INDEXES:
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
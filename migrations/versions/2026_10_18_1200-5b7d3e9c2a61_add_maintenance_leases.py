@@ -0,0 +1,54 @@
+"""add maintenance leases
+
+Revision ID: 5b7d3e9c2a61
+Revises: 7c2e9a4f1b3d
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b7d3e9c2a61"
+down_revision: str | Sequence[str] | None = "7c2e9a4f1b3d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    Add the lease table electing the worker that runs each background
+    maintenance job, and index password reset tokens by expiry for the batched
+    purge of expired tokens. The index is built ``CONCURRENTLY`` outside a
+    transaction, so token writes are not blocked during the deploy.
+    """
+    op.create_table(
+        "maintenance_leases",
+        sa.Column("job", sa.String(length=100), nullable=False),
+        sa.Column("holder", sa.String(length=64), nullable=False),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint("job"),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            op.f("ix_password_reset_tokens_expires_at"),
+            "password_reset_tokens",
+            ["expires_at"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            op.f("ix_password_reset_tokens_expires_at"),
+            table_name="password_reset_tokens",
+            postgresql_concurrently=True,
+        )
+    op.drop_table("maintenance_leases")
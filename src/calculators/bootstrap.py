@@ -0,0 +1,206 @@
+"""Bootstrap confidence intervals for the BeCoMe best compromise.
+
+Requires numpy (installed with the ``numeric``, ``api`` and ``viz`` extras).
+"""
+
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "src.calculators.bootstrap requires numpy; install it with: pip install 'become[numeric]'"
+    ) from exc
+
+from src.calculators.become_calculator import BeCoMeCalculator
+from src.exceptions import EmptyOpinionsError
+from src.models.bootstrap_result import BootstrapResult, ConfidenceInterval
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from src.models.expert_opinion import ExpertOpinion
+
+MAX_RESAMPLES = 100_000
+
+# Target number of (resample, expert) cells per chunk; bounds peak memory at a
+# few tens of megabytes whatever the panel size.
+_CHUNK_CELLS = 1_000_000
+
+
+def compromise_replicates(
+    panel: npt.NDArray[np.float64], draws: npt.NDArray[np.intp]
+) -> npt.NDArray[np.float64]:
+    """
+    Best compromise of many resampled panels at once.
+
+    ``panel`` holds the opinions sorted by centroid (stable), one row of
+    (lower, peak, upper, centroid) each. Every row of ``draws`` is one resample:
+    indices into ``panel``, sorted ascending, so each resample is already in
+    centroid order. The median follows ``BeCoMeCalculator.calculate_median``:
+    the first opinion closest to the median centroid, and for an even panel
+    the closest opinion of a different expert, averaged with it. A resample
+    that repeats a single expert has no different expert; its median is that
+    expert's opinion.
+
+    :param panel: Sorted opinions, shape (n, 4)
+    :param draws: Sorted resample indices, shape (B, n)
+    :return: Best compromise (lower, peak, upper, centroid) per resample, shape (B, 4)
+    """
+    resamples, size = draws.shape
+    rows = np.arange(resamples)
+    values = panel[:, :3]
+    centroids = panel[draws, 3]
+
+    middle = size // 2
+    if size % 2 == 1:
+        median_centroid = centroids[:, middle]
+    else:
+        median_centroid = (centroids[:, middle - 1] + centroids[:, middle]) / 2
+    distance = np.abs(centroids - median_centroid[:, None])
+    # argmin keeps the first of equal distances, like min() in the strategies.
+    first = draws[rows, np.argmin(distance, axis=1)]
+    if size % 2 == 1:
+        median = values[first]
+    else:
+        distance[draws == first[:, None]] = np.inf
+        second = draws[rows, np.argmin(distance, axis=1)]
+        median = (values[first] + values[second]) / 2
+
+    mean = values[draws].mean(axis=1)
+    compromise = (mean + median) / 2
+    centroid = (compromise[:, 0] + compromise[:, 1] + compromise[:, 2]) / 3.0
+    return np.column_stack((compromise, centroid))
+
+
+def _bootstrap_chunk(
+    panel: npt.NDArray[np.float64], resamples: int, seed: np.random.SeedSequence
+) -> npt.NDArray[np.float64]:
+    """
+    Draw and evaluate one chunk of resamples (process pool entry point).
+
+    :param panel: Sorted opinions, shape (n, 4)
+    :param resamples: Number of resamples in this chunk
+    :param seed: Independent seed of this chunk
+    :return: Best compromise per resample, shape (resamples, 4)
+    """
+    rng = np.random.default_rng(seed)
+    draws = np.sort(rng.integers(0, len(panel), size=(resamples, len(panel))), axis=1)
+    return compromise_replicates(panel, draws)
+
+
+class BootstrapAnalyzer:
+    """
+    Percentile bootstrap intervals for the best compromise.
+
+    Resamples the expert panel with replacement ``resamples`` times and takes
+    percentile intervals of the resulting best compromise lower bound, peak,
+    upper bound and centroid. All resamples of a chunk are evaluated as one
+    array operation; chunks run on a process pool when there is more than one.
+
+    Results depend only on the opinions, ``resamples``, ``seed`` and
+    ``chunk_size``: each chunk draws from its own child of ``seed``, so the
+    number of workers does not change them.
+
+    :param resamples: Number of bootstrap resamples B (1 to 100 000)
+    :param confidence: Two-sided confidence level, e.g. 0.95
+    :param seed: Random seed for reproducibility
+    :param chunk_size: Resamples per chunk (default: about a million cells per chunk)
+    :param workers: Process pool size (default: CPU count; 1 runs in process)
+    :raises ValueError: If ``resamples`` or ``confidence`` is out of range
+    """
+
+    def __init__(
+        self,
+        resamples: int = 10_000,
+        confidence: float = 0.95,
+        seed: int = 0,
+        chunk_size: int | None = None,
+        workers: int | None = None,
+    ) -> None:
+        """
+        Initialize the analyzer.
+
+        :param resamples: Number of bootstrap resamples B (1 to 100 000)
+        :param confidence: Two-sided confidence level, e.g. 0.95
+        :param seed: Random seed for reproducibility
+        :param chunk_size: Resamples per chunk
+        :param workers: Process pool size
+        :raises ValueError: If ``resamples`` or ``confidence`` is out of range
+        """
+        if not 1 <= resamples <= MAX_RESAMPLES:
+            raise ValueError(f"resamples must be between 1 and {MAX_RESAMPLES}, got {resamples}")
+        if not 0.0 < confidence < 1.0:
+            raise ValueError(f"confidence must be between 0 and 1, got {confidence}")
+        self._resamples = resamples
+        self._confidence = confidence
+        self._seed = seed
+        self._chunk_size = chunk_size
+        self._workers = workers
+        self._calculator = BeCoMeCalculator()
+
+    def analyze(self, opinions: list[ExpertOpinion]) -> BootstrapResult:
+        """
+        Bootstrap the best compromise of ``opinions``.
+
+        :param opinions: Expert opinions of the panel
+        :return: Point estimate and confidence intervals
+        :raises EmptyOpinionsError: If opinions list is empty
+        """
+        if not opinions:
+            raise EmptyOpinionsError("Cannot bootstrap empty opinions list")
+
+        estimate = self._calculator.calculate_compromise(opinions)
+        panel = np.array(
+            [
+                (op.opinion.lower_bound, op.opinion.peak, op.opinion.upper_bound, op.centroid)
+                for op in self._calculator.sort_by_centroid(opinions)
+            ],
+            dtype=np.float64,
+        )
+        replicates = self._replicates(panel)
+
+        tail = (1.0 - self._confidence) / 2
+        low, high = np.quantile(replicates, [tail, 1.0 - tail], axis=0)
+        intervals = [
+            ConfidenceInterval(low=float(lo), high=float(hi))
+            for lo, hi in zip(low, high, strict=True)
+        ]
+        return BootstrapResult(
+            estimate=estimate,
+            resamples=self._resamples,
+            confidence=self._confidence,
+            seed=self._seed,
+            lower_bound=intervals[0],
+            peak=intervals[1],
+            upper_bound=intervals[2],
+            centroid=intervals[3],
+        )
+
+    def _replicates(self, panel: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """
+        Evaluate all resamples, chunked and spread over a process pool.
+
+        :param panel: Sorted opinions, shape (n, 4)
+        :return: Best compromise per resample, shape (B, 4)
+        """
+        chunk_size = self._chunk_size or max(1, _CHUNK_CELLS // len(panel))
+        sizes = [
+            min(chunk_size, self._resamples - start)
+            for start in range(0, self._resamples, chunk_size)
+        ]
+        seeds = np.random.SeedSequence(self._seed).spawn(len(sizes))
+
+        workers = min(self._workers or os.cpu_count() or 1, len(sizes))
+        if workers == 1:
+            chunks = [
+                _bootstrap_chunk(panel, size, seed) for size, seed in zip(sizes, seeds, strict=True)
+            ]
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                chunks = list(pool.map(_bootstrap_chunk, [panel] * len(sizes), sizes, seeds))
+        return np.concatenate(chunks)
@@ -0,0 +1,114 @@
+"""Exact sums of floats for correctly rounded means."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+
+class ExactSum:
+    """
+    Exact sum of floats, kept as an integer over a power-of-two scale.
+
+    Every finite float is an integer over a power of two, so scaling each
+    value to the largest denominator seen makes the total an exact integer;
+    the scale grows (rescaling the total) when a finer value arrives. A mean
+    is then one correctly rounded integer division -- the same value
+    ``statistics.mean`` returns -- however many values were summed, and a
+    mean with one value taken out or put in costs O(1).
+
+    :param values: Values to start from (default: none)
+    """
+
+    __slots__ = ("_count", "_scale", "_total")
+
+    def __init__(self, values: Iterable[float] = ()) -> None:
+        """
+        Start from the given values.
+
+        :param values: Values to start from (default: none)
+        """
+        self._set_ratios([value.as_integer_ratio() for value in values])
+
+    @classmethod
+    def from_ratios(cls, ratios: Sequence[tuple[int, int]]) -> ExactSum:
+        """
+        Sum values given as integer ratios.
+
+        :param ratios: ``(numerator, denominator)`` pairs with power-of-two denominators
+        :return: Exact sum of the ratios
+        """
+        exact = cls()
+        exact._set_ratios(ratios)
+        return exact
+
+    def _set_ratios(self, ratios: Sequence[tuple[int, int]]) -> None:
+        """Replace the sum with that of the given ratios."""
+        self._count = len(ratios)
+        self._scale = max((denominator for _, denominator in ratios), default=1)
+        self._total = sum(
+            numerator * (self._scale // denominator) for numerator, denominator in ratios
+        )
+
+    @property
+    def count(self) -> int:
+        """Number of values summed."""
+        return self._count
+
+    @property
+    def total(self) -> int:
+        """Exact sum multiplied by :attr:`scale`."""
+        return self._total
+
+    @property
+    def scale(self) -> int:
+        """Power-of-two denominator of :attr:`total`."""
+        return self._scale
+
+    def add_ratio(self, numerator: int, denominator: int, count: int = 1) -> None:
+        """
+        Add ``numerator / denominator`` as the sum of ``count`` values.
+
+        :param numerator: Numerator of the addend
+        :param denominator: Power-of-two denominator of the addend
+        :param count: Number of values the addend sums
+        """
+        if denominator > self._scale:
+            self._total *= denominator // self._scale
+            self._scale = denominator
+        self._total += numerator * (self._scale // denominator)
+        self._count += count
+
+    def mean(self) -> float:
+        """
+        Correctly rounded mean of the values.
+
+        :return: Mean rounded once from the exact sum
+        """
+        return self._total / (self._count * self._scale)
+
+    def mean_replacing(self, removed: float | None, added: float | None) -> float:
+        """
+        Mean after taking one summed value out and/or putting a new one in.
+
+        The sum itself is left unchanged.
+
+        :param removed: Value previously added to take out, or None
+        :param added: Value to put in, or None
+        :return: Correctly rounded mean of the changed values
+        """
+        total, scale, count = self._total, self._scale, self._count
+        if removed is not None:
+            numerator, denominator = removed.as_integer_ratio()
+            total -= numerator * (scale // denominator)
+            count -= 1
+        if added is not None:
+            numerator, denominator = added.as_integer_ratio()
+            if denominator > scale:
+                total *= denominator // scale
+                scale = denominator
+            total += numerator * (scale // denominator)
+            count += 1
+        return total / (count * scale)
@@ -0,0 +1,483 @@
+"""Optimal one-dimensional clustering of expert opinions into factions.
+
+Requires numpy (installed with the ``numeric``, ``api`` and ``viz`` extras).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from itertools import pairwise
+from typing import TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError as exc:
+    raise ImportError(
+        "src.calculators.faction_clustering requires numpy; "
+        "install it with: pip install 'become[numeric]'"
+    ) from exc
+
+from src.calculators.exact_sum import ExactSum
+from src.calculators.influence_analyzer import closest_position
+from src.exceptions import EmptyOpinionsError
+from src.models.become_result import BeCoMeResult
+from src.models.faction_result import Faction, FactionReport
+from src.models.fuzzy_number import FuzzyTriangleNumber
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+    from src.models.expert_opinion import ExpertOpinion
+
+DEFAULT_MAX_CLUSTERS = 5
+MAX_CLUSTERS = 20
+
+# Above this many distinct values the automatic choice runs on a quantile sketch.
+_SKETCH_SIZE = 2048
+
+# Mantissa bits of a float64, and half of them for overflow-free integer sums.
+_MANTISSA_BITS = 53
+_HALF_BITS = 26
+
+_Prefix = tuple["npt.NDArray[np.float64]", "npt.NDArray[np.float64]", "npt.NDArray[np.float64]"]
+
+
+@dataclass(frozen=True)
+class Clustering:
+    """
+    Optimal partition of values into contiguous clusters.
+
+    :ivar labels: Cluster of each value in input order (0 = lowest cluster)
+    :ivar num_clusters: Number of clusters
+    :ivar within_sum_of_squares: Squared distances of the values to their cluster means
+    :ivar total_sum_of_squares: Squared distances of the values to their overall mean
+    """
+
+    labels: npt.NDArray[np.intp]
+    num_clusters: int
+    within_sum_of_squares: float
+    total_sum_of_squares: float
+
+
+def cluster_centroids(
+    centroids: npt.ArrayLike,
+    clusters: int | None = None,
+    max_clusters: int = DEFAULT_MAX_CLUSTERS,
+) -> Clustering:
+    """
+    Partition values into clusters with the least within-cluster sum of squares.
+
+    In one dimension an optimal partition splits the sorted values into
+    contiguous runs, so it is found exactly by dynamic programming over the
+    sorted order (Wang and Song's Ckmeans.1d.dp): the best cost of the first
+    i values in m clusters is the best cost of the first j - 1 values in
+    m - 1 clusters plus the cost of values j..i, each cost O(1) from prefix
+    sums. The best j never decreases with i, so each layer is solved by
+    divide and conquer -- the middle row first, then each half searching
+    only its side of that row's answer -- one vectorised pass per level,
+    O(n log n) per layer. Equal values are merged first with their counts as
+    weights, which keeps opinions given on a fixed scale cheap however many
+    experts answer. The last layer only needs its final row, O(n).
+
+    Without ``clusters`` the number is chosen from 1..``max_clusters`` by the
+    Bayesian information criterion of a Gaussian mixture with one shared
+    variance (the classification likelihood, 2k parameters): unimodal panels
+    stay one cluster, separated camps split. The variance is floored at the
+    quantisation noise of the smallest gap between distinct values, so a
+    coarse scale is not split into one cluster per answer just because each
+    answer fits exactly. With more than ``_SKETCH_SIZE`` distinct values the
+    criterion is evaluated on that many equal-weight quantile bins (keeping
+    the spread inside each bin), and only the chosen number of clusters is
+    solved exactly on the full data. On 1M distinct values choosing and
+    solving two clusters then takes about 0.3 s; every cluster beyond two adds
+    one O(n log n) layer of about 0.7 s.
+
+    :param centroids: Values to cluster (usually opinion centroids)
+    :param clusters: Number of clusters (default: chosen automatically); at
+        most the number of distinct values is used
+    :param max_clusters: Largest number of clusters tried by the automatic choice
+    :return: Optimal clustering
+    :raises ValueError: If the values are empty, not finite or one-dimensional,
+        or a cluster count is out of range
+    """
+    values = np.asarray(centroids, dtype=np.float64)
+    if values.ndim != 1 or values.size == 0:
+        raise ValueError("centroids must be a non-empty one-dimensional sequence")
+    if not np.isfinite(values).all():
+        raise ValueError("centroids must be finite")
+    if clusters is not None and not 1 <= clusters <= MAX_CLUSTERS:
+        raise ValueError(f"clusters must be between 1 and {MAX_CLUSTERS}, got {clusters}")
+    if not 1 <= max_clusters <= MAX_CLUSTERS:
+        raise ValueError(f"max_clusters must be between 1 and {MAX_CLUSTERS}, got {max_clusters}")
+
+    distinct, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    weights = counts.astype(np.float64)
+    limit = min(clusters or max_clusters, distinct.size)
+    if clusters is None and distinct.size > _SKETCH_SIZE:
+        bins, bin_weights, spread = _sketch(distinct, weights, _SKETCH_SIZE)
+        sketch_starts = _optimal_starts(bins, bin_weights, min(limit, bins.size))
+        floor = _quantisation_floor(distinct)
+        chosen = _select(bins, bin_weights, sketch_starts, floor, spread)
+        starts = _optimal_starts(distinct, weights, chosen)
+    elif clusters is None:
+        starts = _optimal_starts(distinct, weights, limit)
+        chosen = _select(distinct, weights, starts, _quantisation_floor(distinct))
+    else:
+        chosen = limit
+        starts = _optimal_starts(distinct, weights, chosen)
+
+    labels = _labels(starts, chosen, distinct.size)[inverse]
+    means = np.bincount(labels, weights=values) / np.bincount(labels)
+    return Clustering(
+        labels=labels,
+        num_clusters=chosen,
+        within_sum_of_squares=float(np.square(values - means[labels]).sum()),
+        total_sum_of_squares=float(np.square(values - values.mean()).sum()),
+    )
+
+
+def _optimal_starts(
+    values: npt.NDArray[np.float64], weights: npt.NDArray[np.float64], limit: int
+) -> list[npt.NDArray[np.intp]]:
+    """
+    Solve the dynamic programme for 1..``limit`` clusters.
+
+    ``starts[m][i]`` is where the last of m + 1 clusters begins in the best
+    partition of values 0..i (``starts[0]`` is all zeros). For the last layer
+    only the final row is filled.
+
+    :param values: Distinct values, ascending
+    :param weights: Multiplicity of each value
+    :param limit: Largest number of clusters, at most len(values)
+    :return: Start of the last cluster per layer and row
+    """
+    size = values.size
+    centered = values - np.average(values, weights=weights)
+    prefix: _Prefix = (
+        np.concatenate(([0.0], np.cumsum(weights))),
+        np.concatenate(([0.0], np.cumsum(weights * centered))),
+        np.concatenate(([0.0], np.cumsum(weights * centered * centered))),
+    )
+    rows = np.arange(size)
+    costs = _cost(prefix, np.zeros(size, dtype=np.intp), rows + 1)
+    starts = [np.zeros(size, dtype=np.intp)]
+    for layer in range(1, limit):
+        if layer < limit - 1:
+            costs, best = _solve_layer(prefix, costs, layer)
+        else:
+            candidates = np.arange(layer, size)
+            totals = costs[candidates - 1] + _cost(prefix, candidates, size)
+            best = np.zeros(size, dtype=np.intp)
+            best[-1] = candidates[np.argmin(totals)]
+        starts.append(best)
+    return starts
+
+
+def _solve_layer(
+    prefix: _Prefix, previous: npt.NDArray[np.float64], layer: int
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.intp]]:
+    """
+    Best costs with one more cluster, by divide and conquer on all rows at once.
+
+    Each pending segment of rows [low, high] knows its answers lie in
+    [first, last]; every level evaluates the middle row of every segment in
+    one pass and splits the segments around the middle row's answer.
+
+    :param prefix: Prefix sums of weights, weighted values and squares
+    :param previous: Best cost of values 0..i with ``layer`` clusters
+    :param layer: Clusters in ``previous``; rows below it stay infinite
+    :return: Best cost and start of the last cluster per row
+    """
+    weight, linear, square = prefix
+    size = previous.size
+    # The row's own square sum is the same for every candidate, so it is added
+    # after the minimum; what varies per candidate j is folded into one array.
+    base = np.full(size + 1, np.inf)
+    base[layer:size] = previous[layer - 1 : size - 1] - square[layer:size]
+    costs = np.full(size, np.inf)
+    best = np.zeros(size, dtype=np.intp)
+    low = np.array([layer])
+    high = np.array([size - 1])
+    first = np.array([layer])
+    last = np.array([size - 1])
+    while low.size:
+        middle = (low + high) // 2
+        lengths = np.minimum(last, middle) - first + 1
+        offsets = np.cumsum(lengths) - lengths
+        candidates = np.arange(int(offsets[-1] + lengths[-1])) + np.repeat(first - offsets, lengths)
+        run = np.repeat(linear[middle + 1], lengths) - linear[candidates]
+        totals = base[candidates] - run * run / (
+            np.repeat(weight[middle + 1], lengths) - weight[candidates]
+        )
+
+        minimum = np.minimum.reduceat(totals, offsets)
+        # The first candidate reaching each segment's minimum, as argmin would pick.
+        hits = np.flatnonzero(totals <= np.repeat(minimum, lengths))
+        chosen = candidates[hits[np.searchsorted(hits, offsets)]]
+        costs[middle] = minimum + square[middle + 1]
+        best[middle] = chosen
+
+        left = low < middle
+        right = middle < high
+        low = np.concatenate((low[left], middle[right] + 1))
+        high = np.concatenate((middle[left] - 1, high[right]))
+        first = np.concatenate((first[left], chosen[right]))
+        last = np.concatenate((chosen[left], last[right]))
+    return costs, best
+
+
+def _cost(
+    prefix: _Prefix, start: npt.NDArray[np.intp], stop: npt.NDArray[np.intp] | int
+) -> npt.NDArray[np.float64]:
+    """
+    Weighted sum of squared deviations of values start..stop-1 from their mean.
+
+    :param prefix: Prefix sums of weights, weighted values and squares
+    :param start: First value of each run
+    :param stop: One past the last value of each run
+    :return: Cost of each run
+    """
+    weight, linear, square = prefix
+    total = linear[stop] - linear[start]
+    return square[stop] - square[start] - total * total / (weight[stop] - weight[start])
+
+
+def _labels(starts: list[npt.NDArray[np.intp]], clusters: int, size: int) -> npt.NDArray[np.intp]:
+    """
+    Cluster of each distinct value in the optimal partition into ``clusters``.
+
+    :param starts: Output of :func:`_optimal_starts`
+    :param clusters: Number of clusters to backtrack
+    :param size: Number of distinct values
+    :return: Cluster per distinct value, ascending from 0
+    """
+    boundaries = np.zeros(size, dtype=np.intp)
+    row = size - 1
+    for layer in range(clusters - 1, 0, -1):
+        start = int(starts[layer][row])
+        boundaries[start] = 1
+        row = start - 1
+    return np.cumsum(boundaries)
+
+
+def _quantisation_floor(values: npt.NDArray[np.float64]) -> float:
+    """
+    Variance of rounding to the smallest gap between distinct values.
+
+    :param values: Distinct values, ascending
+    :return: Smallest gap squared over 12 (0 for a single value)
+    """
+    return float(np.diff(values).min()) ** 2 / 12 if values.size > 1 else 0.0
+
+
+def _sketch(
+    values: npt.NDArray[np.float64], weights: npt.NDArray[np.float64], size: int
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], float]:
+    """
+    Compress weighted values into at most ``size`` contiguous equal-weight bins.
+
+    A value is never split between bins, so a heavy value may fill several
+    bins' share on its own.
+
+    :param values: Distinct values, ascending
+    :param weights: Multiplicity of each value
+    :param size: Number of bins to aim for
+    :return: Weighted mean and weight of each bin, and the weighted sum of
+        squared deviations inside the bins
+    """
+    cumulative = np.cumsum(weights)
+    ids = ((cumulative - weights) * size // cumulative[-1]).astype(np.intp)
+    _, bin_of = np.unique(ids, return_inverse=True)
+    bin_weights = np.bincount(bin_of, weights=weights).astype(np.float64)
+    means = np.bincount(bin_of, weights=weights * values) / bin_weights
+    spread = float((weights * np.square(values - means[bin_of])).sum())
+    return means, bin_weights, spread
+
+
+def _select(
+    values: npt.NDArray[np.float64],
+    weights: npt.NDArray[np.float64],
+    starts: list[npt.NDArray[np.intp]],
+    floor: float,
+    spread: float = 0.0,
+) -> int:
+    """
+    Number of clusters with the lowest BIC (the smallest one on ties).
+
+    :param values: Distinct values (or sketch bins), ascending
+    :param weights: Multiplicity (or weight) of each value
+    :param starts: Output of :func:`_optimal_starts`
+    :param floor: Lowest variance assumed (see :func:`_quantisation_floor`)
+    :param spread: Sum of squares the values stand in for but do not show
+        (the spread inside sketch bins)
+    :return: Chosen number of clusters
+    """
+    total = float(weights.sum())
+    best, best_score = 1, math.inf
+    for clusters in range(1, len(starts) + 1):
+        labels = _labels(starts, clusters, values.size)
+        sizes = np.bincount(labels, weights=weights)
+        means = np.bincount(labels, weights=weights * values) / sizes
+        within = float((weights * np.square(values - means[labels])).sum()) + spread
+        variance = max(within / total, floor)
+        if variance == 0:
+            return clusters
+        likelihood = float((sizes * np.log(sizes / total)).sum()) - total / 2 * (
+            math.log(2 * math.pi * variance) + 1
+        )
+        score = 2 * clusters * math.log(total) - 2 * likelihood
+        if score < best_score:
+            best, best_score = clusters, score
+    return best
+
+
+def _exact_mean(values: npt.NDArray[np.float64]) -> float:
+    """
+    Mean of floats from an :class:`ExactSum`, with the summing done in numpy.
+
+    Each value is split into a 53-bit integer mantissa and an exponent; the
+    mantissas, halved into 26-bit parts so int64 sums cannot overflow, are
+    summed per exponent, and each per-exponent sum is added exactly.
+
+    :param values: Non-empty finite values
+    :return: Mean rounded once from the exact sum
+    """
+    fractions, exponents = np.frexp(values)
+    mantissas = (fractions * float(1 << _MANTISSA_BITS)).astype(np.int64)
+    high = mantissas >> _HALF_BITS
+    low = mantissas - (high << _HALF_BITS)
+    order = np.argsort(exponents, kind="stable")
+    exponents = exponents[order]
+    firsts = np.flatnonzero(np.r_[True, exponents[1:] != exponents[:-1]])
+    high_sums = np.add.reduceat(high[order], firsts)
+    low_sums = np.add.reduceat(low[order], firsts)
+    counts = np.diff(np.r_[firsts, values.size])
+    exact = ExactSum()
+    for exponent, high_sum, low_sum, count in zip(
+        exponents[firsts].tolist(),
+        high_sums.tolist(),
+        low_sums.tolist(),
+        counts.tolist(),
+        strict=True,
+    ):
+        mantissa_sum = (high_sum << _HALF_BITS) + low_sum
+        shift = exponent - _MANTISSA_BITS
+        if shift >= 0:
+            exact.add_ratio(mantissa_sum << shift, 1, count)
+        else:
+            exact.add_ratio(mantissa_sum, 1 << -shift, count)
+    return exact.mean()
+
+
+class FactionAnalyzer:
+    """
+    Split an expert panel into factions and aggregate each one.
+
+    A single best compromise can hide a polarised panel: two camps at 20 and
+    80 agree on 50, which neither holds. The analyzer clusters the opinion
+    centroids optimally (:func:`cluster_centroids`) and reports the BeCoMe
+    result of every faction beside the share of variance the split explains.
+
+    Factions are contiguous in centroid order, so the panel is sorted once
+    and every faction's median is found by bisection in its slice; the means
+    are exact sums in numpy. Each result equals
+    ``BeCoMeCalculator.calculate_compromise`` of the faction's opinions.
+
+    :param max_clusters: Largest number of factions tried by the automatic choice
+    """
+
+    def __init__(self, max_clusters: int = DEFAULT_MAX_CLUSTERS) -> None:
+        """
+        Initialize the analyzer.
+
+        :param max_clusters: Largest number of factions tried automatically (1..20)
+        :raises ValueError: If max_clusters is out of range
+        """
+        if not 1 <= max_clusters <= MAX_CLUSTERS:
+            raise ValueError(
+                f"max_clusters must be between 1 and {MAX_CLUSTERS}, got {max_clusters}"
+            )
+        self._max_clusters = max_clusters
+
+    def analyze(self, opinions: list[ExpertOpinion], clusters: int | None = None) -> FactionReport:
+        """
+        Cluster the opinions by centroid and compute each faction's result.
+
+        :param opinions: Expert opinions as fuzzy triangular numbers
+        :param clusters: Number of factions (default: chosen automatically)
+        :return: Faction report, factions by ascending centroid
+        :raises EmptyOpinionsError: If opinions list is empty
+        :raises ValueError: If clusters is out of range
+        """
+        if not opinions:
+            raise EmptyOpinionsError("Cannot analyze factions of empty opinions list")
+
+        count = len(opinions)
+        fuzzy = [op.opinion for op in opinions]
+        components = np.array(
+            [(f.lower_bound, f.peak, f.upper_bound) for f in fuzzy], dtype=np.float64
+        )
+        # The same operations as triangular_centroid, so the same floats.
+        centroids = (components[:, 0] + components[:, 1] + components[:, 2]) / 3.0
+        clustering = cluster_centroids(centroids, clusters, self._max_clusters)
+        # Stable: equal centroids keep input order, as in BeCoMeCalculator.sort_by_centroid.
+        order = np.argsort(centroids, kind="stable")
+        bounds = np.searchsorted(
+            clustering.labels[order], np.arange(clustering.num_clusters + 1)
+        ).tolist()
+
+        factions = []
+        for start, stop in pairwise(bounds):
+            members = order[start:stop]
+            ordered = centroids[members].tolist()
+            factions.append(
+                Faction(
+                    expert_ids=tuple(opinions[i].expert_id for i in np.sort(members).tolist()),
+                    lowest_centroid=ordered[0],
+                    highest_centroid=ordered[-1],
+                    result=BeCoMeResult.from_calculations(
+                        arithmetic_mean=FuzzyTriangleNumber(
+                            *(_exact_mean(components[members, axis]) for axis in range(3))
+                        ),
+                        median=self._median(opinions, members.tolist(), ordered),
+                        num_experts=stop - start,
+                    ),
+                )
+            )
+        within, total = clustering.within_sum_of_squares, clustering.total_sum_of_squares
+        return FactionReport(
+            num_experts=count,
+            selected=clusters is None,
+            factions=tuple(factions),
+            within_sum_of_squares=within,
+            # Both sums round separately; keep the share inside [0, 1].
+            explained_variance=min(max(1 - within / total, 0.0), 1.0) if total else 1.0,
+        )
+
+    @staticmethod
+    def _median(
+        opinions: list[ExpertOpinion], members: list[int], centroids: list[float]
+    ) -> FuzzyTriangleNumber:
+        """
+        Median of one faction, following ``BeCoMeCalculator.calculate_median``.
+
+        :param opinions: All opinions, in input order
+        :param members: Input positions of the faction, in stable centroid order
+        :param centroids: Their centroids, ascending
+        :return: Median (Ω) of the faction
+        """
+        count = len(centroids)
+        middle = count // 2
+        if count % 2 == 1:
+            median_centroid = centroids[middle]
+        else:
+            median_centroid = (centroids[middle - 1] + centroids[middle]) / 2
+
+        first = closest_position(centroids, median_centroid, ())
+        if count % 2 == 1:
+            return opinions[members[first]].opinion
+        second = closest_position(centroids, median_centroid, (first,))
+        return FuzzyTriangleNumber.average(
+            [opinions[members[first]].opinion, opinions[members[second]].opinion]
+        )
@@ -0,0 +1,238 @@
+"""Single-pass engine for several statistics of one panel."""
+
+from __future__ import annotations
+
+import math
+import statistics
+import sys
+from typing import TYPE_CHECKING
+
+from src.calculators.dispersion_analyzer import DispersionAnalyzer
+from src.calculators.exact_sum import ExactSum
+from src.calculators.median_strategies import (
+    EvenMedianStrategy,
+    MedianCalculationStrategy,
+    OddMedianStrategy,
+)
+from src.exceptions import EmptyOpinionsError
+from src.models.become_result import BeCoMeResult
+from src.models.fuzzy_number import FuzzyTriangleNumber
+from src.models.statistics_summary import (
+    ComponentDeviation,
+    Quartiles,
+    Statistic,
+    StatisticsSummary,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from src.models.expert_opinion import ExpertOpinion
+
+# Statistics read from the opinions in centroid order.
+_ORDERED = frozenset(
+    {Statistic.BECOME, Statistic.QUARTILES, Statistic.TRIMMED_MEAN, Statistic.DISPERSION}
+)
+
+# Bits of the integer square root: enough to round the float result correctly.
+_SQRT_BITS = 2 * sys.float_info.mant_dig + 3
+
+
+def _sqrt_of_fraction(numerator: int, denominator: int) -> float:
+    """
+    Correctly rounded square root of a non-negative fraction.
+
+    The integer square root is taken with enough bits and rounded to odd, so
+    the final division rounds once -- the method ``statistics.pstdev`` uses.
+
+    :param numerator: Numerator (>= 0)
+    :param denominator: Denominator (> 0)
+    :return: sqrt(numerator / denominator) as the nearest float
+    """
+    shift = (numerator.bit_length() - denominator.bit_length() - _SQRT_BITS) // 2
+    if shift >= 0:
+        return float(_odd_isqrt(numerator, denominator << 2 * shift) << shift)
+    return _odd_isqrt(numerator << -2 * shift, denominator) / (1 << -shift)
+
+
+def _odd_isqrt(numerator: int, denominator: int) -> int:
+    """Integer square root of a fraction, rounded to odd when inexact."""
+    root = math.isqrt(numerator // denominator)
+    return root | (root * root * denominator != numerator)
+
+
+class _ExactMoments:
+    """
+    Count, sum, sum of squares, minimum and maximum of one component.
+
+    The sums are exact (:class:`ExactSum`), so the mean is correctly rounded
+    and the variance does not suffer the cancellation of the textbook
+    one-pass formula.
+
+    :param values: Component values of all opinions (non-empty)
+    """
+
+    __slots__ = ("_squares", "_sum", "maximum", "minimum")
+
+    def __init__(self, values: list[float]) -> None:
+        """
+        Sum the values and their squares exactly.
+
+        :param values: Component values of all opinions (non-empty)
+        """
+        ratios = [value.as_integer_ratio() for value in values]
+        self._sum = ExactSum.from_ratios(ratios)
+        self._squares = ExactSum.from_ratios([(n * n, d * d) for n, d in ratios])
+        self.minimum = min(values)
+        self.maximum = max(values)
+
+    def mean(self) -> float:
+        """Correctly rounded mean of the values."""
+        return self._sum.mean()
+
+    def pstdev(self) -> float:
+        """Population standard deviation of the values."""
+        count, total, scale = self._sum.count, self._sum.total, self._sum.scale
+        squares, square_scale = self._squares.total, self._squares.scale
+        # count * sum(x^2) - sum(x)^2 over count^2, with both sums as exact fractions.
+        spread = count * squares * scale * scale - total * total * square_scale
+        return _sqrt_of_fraction(spread, square_scale * (count * scale) ** 2)
+
+
+class StatisticsEngine:
+    """
+    Several statistics of one panel from one pass and at most one sort.
+
+    Computing quartiles, a trimmed mean, extremes, deviations and the BeCoMe
+    result separately walks the opinions once per statistic and sorts them
+    once per order statistic. The engine accumulates the moments and extremes
+    of every component in a single pass, then sorts by centroid once (only
+    when an order statistic is requested) and reads the median, quartiles
+    and trimmed mean off that order; the dispersion metrics start from the
+    same order (:class:`DispersionAnalyzer`). The BeCoMe result equals what
+    ``BeCoMeCalculator.calculate_compromise`` returns for the same opinions,
+    and the deviations equal ``statistics.pstdev``.
+
+    :param statistics: Statistics to compute (default: all)
+    :param trim_proportion: Share of centroids cut from each end for the trimmed mean
+    """
+
+    def __init__(
+        self,
+        statistics: Iterable[Statistic] = tuple(Statistic),
+        trim_proportion: float = 0.1,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        :param statistics: Statistics to compute
+        :param trim_proportion: Share cut from each end, in [0, 0.5)
+        :raises ValueError: If trim_proportion is outside [0, 0.5)
+        """
+        if not 0.0 <= trim_proportion < 0.5:
+            raise ValueError(f"trim_proportion must be in [0, 0.5), got {trim_proportion}")
+        self._statistics = frozenset(statistics)
+        self._trim_proportion = trim_proportion
+
+    @property
+    def statistics(self) -> frozenset[Statistic]:
+        """Statistics this engine computes."""
+        return self._statistics
+
+    def summarize(self, opinions: list[ExpertOpinion]) -> StatisticsSummary:
+        """
+        Compute the configured statistics of the opinions.
+
+        :param opinions: Expert opinions as fuzzy triangular numbers
+        :return: Summary with the requested statistics set and the others None
+        :raises EmptyOpinionsError: If opinions list is empty
+        """
+        if not opinions:
+            raise EmptyOpinionsError("Cannot summarize empty opinions list")
+
+        wanted = self._statistics
+        fuzzies = [op.opinion for op in opinions]
+        centroids = [fuzzy.centroid for fuzzy in fuzzies]
+        lower = _ExactMoments([fuzzy.lower_bound for fuzzy in fuzzies])
+        peak = _ExactMoments([fuzzy.peak for fuzzy in fuzzies])
+        upper = _ExactMoments([fuzzy.upper_bound for fuzzy in fuzzies])
+        centroid = _ExactMoments(centroids)
+
+        fields: dict[str, object] = {"num_experts": len(opinions)}
+        if Statistic.MIN_MAX in wanted:
+            fields["minimum"] = FuzzyTriangleNumber(lower.minimum, peak.minimum, upper.minimum)
+            fields["maximum"] = FuzzyTriangleNumber(lower.maximum, peak.maximum, upper.maximum)
+        if Statistic.STD_DEV in wanted:
+            fields["std_dev"] = ComponentDeviation(
+                lower_bound=lower.pstdev(),
+                peak=peak.pstdev(),
+                upper_bound=upper.pstdev(),
+                centroid=centroid.pstdev(),
+            )
+
+        if wanted & _ORDERED:
+            # Stable sort by centroid: the same order BeCoMeCalculator.sort_by_centroid yields.
+            order = sorted(range(len(opinions)), key=centroids.__getitem__)
+            sorted_opinions = [opinions[i] for i in order]
+            ordered = [centroids[i] for i in order]
+            if Statistic.BECOME in wanted:
+                mean = FuzzyTriangleNumber(lower.mean(), peak.mean(), upper.mean())
+                fields["become"] = BeCoMeResult.from_calculations(
+                    arithmetic_mean=mean,
+                    median=self._median(sorted_opinions, ordered),
+                    num_experts=len(opinions),
+                )
+            if Statistic.QUARTILES in wanted:
+                fields["quartiles"] = self._quartiles(ordered)
+            if Statistic.TRIMMED_MEAN in wanted:
+                cut = int(len(ordered) * self._trim_proportion)
+                fields["trimmed_mean"] = statistics.fmean(ordered[cut : len(ordered) - cut])
+            if Statistic.DISPERSION in wanted:
+                fields["dispersion"] = DispersionAnalyzer().analyze_sorted(sorted_opinions)
+
+        return StatisticsSummary.model_validate(fields)
+
+    @staticmethod
+    def _median(
+        sorted_opinions: list[ExpertOpinion], centroids: list[float]
+    ) -> FuzzyTriangleNumber:
+        """
+        Median (Ω) following ``BeCoMeCalculator.calculate_median``.
+
+        The median centroid is read off the already sorted centroids instead
+        of sorting them again.
+
+        :param sorted_opinions: Opinions sorted by centroid
+        :param centroids: Their centroids
+        :return: Median as FuzzyTriangleNumber(rho, omega, sigma)
+        """
+        count = len(centroids)
+        middle = count // 2
+        strategy: MedianCalculationStrategy
+        if count % 2 == 1:
+            median_centroid = centroids[middle]
+            strategy = OddMedianStrategy()
+        else:
+            median_centroid = (centroids[middle - 1] + centroids[middle]) / 2
+            strategy = EvenMedianStrategy()
+        return strategy.calculate(sorted_opinions, median_centroid)
+
+    @staticmethod
+    def _quartiles(centroids: list[float]) -> Quartiles:
+        """
+        Quartiles of sorted centroids by inclusive linear interpolation.
+
+        Matches ``statistics.quantiles(centroids, n=4, method="inclusive")``;
+        a single centroid is all three quartiles.
+
+        :param centroids: Centroids sorted ascending
+        :return: Quartiles of the centroids
+        """
+        last = len(centroids) - 1
+        if last == 0:
+            return Quartiles(q1=centroids[0], q2=centroids[0], q3=centroids[0])
+        cuts = []
+        for i in range(1, 4):
+            j, delta = divmod(i * last, 4)
+            cuts.append((centroids[j] * (4 - delta) + centroids[j + 1] * delta) / 4)
+        return Quartiles(q1=cuts[0], q2=cuts[1], q3=cuts[2])
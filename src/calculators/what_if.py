@@ -0,0 +1,203 @@
+"""What-if previews: the BeCoMe result with one expert's opinion replaced."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, overload
+
+from src.calculators.become_calculator import BeCoMeCalculator
+from src.calculators.exact_sum import ExactSum
+from src.calculators.influence_analyzer import closest_position
+from src.exceptions import InvalidOpinionError
+from src.models.become_result import BeCoMeResult
+from src.models.fuzzy_number import FuzzyTriangleNumber
+
+if TYPE_CHECKING:
+    from src.models.expert_opinion import ExpertOpinion
+
+
+class _ReplacedCentroids(Sequence[float]):
+    """
+    Sorted centroids with one position removed and one value inserted, without copying.
+
+    :param centroids: Centroids sorted ascending
+    :param removed: Sorted position of the replaced opinion, or None
+    :param inserted: Position of the new centroid in the changed order
+    :param value: New centroid
+    """
+
+    def __init__(
+        self, centroids: list[float], removed: int | None, inserted: int, value: float
+    ) -> None:
+        """
+        Describe the changed order.
+
+        :param centroids: Centroids sorted ascending
+        :param removed: Sorted position of the replaced opinion, or None
+        :param inserted: Position of the new centroid in the changed order
+        :param value: New centroid
+        """
+        self._centroids = centroids
+        self._removed = removed
+        self._inserted = inserted
+        self._value = value
+
+    def source(self, position: int) -> int | None:
+        """
+        Original sorted position of a changed position (None for the new opinion).
+
+        :param position: Position in the changed order
+        :return: Position in the original order, or None
+        """
+        if position == self._inserted:
+            return None
+        if position > self._inserted:
+            position -= 1
+        if self._removed is not None and position >= self._removed:
+            position += 1
+        return position
+
+    def __len__(self) -> int:
+        """Number of centroids after the change."""
+        return len(self._centroids) + (1 if self._removed is None else 0)
+
+    @overload
+    def __getitem__(self, position: int) -> float: ...
+
+    @overload
+    def __getitem__(self, position: slice) -> Sequence[float]: ...
+
+    def __getitem__(self, position: int | slice) -> float | Sequence[float]:
+        """
+        Centroid at a position of the changed order.
+
+        :param position: Position in the changed order
+        :return: Centroid
+        """
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(len(self)))]
+        if not 0 <= position < len(self):
+            raise IndexError(position)
+        original = self.source(position)
+        return self._value if original is None else self._centroids[original]
+
+
+class WhatIfIndex:
+    """
+    A panel prepared to answer "what if this expert said X" in O(log n).
+
+    Building the index sorts the panel once and keeps exact component sums.
+    Each preview then changes one opinion without recomputing the rest: the
+    means move by the difference of the changed values, and the median comes
+    from bisection in the sorted centroids, read through a view that skips the
+    old opinion and slots the new one in. The new opinion keeps the expert's
+    place in the input order (a new expert comes last), which decides ties
+    between equal centroids as the stable sort of ``BeCoMeCalculator`` would.
+    Every preview equals ``BeCoMeCalculator.calculate_compromise`` of the
+    changed panel.
+
+    :param opinions: Expert opinions with unique expert IDs, in input order
+    :param calculator: Calculator for the current result (default: BeCoMeCalculator)
+    :raises InvalidOpinionError: If expert IDs repeat
+    """
+
+    def __init__(
+        self, opinions: list[ExpertOpinion], calculator: BeCoMeCalculator | None = None
+    ) -> None:
+        """
+        Sort the panel and precompute its sums.
+
+        :param opinions: Expert opinions with unique expert IDs, in input order
+        :param calculator: Calculator for the current result
+        :raises InvalidOpinionError: If expert IDs repeat
+        """
+        count = len(opinions)
+        self._index = {op.expert_id: index for index, op in enumerate(opinions)}
+        if len(self._index) != count:
+            raise InvalidOpinionError("What-if previews need unique expert IDs")
+
+        calculator = calculator or BeCoMeCalculator()
+        self._current = calculator.calculate_compromise(opinions) if opinions else None
+        # (centroid, input position) orders like the stable sort by centroid.
+        self._keys = sorted((op.centroid, index) for index, op in enumerate(opinions))
+        self._centroids = [centroid for centroid, _ in self._keys]
+        self._sorted = [opinions[index].opinion for _, index in self._keys]
+        self._position = [0] * count
+        for position, (_, index) in enumerate(self._keys):
+            self._position[index] = position
+        self._lower = ExactSum(op.opinion.lower_bound for op in opinions)
+        self._peak = ExactSum(op.opinion.peak for op in opinions)
+        self._upper = ExactSum(op.opinion.upper_bound for op in opinions)
+
+    @property
+    def current(self) -> BeCoMeResult | None:
+        """Result of the unchanged panel (None when it is empty)."""
+        return self._current
+
+    @property
+    def num_experts(self) -> int:
+        """Number of opinions in the panel."""
+        return len(self._keys)
+
+    def replace(self, expert_id: str, opinion: FuzzyTriangleNumber) -> BeCoMeResult:
+        """
+        BeCoMe result of the panel with the expert's opinion replaced.
+
+        An expert without an opinion in the panel is added as a new one.
+
+        :param expert_id: Expert whose opinion changes
+        :param opinion: The expert's new opinion
+        :return: Result of the changed panel
+        """
+        index = self._index.get(expert_id)
+        removed = None if index is None else self._position[index]
+        count = self.num_experts + (1 if index is None else 0)
+
+        key = (opinion.centroid, self.num_experts if index is None else index)
+        inserted = bisect_left(self._keys, key)
+        if removed is not None and removed < inserted:
+            inserted -= 1
+        centroids = _ReplacedCentroids(self._centroids, removed, inserted, opinion.centroid)
+        old = None if removed is None else self._sorted[removed]
+
+        return BeCoMeResult.from_calculations(
+            arithmetic_mean=FuzzyTriangleNumber(
+                lower_bound=self._lower.mean_replacing(
+                    None if old is None else old.lower_bound, opinion.lower_bound
+                ),
+                peak=self._peak.mean_replacing(None if old is None else old.peak, opinion.peak),
+                upper_bound=self._upper.mean_replacing(
+                    None if old is None else old.upper_bound, opinion.upper_bound
+                ),
+            ),
+            median=self._median(centroids, opinion),
+            num_experts=count,
+        )
+
+    def _median(
+        self, centroids: _ReplacedCentroids, opinion: FuzzyTriangleNumber
+    ) -> FuzzyTriangleNumber:
+        """
+        Median of the changed panel, following ``BeCoMeCalculator.calculate_median``.
+
+        :param centroids: Changed sorted centroids
+        :param opinion: The new opinion
+        :return: Median (Ω) of the changed panel
+        """
+        count = len(centroids)
+        middle = count // 2
+        if count % 2 == 1:
+            median_centroid = centroids[middle]
+        else:
+            median_centroid = (centroids[middle - 1] + centroids[middle]) / 2
+
+        def opinion_at(position: int) -> FuzzyTriangleNumber:
+            original = centroids.source(position)
+            return opinion if original is None else self._sorted[original]
+
+        first = closest_position(centroids, median_centroid, ())
+        if count % 2 == 1:
+            return opinion_at(first)
+        second = closest_position(centroids, median_centroid, (first,))
+        return FuzzyTriangleNumber.average([opinion_at(first), opinion_at(second)])
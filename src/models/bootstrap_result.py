@@ -0,0 +1,55 @@
+"""Bootstrap confidence interval representation."""
+
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+
+from .become_result import BeCoMeResult
+
+
+class ConfidenceInterval(BaseModel):
+    """
+    Immutable two-sided confidence interval.
+
+    :ivar low: Lower end of the interval
+    :ivar high: Upper end of the interval
+    """
+
+    low: float = Field(..., description="Lower end of the interval")
+    high: float = Field(..., description="Upper end of the interval")
+
+    model_config = ConfigDict(frozen=True)
+
+    @model_validator(mode="after")
+    def _check_order(self) -> "ConfidenceInterval":
+        """Reject intervals whose ends are reversed."""
+        if self.low > self.high:
+            raise ValueError(f"Interval ends reversed: low={self.low}, high={self.high}")
+        return self
+
+
+class BootstrapResult(BaseModel):
+    """
+    Immutable result of a bootstrap analysis of the best compromise.
+
+    Each interval is a percentile interval over the resampled panels for one
+    characteristic of the best compromise (ΓΩMean).
+
+    :ivar estimate: BeCoMe result of the original panel
+    :ivar resamples: Number of bootstrap resamples (B)
+    :ivar confidence: Two-sided confidence level, e.g. 0.95
+    :ivar seed: Random seed the resamples were drawn with
+    :ivar lower_bound: Interval for the best compromise lower bound (π)
+    :ivar peak: Interval for the best compromise peak (φ)
+    :ivar upper_bound: Interval for the best compromise upper bound (ξ)
+    :ivar centroid: Interval for the best compromise centroid
+    """
+
+    estimate: BeCoMeResult = Field(..., description="Result of the original panel")
+    resamples: int = Field(..., ge=1, description="Number of bootstrap resamples")
+    confidence: float = Field(..., gt=0.0, lt=1.0, description="Two-sided confidence level")
+    seed: int = Field(..., description="Random seed of the resamples")
+    lower_bound: ConfidenceInterval = Field(..., description="Interval for π")
+    peak: ConfidenceInterval = Field(..., description="Interval for φ")
+    upper_bound: ConfidenceInterval = Field(..., description="Interval for ξ")
+    centroid: ConfidenceInterval = Field(..., description="Interval for the centroid")
+
+    model_config = ConfigDict(frozen=True)
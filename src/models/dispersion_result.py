@@ -0,0 +1,55 @@
+"""Dispersion (consensus) metrics representation."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class ExpertOutlier(BaseModel):
+    """
+    Immutable outlier flag of one expert.
+
+    :ivar expert_id: Identifier of the expert
+    :ivar centroid: Centroid of the expert's opinion
+    :ivar score: Robust z-score of the centroid (distance from the median in MAD units)
+    """
+
+    expert_id: str = Field(..., description="Identifier of the expert")
+    centroid: float = Field(..., description="Centroid of the expert's opinion")
+    score: float = Field(..., ge=0.0, description="Robust z-score of the centroid")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class DispersionReport(BaseModel):
+    """
+    Immutable dispersion metrics of a panel of expert opinions.
+
+    Pairwise metrics run over all n(n-1)/2 unordered pairs of experts; a
+    single expert has no pairs and reports no spread (distance and overlap
+    length 0, every pair overlapping).
+
+    :ivar num_experts: Number of expert opinions
+    :ivar mean_pairwise_distance: Mean |centroid_i - centroid_j| over all pairs
+    :ivar overlapping_pairs: Share of pairs whose supports [lower, upper] intersect
+    :ivar mean_support_overlap: Mean length of the intersection of two supports
+    :ivar median_centroid: Median of the centroids
+    :ivar mad: Median absolute deviation of the centroids from their median
+    :ivar outliers: Experts flagged as outliers, by ascending centroid
+    """
+
+    num_experts: int = Field(..., ge=1, description="Number of expert opinions")
+    mean_pairwise_distance: float = Field(
+        ..., ge=0.0, description="Mean absolute centroid distance over all pairs"
+    )
+    overlapping_pairs: float = Field(
+        ..., ge=0.0, le=1.0, description="Share of pairs with intersecting supports"
+    )
+    mean_support_overlap: float = Field(
+        ..., ge=0.0, description="Mean intersection length of two supports"
+    )
+    median_centroid: float = Field(..., description="Median of the centroids")
+    mad: float = Field(..., ge=0.0, description="Median absolute deviation of the centroids")
+    outliers: tuple[ExpertOutlier, ...] = Field(
+        ..., description="Experts flagged as outliers, by ascending centroid"
+    )
+
+    model_config = ConfigDict(frozen=True)
@@ -0,0 +1,57 @@
+"""Expert faction (clustering) representation."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .become_result import BeCoMeResult
+
+
+class Faction(BaseModel):
+    """
+    Immutable group of experts with neighbouring opinion centroids.
+
+    :ivar expert_ids: Experts in the faction, in input order
+    :ivar lowest_centroid: Lowest centroid in the faction
+    :ivar highest_centroid: Highest centroid in the faction
+    :ivar result: BeCoMe result of the faction's opinions
+    """
+
+    expert_ids: tuple[str, ...] = Field(..., min_length=1, description="Experts in the faction")
+    lowest_centroid: float = Field(..., description="Lowest centroid in the faction")
+    highest_centroid: float = Field(..., description="Highest centroid in the faction")
+    result: BeCoMeResult = Field(..., description="BeCoMe result of the faction")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class FactionReport(BaseModel):
+    """
+    Immutable partition of an expert panel into factions.
+
+    Factions are the optimal clustering of the opinion centroids: contiguous
+    ranges with the least within-faction sum of squared deviations.
+
+    :ivar num_experts: Number of expert opinions
+    :ivar selected: True if the number of factions was chosen automatically
+    :ivar factions: Factions by ascending centroid
+    :ivar within_sum_of_squares: Squared centroid distances to the faction means
+    :ivar explained_variance: Share of the centroid variance explained by the split
+    """
+
+    num_experts: int = Field(..., ge=1, description="Number of expert opinions")
+    selected: bool = Field(..., description="Whether the number of factions was chosen")
+    factions: tuple[Faction, ...] = Field(
+        ..., min_length=1, description="Factions by ascending centroid"
+    )
+    within_sum_of_squares: float = Field(
+        ..., ge=0.0, description="Squared centroid distances to the faction means"
+    )
+    explained_variance: float = Field(
+        ..., ge=0.0, le=1.0, description="Share of centroid variance explained"
+    )
+
+    model_config = ConfigDict(frozen=True)
+
+    @property
+    def num_factions(self) -> int:
+        """Number of factions."""
+        return len(self.factions)
@@ -0,0 +1,53 @@
+"""Leave-one-out expert influence representation."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .become_result import BeCoMeResult
+
+
+class ExpertInfluence(BaseModel):
+    """
+    Immutable influence of one expert on the best compromise.
+
+    Shifts are signed and measured as (result with the expert) minus (result
+    without the expert): a positive ``compromise_shift`` means the expert pulls
+    the best compromise up.
+
+    :ivar rank: Position in the influence ranking (1 = most influential)
+    :ivar expert_id: Identifier of the expert
+    :ivar influence: Absolute shift of the best compromise centroid
+    :ivar compromise_shift: Signed shift of the best compromise centroid
+    :ivar lower_shift: Signed shift of the best compromise lower bound (π)
+    :ivar peak_shift: Signed shift of the best compromise peak (φ)
+    :ivar upper_shift: Signed shift of the best compromise upper bound (ξ)
+    :ivar max_error_shift: Signed shift of the maximum error (Δmax)
+    :ivar result_without: BeCoMe result of the remaining experts
+    """
+
+    rank: int = Field(..., ge=1, description="Position in the ranking (1 = most influential)")
+    expert_id: str = Field(..., description="Identifier of the expert")
+    influence: float = Field(..., ge=0.0, description="|compromise_shift|")
+    compromise_shift: float = Field(..., description="Shift of the ΓΩMean centroid")
+    lower_shift: float = Field(..., description="Shift of π")
+    peak_shift: float = Field(..., description="Shift of φ")
+    upper_shift: float = Field(..., description="Shift of ξ")
+    max_error_shift: float = Field(..., description="Shift of Δmax")
+    result_without: BeCoMeResult = Field(..., description="Result without this expert")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class InfluenceReport(BaseModel):
+    """
+    Immutable result of a leave-one-out influence analysis.
+
+    :ivar baseline: BeCoMe result of all experts
+    :ivar experts: One entry per expert, ranked by descending influence
+    """
+
+    baseline: BeCoMeResult = Field(..., description="Result of all experts")
+    experts: tuple[ExpertInfluence, ...] = Field(
+        ..., description="Experts ranked by descending influence"
+    )
+
+    model_config = ConfigDict(frozen=True)
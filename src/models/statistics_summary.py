@@ -0,0 +1,91 @@
+"""Multi-statistic summary representation."""
+
+from enum import StrEnum
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from .become_result import BeCoMeResult
+from .dispersion_result import DispersionReport
+from .fuzzy_number import FuzzyTriangleNumber
+
+
+class Statistic(StrEnum):
+    """Statistics a :class:`StatisticsSummary` can carry."""
+
+    BECOME = "become"
+    QUARTILES = "quartiles"
+    TRIMMED_MEAN = "trimmed_mean"
+    MIN_MAX = "min_max"
+    STD_DEV = "std_dev"
+    DISPERSION = "dispersion"
+
+
+class Quartiles(BaseModel):
+    """
+    Immutable quartiles of the expert centroids.
+
+    Inclusive linear interpolation, as ``statistics.quantiles(method="inclusive")``.
+
+    :ivar q1: First quartile
+    :ivar q2: Median
+    :ivar q3: Third quartile
+    """
+
+    q1: float = Field(..., description="First quartile")
+    q2: float = Field(..., description="Median")
+    q3: float = Field(..., description="Third quartile")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class ComponentDeviation(BaseModel):
+    """
+    Immutable population standard deviation of each opinion component.
+
+    :ivar lower_bound: Deviation of the lower bounds (A)
+    :ivar peak: Deviation of the peaks (C)
+    :ivar upper_bound: Deviation of the upper bounds (B)
+    :ivar centroid: Deviation of the centroids
+    """
+
+    lower_bound: float = Field(..., ge=0.0, description="Deviation of the lower bounds")
+    peak: float = Field(..., ge=0.0, description="Deviation of the peaks")
+    upper_bound: float = Field(..., ge=0.0, description="Deviation of the upper bounds")
+    centroid: float = Field(..., ge=0.0, description="Deviation of the centroids")
+
+    model_config = ConfigDict(frozen=True)
+
+
+class StatisticsSummary(BaseModel):
+    """
+    Immutable set of statistics over one panel of expert opinions.
+
+    Statistics that were not requested are None.
+
+    :ivar num_experts: Number of expert opinions
+    :ivar become: BeCoMe result (Γ, Ω and ΓΩMean)
+    :ivar quartiles: Quartiles of the centroids
+    :ivar trimmed_mean: Trimmed mean of the centroids
+    :ivar minimum: Component-wise minimum of the opinions
+    :ivar maximum: Component-wise maximum of the opinions
+    :ivar std_dev: Population standard deviation of each component
+    :ivar dispersion: Consensus and dispersion metrics
+    """
+
+    num_experts: int = Field(..., ge=1, description="Number of expert opinions")
+    become: BeCoMeResult | None = Field(None, description="BeCoMe result")
+    quartiles: Quartiles | None = Field(None, description="Quartiles of the centroids")
+    trimmed_mean: float | None = Field(None, description="Trimmed mean of the centroids")
+    minimum: FuzzyTriangleNumber | None = Field(None, description="Component-wise minimum")
+    maximum: FuzzyTriangleNumber | None = Field(None, description="Component-wise maximum")
+    std_dev: ComponentDeviation | None = Field(
+        None, description="Population standard deviation of each component"
+    )
+    dispersion: DispersionReport | None = Field(
+        None, description="Consensus and dispersion metrics"
+    )
+
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True,
+        frozen=True,
+    )
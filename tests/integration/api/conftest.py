@@ -23,12 +23,22 @@ from api.db.models import (  # noqa: F401 - models required for SQLModel.metadat
     PasswordResetToken,
     Project,
     ProjectMember,
+    ResultSnapshot,
     User,
 )
-from api.db.session import get_session
+from api.db.session import get_read_session, get_session
 from api.middleware.exception_handlers import register_exception_handlers
 from api.middleware.rate_limit import limiter
-from api.routes import auth, calculate, health, invitations, opinions, projects, users
+from api.routes import (
+    auth,
+    calculate,
+    health,
+    invitations,
+    opinions,
+    projects,
+    snapshots,
+    users,
+)
 from tests.shared.helpers import (  # noqa: F401
     DEFAULT_TEST_PASSWORD,
     auth_header,
@@ -61,6 +71,7 @@ def create_test_app() -> FastAPI:
     app.include_router(projects.router)
     app.include_router(invitations.router)
     app.include_router(opinions.router)
+    app.include_router(snapshots.router)
     return app
 
 
@@ -171,6 +182,8 @@ def client(test_engine):
 
     test_app.dependency_overrides[get_session] = override_get_session
 
+    test_app.dependency_overrides[get_read_session] = override_get_session
+
     with TestClient(test_app) as test_client:
         yield test_client
 
@@ -192,5 +205,7 @@ def client_with_session(test_engine):
 
         test_app.dependency_overrides[get_session] = override_get_session
 
+        test_app.dependency_overrides[get_read_session] = override_get_session
+
         with TestClient(test_app) as test_client:
             yield test_client, session
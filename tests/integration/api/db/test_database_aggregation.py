@@ -0,0 +1,158 @@
+"""Differential tests: database-side aggregation against the Python calculator."""
+
+import random
+from datetime import timedelta
+
+import pytest
+from sqlmodel import Session
+
+from api.db.models import CalculationResult, ExpertOpinion, Project, User
+from api.db.utils import utc_now
+from api.services.calculation_service import CalculationService
+from api.services.database_aggregation import DatabaseAggregator
+from tests.reference.budget_case import BUDGET_CASE
+from tests.reference.floods_case import FLOODS_CASE
+from tests.reference.pendlers_case import PENDLERS_CASE
+
+_Triple = tuple[float, float, float]
+_RESULT_FIELDS = [
+    name
+    for name in CalculationResult.model_fields
+    if name not in ("id", "project_id", "calculated_at")
+]
+
+
+def store_opinions(session: Session, triples: list[_Triple], same_time: bool = False) -> Project:
+    """Store a project with one opinion per triple, submitted in list order.
+
+    :param session: Database session
+    :param triples: (lower, peak, upper) per expert
+    :param same_time: Give every opinion the same timestamp (ties fall back to id)
+    :return: The stored project
+    """
+    admin = User(email="admin@example.com", hashed_password="hash", first_name="A", last_name="B")
+    session.add(admin)
+    session.commit()
+    project = Project(name="Differential", admin_id=admin.id, scale_min=-1000, scale_max=1000)
+    session.add(project)
+    start = utc_now()
+    for index, (lower, peak, upper) in enumerate(triples):
+        expert = User(
+            email=f"expert{index}@example.com",
+            hashed_password="hash",
+            first_name="E",
+            last_name="X",
+        )
+        session.add(expert)
+        submitted = start if same_time else start + timedelta(seconds=index)
+        session.add(
+            ExpertOpinion(
+                project_id=project.id,
+                user_id=expert.id,
+                position="Expert",
+                lower_bound=lower,
+                peak=peak,
+                upper_bound=upper,
+                created_at=submitted,
+                updated_at=submitted,
+            )
+        )
+    session.commit()
+    return project
+
+
+def assert_same_result(session: Session, project: Project) -> None:
+    """Recalculate with both backends and compare the stored results.
+
+    Medians must be identical (same opinions picked); means may differ in the
+    last bits between SQL AVG and statistics.mean.
+    """
+    python = CalculationService(session).recalculate(project.id)
+    assert python is not None
+    expected = {name: getattr(python, name) for name in _RESULT_FIELDS}
+
+    database = CalculationService(session, aggregator=DatabaseAggregator(session)).recalculate(
+        project.id
+    )
+    assert database is not None
+    actual = {name: getattr(database, name) for name in _RESULT_FIELDS}
+
+    for name in ("median_lower", "median_peak", "median_upper", "num_experts", "likert_decision"):
+        assert actual[name] == expected[name], name
+    for name in set(expected) - {"median_lower", "median_peak", "median_upper"}:
+        if isinstance(expected[name], float):
+            assert actual[name] == pytest.approx(expected[name], rel=1e-12, abs=1e-12), name
+
+
+def reference_triples(case: dict) -> list[_Triple]:
+    """Extract (lower, peak, upper) triples from a reference case."""
+    return [
+        (op.opinion.lower_bound, op.opinion.peak, op.opinion.upper_bound) for op in case["opinions"]
+    ]
+
+
+class TestDatabaseAggregator:
+    """Tests for DatabaseAggregator on SQLite."""
+
+    @pytest.mark.parametrize(
+        "case", [BUDGET_CASE, FLOODS_CASE, PENDLERS_CASE], ids=["budget", "floods", "pendlers"]
+    )
+    def test_matches_calculator_on_reference_cases(self, session, case):
+        """
+        GIVEN the Excel reference cases
+        WHEN aggregated in the database
+        THEN the result equals the Python calculator's
+        """
+        # GIVEN
+        project = store_opinions(session, reference_triples(case))
+
+        # WHEN / THEN
+        assert_same_result(session, project)
+
+    @pytest.mark.parametrize("count", [1, 2, 3, 4, 7, 10])
+    @pytest.mark.parametrize("same_time", [False, True], ids=["ordered", "same-time"])
+    def test_matches_calculator_on_centroid_ties(self, session, count, same_time):
+        """
+        GIVEN opinions from a tiny value range (many equal centroids)
+        WHEN aggregated in the database
+        THEN the median picks the same opinions as the median strategies
+        """
+        # GIVEN
+        rng = random.Random(count * 2 + same_time)
+        triples = []
+        for _ in range(count):
+            lower, peak, upper = sorted(rng.choice((0.0, 1.0, 2.0, 3.0)) for _ in range(3))
+            triples.append((lower, peak, upper))
+        project = store_opinions(session, triples, same_time=same_time)
+
+        # WHEN / THEN
+        assert_same_result(session, project)
+
+    def test_breaks_equal_centroid_ties_by_submission(self, session):
+        """
+        GIVEN three opinions with the same centroid but different shapes
+        WHEN aggregated in the database
+        THEN the earliest submitted one is the median, as in OddMedianStrategy
+        """
+        # GIVEN
+        project = store_opinions(session, [(0.0, 2.0, 4.0), (2.0, 2.0, 2.0), (1.0, 2.0, 3.0)])
+
+        # WHEN
+        result = DatabaseAggregator(session).aggregate(project.id)
+
+        # THEN
+        assert result is not None
+        assert result.median.lower_bound == 0.0
+        assert result.median.upper_bound == 4.0
+
+    def test_returns_none_without_opinions(self, session):
+        """
+        GIVEN a project without opinions
+        WHEN aggregated in the database
+        THEN there is no result
+        """
+        # GIVEN
+        project = store_opinions(session, [])
+
+        # WHEN / THEN
+        assert DatabaseAggregator(session).aggregate(project.id) is None
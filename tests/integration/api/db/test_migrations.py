@@ -10,7 +10,7 @@ import shutil
 import pytest
 from alembic import command
 from alembic.config import Config
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, inspect, text
 
 pytestmark = pytest.mark.skipif(
     not shutil.which("pg_ctl"),
@@ -63,8 +63,8 @@ class TestProjectAdminRestrictMigration:
             # THEN - admin_id is protected by RESTRICT
             assert _delete_rule(engine, "projects_admin_id_fkey") == "RESTRICT"
 
-            # WHEN - the RESTRICT migration is rolled back one step
-            command.downgrade(config, "-1")
+            # WHEN - the RESTRICT migration (and everything after it) is rolled back
+            command.downgrade(config, "b1d9f4a2c7e3-1")
 
             # THEN - the constraint reverts to CASCADE (downgrade works)
             assert _delete_rule(engine, "projects_admin_id_fkey") == "CASCADE"
@@ -76,3 +76,104 @@ class TestProjectAdminRestrictMigration:
             assert _delete_rule(engine, "projects_admin_id_fkey") == "RESTRICT"
         finally:
             engine.dispose()
+
+
+def _index_names(engine, table: str) -> set[str]:
+    """Return the names of a table's indexes."""
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+class TestCompositeQueryIndexesMigration:
+    """The migration replacing single-column FK indexes with composite ones."""
+
+    def test_upgrade_adds_composite_indexes_and_downgrade_restores(self, migration_pg, monkeypatch):
+        """upgrade builds the composite/partial indexes concurrently; downgrade reverts."""
+        # GIVEN - a clean database with Alembic aimed at it
+        url = _url(migration_pg)
+        monkeypatch.setenv("ALEMBIC_DATABASE_URL", url)
+        config = Config("alembic.ini")
+        engine = create_engine(url)
+
+        try:
+            # WHEN - the full migration chain is applied
+            command.upgrade(config, "head")
+
+            # THEN - composite and partial indexes replace the single-column ones
+            opinion_indexes = _index_names(engine, "expert_opinions")
+            assert "ix_expert_opinions_project_id_created_at" in opinion_indexes
+            assert "ix_expert_opinions_project_id" not in opinion_indexes
+            assert "ix_password_reset_tokens_user_id_unused" in _index_names(
+                engine, "password_reset_tokens"
+            )
+
+            # WHEN - the index migration is rolled back
+            command.downgrade(config, "7c2e9a4f1b3d-1")
+
+            # THEN - the original indexes are back
+            opinion_indexes = _index_names(engine, "expert_opinions")
+            assert "ix_expert_opinions_project_id" in opinion_indexes
+            assert "ix_expert_opinions_project_id_created_at" not in opinion_indexes
+        finally:
+            engine.dispose()
+
+
+class TestMaintenanceLeasesMigration:
+    """The migration adding maintenance leases and the reset token expiry index."""
+
+    def test_upgrade_adds_leases_and_downgrade_removes(self, migration_pg, monkeypatch):
+        """upgrade creates the lease table and expiry index; downgrade drops both."""
+        # GIVEN - a clean database with Alembic aimed at it
+        url = _url(migration_pg)
+        monkeypatch.setenv("ALEMBIC_DATABASE_URL", url)
+        config = Config("alembic.ini")
+        engine = create_engine(url)
+
+        try:
+            # WHEN - the full migration chain is applied
+            command.upgrade(config, "head")
+
+            # THEN - the lease table and the expiry index exist
+            assert "maintenance_leases" in inspect(engine).get_table_names()
+            assert "ix_password_reset_tokens_expires_at" in _index_names(
+                engine, "password_reset_tokens"
+            )
+
+            # WHEN - the migration is rolled back
+            command.downgrade(config, "5b7d3e9c2a61-1")
+
+            # THEN - both are gone
+            assert "maintenance_leases" not in inspect(engine).get_table_names()
+            assert "ix_password_reset_tokens_expires_at" not in _index_names(
+                engine, "password_reset_tokens"
+            )
+        finally:
+            engine.dispose()
+
+
+class TestResultSnapshotsMigration:
+    """The migration adding published result snapshots."""
+
+    def test_upgrade_adds_snapshots_and_downgrade_removes(self, migration_pg, monkeypatch):
+        """upgrade creates the snapshot table with its delete rules; downgrade drops it."""
+        # GIVEN - a clean database with Alembic aimed at it
+        url = _url(migration_pg)
+        monkeypatch.setenv("ALEMBIC_DATABASE_URL", url)
+        config = Config("alembic.ini")
+        engine = create_engine(url)
+
+        try:
+            # WHEN - the full migration chain is applied
+            command.upgrade(config, "head")
+
+            # THEN - snapshots go with their project and outlive their publisher
+            assert "result_snapshots" in inspect(engine).get_table_names()
+            assert _delete_rule(engine, "result_snapshots_project_id_fkey") == "CASCADE"
+            assert _delete_rule(engine, "result_snapshots_published_by_fkey") == "SET NULL"
+
+            # WHEN - the migration is rolled back
+            command.downgrade(config, "9a4f6c2d8e15-1")
+
+            # THEN - the table is gone
+            assert "result_snapshots" not in inspect(engine).get_table_names()
+        finally:
+            engine.dispose()
@@ -7,6 +7,7 @@ Run with: uv run pytest tests/integration/api/db/test_postgres_integration.py -v
 """
 
 import shutil
+import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from uuid import UUID, uuid4
 
@@ -14,7 +15,7 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import scoped_session, sessionmaker
-from sqlmodel import SQLModel, select
+from sqlmodel import Session, SQLModel, select
 
 from api.db.models import (
     CalculationResult,
@@ -24,6 +25,24 @@ from api.db.models import (
     ProjectMember,
     User,
 )
+from api.services.calculation_service import CalculationService
+from api.services.opinion_service import OpinionService
+from api.services.recalculation import RecalculationCoordinator
+from api.services.result_snapshot_service import ResultSnapshotService, SnapshotCache
+from tests.integration.api.db.test_database_aggregation import (
+    assert_same_result,
+    reference_triples,
+    store_opinions,
+)
+from tests.integration.api.db.test_query_plans import (
+    PLAN_CASES,
+    assert_index_only_plans,
+    seed_workload,
+)
+from tests.reference.budget_case import BUDGET_CASE
+from tests.reference.floods_case import FLOODS_CASE
+from tests.reference.pendlers_case import PENDLERS_CASE
+from tests.shared.helpers import record_statements
 
 # Skip all tests in this module if PostgreSQL is not installed
 pytestmark = pytest.mark.skipif(
@@ -258,6 +277,49 @@ class TestConcurrentAccess:
         assert results["success"] == 1
         assert results["errors"] == 4
 
+    def test_concurrent_publishes_get_distinct_versions(self, pg_engine):
+        """
+        GIVEN a project with a result
+        WHEN five admins' requests publish snapshots at the same time
+        THEN every publish succeeds with its own version, 1 to 5
+        """
+        # GIVEN
+        with Session(pg_engine) as session:
+            admin = User(
+                email="publisher@example.com", hashed_password="hash", first_name="A", last_name="B"
+            )
+            session.add(admin)
+            session.flush()
+            project = Project(name="Published", admin_id=admin.id)
+            session.add(project)
+            session.flush()
+            session.add(
+                ExpertOpinion(
+                    project_id=project.id,
+                    user_id=admin.id,
+                    position="Expert",
+                    lower_bound=10.0,
+                    peak=20.0,
+                    upper_bound=30.0,
+                )
+            )
+            session.commit()
+            CalculationService(session).recalculate(project.id)
+            project_id, admin_id = project.id, admin.id
+
+        def publish() -> int:
+            with Session(pg_engine) as session:
+                project = session.get(Project, project_id)
+                service = ResultSnapshotService(session, cache=SnapshotCache())
+                return service.publish(project, admin_id).version
+
+        # WHEN
+        with ThreadPoolExecutor(max_workers=5) as executor:
+            versions = [future.result() for future in [executor.submit(publish) for _ in range(5)]]
+
+        # THEN
+        assert sorted(versions) == [1, 2, 3, 4, 5]
+
 
 class TestSavepointAndPartialRollback:
     """Tests for SAVEPOINT functionality in PostgreSQL."""
@@ -442,3 +504,176 @@ class TestPostgreSQLSpecificFeatures:
                     "scale_max": 50.0,
                 }
             )
+
+
+class TestOpinionWritePath:
+    """Tests for the single-transaction opinion write path on PostgreSQL."""
+
+    @pytest.mark.parametrize("existing", [False, True], ids=["create", "update"])
+    def test_upserts_opinion_and_result_in_one_transaction(self, pg_engine, existing):
+        """
+        GIVEN a project member, with or without an earlier opinion
+        WHEN an opinion is submitted and the project recalculated in one transaction
+        THEN four statements and one commit store both opinion and result
+        """
+        # GIVEN
+        with Session(pg_engine) as setup:
+            admin = User(
+                email=f"write-path-{existing}@example.com",
+                hashed_password="hash",
+                first_name="Admin",
+                last_name="User",
+            )
+            setup.add(admin)
+            setup.commit()
+            project = Project(name="Write Path", admin_id=admin.id)
+            setup.add(project)
+            setup.commit()
+            setup.add(ProjectMember(project_id=project.id, user_id=admin.id, role=MemberRole.ADMIN))
+            setup.commit()
+            project_id, user_id = project.id, admin.id
+
+        if existing:
+            with Session(pg_engine) as session:
+                OpinionService(session).upsert_opinion(project_id, user_id, "Expert", 1, 2, 3)
+
+        with Session(pg_engine) as session:
+            # Loaded by the membership check; the recalculation reuses it.
+            loaded = session.get(Project, project_id)
+
+            # WHEN
+            with record_statements(pg_engine) as log:
+                upserted = OpinionService(session).upsert_opinion(
+                    project_id, user_id, "Expert", 30, 50, 70, commit=False
+                )
+                CalculationService(session).recalculate(project_id, in_transaction=True)
+
+        # THEN
+        assert loaded is not None
+        assert upserted.is_new is not existing
+        assert len(log.statements) == 4
+        assert log.commits == 1
+        with Session(pg_engine) as session:
+            stored = session.exec(
+                select(CalculationResult).where(CalculationResult.project_id == project_id)
+            ).one()
+            assert stored.best_compromise_peak == 50.0
+
+    def test_recalculation_in_another_worker_waits_for_the_running_one(self, pg_engine):
+        """
+        GIVEN a worker holding the project row mid-recalculation with a new opinion
+        WHEN another worker (its own coordinator) recalculates the project
+        THEN it waits for that commit and stores a result over both opinions
+        """
+        # GIVEN
+        with Session(pg_engine) as setup:
+            users = [
+                User(
+                    email=f"worker-{n}@example.com",
+                    hashed_password="hash",
+                    first_name="W",
+                    last_name=str(n),
+                )
+                for n in range(2)
+            ]
+            setup.add_all(users)
+            setup.flush()
+            project = Project(name="Two Workers", admin_id=users[0].id)
+            setup.add(project)
+            setup.flush()
+            setup.add(
+                ExpertOpinion(
+                    project_id=project.id,
+                    user_id=users[0].id,
+                    position="Expert",
+                    lower_bound=10.0,
+                    peak=20.0,
+                    upper_bound=30.0,
+                )
+            )
+            setup.commit()
+            project_id, second_user = project.id, users[1].id
+
+        def recalculate_elsewhere() -> int:
+            with Session(pg_engine) as session:
+                service = CalculationService(session, coordinator=RecalculationCoordinator())
+                result = service.recalculate(project_id)
+                assert result is not None
+                return result.num_experts
+
+        with Session(pg_engine) as first, ThreadPoolExecutor(max_workers=1) as executor:
+            first.exec(
+                select(Project.id).where(Project.id == project_id).with_for_update(key_share=True)
+            ).one()
+
+            # WHEN
+            pending = executor.submit(recalculate_elsewhere)
+            time.sleep(0.2)
+            waited = not pending.done()
+            first.add(
+                ExpertOpinion(
+                    project_id=project_id,
+                    user_id=second_user,
+                    position="Expert",
+                    lower_bound=30.0,
+                    peak=40.0,
+                    upper_bound=50.0,
+                )
+            )
+            first.commit()
+
+            # THEN
+            assert waited
+            assert pending.result() == 2
+
+
+class TestDatabaseAggregation:
+    """Differential tests of DatabaseAggregator on PostgreSQL."""
+
+    @pytest.mark.parametrize(
+        "case", [BUDGET_CASE, FLOODS_CASE, PENDLERS_CASE], ids=["budget", "floods", "pendlers"]
+    )
+    def test_matches_calculator_on_reference_cases(self, pg_engine, case):
+        """
+        GIVEN the Excel reference cases stored in PostgreSQL
+        WHEN aggregated in the database
+        THEN the result equals the Python calculator's
+        """
+        with Session(pg_engine) as session:
+            # GIVEN
+            project = store_opinions(session, reference_triples(case))
+
+            # WHEN / THEN
+            assert_same_result(session, project)
+
+    def test_matches_calculator_on_centroid_ties(self, pg_engine):
+        """
+        GIVEN opinions with equal centroids and equal timestamps
+        WHEN aggregated in the database
+        THEN the median picks the same opinions as the median strategies
+        """
+        triples = [(0.0, 2.0, 4.0), (2.0, 2.0, 2.0), (1.0, 2.0, 3.0), (1.0, 1.0, 1.0)]
+        with Session(pg_engine) as session:
+            # GIVEN
+            project = store_opinions(session, triples, same_time=True)
+
+            # WHEN / THEN
+            assert_same_result(session, project)
+
+
+class TestQueryPlans:
+    """Service queries on PostgreSQL use indexes for filtering and ordering."""
+
+    @pytest.mark.parametrize("name", list(PLAN_CASES))
+    def test_reads_use_indexes(self, pg_engine, name):
+        """
+        GIVEN a seeded, analyzed PostgreSQL database
+        WHEN a service read path runs
+        THEN no plan has a Seq Scan, nor a Sort an index could have avoided
+        """
+        with Session(pg_engine) as session:
+            # GIVEN
+            ids = seed_workload(session)
+
+            # WHEN / THEN
+            assert_index_only_plans(pg_engine, session, ids, PLAN_CASES[name])
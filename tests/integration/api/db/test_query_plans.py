@@ -0,0 +1,286 @@
+"""Query-plan regression suite: service queries must be served by indexes.
+
+Each case runs a read path of a service against a seeded database, records
+the statements it executes and asks the database to ``EXPLAIN`` them. A full
+table scan fails the case, and so does a sort node unless the case's ordering
+column lives on another table than its filter (a join's rows can then only be
+sorted after the index lookup; the sort covers one user's rows, not the table).
+
+SQLite reports ``SCAN <table>`` and ``USE TEMP B-TREE FOR ORDER BY``;
+PostgreSQL reports ``Seq Scan`` and ``Sort`` nodes. On PostgreSQL the cost
+switches ``enable_seqscan`` and ``enable_sort`` are turned off, so a scan or
+sort that still shows up has no index alternative at all, whatever the
+table sizes.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+from uuid import UUID
+
+import pytest
+from sqlalchemy import Connection, Engine
+from sqlmodel import Session
+
+from api.db.models import (
+    CalculationResult,
+    ExpertOpinion,
+    Invitation,
+    MemberRole,
+    PasswordResetToken,
+    Project,
+    ProjectMember,
+    User,
+)
+from api.db.utils import utc_now
+from api.services.calculation_service import CalculationService
+from api.services.data_export_service import DataExportService
+from api.services.invitation_service import InvitationService
+from api.services.opinion_service import OpinionService
+from api.services.password_reset_service import PasswordResetService
+from api.services.project_membership_service import ProjectMembershipService
+from api.services.project_query_service import ProjectQueryService
+from api.services.result_snapshot_service import ResultSnapshotService
+from tests.shared.helpers import record_statements
+
+_PROJECTS = 12
+_MEMBERS_PER_PROJECT = 8
+_USERS = 40
+
+
+@dataclass(frozen=True)
+class SeededIds:
+    """Identifiers the plan cases query for."""
+
+    user_id: UUID
+    user_email: str
+    project_id: UUID
+
+
+@dataclass(frozen=True)
+class PlanCase:
+    """A service read path and whether a sort node is acceptable in its plan."""
+
+    run: Callable[[Session, SeededIds], Any]
+    allow_sort: bool = False
+
+
+PLAN_CASES = {
+    "opinions_for_project": PlanCase(
+        lambda s, ids: OpinionService(s).get_opinions_for_project(ids.project_id)
+    ),
+    "opinions_version": PlanCase(
+        lambda s, ids: OpinionService(s).get_opinions_version(ids.project_id)
+    ),
+    "opinions_for_calculation": PlanCase(
+        lambda s, ids: CalculationService(s).analyze_influence(ids.project_id)
+    ),
+    "members": PlanCase(lambda s, ids: ProjectMembershipService(s).get_members(ids.project_id)),
+    "members_version": PlanCase(
+        lambda s, ids: ProjectMembershipService(s).get_members_version(ids.project_id)
+    ),
+    "project_invitations": PlanCase(
+        lambda s, ids: InvitationService(s).get_project_invitations(ids.project_id)
+    ),
+    "bulk_invite": PlanCase(
+        lambda s, ids: InvitationService(s).invite_many(
+            ids.project_id, ids.user_id, [f"user{index}@example.com" for index in range(_USERS)]
+        )
+    ),
+    "user_invitations": PlanCase(
+        lambda s, ids: InvitationService(s).get_user_invitations(ids.user_id)
+    ),
+    # Ordered by Project.created_at but filtered on the user's memberships.
+    "user_projects": PlanCase(
+        lambda s, ids: ProjectQueryService(s).get_user_projects_with_roles(ids.user_id),
+        allow_sort=True,
+    ),
+    "data_export": PlanCase(
+        lambda s, ids: DataExportService(s).build_export(s.get_one(User, ids.user_id))
+    ),
+    "result_snapshots": PlanCase(
+        lambda s, ids: ResultSnapshotService(s).list_snapshots(ids.project_id)
+    ),
+    "reset_token_invalidation": PlanCase(
+        lambda s, ids: PasswordResetService(s).create_reset_token(ids.user_email)
+    ),
+    "reset_token_purge": PlanCase(lambda s, ids: PasswordResetService(s).purge_expired(100)),
+}
+
+
+def seed_workload(session: Session) -> SeededIds:
+    """Store users, projects, members, opinions, invitations and reset tokens.
+
+    :param session: Database session
+    :return: Identifiers of one busy user and one of their projects
+    """
+    now = utc_now()
+    users = [
+        User(
+            email=f"user{index}@example.com",
+            hashed_password="hash",
+            first_name="U",
+            last_name=str(index),
+        )
+        for index in range(_USERS)
+    ]
+    session.add_all(users)
+    session.flush()
+    for number in range(_PROJECTS):
+        admin = users[number % 3]
+        project = Project(name=f"Project {number}", admin_id=admin.id)
+        session.add(project)
+        session.flush()
+        members = [admin, *users[3 + number : 3 + number + _MEMBERS_PER_PROJECT - 1]]
+        for offset, member in enumerate(members):
+            joined = now + timedelta(minutes=offset)
+            role = MemberRole.ADMIN if member is admin else MemberRole.EXPERT
+            session.add(
+                ProjectMember(project_id=project.id, user_id=member.id, role=role, joined_at=joined)
+            )
+            session.add(
+                ExpertOpinion(
+                    project_id=project.id,
+                    user_id=member.id,
+                    position="Expert",
+                    lower_bound=offset,
+                    peak=offset + 1.0,
+                    upper_bound=offset + 2.0,
+                    created_at=joined,
+                    updated_at=joined,
+                )
+            )
+        session.add(
+            CalculationResult(
+                project_id=project.id,
+                best_compromise_lower=1.0,
+                best_compromise_peak=2.0,
+                best_compromise_upper=3.0,
+                arithmetic_mean_lower=1.0,
+                arithmetic_mean_peak=2.0,
+                arithmetic_mean_upper=3.0,
+                median_lower=1.0,
+                median_peak=2.0,
+                median_upper=3.0,
+                max_error=0.0,
+                num_experts=len(members),
+            )
+        )
+        for invitee in users[-5:]:
+            session.add(
+                Invitation(project_id=project.id, invitee_id=invitee.id, inviter_id=admin.id)
+            )
+    for user in users:
+        session.add(
+            PasswordResetToken(
+                user_id=user.id,
+                token_hash=user.id.hex * 2,
+                expires_at=now,
+                used_at=now,
+            )
+        )
+    session.commit()
+    return SeededIds(user_id=users[0].id, user_email=users[0].email, project_id=project.id)
+
+
+def _plan_nodes(connection: Connection, statement: str, parameters: Any) -> list[str]:
+    """EXPLAIN a statement and describe its plan nodes.
+
+    :param connection: Connection to the seeded database
+    :param statement: SQL as sent to the driver
+    :param parameters: Driver parameters the statement ran with
+    :return: One description per node (PostgreSQL: node type and relation;
+        SQLite: the ``EXPLAIN QUERY PLAN`` detail)
+    """
+    if connection.dialect.name == "postgresql":
+        plan = connection.exec_driver_sql(f"EXPLAIN (FORMAT JSON) {statement}", parameters)
+        nodes: list[str] = []
+        pending = [plan.scalar_one()[0]["Plan"]]
+        while pending:
+            node = pending.pop()
+            nodes.append(f"{node['Node Type']} {node.get('Relation Name', '')}".strip())
+            pending.extend(node.get("Plans", []))
+        return nodes
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [row.detail for row in rows]
+
+
+def _plan_problems(nodes: list[str], allow_sort: bool) -> list[str]:
+    """Pick the full scans, and unless allowed the sorts, out of a plan.
+
+    :param nodes: Plan node descriptions from :func:`_plan_nodes`
+    :param allow_sort: Whether sort nodes are acceptable
+    :return: Offending node descriptions
+    """
+    problems = []
+    for node in nodes:
+        is_scan = node.startswith("Seq Scan") or (
+            node.startswith("SCAN ") and node != "SCAN CONSTANT ROW"
+        )
+        is_sort = node.split(" ")[0] in ("Sort", "Incremental") or "TEMP B-TREE" in node
+        if is_scan or (is_sort and not allow_sort):
+            problems.append(node)
+    return problems
+
+
+def assert_index_only_plans(engine: Engine, session: Session, ids: SeededIds, case: PlanCase):
+    """Run a case, EXPLAIN its reads and fail on scans or unexpected sorts.
+
+    :param engine: Engine of the seeded database
+    :param session: Session bound to ``engine``
+    :param ids: Seeded identifiers
+    :param case: Service read path under test
+    """
+    with record_statements(engine) as log:
+        case.run(session, ids)
+    session.rollback()
+    reads = [
+        (statement, parameters)
+        for statement, parameters in zip(log.statements, log.parameters, strict=True)
+        if statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE", "WITH"))
+    ]
+    assert reads
+    with engine.connect() as connection:
+        if connection.dialect.name == "postgresql":
+            connection.exec_driver_sql("ANALYZE")
+            connection.exec_driver_sql("SET enable_seqscan = off")
+            connection.exec_driver_sql("SET enable_sort = off")
+        for statement, parameters in reads:
+            nodes = _plan_nodes(connection, statement, parameters)
+            assert not _plan_problems(nodes, case.allow_sort), f"{statement}\n{nodes}"
+
+
+class TestQueryPlans:
+    """Service queries on SQLite use indexes for filtering and ordering."""
+
+    @pytest.mark.parametrize("name", list(PLAN_CASES))
+    def test_reads_use_indexes(self, test_engine, session, name):
+        """
+        GIVEN a seeded database
+        WHEN a service read path runs
+        THEN none of its statements scans a table or sorts where an index could order
+        """
+        # GIVEN
+        ids = seed_workload(session)
+
+        # WHEN / THEN
+        assert_index_only_plans(test_engine, session, ids, PLAN_CASES[name])
+
+    def test_detects_a_full_scan(self, test_engine, session):
+        """
+        GIVEN a query filtering on an unindexed column
+        WHEN its plan is checked
+        THEN the full scan is reported
+        """
+        # GIVEN
+        seed_workload(session)
+        statement = "SELECT id FROM expert_opinions WHERE position = ? ORDER BY peak"
+
+        # WHEN
+        with test_engine.connect() as connection:
+            nodes = _plan_nodes(connection, statement, ("Expert",))
+
+        # THEN
+        assert len(_plan_problems(nodes, allow_sort=False)) == 2
+        assert len(_plan_problems(nodes, allow_sort=True)) == 1
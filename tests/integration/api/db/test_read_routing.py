@@ -0,0 +1,236 @@
+"""Tests for read-replica routing on two local SQLite databases."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import Engine
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from api.db.models import User
+from api.db.routing import ReplicaRouter, RoutingSession
+from api.db.session import get_read_session, get_session
+from api.logging_context import reset_user_id, set_user_id
+
+
+class _Clock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _database(path: Path, email: str) -> Engine:
+    """Create a SQLite database holding one user, identifying the database."""
+    engine = create_engine(f"sqlite:///{path}")
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(User(email=email, hashed_password="hash", first_name="A", last_name="B"))
+        session.commit()
+    return engine
+
+
+def _served_by(session: Session) -> str:
+    """Return the email identifying the database a session reads from."""
+    return session.exec(select(User.email)).one()
+
+
+@pytest.fixture
+def primary(tmp_path) -> Iterator[Engine]:
+    engine = _database(tmp_path / "primary.db", "primary@example.com")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def replica(tmp_path) -> Iterator[Engine]:
+    engine = _database(tmp_path / "replica.db", "replica@example.com")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+@pytest.fixture
+def router(primary, replica, clock) -> ReplicaRouter:
+    return ReplicaRouter(primary, [replica], sticky_seconds=5.0, retry_seconds=30.0, clock=clock)
+
+
+@pytest.fixture
+def acting_user() -> Iterator[str]:
+    token = set_user_id("user-1")
+    yield "user-1"
+    reset_user_id(token)
+
+
+class TestReplicaRouter:
+    """Tests for ReplicaRouter engine selection."""
+
+    def test_reads_from_replica(self, router):
+        """
+        GIVEN a healthy replica and a user without recent writes
+        WHEN a read-only session queries
+        THEN the replica serves it
+        """
+        # WHEN
+        with RoutingSession(router) as session:
+            served_by = _served_by(session)
+
+        # THEN
+        assert served_by == "replica@example.com"
+
+    def test_reads_own_writes_from_primary_within_window(self, router, clock, acting_user):
+        """
+        GIVEN a user who committed a write
+        WHEN they read within the sticky window, and again after it
+        THEN the primary serves the first read and the replica the second
+        """
+        # GIVEN
+        router.mark_write(acting_user)
+
+        # WHEN
+        with RoutingSession(router) as session:
+            within = _served_by(session)
+        clock.now = 5.0
+        with RoutingSession(router) as session:
+            after = _served_by(session)
+
+        # THEN
+        assert within == "primary@example.com"
+        assert after == "replica@example.com"
+
+    def test_stickiness_is_per_user(self, router):
+        """
+        GIVEN one user who wrote
+        WHEN another user and an anonymous request read
+        THEN both are served by the replica
+        """
+        # GIVEN
+        router.mark_write("user-1")
+
+        # WHEN / THEN
+        assert router.read_engine("user-2") is not router.primary
+        assert router.read_engine(None) is not router.primary
+        assert router.read_engine("user-1") is router.primary
+
+    def test_falls_back_to_primary_while_replica_is_down(self, primary, clock, tmp_path):
+        """
+        GIVEN a replica that cannot be reached
+        WHEN reads arrive before and after the retry window
+        THEN they fall back to the primary and the replica is probed only once per window
+        """
+        # GIVEN
+        unreachable = create_engine(f"sqlite:///{tmp_path / 'missing' / 'replica.db'}")
+        router = ReplicaRouter(primary, [unreachable], retry_seconds=30.0, clock=clock)
+        before = REGISTRY.get_sample_value("become_db_read_routes_total", {"target": "fallback"})
+
+        # WHEN
+        with patch.object(unreachable, "connect", wraps=unreachable.connect) as connect:
+            first = router.read_engine(None)
+            clock.now = 29.0
+            second = router.read_engine(None)
+            probes_in_window = connect.call_count
+            clock.now = 30.0
+            router.read_engine(None)
+
+        # THEN
+        assert first is primary
+        assert second is primary
+        assert probes_in_window == 1
+        assert connect.call_count == 2
+        after = REGISTRY.get_sample_value("become_db_read_routes_total", {"target": "fallback"})
+        assert after - (before or 0.0) == 3
+
+    def test_returns_recovered_replica_to_rotation(self, router, replica, clock):
+        """
+        GIVEN a replica marked unhealthy after a dropped connection
+        WHEN the retry window has passed and the probe succeeds
+        THEN reads go to the replica again
+        """
+        # GIVEN
+        router.mark_unhealthy(replica)
+        assert router.read_engine(None) is router.primary
+
+        # WHEN
+        clock.now = 30.0
+
+        # THEN
+        assert router.read_engine(None) is replica
+
+    def test_alternates_between_replicas(self, primary, replica, tmp_path):
+        """
+        GIVEN two healthy replicas
+        WHEN four reads arrive
+        THEN the replicas take turns
+        """
+        # GIVEN
+        second = _database(tmp_path / "second.db", "second@example.com")
+        router = ReplicaRouter(primary, [replica, second])
+
+        # WHEN
+        picked = [router.read_engine(None) for _ in range(4)]
+
+        # THEN
+        assert picked == [replica, second, replica, second]
+        second.dispose()
+
+
+class TestSessionDependencies:
+    """Tests for get_session / get_read_session with replicas configured."""
+
+    def test_commit_makes_acting_user_sticky(self, router, acting_user):
+        """
+        GIVEN an acting user committing through the primary session
+        WHEN they read through the read session
+        THEN the read sees the primary
+        """
+        # GIVEN
+        with (
+            patch("api.db.session.get_engine", return_value=router.primary),
+            patch("api.db.session.get_replica_router", return_value=router),
+        ):
+            writes = get_session()
+            session = next(writes)
+            session.commit()
+            writes.close()
+
+            # WHEN
+            reads = get_read_session()
+            read_session = next(reads)
+            served_by = _served_by(read_session)
+            reads.close()
+
+        # THEN
+        assert isinstance(read_session, RoutingSession)
+        assert served_by == "primary@example.com"
+
+    def test_read_session_uses_primary_without_replicas(self, primary):
+        """
+        GIVEN no configured replica
+        WHEN a read session queries
+        THEN it is a plain session on the primary
+        """
+        # GIVEN
+        router = ReplicaRouter(primary, [])
+
+        # WHEN
+        with (
+            patch("api.db.session.get_engine", return_value=primary),
+            patch("api.db.session.get_replica_router", return_value=router),
+        ):
+            reads = get_read_session()
+            session = next(reads)
+            served_by = _served_by(session)
+            reads.close()
+
+        # THEN
+        assert not isinstance(session, RoutingSession)
+        assert served_by == "primary@example.com"
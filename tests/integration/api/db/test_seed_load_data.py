@@ -0,0 +1,91 @@
+"""Smoke tests for the load-test seeder on SQLite."""
+
+from uuid import UUID
+
+import pytest
+from sqlmodel import select
+
+from api.auth.password import verify_password
+from api.db.models import (
+    CalculationResult,
+    ExpertOpinion,
+    Invitation,
+    MemberRole,
+    Project,
+    ProjectMember,
+    User,
+)
+from tests.performance.seed_load_data import LOAD_TEST_PASSWORD, seed
+
+
+class TestSeed:
+    """Seeds a few rows and reads them back against the manifest."""
+
+    def test_manifest_matches_seeded_rows(self, session):
+        """
+        GIVEN a small load-test population
+        WHEN it is seeded into an empty SQLite schema
+        THEN the manifest's accounts, projects and invitations exist with the stated roles
+        """
+        # WHEN
+        manifest = seed(
+            session,
+            users=4,
+            projects=2,
+            experts_per_project=2,
+            invitees=1,
+            invitations_per_invitee=2,
+            seed_value=7,
+        )
+
+        # THEN
+        users = {user.email: user for user in session.exec(select(User)).all()}
+        assert len(users) == 5
+        assert verify_password(LOAD_TEST_PASSWORD, next(iter(users.values())).hashed_password)
+
+        for entry in manifest["admins"]:
+            for project_id in entry["projects"]:
+                project = session.get(Project, UUID(project_id))
+                assert project is not None
+                assert project.admin_id == users[entry["email"]].id
+
+        for entry in manifest["experts"]:
+            user_id = users[entry["email"]].id
+            for project_id in entry["projects"]:
+                member = session.exec(
+                    select(ProjectMember).where(
+                        ProjectMember.project_id == UUID(project_id),
+                        ProjectMember.user_id == user_id,
+                    )
+                ).one()
+                assert member.role == MemberRole.EXPERT
+                opinion = session.exec(
+                    select(ExpertOpinion).where(
+                        ExpertOpinion.project_id == UUID(project_id),
+                        ExpertOpinion.user_id == user_id,
+                    )
+                ).one()
+                assert opinion.lower_bound <= opinion.peak <= opinion.upper_bound
+
+        (invitee,) = manifest["invitees"]
+        invitations = [session.get(Invitation, UUID(id_)) for id_ in invitee["invitations"]]
+        assert len(invitations) == 2
+        assert all(
+            i is not None and i.invitee_id == users[invitee["email"]].id for i in invitations
+        )
+
+        results = session.exec(select(CalculationResult)).all()
+        assert sorted(result.num_experts for result in results) == [2, 2]
+
+    def test_rejects_more_experts_than_users(self, session):
+        """A project cannot need more experts than there are other users."""
+        with pytest.raises(ValueError, match="experts_per_project"):
+            seed(
+                session,
+                users=2,
+                projects=1,
+                experts_per_project=2,
+                invitees=0,
+                invitations_per_invitee=0,
+                seed_value=7,
+            )
@@ -0,0 +1,108 @@
+"""Smoke tests for the scale-test bulk seeder on SQLite."""
+
+from datetime import UTC, datetime
+
+import pytest
+from sqlmodel import Session, func, select
+
+from api.db.models import (
+    CalculationResult,
+    ExpertOpinion,
+    Invitation,
+    MemberRole,
+    Project,
+    ProjectMember,
+    User,
+)
+from tests.performance.seed_scale_data import BulkLoader, ScaleSeeder
+
+
+class TestScaleSeeder:
+    """Seeds a few rows and reads them back through the ORM."""
+
+    def test_seeded_rows_read_back_as_models(self, test_engine):
+        """
+        GIVEN a small scale population
+        WHEN it is bulk-loaded into an empty SQLite schema
+        THEN every table holds the generated rows with values in the right columns
+        """
+        # GIVEN
+        seeder = ScaleSeeder(users=6, projects=2, opinions=5, invitations_per_project=1)
+
+        # WHEN
+        with test_engine.connect() as connection:
+            counts = seeder.run(connection, batch_size=3)
+
+        # THEN
+        experts = sum(project.experts for project in seeder.projects)
+        assert counts == {
+            "users": 6,
+            "projects": 2,
+            "project_members": experts + 2,
+            "expert_opinions": experts,
+            "invitations": 2,
+            "calculation_results": 2,
+        }
+        with Session(test_engine) as session:
+            user = session.get(User, seeder.user_ids[3])
+            assert user is not None
+            assert (user.email, user.first_name, user.last_name) == (
+                "scale-user-3@scale.example",
+                "Scale",
+                "3",
+            )
+            assert user.photo_url is None
+
+            layout = seeder.projects[0]
+            project = session.get(Project, layout.id)
+            assert project is not None
+            assert project.admin_id == seeder.user_ids[layout.admin]
+            assert (project.name, project.description) == ("Scale project 0", None)
+            assert (project.scale_min, project.scale_max, project.scale_unit) == (0.0, 100.0, "pts")
+            assert project.created_at.replace(tzinfo=UTC) == datetime(2026, 1, 1, tzinfo=UTC)
+
+            roles = session.exec(
+                select(ProjectMember.role, func.count())
+                .where(ProjectMember.project_id == layout.id)
+                .group_by(ProjectMember.role)
+            ).all()
+            assert dict(roles) == {MemberRole.ADMIN: 1, MemberRole.EXPERT: layout.experts}
+
+            opinions = session.exec(
+                select(ExpertOpinion).where(ExpertOpinion.project_id == layout.id)
+            ).all()
+            assert len(opinions) == layout.experts
+            for opinion in opinions:
+                assert 0.0 <= opinion.lower_bound <= opinion.peak <= opinion.upper_bound <= 100.0
+                assert opinion.user_id != project.admin_id
+
+            invitation = session.exec(
+                select(Invitation).where(Invitation.project_id == layout.id)
+            ).one()
+            assert invitation.inviter_id == project.admin_id
+            members = session.exec(
+                select(ProjectMember.user_id).where(ProjectMember.project_id == layout.id)
+            ).all()
+            assert invitation.invitee_id not in members
+
+            result = session.exec(
+                select(CalculationResult).where(CalculationResult.project_id == layout.id)
+            ).one()
+            assert result.num_experts == layout.experts
+            assert result.likert_value is not None
+
+    def test_load_rejects_rows_with_mismatched_columns(self, test_engine):
+        """
+        GIVEN a row missing one of the table's columns
+        WHEN it is loaded
+        THEN loading fails naming the columns instead of shifting values
+        """
+        # GIVEN
+        row = {"id": "x", "project_id": "y", "invitee_id": "z", "inviter_id": "w"}
+
+        # WHEN / THEN
+        with (
+            test_engine.connect() as connection,
+            pytest.raises(ValueError, match="invitations row has columns"),
+        ):
+            BulkLoader(connection).load(Invitation.__table__, [row])
@@ -0,0 +1,51 @@
+"""Integration tests for the application's CORS policy."""
+
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+
+_ORIGIN = "http://localhost:3000"
+
+
+class TestConditionalRequestsCors:
+    """Tests that a cross-origin client can make conditional GETs."""
+
+    def test_preflight_allows_if_none_match(self):
+        """
+        GIVEN the full application
+        WHEN a CORS preflight asks to send If-None-Match
+        THEN the header is allowed
+        """
+        # GIVEN
+        live_client = TestClient(create_app())
+
+        # WHEN
+        response = live_client.options(
+            "/api/v1/health",
+            headers={
+                "Origin": _ORIGIN,
+                "Access-Control-Request-Method": "GET",
+                "Access-Control-Request-Headers": "If-None-Match",
+            },
+        )
+
+        # THEN
+        assert response.status_code == 200
+        allowed = response.headers.get("Access-Control-Allow-Headers", "")
+        assert "if-none-match" in allowed.lower()
+
+    def test_etag_is_exposed_to_the_client(self):
+        """
+        GIVEN the full application
+        WHEN a cross-origin request is answered
+        THEN the response lets the client script read ETag
+        """
+        # GIVEN
+        live_client = TestClient(create_app())
+
+        # WHEN
+        response = live_client.get("/api/v1/health", headers={"Origin": _ORIGIN})
+
+        # THEN
+        exposed = response.headers.get("Access-Control-Expose-Headers", "")
+        assert "etag" in exposed.lower()
@@ -463,3 +463,54 @@ class TestCalculateEdgeCases:
 
         # THEN
         assert response.status_code == 422
+
+
+class TestCalculateInclude:
+    """Tests for extra statistics requested with include=."""
+
+    def test_includes_requested_statistics(self, client: TestClient):
+        """
+        GIVEN expert opinions from budget case study
+        WHEN POST /api/v1/calculate?include=quartiles,trimmed_mean,std_dev is called
+        THEN the BeCoMe result is unchanged and the statistics are returned
+        """
+        # GIVEN
+        experts = _opinions_to_api_format(BUDGET_CASE["opinions"])
+        plain = client.post("/api/v1/calculate", json={"experts": experts}).json()
+
+        # WHEN
+        response = client.post(
+            "/api/v1/calculate?include=quartiles,trimmed_mean,std_dev",
+            json={"experts": experts},
+        )
+
+        # THEN
+        assert response.status_code == 200
+        data = response.json()
+        statistics = data.pop("statistics")
+        assert plain.pop("statistics") is None
+        assert data == plain
+        centroids = sorted(
+            (op.opinion.lower_bound + op.opinion.peak + op.opinion.upper_bound) / 3
+            for op in BUDGET_CASE["opinions"]
+        )
+        assert statistics["quartiles"]["q2"] == pytest.approx((centroids[10] + centroids[11]) / 2)
+        assert statistics["trimmed_mean"] == pytest.approx(sum(centroids[2:20]) / 18)
+        assert statistics["std_dev"]["centroid"] > 0
+        assert statistics["minimum"] is None
+
+    def test_unknown_statistic_returns_422(self, client: TestClient):
+        """
+        GIVEN an include list naming an unknown statistic
+        WHEN POST /api/v1/calculate is called
+        THEN response status is 422 naming the statistic
+        """
+        # GIVEN
+        experts = [{"name": "Test", "lower": 5.0, "peak": 10.0, "upper": 15.0}]
+
+        # WHEN
+        response = client.post("/api/v1/calculate?include=mode", json={"experts": experts})
+
+        # THEN
+        assert response.status_code == 422
+        assert response.json()["detail"] == "Unknown statistics: mode"
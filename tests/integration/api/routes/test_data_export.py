@@ -1,5 +1,9 @@
 """Tests for GET /api/v1/users/me/export endpoint (GDPR Article 20)."""
 
+import io
+import json
+import zipfile
+
 from fastapi import status
 
 from tests.integration.api.conftest import (
@@ -110,3 +114,63 @@ class TestDataExport:
 
         # THEN
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+    def test_streamed_json_matches_default_export(self, client):
+        """
+        GIVEN a user with an owned project and an opinion
+        WHEN the export is requested with format=json-stream
+        THEN the download parses to the default export document
+        """
+        # GIVEN
+        token = register_and_login(client, "stream@example.com")
+        project = create_project(client, token, "Streamed Project")
+        submit_opinion(client, token, project["id"], 20.0, 50.0, 80.0, "Lead")
+        expected = client.get(_EXPORT_URL, headers=auth_header(token)).json()
+
+        # WHEN
+        response = client.get(
+            _EXPORT_URL, params={"format": "json-stream"}, headers=auth_header(token)
+        )
+
+        # THEN
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/json"
+        assert "attachment" in response.headers["content-disposition"]
+        streamed = response.json()
+        del streamed["export_metadata"]["generated_at"], expected["export_metadata"]["generated_at"]
+        assert streamed == expected
+
+    def test_zip_export_holds_ndjson_sections(self, client):
+        """
+        GIVEN a user with an owned project and an opinion
+        WHEN the export is requested with format=zip
+        THEN the archive holds one NDJSON line per item
+        """
+        # GIVEN
+        token = register_and_login(client, "zip@example.com")
+        project = create_project(client, token, "Zipped Project")
+        submit_opinion(client, token, project["id"], 20.0, 50.0, 80.0, "Lead")
+
+        # WHEN
+        response = client.get(_EXPORT_URL, params={"format": "zip"}, headers=auth_header(token))
+
+        # THEN
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/zip"
+        archive = zipfile.ZipFile(io.BytesIO(response.content))
+        owned = archive.read("owned_projects.ndjson").decode().splitlines()
+        assert [json.loads(line)["name"] for line in owned] == ["Zipped Project"]
+        opinions = archive.read("opinions.ndjson").decode().splitlines()
+        assert json.loads(opinions[0])["peak"] == 50.0
+        assert archive.read("received_invitations.ndjson") == b""
+
+    def test_rejects_unknown_format(self, client):
+        """An unsupported export format is a validation error."""
+        # GIVEN
+        token = register_and_login(client, "badformat@example.com")
+
+        # WHEN
+        response = client.get(_EXPORT_URL, params={"format": "xml"}, headers=auth_header(token))
+
+        # THEN
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,5 +1,6 @@
 """Tests for invitation management endpoints (email-based)."""
 
+from api.schemas.invitation import MAX_BULK_INVITES
 from tests.integration.api.conftest import auth_header, create_project, register_and_login
 
 
@@ -136,6 +137,90 @@ class TestInviteByEmail:
         assert response.status_code == 401
 
 
+class TestBulkInvite:
+    """Tests for POST /api/v1/projects/{id}/invite/bulk."""
+
+    def test_reports_status_per_email(self, client):
+        """Admin gets one status per email; only invitable users are invited."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        register_and_login(client, "first@example.com")
+        register_and_login(client, "second@example.com")
+        project = create_project(client, admin_token)
+        client.post(
+            f"/api/v1/projects/{project['id']}/invite",
+            json={"email": "second@example.com"},
+            headers=auth_header(admin_token),
+        )
+
+        # WHEN
+        response = client.post(
+            f"/api/v1/projects/{project['id']}/invite/bulk",
+            json={
+                "emails": [
+                    "first@example.com",
+                    "second@example.com",
+                    "admin@example.com",
+                    "nobody@example.com",
+                ]
+            },
+            headers=auth_header(admin_token),
+        )
+
+        # THEN
+        assert response.status_code == 200
+        data = response.json()
+        assert data["invited"] == 1
+        assert [(item["email"], item["status"]) for item in data["results"]] == [
+            ("first@example.com", "invited"),
+            ("second@example.com", "already_invited"),
+            ("admin@example.com", "already_member"),
+            ("nobody@example.com", "not_found"),
+        ]
+        assert data["results"][0]["invitation_id"] is not None
+        assert data["results"][1]["invitation_id"] is None
+        pending = client.get(
+            f"/api/v1/projects/{project['id']}/invitations", headers=auth_header(admin_token)
+        ).json()
+        assert {item["invitee_email"] for item in pending} == {
+            "first@example.com",
+            "second@example.com",
+        }
+
+    def test_bulk_invite_not_admin(self, client):
+        """403 returned when non-admin tries to invite."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        other_token = register_and_login(client, "other@example.com")
+        project = create_project(client, admin_token)
+
+        # WHEN
+        response = client.post(
+            f"/api/v1/projects/{project['id']}/invite/bulk",
+            json={"emails": ["admin@example.com"]},
+            headers=auth_header(other_token),
+        )
+
+        # THEN
+        assert response.status_code == 403
+
+    def test_rejects_empty_and_oversized_lists(self, client):
+        """422 returned for no emails or more than the bulk limit."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        url = f"/api/v1/projects/{project['id']}/invite/bulk"
+        too_many = [f"user{index}@example.com" for index in range(MAX_BULK_INVITES + 1)]
+
+        # WHEN
+        empty = client.post(url, json={"emails": []}, headers=auth_header(admin_token))
+        oversized = client.post(url, json={"emails": too_many}, headers=auth_header(admin_token))
+
+        # THEN
+        assert empty.status_code == 422
+        assert oversized.status_code == 422
+
+
 class TestGetUserInvitations:
     """Tests for GET /api/v1/invitations."""
 
@@ -0,0 +1,76 @@
+"""Integration tests for the Prometheus metrics endpoint."""
+
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from api.main import create_app
+
+_TOKEN = "scrape-token"  # pragma: allowlist secret
+
+
+def _with_metrics_token(token: str | None) -> object:
+    """Patch the metrics route settings so ``metrics_token`` returns ``token``."""
+    settings = MagicMock()
+    settings.metrics_token = token
+    return patch("api.routes.metrics.get_settings", return_value=settings)
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics on the full application."""
+
+    def test_exposes_request_and_calculation_metrics(self):
+        """
+        GIVEN the full application after a calculation request
+        WHEN /metrics is scraped
+        THEN the route-templated latency and calculator timings are exposed
+        """
+        # GIVEN
+        live_client = TestClient(create_app())
+        live_client.post(
+            "/api/v1/calculate",
+            json={"experts": [{"name": "A", "lower": 1, "peak": 2, "upper": 3}]},
+        )
+
+        # WHEN
+        with _with_metrics_token(None):
+            response = live_client.get("/metrics")
+
+        # THEN
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        body = response.text
+        assert 'route="/api/v1/calculate"' in body
+        assert 'become_calculation_duration_seconds_count{source="stateless"}' in body
+
+    def test_rejects_missing_token_when_configured(self):
+        """
+        GIVEN a configured metrics token
+        WHEN /metrics is scraped without it
+        THEN the request is rejected with 401
+        """
+        # GIVEN
+        live_client = TestClient(create_app())
+
+        # WHEN
+        with _with_metrics_token(_TOKEN):
+            response = live_client.get("/metrics")
+
+        # THEN
+        assert response.status_code == 401
+
+    def test_accepts_configured_bearer_token(self):
+        """
+        GIVEN a configured metrics token
+        WHEN /metrics is scraped with the matching bearer token
+        THEN the metrics are returned
+        """
+        # GIVEN
+        live_client = TestClient(create_app())
+
+        # WHEN
+        with _with_metrics_token(_TOKEN):
+            response = live_client.get("/metrics", headers={"Authorization": f"Bearer {_TOKEN}"})
+
+        # THEN
+        assert response.status_code == 200
@@ -1,11 +1,33 @@
 """Integration tests for opinion management endpoints."""
 
+import json
+import threading
+import time
+from uuid import UUID
+
+import pytest
+
+from api.routes import opinions
+from api.services.result_events import result_hub
 from tests.integration.api.conftest import (
     auth_header,
     create_project,
     register_and_login,
     submit_opinion,
 )
+from tests.shared.helpers import record_statements
+
+
+def _join(client, admin_token: str, project_id: str, email: str) -> str:
+    """Register an expert, invite them to the project and accept."""
+    token = register_and_login(client, email)
+    invitation = client.post(
+        f"/api/v1/projects/{project_id}/invite",
+        json={"email": email},
+        headers=auth_header(admin_token),
+    ).json()
+    client.post(f"/api/v1/invitations/{invitation['id']}/accept", headers=auth_header(token))
+    return token
 
 
 class TestListOpinions:
@@ -93,6 +115,26 @@ class TestListOpinions:
         # THEN
         assert response.status_code == 404
 
+    def test_not_modified_until_opinion_deleted(self, client):
+        """Answers 304 for the current ETag and 200 once an opinion is removed."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        submit_opinion(client, admin_token, project["id"])
+        url = f"/api/v1/projects/{project['id']}/opinions"
+        etag = client.get(url, headers=auth_header(admin_token)).headers["ETag"]
+        conditional = {**auth_header(admin_token), "If-None-Match": etag}
+
+        # WHEN
+        unchanged = client.get(url, headers=conditional)
+        client.delete(url, headers=auth_header(admin_token))
+        changed = client.get(url, headers=conditional)
+
+        # THEN
+        assert unchanged.status_code == 304
+        assert changed.status_code == 200
+        assert changed.json() == []
+
 
 class TestSubmitOpinion:
     """Tests for POST /api/v1/projects/{id}/opinions."""
@@ -324,6 +366,35 @@ class TestSubmitOpinion:
         assert data is not None
         assert data["num_experts"] == 1
 
+    @pytest.mark.parametrize("existing", [False, True], ids=["create", "update"])
+    def test_writes_in_one_transaction(self, client, test_engine, existing):
+        """Opinion and result are upserted in one transaction of seven statements.
+
+        Three statements authenticate and authorise (user, project,
+        membership); the write path adds the opinion upsert, the project row
+        lock that orders recalculations across workers, the opinion read for
+        the calculation and the result upsert.
+        """
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+        if existing:
+            submit_opinion(client, token, project["id"], 10.0, 20.0, 30.0)
+
+        # WHEN
+        with record_statements(test_engine) as log:
+            submitted = submit_opinion(client, token, project["id"], 30.0, 50.0, 70.0)
+
+        # THEN
+        assert submitted["peak"] == 50.0
+        assert len(log.statements) == 7
+        assert log.commits == 1
+        assert sum(sql.lstrip().upper().startswith("INSERT") for sql in log.statements) == 2
+        result = client.get(
+            f"/api/v1/projects/{project['id']}/result", headers=auth_header(token)
+        ).json()
+        assert result["best_compromise"]["peak"] == 50.0
+
 
 class TestDeleteOpinion:
     """Tests for DELETE /api/v1/projects/{id}/opinions."""
@@ -453,6 +524,148 @@ class TestDeleteOpinion:
         assert result_after is None
 
 
+class TestImportOpinions:
+    """Tests for POST /api/v1/projects/{id}/opinions/import."""
+
+    @staticmethod
+    def _import(client, token: str, project_id: str, body: str, content_type: str):
+        """Post an import file."""
+        return client.post(
+            f"/api/v1/projects/{project_id}/opinions/import",
+            content=body.encode(),
+            headers={**auth_header(token), "Content-Type": content_type},
+        )
+
+    def test_csv_creates_and_updates_then_recalculates(self, client):
+        """Upserts every record and recalculates the result once."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        _join(client, admin_token, project["id"], "expert@example.com")
+        submit_opinion(client, admin_token, project["id"], 10.0, 20.0, 30.0)
+        body = (
+            "email,position,lower_bound,peak,upper_bound\n"
+            "admin@example.com,Chair,30,50,70\n"
+            "EXPERT@example.com,<b>Analyst</b>,40,60,80\n"
+        )
+
+        # WHEN
+        response = self._import(client, admin_token, project["id"], body, "text/csv")
+
+        # THEN
+        assert response.status_code == 200
+        assert response.json() == {"created": 1, "updated": 1}
+        opinions = client.get(
+            f"/api/v1/projects/{project['id']}/opinions", headers=auth_header(admin_token)
+        ).json()
+        assert sorted(item["position"] for item in opinions) == ["Analyst", "Chair"]
+        result = client.get(
+            f"/api/v1/projects/{project['id']}/result", headers=auth_header(admin_token)
+        ).json()
+        assert result["num_experts"] == 2
+
+    def test_ndjson_import(self, client):
+        """Accepts one JSON object per line."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        body = json.dumps(
+            {
+                "email": "admin@example.com",
+                "position": "Chair",
+                "lower_bound": 1,
+                "peak": 2,
+                "upper_bound": 3,
+            }
+        )
+
+        # WHEN
+        response = self._import(
+            client, admin_token, project["id"], body + "\n", "application/x-ndjson"
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.json() == {"created": 1, "updated": 0}
+
+    def test_reports_every_bad_row_and_stores_nothing(self, client):
+        """Rejects the whole file with one error per failing record."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        records = [
+            {
+                "email": "admin@example.com",
+                "position": "Chair",
+                "lower_bound": 1,
+                "peak": 2,
+                "upper_bound": 3,
+            },
+            {
+                "email": "nobody@example.com",
+                "position": "X",
+                "lower_bound": 1,
+                "peak": 2,
+                "upper_bound": 3,
+            },
+            {
+                "email": "admin@example.com",
+                "position": "Chair",
+                "lower_bound": 5,
+                "peak": 2,
+                "upper_bound": 3,
+            },
+            {
+                "email": "admin@example.com",
+                "position": "Chair",
+                "lower_bound": 1,
+                "peak": 2,
+                "upper_bound": 300,
+            },
+        ]
+
+        # WHEN
+        response = self._import(
+            client, admin_token, project["id"], json.dumps(records), "application/json"
+        )
+
+        # THEN
+        assert response.status_code == 422
+        errors = [(error["row"], error["message"]) for error in response.json()["detail"]]
+        assert [row for row, _ in errors] == [2, 3, 3, 4, 4]
+        assert "not a member" in errors[0][1]
+        assert sum("Duplicate of row 1" in message for _, message in errors) == 2
+        opinions = client.get(
+            f"/api/v1/projects/{project['id']}/opinions", headers=auth_header(admin_token)
+        ).json()
+        assert opinions == []
+
+    def test_rejects_unsupported_content_type(self, client):
+        """Returns 415 for a body that is not CSV, JSON or NDJSON."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+
+        # WHEN
+        response = self._import(client, admin_token, project["id"], "<xml/>", "text/xml")
+
+        # THEN
+        assert response.status_code == 415
+
+    def test_requires_admin(self, client):
+        """Returns 403 for a member who is not the project admin."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        expert_token = _join(client, admin_token, project["id"], "expert@example.com")
+
+        # WHEN
+        response = self._import(client, expert_token, project["id"], "[]", "application/json")
+
+        # THEN
+        assert response.status_code == 403
+
+
 class TestGetResult:
     """Tests for GET /api/v1/projects/{id}/result."""
 
@@ -552,6 +765,482 @@ class TestGetResult:
         # THEN
         assert response.status_code == 403
 
+    def test_not_modified_until_recalculated(self, client):
+        """Answers 304 for the current ETag and 200 once a new opinion lands."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"], 30.0, 50.0, 70.0)
+        url = f"/api/v1/projects/{project['id']}/result"
+        first = client.get(url, headers=auth_header(token))
+        conditional = {**auth_header(token), "If-None-Match": first.headers["ETag"]}
+
+        # WHEN
+        unchanged = client.get(url, headers=conditional)
+        submit_opinion(client, token, project["id"], 40.0, 60.0, 80.0)
+        changed = client.get(url, headers=conditional)
+
+        # THEN
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        assert "Last-Modified" in first.headers
+        assert unchanged.status_code == 304
+        assert unchanged.content == b""
+        assert changed.status_code == 200
+        assert changed.json()["best_compromise"]["peak"] == 60.0
+
+    def test_includes_requested_statistics(self, client):
+        """Statistics named in include= are returned under statistics."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"], 30.0, 50.0, 70.0)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result?include=quartiles,min_max",
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert response.status_code == 200
+        statistics = response.json()["statistics"]
+        assert statistics["quartiles"] == {"q1": 50.0, "q2": 50.0, "q3": 50.0}
+        assert statistics["minimum"]["lower"] == 30.0
+        assert statistics["maximum"]["upper"] == 70.0
+        assert statistics["std_dev"] is None
+
+    def test_includes_dispersion_metrics(self, client):
+        """include=dispersion adds pairwise spread and flags the outlying expert."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        near_token = _join(client, admin_token, project["id"], "near@example.com")
+        far_token = _join(client, admin_token, project["id"], "far@example.com")
+        submit_opinion(client, admin_token, project["id"], 10.0, 20.0, 30.0)
+        submit_opinion(client, near_token, project["id"], 12.0, 22.0, 32.0)
+        submit_opinion(client, far_token, project["id"], 70.0, 80.0, 90.0)
+        far_id = client.get("/api/v1/users/me", headers=auth_header(far_token)).json()["id"]
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result?include=dispersion",
+            headers=auth_header(admin_token),
+        )
+
+        # THEN
+        dispersion = response.json()["statistics"]["dispersion"]
+        assert dispersion["mean_pairwise_distance"] == pytest.approx(40.0)
+        assert dispersion["overlapping_pairs"] == pytest.approx(1 / 3)
+        assert dispersion["median_centroid"] == 22.0
+        assert [outlier["expert_id"] for outlier in dispersion["outliers"]] == [far_id]
+
+    def test_include_is_part_of_etag(self, client):
+        """A cached plain result does not satisfy a request with include=."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"], 30.0, 50.0, 70.0)
+        url = f"/api/v1/projects/{project['id']}/result"
+        plain = client.get(url, headers=auth_header(token))
+        conditional = {**auth_header(token), "If-None-Match": plain.headers["ETag"]}
+
+        # WHEN
+        response = client.get(f"{url}?include=std_dev", headers=conditional)
+
+        # THEN
+        assert plain.json()["statistics"] is None
+        assert response.status_code == 200
+        assert response.json()["statistics"]["std_dev"]["centroid"] == 0.0
+
+    def test_rejects_unknown_statistic(self, client):
+        """422 returned for a name that is not a statistic."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result?include=mode",
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert response.status_code == 422
+        assert "mode" in response.json()["detail"]
+
+
+class TestStreamResult:
+    """Tests for GET /api/v1/projects/{id}/result/events."""
+
+    @pytest.fixture(autouse=True)
+    def _short_streams(self, monkeypatch):
+        """End streams quickly: the test client returns the body once it closes."""
+        monkeypatch.setattr(opinions, "RESULT_EVENTS_LIFETIME", 0.3)
+        monkeypatch.setattr(opinions, "RESULT_EVENTS_HEARTBEAT", 0.1)
+
+    @staticmethod
+    def _results(body: str) -> list:
+        """Decode the data of every ``result`` event in an SSE body."""
+        return [
+            json.loads(frame.split("data: ", 1)[1])
+            for frame in body.split("\n\n")
+            if "event: result" in frame
+        ]
+
+    def test_first_event_is_current_result(self, client):
+        """Sends the stored result as the first event, then keep-alives."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"], 30.0, 50.0, 70.0)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/events",
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.startswith("retry: ")
+        assert ": keep-alive" in response.text
+        results = self._results(response.text)
+        assert len(results) == 1
+        assert results[0]["best_compromise"]["peak"] == 50.0
+
+    def test_first_event_is_null_for_empty_project(self, client):
+        """Sends null when the project has no result yet."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/events",
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert self._results(response.text) == [None]
+
+    def test_pushes_recalculated_result(self, client, monkeypatch):
+        """An opinion submitted while streaming is pushed without polling."""
+        # GIVEN
+        monkeypatch.setattr(opinions, "RESULT_EVENTS_LIFETIME", 2.0)
+        token = register_and_login(client)
+        project = create_project(client, token)
+        project_id = UUID(project["id"])
+        responses = []
+        listener = threading.Thread(
+            target=lambda: responses.append(
+                client.get(
+                    f"/api/v1/projects/{project['id']}/result/events",
+                    headers=auth_header(token),
+                )
+            )
+        )
+        listener.start()
+        deadline = time.monotonic() + 2.0
+        while result_hub.subscriber_count(project_id) == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        # WHEN
+        submit_opinion(client, token, project["id"], 30.0, 50.0, 70.0)
+        listener.join()
+
+        # THEN
+        results = self._results(responses[0].text)
+        assert results[0] is None
+        assert results[1]["num_experts"] == 1
+        assert results[1]["best_compromise"]["peak"] == 50.0
+        assert result_hub.subscriber_count(project_id) == 0
+
+    def test_requires_membership(self, client):
+        """Returns 403 for non-members before opening a stream."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        other_token = register_and_login(client, "other@example.com")
+        project = create_project(client, admin_token)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/events",
+            headers=auth_header(other_token),
+        )
+
+        # THEN
+        assert response.status_code == 403
+        assert result_hub.subscriber_count(UUID(project["id"])) == 0
+
+
+class TestGetInfluence:
+    """Tests for GET /api/v1/projects/{id}/result/influence."""
+
+    def test_returns_none_with_single_opinion(self, client):
+        """Returns None when leaving one expert out would leave nobody."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"], 30.0, 50.0, 70.0)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/influence",
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.json() is None
+
+    def test_ranks_experts_by_influence(self, client):
+        """Ranks every expert, the outlier first, with its leave-one-out result."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        expert1 = _join(client, admin_token, project["id"], "expert1@example.com")
+        expert2 = _join(client, admin_token, project["id"], "expert2@example.com")
+        outlier = _join(client, admin_token, project["id"], "outlier@example.com")
+        submit_opinion(client, admin_token, project["id"], 40.0, 45.0, 50.0)
+        submit_opinion(client, expert1, project["id"], 42.0, 47.0, 52.0)
+        submit_opinion(client, expert2, project["id"], 44.0, 49.0, 54.0)
+        submit_opinion(client, outlier, project["id"], 90.0, 95.0, 100.0)
+        outlier_user = client.get("/api/v1/users/me", headers=auth_header(outlier)).json()
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/influence",
+            headers=auth_header(admin_token),
+        )
+
+        # THEN
+        assert response.status_code == 200
+        data = response.json()
+        assert data["baseline"]["num_experts"] == 4
+        assert [entry["rank"] for entry in data["experts"]] == [1, 2, 3, 4]
+        top = data["experts"][0]
+        assert top["user_id"] == outlier_user["id"]
+        assert top["compromise_shift"] > 0
+        assert top["result_without"]["num_experts"] == 3
+
+    def test_requires_admin(self, client):
+        """Returns 403 for members who are not the project admin."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        expert = _join(client, admin_token, project["id"], "expert@example.com")
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/influence",
+            headers=auth_header(expert),
+        )
+
+        # THEN
+        assert response.status_code == 403
+
+
+class TestGetFactions:
+    """Tests for GET /api/v1/projects/{id}/result/factions."""
+
+    def test_returns_none_without_opinions(self, client):
+        """Returns None when there is nobody to cluster."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/factions",
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.json() is None
+
+    def test_splits_requested_number_of_factions(self, client):
+        """Two camps come back as two factions, each with its own result."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        low = _join(client, admin_token, project["id"], "low@example.com")
+        high = _join(client, admin_token, project["id"], "high@example.com")
+        submit_opinion(client, admin_token, project["id"], 10.0, 15.0, 20.0)
+        submit_opinion(client, low, project["id"], 12.0, 17.0, 22.0)
+        submit_opinion(client, high, project["id"], 80.0, 85.0, 90.0)
+        high_user = client.get("/api/v1/users/me", headers=auth_header(high)).json()
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/factions",
+            params={"clusters": 2},
+            headers=auth_header(admin_token),
+        )
+
+        # THEN
+        assert response.status_code == 200
+        data = response.json()
+        assert data["selected"] is False
+        assert [len(faction["user_ids"]) for faction in data["factions"]] == [2, 1]
+        assert data["factions"][1]["user_ids"] == [high_user["id"]]
+        assert data["factions"][0]["result"]["num_experts"] == 2
+        assert data["factions"][1]["result"]["best_compromise"]["peak"] == 85.0
+        assert data["explained_variance"] > 0.99
+
+    def test_rejects_out_of_range_clusters(self, client):
+        """Returns 422 for a number of factions outside 1..20."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/factions",
+            params={"clusters": 0},
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert response.status_code == 422
+
+    def test_requires_admin(self, client):
+        """Returns 403 for members who are not the project admin."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        expert = _join(client, admin_token, project["id"], "expert@example.com")
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/factions",
+            headers=auth_header(expert),
+        )
+
+        # THEN
+        assert response.status_code == 403
+
+
+class TestGetWhatIf:
+    """Tests for GET /api/v1/projects/{id}/result/what-if."""
+
+    def test_preview_matches_result_after_submitting(self, client):
+        """
+        GIVEN two experts' opinions
+        WHEN one previews a new opinion and then submits it
+        THEN the preview equals the stored result, and nothing was saved before
+        """
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        expert = _join(client, admin_token, project["id"], "expert@example.com")
+        submit_opinion(client, admin_token, project["id"], 10.0, 20.0, 30.0)
+        submit_opinion(client, expert, project["id"], 40.0, 50.0, 60.0)
+        url = f"/api/v1/projects/{project['id']}/result/what-if"
+        values = {"lower_bound": 70.0, "peak": 80.0, "upper_bound": 90.0}
+
+        # WHEN
+        response = client.get(url, params=values, headers=auth_header(expert))
+        unchanged = client.get(
+            f"/api/v1/projects/{project['id']}/result", headers=auth_header(expert)
+        ).json()
+        submit_opinion(client, expert, project["id"], 70.0, 80.0, 90.0)
+        stored = client.get(
+            f"/api/v1/projects/{project['id']}/result", headers=auth_header(expert)
+        ).json()
+
+        # THEN
+        assert response.status_code == 200
+        data = response.json()
+        assert data["current"]["best_compromise"] == unchanged["best_compromise"]
+        assert data["preview"]["best_compromise"] == stored["best_compromise"]
+        assert data["preview"]["num_experts"] == 2
+        assert data["compromise_shift"] == pytest.approx(
+            stored["best_compromise"]["centroid"] - unchanged["best_compromise"]["centroid"]
+        )
+
+    def test_reflects_opinions_submitted_after_caching(self, client):
+        """A submitted opinion invalidates the cached index of the project."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        expert = _join(client, admin_token, project["id"], "expert@example.com")
+        submit_opinion(client, admin_token, project["id"], 10.0, 20.0, 30.0)
+        url = f"/api/v1/projects/{project['id']}/result/what-if"
+        values = {"lower_bound": 40.0, "peak": 50.0, "upper_bound": 60.0}
+        before = client.get(url, params=values, headers=auth_header(admin_token)).json()
+
+        # WHEN
+        submit_opinion(client, expert, project["id"], 70.0, 80.0, 90.0)
+        after = client.get(url, params=values, headers=auth_header(admin_token)).json()
+
+        # THEN
+        assert before["preview"]["num_experts"] == 1
+        assert after["current"]["num_experts"] == 2
+        assert after["preview"]["num_experts"] == 2
+
+    def test_previews_joining_without_opinion(self, client):
+        """A member without an opinion previews adding one."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/what-if",
+            params={"lower_bound": 10.0, "peak": 20.0, "upper_bound": 30.0},
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert response.status_code == 200
+        data = response.json()
+        assert data["current"] is None
+        assert data["preview"]["num_experts"] == 1
+        assert data["compromise_shift"] == 0.0
+
+    @pytest.mark.parametrize(
+        "values",
+        [
+            {"lower_bound": 30.0, "peak": 20.0, "upper_bound": 10.0},
+            {"lower_bound": 10.0, "peak": 20.0, "upper_bound": 300.0},
+            {"lower_bound": 10.0, "peak": 20.0},
+        ],
+    )
+    def test_rejects_invalid_opinion(self, client, values):
+        """Returns 422 for unordered, out-of-scale or missing values."""
+        # GIVEN
+        token = register_and_login(client)
+        project = create_project(client, token)
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/what-if",
+            params=values,
+            headers=auth_header(token),
+        )
+
+        # THEN
+        assert response.status_code == 422
+
+    def test_requires_membership(self, client):
+        """Returns 403 for users outside the project."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        project = create_project(client, admin_token)
+        outsider = register_and_login(client, "outsider@example.com")
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project['id']}/result/what-if",
+            params={"lower_bound": 10.0, "peak": 20.0, "upper_bound": 30.0},
+            headers=auth_header(outsider),
+        )
+
+        # THEN
+        assert response.status_code == 403
+
 
 class TestOpinionFlow:
     """Integration tests for complete opinion workflow."""
@@ -7,7 +7,7 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlmodel import Session
 
-from api.db.session import get_session
+from api.db.session import get_read_session, get_session
 from api.dependencies import get_storage_service
 from api.services.storage.base import StorageService
 from api.services.storage.exceptions import StorageDeleteError, StorageUploadError
@@ -37,6 +37,8 @@ def client_with_mock_storage(test_engine):
     mock_storage.open.return_value = (VALID_JPEG_BYTES, "image/jpeg")
 
     test_app.dependency_overrides[get_session] = override_get_session
+
+    test_app.dependency_overrides[get_read_session] = override_get_session
     test_app.dependency_overrides[get_storage_service] = lambda: mock_storage
 
     with TestClient(test_app) as test_client:
@@ -56,6 +58,8 @@ def client_without_storage(test_engine):
             yield session
 
     test_app.dependency_overrides[get_session] = override_get_session
+
+    test_app.dependency_overrides[get_read_session] = override_get_session
     test_app.dependency_overrides[get_storage_service] = lambda: None
 
     with TestClient(test_app) as test_client:
@@ -251,6 +251,69 @@ class TestGetProject:
         assert response.status_code == 404
         assert response.json()["detail"] == "Membership not found for this project."
 
+    def test_get_project_not_modified(self, client):
+        """A matching If-None-Match gets 304 with no body."""
+        # GIVEN
+        token = register_and_login(client)
+        project_id = create_project(client, token)["id"]
+        first = client.get(f"/api/v1/projects/{project_id}", headers=auth_header(token))
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project_id}",
+            headers={**auth_header(token), "If-None-Match": first.headers["ETag"]},
+        )
+
+        # THEN
+        assert first.headers["ETag"].startswith('W/"')
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        assert "Last-Modified" in first.headers
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == first.headers["ETag"]
+
+    def test_get_project_etag_changes_on_update(self, client):
+        """Editing the project invalidates the previous ETag."""
+        # GIVEN
+        token = register_and_login(client)
+        project_id = create_project(client, token)["id"]
+        etag = client.get(f"/api/v1/projects/{project_id}", headers=auth_header(token)).headers[
+            "ETag"
+        ]
+        client.patch(
+            f"/api/v1/projects/{project_id}", json={"name": "Renamed"}, headers=auth_header(token)
+        )
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project_id}",
+            headers={**auth_header(token), "If-None-Match": etag},
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert response.json()["name"] == "Renamed"
+        assert response.headers["ETag"] != etag
+
+    def test_get_project_not_member_ignores_etag(self, client):
+        """A non-member gets 403 even when sending the current ETag."""
+        # GIVEN
+        owner_token = register_and_login(client, "owner@example.com")
+        other_token = register_and_login(client, "other@example.com")
+        project_id = create_project(client, owner_token)["id"]
+        etag = client.get(
+            f"/api/v1/projects/{project_id}", headers=auth_header(owner_token)
+        ).headers["ETag"]
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/projects/{project_id}",
+            headers={**auth_header(other_token), "If-None-Match": etag},
+        )
+
+        # THEN
+        assert response.status_code == 403
+
 
 class TestUpdateProject:
     """Tests for PATCH /api/v1/projects/{id}."""
@@ -460,6 +523,41 @@ class TestListMembers:
         # THEN
         assert response.status_code == 403
 
+    def test_list_members_not_modified(self, client):
+        """A matching If-None-Match gets 304 with no body."""
+        # GIVEN
+        token = register_and_login(client)
+        project_id = create_project(client, token)["id"]
+        url = f"/api/v1/projects/{project_id}/members"
+        etag = client.get(url, headers=auth_header(token)).headers["ETag"]
+
+        # WHEN
+        response = client.get(url, headers={**auth_header(token), "If-None-Match": etag})
+
+        # THEN
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_list_members_etag_changes_on_profile_update(self, client):
+        """Renaming a member invalidates the listing that embeds their name."""
+        # GIVEN
+        token = register_and_login(client)
+        project_id = create_project(client, token)["id"]
+        url = f"/api/v1/projects/{project_id}/members"
+        etag = client.get(url, headers=auth_header(token)).headers["ETag"]
+        client.put(
+            "/api/v1/users/me",
+            json={"first_name": "Renamed", "last_name": "User"},
+            headers=auth_header(token),
+        )
+
+        # WHEN
+        response = client.get(url, headers={**auth_header(token), "If-None-Match": etag})
+
+        # THEN
+        assert response.status_code == 200
+        assert response.json()[0]["first_name"] == "Renamed"
+
 
 class TestRemoveMember:
     """Tests for DELETE /api/v1/projects/{id}/members/{user_id}."""
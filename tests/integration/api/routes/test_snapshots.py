@@ -0,0 +1,181 @@
+"""Tests for published result snapshot endpoints."""
+
+import pytest
+
+from api.services.result_snapshot_service import snapshot_cache
+from tests.integration.api.conftest import (
+    auth_header,
+    create_project,
+    register_and_login,
+    submit_opinion,
+)
+from tests.shared.helpers import record_statements
+
+
+@pytest.fixture(autouse=True)
+def _empty_snapshot_cache():
+    """Start every test with this worker's snapshot cache empty."""
+    snapshot_cache.clear()
+    yield
+    snapshot_cache.clear()
+
+
+def _publish(client, token: str, project_id: str) -> dict:
+    """Publish a snapshot of the project and return the response data."""
+    response = client.post(f"/api/v1/projects/{project_id}/snapshots", headers=auth_header(token))
+    assert response.status_code == 201
+    return response.json()
+
+
+class TestPublishSnapshot:
+    """Tests for POST /api/v1/projects/{id}/snapshots."""
+
+    def test_publishes_result_under_public_link(self, client):
+        """Admin publishes a snapshot that anyone can read without logging in."""
+        # GIVEN
+        token = register_and_login(client, "admin@example.com")
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"], 10.0, 20.0, 30.0)
+
+        # WHEN
+        published = _publish(client, token, project["id"])
+        response = client.get(f"/api/v1/snapshots/{published['id']}")
+
+        # THEN
+        assert published["version"] == 1
+        assert published["url"].endswith(f"/api/v1/snapshots/{published['id']}")
+        assert len(published["id"]) >= 22
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+        document = response.json()
+        assert document["project"]["name"] == project["name"]
+        assert document["result"]["best_compromise"]["peak"] == 20.0
+        assert document["opinions"] == [
+            {
+                "position": "Expert",
+                "lower_bound": 10.0,
+                "peak": 20.0,
+                "upper_bound": 30.0,
+                "centroid": 20.0,
+            }
+        ]
+
+    def test_republishing_creates_a_new_version(self, client):
+        """A new snapshot gets the next version; the old one keeps its content."""
+        # GIVEN
+        token = register_and_login(client, "admin@example.com")
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"], 10.0, 20.0, 30.0)
+        first = _publish(client, token, project["id"])
+        submit_opinion(client, token, project["id"], 30.0, 50.0, 70.0)
+
+        # WHEN
+        second = _publish(client, token, project["id"])
+
+        # THEN
+        assert second["version"] == 2
+        assert second["id"] != first["id"]
+        old = client.get(f"/api/v1/snapshots/{first['id']}").json()
+        new = client.get(f"/api/v1/snapshots/{second['id']}").json()
+        assert old["result"]["best_compromise"]["peak"] == 20.0
+        assert new["result"]["best_compromise"]["peak"] == 50.0
+        listed = client.get(
+            f"/api/v1/projects/{project['id']}/snapshots", headers=auth_header(token)
+        ).json()
+        assert [item["version"] for item in listed] == [2, 1]
+
+    def test_rejects_project_without_result(self, client):
+        """409 returned when there is no result to publish."""
+        # GIVEN
+        token = register_and_login(client, "admin@example.com")
+        project = create_project(client, token)
+
+        # WHEN
+        response = client.post(
+            f"/api/v1/projects/{project['id']}/snapshots", headers=auth_header(token)
+        )
+
+        # THEN
+        assert response.status_code == 409
+
+    def test_publish_not_admin(self, client):
+        """403 returned when a non-admin tries to publish."""
+        # GIVEN
+        admin_token = register_and_login(client, "admin@example.com")
+        other_token = register_and_login(client, "other@example.com")
+        project = create_project(client, admin_token)
+        submit_opinion(client, admin_token, project["id"])
+
+        # WHEN
+        response = client.post(
+            f"/api/v1/projects/{project['id']}/snapshots", headers=auth_header(other_token)
+        )
+
+        # THEN
+        assert response.status_code == 403
+
+
+class TestGetSnapshot:
+    """Tests for GET /api/v1/snapshots/{id}."""
+
+    def test_cached_snapshot_is_served_without_loading_blob(self, client, test_engine):
+        """Once a worker has the blob, reads only check that the snapshot still exists."""
+        # GIVEN
+        token = register_and_login(client, "admin@example.com")
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"])
+        snapshot_id = _publish(client, token, project["id"])["id"]
+        snapshot_cache.clear()
+        client.get(f"/api/v1/snapshots/{snapshot_id}")
+
+        # WHEN
+        with record_statements(test_engine) as log:
+            response = client.get(f"/api/v1/snapshots/{snapshot_id}")
+
+        # THEN
+        assert response.status_code == 200
+        assert len(log.statements) == 1
+        assert "content" not in log.statements[0]
+
+    def test_answers_304_for_current_copy(self, client):
+        """304 returned when If-None-Match holds the snapshot's ETag."""
+        # GIVEN
+        token = register_and_login(client, "admin@example.com")
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"])
+        snapshot_id = _publish(client, token, project["id"])["id"]
+        etag = client.get(f"/api/v1/snapshots/{snapshot_id}").headers["etag"]
+
+        # WHEN
+        response = client.get(f"/api/v1/snapshots/{snapshot_id}", headers={"If-None-Match": etag})
+
+        # THEN
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_decompresses_for_clients_without_gzip(self, client):
+        """The document is sent uncompressed when gzip is not accepted."""
+        # GIVEN
+        token = register_and_login(client, "admin@example.com")
+        project = create_project(client, token)
+        submit_opinion(client, token, project["id"])
+        snapshot_id = _publish(client, token, project["id"])["id"]
+
+        # WHEN
+        response = client.get(
+            f"/api/v1/snapshots/{snapshot_id}", headers={"Accept-Encoding": "identity"}
+        )
+
+        # THEN
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.json()["id"] == snapshot_id
+
+    def test_unknown_snapshot(self, client):
+        """404 returned for an id that was never published."""
+        # WHEN
+        response = client.get("/api/v1/snapshots/unknown")
+
+        # THEN
+        assert response.status_code == 404
@@ -0,0 +1,221 @@
+"""Locust journeys for authenticated BeCoMe users against a seeded database.
+
+Three user classes replay the production mix on top of the population written
+by ``tests/performance/seed_load_data.py``:
+
+- ``ExpertUser``: logs in, lists projects, reads results and opinions,
+  submits opinions (each one triggers a recalculation) and exports PDF/CSV.
+- ``AdminUser``: logs in as a project admin, reads members and pending
+  invitations, and invites spare accounts.
+- ``InviteeUser``: logs in as an invitation-only account, lists its
+  invitations and accepts or declines them.
+
+Requests are named by route template (``/projects/{id}/result``) so the report
+has one row per endpoint. With ``--report-json`` the run ends by writing the
+per-endpoint latency and throughput summary that
+``tests/performance/load_report.py`` compares across commits.
+
+The server must run with ``TESTING=1`` so the 5/minute login limit does not
+throttle the simulated users, which all share one client IP.
+
+Usage::
+
+    DATABASE_URL=sqlite:///./loadtest.db SECRET_KEY=load-secret-key \\
+        uv run python -m tests.performance.seed_load_data --manifest loadtest-manifest.json
+    DATABASE_URL=sqlite:///./loadtest.db SECRET_KEY=load-secret-key TESTING=1 \\
+        uv run uvicorn api.main:app --port 8000
+    uv run locust -f tests/performance/authenticated_locustfile.py \\
+        --host http://localhost:8000 --headless --users 20 --spawn-rate 5 --run-time 60s \\
+        --manifest loadtest-manifest.json --report-json load-report.json
+"""
+
+import itertools
+import json
+import random
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+from locust import HttpUser, between, events, task
+from locust.env import Environment
+
+from tests.performance.load_report import summarize_stats
+
+_MANIFEST: dict[str, Any] = {}
+_ACCOUNTS: dict[str, Iterator[dict[str, Any]]] = {}
+
+
+@events.init_command_line_parser.add_listener
+def _add_arguments(parser: Any) -> None:
+    """Register the manifest and report options on the locust command line."""
+    parser.add_argument(
+        "--manifest", default="loadtest-manifest.json", help="Seed manifest to read accounts from"
+    )
+    parser.add_argument("--report-json", default="", help="Write a per-endpoint JSON report here")
+
+
+@events.init.add_listener
+def _load_manifest(environment: Environment, **_: Any) -> None:
+    """Load the seed manifest once and hand out its accounts round-robin."""
+    options = environment.parsed_options
+    if options is None:
+        return
+    _MANIFEST.update(json.loads(Path(options.manifest).read_text(encoding="utf-8")))
+    for role in ("experts", "admins", "invitees"):
+        _ACCOUNTS[role] = itertools.cycle(_MANIFEST[role])
+
+
+@events.test_stop.add_listener
+def _write_report(environment: Environment, **_: Any) -> None:
+    """Write the JSON report when ``--report-json`` is set."""
+    options = environment.parsed_options
+    if options is None or not options.report_json:
+        return
+    report = summarize_stats(environment.stats, options.num_users)
+    Path(options.report_json).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+
+class _SeededUser(HttpUser):
+    """Log in as the next seeded account of ``role`` and keep its bearer token."""
+
+    abstract = True
+    wait_time = between(0.5, 2.0)
+    role = ""
+
+    def on_start(self) -> None:
+        """Authenticate with the shared seed password."""
+        self.account = next(_ACCOUNTS[self.role])
+        response = self.client.post(
+            "/api/v1/auth/login",
+            data={"username": self.account["email"], "password": _MANIFEST["password"]},
+            name="/auth/login",
+        )
+        response.raise_for_status()
+        self.client.headers["Authorization"] = f"Bearer {response.json()['access_token']}"
+
+    def _project_id(self) -> str:
+        """Pick one of the account's projects."""
+        return str(random.choice(self.account["projects"]))
+
+
+class ExpertUser(_SeededUser):
+    """An expert reading results and submitting opinions (the bulk of traffic)."""
+
+    weight = 8
+    role = "experts"
+
+    @task(5)
+    def list_projects(self) -> None:
+        """List the expert's projects."""
+        self.client.get("/api/v1/projects", name="/projects")
+
+    @task(4)
+    def get_result(self) -> None:
+        """Read a project's stored result."""
+        self.client.get(
+            f"/api/v1/projects/{self._project_id()}/result", name="/projects/{id}/result"
+        )
+
+    @task(2)
+    def list_opinions(self) -> None:
+        """Read every opinion in a project."""
+        self.client.get(
+            f"/api/v1/projects/{self._project_id()}/opinions", name="/projects/{id}/opinions"
+        )
+
+    @task(2)
+    def submit_opinion(self) -> None:
+        """Update the expert's opinion, which recalculates the project."""
+        lower, peak, upper = sorted(random.uniform(0.0, 100.0) for _ in range(3))
+        self.client.post(
+            f"/api/v1/projects/{self._project_id()}/opinions",
+            json={
+                "position": "Load tester",
+                "lower_bound": lower,
+                "peak": peak,
+                "upper_bound": upper,
+            },
+            name="/projects/{id}/opinions [submit]",
+        )
+
+    @task(1)
+    def export_csv(self) -> None:
+        """Download the result as CSV."""
+        self.client.get(
+            f"/api/v1/projects/{self._project_id()}/result/export",
+            params={"format": "csv"},
+            name="/projects/{id}/result/export [csv]",
+        )
+
+    @task(1)
+    def export_pdf(self) -> None:
+        """Download the result as PDF."""
+        self.client.get(
+            f"/api/v1/projects/{self._project_id()}/result/export",
+            params={"format": "pdf"},
+            name="/projects/{id}/result/export [pdf]",
+        )
+
+
+class AdminUser(_SeededUser):
+    """A project admin managing members and invitations."""
+
+    weight = 1
+    role = "admins"
+
+    @task(3)
+    def get_project(self) -> None:
+        """Read project details."""
+        self.client.get(f"/api/v1/projects/{self._project_id()}", name="/projects/{id}")
+
+    @task(2)
+    def list_members(self) -> None:
+        """List project members."""
+        self.client.get(
+            f"/api/v1/projects/{self._project_id()}/members", name="/projects/{id}/members"
+        )
+
+    @task(2)
+    def list_project_invitations(self) -> None:
+        """List the project's pending invitations."""
+        self.client.get(
+            f"/api/v1/projects/{self._project_id()}/invitations",
+            name="/projects/{id}/invitations",
+        )
+
+    @task(1)
+    def invite(self) -> None:
+        """Invite a spare account; an existing invitation or membership is expected."""
+        email = random.choice(_MANIFEST["spare_emails"])
+        with self.client.post(
+            f"/api/v1/projects/{self._project_id()}/invite",
+            json={"email": email},
+            name="/projects/{id}/invite",
+            catch_response=True,
+        ) as response:
+            if response.status_code in (201, 409):
+                response.success()
+
+
+class InviteeUser(_SeededUser):
+    """An invited user answering pending invitations."""
+
+    weight = 1
+    role = "invitees"
+
+    @task(3)
+    def list_invitations(self) -> None:
+        """List the user's pending invitations."""
+        self.client.get("/api/v1/invitations", name="/invitations")
+
+    @task(1)
+    def answer_invitation(self) -> None:
+        """Accept or decline the first pending invitation, if any."""
+        pending = self.client.get("/api/v1/invitations", name="/invitations").json()
+        if not pending:
+            return
+        action = random.choice(("accept", "decline"))
+        self.client.post(
+            f"/api/v1/invitations/{pending[0]['id']}/{action}",
+            name=f"/invitations/{{id}}/{action}",
+        )
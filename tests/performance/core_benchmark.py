@@ -0,0 +1,389 @@
+"""Reproducible benchmark of the ``src/`` library with stored baselines.
+
+Times the core operations on synthetic expert panels and writes the results as
+JSON, so a later run can be compared against a stored baseline:
+
+- ``FuzzyTriangleNumber.average``
+- ``BeCoMeCalculator.calculate_arithmetic_mean`` / ``calculate_median`` /
+  ``calculate_compromise``
+- ``OddMedianStrategy.calculate`` (odd panels) and ``EvenMedianStrategy.calculate``
+  (even panels), on opinions already sorted by centroid
+- ``LikertDecisionInterpreter.interpret`` over every opinion of the panel
+- ``load_data_from_txt`` on the panel written in the examples' text format
+
+Panels come in two distributions, each with an odd and an even expert count
+per size step (3/4, 9/10, 99/100, ... up to ``--max-experts``):
+
+- ``uniform``: independent triangles on the 0-100 scale, almost no ties.
+- ``ties``: opinions drawn from a handful of Likert-point triangles, so most
+  centroids are shared (the worst case for closest-centroid searches).
+
+Each panel is generated from a fixed seed, so every run measures the same
+input. A case is timed ``--repeat`` times, each timing looping enough calls to
+last at least ``--min-time`` seconds; the JSON records the per-call minimum and
+median.
+
+Usage::
+
+    uv run python -m tests.performance.core_benchmark run --output current.json
+    uv run python -m tests.performance.core_benchmark run --max-experts 1000000
+    uv run python -m tests.performance.core_benchmark compare current.json --tolerance 0.25
+
+``compare`` exits with status 1 when any case's fastest time exceeds the
+baseline by more than the tolerance.
+"""
+
+import argparse
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+from time import perf_counter
+from typing import Any
+
+from examples.utils.data_loading import load_data_from_txt
+from src.calculators.become_calculator import BeCoMeCalculator
+from src.calculators.median_strategies import EvenMedianStrategy, OddMedianStrategy
+from src.interpreters.likert_interpreter import LikertDecisionInterpreter
+from src.models.expert_opinion import ExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "core_library.json"
+
+_SCHEMA_VERSION = 1
+_SEED = 20260218
+_DISTRIBUTIONS = ("uniform", "ties")
+
+# Triangles at the Likert points: tie-heavy panels draw only from these.
+_TIE_TRIANGLES = ((0, 0, 25), (0, 25, 50), (25, 50, 75), (50, 75, 100), (75, 100, 100))
+
+
+@dataclass(frozen=True)
+class Panel:
+    """A synthetic expert panel and the derived inputs some operations need.
+
+    :param distribution: Distribution name (``uniform`` or ``ties``).
+    :param opinions: Expert opinions in generation order.
+    :param sorted_opinions: The same opinions sorted by centroid.
+    :param median_centroid: Median of the centroids.
+    :param data_file: Path of the panel written in the examples' text format.
+    """
+
+    distribution: str
+    opinions: list[ExpertOpinion]
+    sorted_opinions: list[ExpertOpinion]
+    median_centroid: float
+    data_file: Path
+
+    @property
+    def size(self) -> int:
+        """Number of experts in the panel."""
+        return len(self.opinions)
+
+    @property
+    def parity(self) -> str:
+        """``odd`` or ``even`` expert count."""
+        return "odd" if self.size % 2 else "even"
+
+
+def _triangle(rng: random.Random, distribution: str) -> tuple[float, float, float]:
+    """Draw one (lower, peak, upper) triangle from a distribution."""
+    if distribution == "ties":
+        return tuple(map(float, rng.choice(_TIE_TRIANGLES)))  # type: ignore[return-value]
+    lower, peak, upper = sorted(rng.uniform(0.0, 100.0) for _ in range(3))
+    return lower, peak, upper
+
+
+def build_panel(size: int, distribution: str, directory: Path) -> Panel:
+    """Generate a deterministic panel and write its data file.
+
+    :param size: Number of experts.
+    :param distribution: Distribution name from ``_DISTRIBUTIONS``.
+    :param directory: Directory to write the panel's text file into.
+    :return: The generated panel.
+    """
+    rng = random.Random(f"{_SEED}:{distribution}:{size}")
+    opinions = [
+        ExpertOpinion(f"E{index}", FuzzyTriangleNumber(*_triangle(rng, distribution)))
+        for index in range(size)
+    ]
+    data_file = directory / f"{distribution}_{size}.txt"
+    with open(data_file, "w", encoding="utf-8") as f:
+        f.write(f"CASE: {distribution}-{size}\nDESCRIPTION: synthetic\nEXPERTS: {size}\n\n")
+        for op in opinions:
+            fn = op.opinion
+            f.write(f"{op.expert_id} | {fn.lower_bound} | {fn.peak} | {fn.upper_bound}\n")
+    calculator = BeCoMeCalculator()
+    sorted_opinions = calculator.sort_by_centroid(opinions)
+    median_centroid = statistics.median(op.centroid for op in sorted_opinions)
+    return Panel(distribution, opinions, sorted_opinions, median_centroid, data_file)
+
+
+def _operations() -> dict[str, Callable[[Panel], Callable[[], object]]]:
+    """Map each operation name to a factory binding it to a panel.
+
+    Factories return zero-argument callables, keeping panel preparation outside
+    the timed region.
+    """
+    calculator = BeCoMeCalculator()
+    interpreter = LikertDecisionInterpreter()
+    odd, even = OddMedianStrategy(), EvenMedianStrategy()
+
+    def interpret_all(panel: Panel) -> Callable[[], object]:
+        numbers = [op.opinion for op in panel.opinions]
+        return lambda: [interpreter.interpret(fn) for fn in numbers]
+
+    def average(panel: Panel) -> Callable[[], object]:
+        numbers = [op.opinion for op in panel.opinions]
+        return lambda: FuzzyTriangleNumber.average(numbers)
+
+    return {
+        "fuzzy_average": average,
+        "arithmetic_mean": lambda p: lambda: calculator.calculate_arithmetic_mean(p.opinions),
+        "median": lambda p: lambda: calculator.calculate_median(p.opinions),
+        "compromise": lambda p: lambda: calculator.calculate_compromise(p.opinions),
+        "odd_median_strategy": lambda p: (
+            lambda: odd.calculate(p.sorted_opinions, p.median_centroid)
+        ),
+        "even_median_strategy": lambda p: (
+            lambda: even.calculate(p.sorted_opinions, p.median_centroid)
+        ),
+        "likert_interpret": interpret_all,
+        "load_data_from_txt": lambda p: lambda: load_data_from_txt(str(p.data_file)),
+    }
+
+
+def _applies(operation: str, panel: Panel) -> bool:
+    """Median strategies only run on panels of their own parity."""
+    if operation == "odd_median_strategy":
+        return panel.parity == "odd"
+    if operation == "even_median_strategy":
+        return panel.parity == "even"
+    return True
+
+
+def panel_sizes(max_experts: int) -> list[int]:
+    """Odd and even sizes per step: 3, 4, 9, 10, 99, 100, ... up to ``max_experts``.
+
+    :param max_experts: Largest panel size to include.
+    :return: Sizes in ascending step order.
+    """
+    sizes = [3, 4]
+    step = 10
+    while step <= max_experts:
+        sizes.extend((step - 1, step))
+        step *= 10
+    return [size for size in sizes if size <= max_experts]
+
+
+def time_call(func: Callable[[], object], repeat: int, min_time: float) -> tuple[float, float, int]:
+    """Time a callable the way ``timeit`` autoranges, returning per-call seconds.
+
+    :param func: Zero-argument callable to time.
+    :param repeat: Number of timings to take.
+    :param min_time: Minimum duration of one timing in seconds.
+    :return: Tuple of (minimum, median, calls per timing).
+    """
+    start = perf_counter()
+    func()
+    single = perf_counter() - start
+    number = max(1, int(min_time / single)) if single > 0 else 1
+    timings = []
+    for _ in range(repeat):
+        start = perf_counter()
+        for _ in range(number):
+            func()
+        timings.append((perf_counter() - start) / number)
+    return min(timings), statistics.median(timings), number
+
+
+def case_key(operation: str, distribution: str, size: int) -> str:
+    """Build the stable identifier of one benchmark case."""
+    return f"{operation}[{distribution},n={size}]"
+
+
+def _iter_cases(max_experts: int, directory: Path) -> Iterator[tuple[str, Panel]]:
+    """Yield every (operation, panel) pair, building each panel once."""
+    operations = _operations()
+    for size in panel_sizes(max_experts):
+        for distribution in _DISTRIBUTIONS:
+            panel = build_panel(size, distribution, directory)
+            for operation in operations:
+                if _applies(operation, panel):
+                    yield operation, panel
+
+
+def _git_commit() -> str | None:
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607 -- developer tool
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run_benchmarks(max_experts: int, repeat: int, min_time: float) -> dict[str, Any]:
+    """Run every case and collect the results document.
+
+    :param max_experts: Largest panel size.
+    :param repeat: Timings per case.
+    :param min_time: Minimum duration of one timing in seconds.
+    :return: JSON-serialisable results with environment metadata.
+    """
+    operations = _operations()
+    cases: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for operation, panel in _iter_cases(max_experts, Path(tmp)):
+            best, median, number = time_call(operations[operation](panel), repeat, min_time)
+            key = case_key(operation, panel.distribution, panel.size)
+            cases[key] = {
+                "operation": operation,
+                "distribution": panel.distribution,
+                "experts": panel.size,
+                "parity": panel.parity,
+                "min_s": best,
+                "median_s": median,
+                "calls_per_timing": number,
+            }
+            print(f"{key:<48}{median * 1e3:>12.4f} ms", file=sys.stderr)
+    return {
+        "schema": _SCHEMA_VERSION,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": _SEED,
+        "repeat": repeat,
+        "min_time_s": min_time,
+        "max_experts": max_experts,
+        "cases": cases,
+    }
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Outcome of comparing one case against its baseline.
+
+    :param key: Case identifier.
+    :param baseline_s: Baseline fastest seconds per call.
+    :param current_s: Current fastest seconds per call.
+    :param regressed: True when slower than the baseline beyond the tolerance.
+    """
+
+    key: str
+    baseline_s: float
+    current_s: float
+    regressed: bool
+
+    @property
+    def ratio(self) -> float:
+        """Current time as a multiple of the baseline time."""
+        return self.current_s / self.baseline_s if self.baseline_s else float("inf")
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    tolerance: float,
+    noise_floor: float,
+) -> tuple[list[Comparison], list[str]]:
+    """Compare two results documents case by case.
+
+    A case regresses when its fastest timing is more than ``tolerance`` (a
+    fraction) slower than the baseline and the absolute slowdown exceeds
+    ``noise_floor`` seconds, so jitter on tiny panels is not flagged. The fastest
+    timing is used because other load on the machine only ever adds to it.
+
+    :param baseline: Stored baseline results.
+    :param current: Fresh results.
+    :param tolerance: Allowed relative slowdown, e.g. 0.25 for 25%.
+    :param noise_floor: Smallest absolute slowdown in seconds that counts.
+    :return: Tuple of (comparisons for shared cases, keys missing from either side).
+    """
+    base_cases, current_cases = baseline["cases"], current["cases"]
+    comparisons = []
+    for key in sorted(base_cases.keys() & current_cases.keys()):
+        before = base_cases[key]["min_s"]
+        after = current_cases[key]["min_s"]
+        regressed = after > before * (1 + tolerance) and after - before > noise_floor
+        comparisons.append(Comparison(key, before, after, regressed))
+    unmatched = sorted(base_cases.keys() ^ current_cases.keys())
+    return comparisons, unmatched
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    """Run the suite and write the JSON document."""
+    results = run_benchmarks(args.max_experts, args.repeat, args.min_time)
+    payload = json.dumps(results, indent=2, sort_keys=True) + "\n"
+    if args.output == "-":
+        sys.stdout.write(payload)
+    else:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(payload, encoding="utf-8")
+    return 0
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    """Print a comparison table and return 1 if anything regressed."""
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    comparisons, unmatched = compare_results(baseline, current, args.tolerance, args.noise_floor)
+
+    print(f"{'case':<48}{'baseline ms':>14}{'current ms':>14}{'ratio':>8}")
+    for item in comparisons:
+        flag = "  REGRESSION" if item.regressed else ""
+        print(
+            f"{item.key:<48}{item.baseline_s * 1e3:>14.4f}{item.current_s * 1e3:>14.4f}"
+            f"{item.ratio:>8.2f}{flag}"
+        )
+    for key in unmatched:
+        print(f"{key:<48}  (only in one file, not compared)")
+
+    regressions = [item for item in comparisons if item.regressed]
+    print(
+        f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%} "
+        f"out of {len(comparisons)} compared case(s)"
+    )
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and dispatch to ``run`` or ``compare``."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="Run the suite and write JSON results")
+    run.add_argument("--output", default="-", help="Results file ('-' for stdout)")
+    run.add_argument("--max-experts", type=int, default=100_000, help="Largest panel size")
+    run.add_argument("--repeat", type=int, default=5, help="Timings per case")
+    run.add_argument("--min-time", type=float, default=0.05, help="Seconds per timing")
+    run.set_defaults(handler=_cmd_run)
+
+    compare = commands.add_parser("compare", help="Compare results against a baseline")
+    compare.add_argument("current", help="Results file from a fresh run")
+    compare.add_argument("--baseline", default=str(BASELINE_PATH), help="Stored baseline")
+    compare.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown")
+    compare.add_argument(
+        "--noise-floor", type=float, default=1e-5, help="Ignore slowdowns below this (s)"
+    )
+    compare.set_defaults(handler=_cmd_compare)
+
+    args = parser.parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
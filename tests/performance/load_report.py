@@ -0,0 +1,137 @@
+"""Per-endpoint load-test reports and their comparison across commits.
+
+``authenticated_locustfile.py`` calls :func:`summarize_stats` at the end of a
+run (``--report-json``) to write one JSON document per run: requests, failures,
+throughput and latency percentiles for every named endpoint, tagged with the
+commit. The ``compare`` command lines two such reports up and flags endpoints
+whose p95 latency grew or whose throughput dropped beyond a tolerance.
+
+Usage::
+
+    uv run python -m tests.performance.load_report compare before.json after.json
+    uv run python -m tests.performance.load_report compare before.json after.json --tolerance 0.2
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+_PERCENTILES = (0.5, 0.95, 0.99)
+
+
+def _git_commit() -> str | None:
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],  # noqa: S607 -- developer tool
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def _entry_summary(entry: Any) -> dict[str, float | int]:
+    """Summarise one locust ``StatsEntry`` (milliseconds and requests/s)."""
+    summary: dict[str, float | int] = {
+        "requests": entry.num_requests,
+        "failures": entry.num_failures,
+        "rps": entry.total_rps,
+        "avg_ms": entry.avg_response_time,
+        "max_ms": entry.max_response_time,
+    }
+    for percentile in _PERCENTILES:
+        key = f"p{round(percentile * 100)}_ms"
+        summary[key] = entry.get_response_time_percentile(percentile) if entry.num_requests else 0
+    return summary
+
+
+def summarize_stats(stats: Any, users: int) -> dict[str, Any]:
+    """Build the JSON report for a finished locust run.
+
+    :param stats: The run's ``RequestStats``.
+    :param users: Number of simulated users requested for the run.
+    :return: JSON-serialisable report keyed by ``"METHOD name"``.
+    """
+    endpoints = {
+        f"{entry.method} {entry.name}": _entry_summary(entry)
+        for entry in sorted(stats.entries.values(), key=lambda e: (e.name, e.method))
+    }
+    return {
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "users": users,
+        "total": _entry_summary(stats.total),
+        "endpoints": endpoints,
+    }
+
+
+def compare_reports(
+    baseline: dict[str, Any], current: dict[str, Any], tolerance: float
+) -> list[tuple[str, dict[str, Any], dict[str, Any], list[str]]]:
+    """Compare two reports endpoint by endpoint.
+
+    An endpoint regresses when its p95 latency exceeds the baseline's by more
+    than ``tolerance`` (a fraction) or its throughput falls by more than that.
+
+    :param baseline: Earlier report.
+    :param current: Later report.
+    :param tolerance: Allowed relative change, e.g. 0.2 for 20%.
+    :return: (endpoint, baseline stats, current stats, regression reasons) per shared endpoint.
+    """
+    rows = []
+    shared = sorted(baseline["endpoints"].keys() & current["endpoints"].keys())
+    for name in shared:
+        before, after = baseline["endpoints"][name], current["endpoints"][name]
+        reasons = []
+        if after["p95_ms"] > before["p95_ms"] * (1 + tolerance):
+            reasons.append("p95")
+        if after["rps"] < before["rps"] * (1 - tolerance):
+            reasons.append("rps")
+        rows.append((name, before, after, reasons))
+    return rows
+
+
+def _cmd_compare(args: argparse.Namespace) -> int:
+    """Print the comparison table and return 1 if any endpoint regressed."""
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    rows = compare_reports(baseline, current, args.tolerance)
+
+    print(f"baseline {baseline.get('commit')} -> current {current.get('commit')}")
+    print(f"{'endpoint':<48}{'p95 ms':>16}{'req/s':>16}")
+    for name, before, after, reasons in rows:
+        flag = f"  REGRESSION ({', '.join(reasons)})" if reasons else ""
+        print(
+            f"{name:<48}{before['p95_ms']:>7.0f} -> {after['p95_ms']:<5.0f}"
+            f"{before['rps']:>7.1f} -> {after['rps']:<6.1f}{flag}"
+        )
+    regressions = sum(1 for *_, reasons in rows if reasons)
+    print(
+        f"\n{regressions} regression(s) beyond {args.tolerance:.0%} out of {len(rows)} endpoint(s)"
+    )
+    return 1 if regressions else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Parse the command line and run ``compare``."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    compare = commands.add_parser("compare", help="Compare two load-test reports")
+    compare.add_argument("baseline", help="Report from the reference commit")
+    compare.add_argument("current", help="Report from the commit under test")
+    compare.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative change")
+    args = parser.parse_args(argv)
+    return _cmd_compare(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+"""Microbenchmark of the HTTP middleware stack (pure ASGI vs BaseHTTPMiddleware).
+
+Drives the health and calculate endpoints in-process through
+``httpx.ASGITransport`` (no sockets, no server) and reports requests/s for two
+otherwise identical apps:
+
+- ``asgi``: the current pure-ASGI ``RequestLoggingMiddleware`` and
+  ``SecurityHeadersMiddleware`` from ``api.middleware``.
+- ``base_http``: the same behaviour implemented on Starlette's
+  ``BaseHTTPMiddleware`` (the previous implementation, kept here only as a
+  baseline for comparison).
+
+Usage::
+
+    uv run python -m tests.performance.middleware_benchmark
+    uv run python -m tests.performance.middleware_benchmark --requests 5000 --experts 100
+"""
+
+import os
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+os.environ["TESTING"] = "1"  # Disable rate limiting before api modules are imported
+
+import argparse
+import asyncio
+import logging
+import uuid
+from collections.abc import Awaitable, Callable
+from time import perf_counter
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+from api.logging_context import reset_request_id, set_request_id
+from api.middleware.rate_limit import limiter
+from api.middleware.request_logging import (
+    _SKIP_PATHS,
+    _SLOW_REQUEST_MS,
+    REQUEST_ID_HEADER,
+    RequestLoggingMiddleware,
+    logger,
+)
+from api.middleware.security_headers import (
+    _HSTS_HEADER,
+    _SECURITY_HEADERS,
+    SecurityHeadersMiddleware,
+)
+from api.routes import calculate, health
+from api.utils.client_ip import get_client_ip
+
+
+class _BaseHTTPRequestLogging(BaseHTTPMiddleware):
+    """Request-ID binding, request/response logging and timing on ``BaseHTTPMiddleware``.
+
+    The previous ``RequestLoggingMiddleware`` (baseline): it logs the same
+    records through the same logger as the pure-ASGI version, so the two
+    stacks differ only in how they wrap the downstream app.
+    """
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        request_id = request.headers.get(REQUEST_ID_HEADER) or str(uuid.uuid4())
+        request.state.request_id = request_id
+        path = request.url.path
+        token = set_request_id(request_id)
+        try:
+            if path in _SKIP_PATHS:
+                response = await call_next(request)
+                response.headers[REQUEST_ID_HEADER] = request_id
+                return response
+
+            logger.info(
+                "%s %s",
+                request.method,
+                path,
+                extra={
+                    "request_id": request_id,
+                    "method": request.method,
+                    "path": path,
+                    "ip": get_client_ip(request),
+                },
+            )
+
+            start = perf_counter()
+            response = await call_next(request)
+            duration_ms = (perf_counter() - start) * 1000.0
+
+            level = logging.WARNING if duration_ms > _SLOW_REQUEST_MS else logging.INFO
+            logger.log(
+                level,
+                "%s %s %d %.0fms",
+                request.method,
+                path,
+                response.status_code,
+                duration_ms,
+                extra={
+                    "request_id": request_id,
+                    "status_code": response.status_code,
+                    "duration_ms": round(duration_ms, 1),
+                },
+            )
+
+            response.headers[REQUEST_ID_HEADER] = request_id
+            return response
+        finally:
+            reset_request_id(token)
+
+
+class _BaseHTTPSecurityHeaders(BaseHTTPMiddleware):
+    """Security header injection on ``BaseHTTPMiddleware`` (baseline)."""
+
+    async def dispatch(
+        self, request: Request, call_next: Callable[[Request], Awaitable[Response]]
+    ) -> Response:
+        response = await call_next(request)
+        for name, value in _SECURITY_HEADERS:
+            response.headers[name] = value
+        if request.url.scheme == "https":
+            response.headers[_HSTS_HEADER[0]] = _HSTS_HEADER[1]
+        return response
+
+
+_STACKS: dict[str, tuple[type, type]] = {
+    "asgi": (SecurityHeadersMiddleware, RequestLoggingMiddleware),
+    "base_http": (_BaseHTTPSecurityHeaders, _BaseHTTPRequestLogging),
+}
+
+
+def build_app(stack: str) -> FastAPI:
+    """Build an app with the health and calculate routers behind one middleware stack.
+
+    :param stack: Key of ``_STACKS`` selecting the middleware implementation.
+    :return: FastAPI application with the selected middleware installed.
+    """
+    security, logging_middleware = _STACKS[stack]
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_middleware(security)
+    app.add_middleware(logging_middleware)
+    app.include_router(health.router)
+    app.include_router(calculate.router)
+    return app
+
+
+async def _run(app: FastAPI, method: str, url: str, payload: object, requests: int) -> float:
+    """Issue ``requests`` sequential calls and return the achieved requests/s."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for _ in range(min(50, requests)):  # warm-up
+            await client.request(method, url, json=payload)
+        start = perf_counter()
+        for _ in range(requests):
+            response = await client.request(method, url, json=payload)
+            response.raise_for_status()
+        return requests / (perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark for every stack and endpoint and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per measurement")
+    parser.add_argument("--experts", type=int, default=10, help="Experts in calculate payload")
+    args = parser.parse_args()
+
+    payload = {
+        "experts": [
+            {"name": f"E{i}", "lower": float(i), "peak": float(i + 5), "upper": float(i + 10)}
+            for i in range(args.experts)
+        ]
+    }
+    endpoints = [
+        ("GET /health", "GET", "/api/v1/health", None),
+        (f"POST /calculate [{args.experts}]", "POST", "/api/v1/calculate", payload),
+    ]
+
+    print(f"{'endpoint':<28}{'stack':<12}{'req/s':>10}")
+    for label, method, url, body in endpoints:
+        for stack in _STACKS:
+            rate = asyncio.run(_run(build_app(stack), method, url, body, args.requests))
+            print(f"{label:<28}{stack:<12}{rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
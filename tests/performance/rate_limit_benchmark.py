@@ -0,0 +1,86 @@
+"""Microbenchmark of rate limiter overhead per request.
+
+Calls ``limits``' moving-window limiter directly (no HTTP stack) for each
+storage backend and reports the mean cost of one hit and the state left
+behind after ``--keys`` distinct clients:
+
+- ``memory``: the stock ``limits`` in-memory storage (one timestamp per hit).
+- ``gcra-memory``: the lock-free in-process GCRA storage (one float per key).
+- ``gcra-sql``: the shared GCRA storage on a file-backed SQLite database (one
+  upsert per hit; PostgreSQL adds a network round trip on top).
+
+Usage::
+
+    uv run python -m tests.performance.rate_limit_benchmark
+    uv run python -m tests.performance.rate_limit_benchmark --hits 50000 --keys 5000
+"""
+
+import os
+
+os.environ.setdefault("APP_ENV", "test")
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key")
+
+import argparse
+import tempfile
+from pathlib import Path
+from time import perf_counter
+
+from limits import RateLimitItemPerMinute
+from limits.storage import MemoryStorage, Storage
+from limits.strategies import MovingWindowRateLimiter
+from sqlmodel import SQLModel, create_engine
+
+from api.middleware.rate_limit_storage import GCRAMemoryStorage, GCRASQLStorage
+
+# LIMIT_STANDARD: generous enough that most hits are admitted and written.
+_LIMIT = RateLimitItemPerMinute(60)
+
+
+def _held_state(storage: Storage) -> int:
+    """Return the number of timestamps/keys the storage keeps in process (0 for SQL)."""
+    if isinstance(storage, MemoryStorage):
+        return sum(len(entries) for entries in storage.events.values())
+    if isinstance(storage, GCRAMemoryStorage):
+        return len(storage)
+    return 0
+
+
+def _run(storage: Storage, hits: int, keys: int) -> tuple[float, int]:
+    """Spread ``hits`` across ``keys`` clients and time them.
+
+    :return: Tuple of (mean microseconds per hit, in-process entries held afterwards).
+    """
+    limiter = MovingWindowRateLimiter(storage)
+    identifiers = [f"198.51.{index // 256}.{index % 256}" for index in range(keys)]
+    start = perf_counter()
+    for index in range(hits):
+        limiter.hit(_LIMIT, identifiers[index % keys])
+    elapsed = perf_counter() - start
+    return elapsed / hits * 1e6, _held_state(storage)
+
+
+def main() -> None:
+    """Run the benchmark for every backend and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hits", type=int, default=20000, help="Hits per backend")
+    parser.add_argument("--keys", type=int, default=1000, help="Distinct client keys")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'ratelimit.db'}")
+        SQLModel.metadata.create_all(engine)
+        backends: dict[str, Storage] = {
+            "memory": MemoryStorage(),
+            "gcra-memory": GCRAMemoryStorage(),
+            "gcra-sql": GCRASQLStorage(engine=engine),
+        }
+
+        print(f"{'backend':<14}{'us/hit':>10}{'held entries':>15}")
+        for name, storage in backends.items():
+            micros, held = _run(storage, args.hits, args.keys)
+            print(f"{name:<14}{micros:>10.1f}{held:>15}")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
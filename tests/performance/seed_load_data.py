@@ -0,0 +1,185 @@
+"""Seed a database for the authenticated load test and write its manifest.
+
+Creates a deterministic population in the database named by ``DATABASE_URL``:
+
+- ``--users`` accounts (``load-user-<n>@loadtest.example``), all sharing one
+  password so the load test can log in as any of them.
+- ``--projects`` projects, each administered by one user and joined by
+  ``--experts-per-project`` other users who have already submitted an opinion,
+  with the calculation result stored.
+- ``--invitees`` extra accounts outside every project, each holding pending
+  invitations to ``--invitations-per-invitee`` projects.
+
+The manifest (JSON) lists which account plays which role in which project;
+``tests/performance/authenticated_locustfile.py`` reads it to pick logins and
+targets. Re-running against a database that already holds seeded accounts
+fails on the unique email constraint; start from an empty database.
+
+Usage::
+
+    DATABASE_URL=sqlite:///./loadtest.db SECRET_KEY=load-secret-key \\
+        uv run python -m tests.performance.seed_load_data \\
+        --users 200 --projects 50 --experts-per-project 10 --manifest loadtest-manifest.json
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+from typing import Any
+from uuid import UUID
+
+from sqlmodel import Session
+
+from api.auth.password import hash_password
+from api.db.engine import create_db_and_tables, get_engine
+from api.db.models import ExpertOpinion, Invitation, MemberRole, Project, ProjectMember, User
+from api.services.calculation_service import CalculationService
+
+LOAD_TEST_PASSWORD = "LoadTest-Passw0rd!"  # pragma: allowlist secret
+_EMAIL_DOMAIN = "loadtest.example"
+
+
+def _email(kind: str, index: int) -> str:
+    """Build the deterministic email of a seeded account."""
+    return f"load-{kind}-{index}@{_EMAIL_DOMAIN}"
+
+
+def _opinion_values(rng: random.Random, scale_max: float) -> tuple[float, float, float]:
+    """Draw a valid (lower, peak, upper) triangle on ``[0, scale_max]``."""
+    lower, peak, upper = sorted(round(rng.uniform(0.0, scale_max), 2) for _ in range(3))
+    return lower, peak, upper
+
+
+def seed(
+    session: Session,
+    users: int,
+    projects: int,
+    experts_per_project: int,
+    invitees: int,
+    invitations_per_invitee: int,
+    seed_value: int,
+) -> dict[str, Any]:
+    """Insert the load-test population and return its manifest.
+
+    :param session: Open database session.
+    :param users: Number of member accounts.
+    :param projects: Number of projects.
+    :param experts_per_project: Experts (besides the admin) per project.
+    :param invitees: Number of accounts holding only pending invitations.
+    :param invitations_per_invitee: Pending invitations per invitee account.
+    :param seed_value: Random seed for opinion values and membership layout.
+    :return: Manifest describing accounts, roles and project ids.
+    :raises ValueError: If a project would need more experts than there are users.
+    """
+    if experts_per_project >= users:
+        raise ValueError("experts_per_project must be smaller than users")
+
+    rng = random.Random(seed_value)
+    # bcrypt is deliberately slow, so every account shares one hash.
+    hashed = hash_password(LOAD_TEST_PASSWORD)
+
+    members = [
+        User(email=_email("user", i), hashed_password=hashed, first_name="Load", last_name=str(i))
+        for i in range(users)
+    ]
+    outsiders = [
+        User(
+            email=_email("invitee", i),
+            hashed_password=hashed,
+            first_name="Invitee",
+            last_name=str(i),
+        )
+        for i in range(invitees)
+    ]
+    session.add_all(members + outsiders)
+
+    admin_projects: dict[str, list[str]] = {}
+    expert_projects: dict[str, list[str]] = {}
+    project_admins: dict[UUID, UUID] = {}
+    for p in range(projects):
+        admin = members[p % users]
+        project = Project(name=f"Load project {p}", admin_id=admin.id, scale_unit="pts")
+        session.add(project)
+        project_admins[project.id] = admin.id
+        session.add(ProjectMember(project_id=project.id, user_id=admin.id, role=MemberRole.ADMIN))
+        admin_projects.setdefault(admin.email, []).append(str(project.id))
+
+        candidates = [user for user in members if user.id != admin.id]
+        for expert in rng.sample(candidates, experts_per_project):
+            session.add(ProjectMember(project_id=project.id, user_id=expert.id))
+            lower, peak, upper = _opinion_values(rng, project.scale_max)
+            session.add(
+                ExpertOpinion(
+                    project_id=project.id,
+                    user_id=expert.id,
+                    position="Load tester",
+                    lower_bound=lower,
+                    peak=peak,
+                    upper_bound=upper,
+                )
+            )
+            expert_projects.setdefault(expert.email, []).append(str(project.id))
+
+    invitee_invitations: dict[str, list[str]] = {}
+    for outsider in outsiders:
+        targets = rng.sample(sorted(project_admins), min(invitations_per_invitee, projects))
+        for project_id in targets:
+            invitation = Invitation(
+                project_id=project_id, invitee_id=outsider.id, inviter_id=project_admins[project_id]
+            )
+            session.add(invitation)
+            invitee_invitations.setdefault(outsider.email, []).append(str(invitation.id))
+    session.commit()
+
+    calculation = CalculationService(session)
+    for project_id in project_admins:
+        calculation.recalculate(project_id)
+
+    return {
+        "password": LOAD_TEST_PASSWORD,
+        "seed": seed_value,
+        "admins": [{"email": e, "projects": ids} for e, ids in admin_projects.items()],
+        "experts": [{"email": e, "projects": ids} for e, ids in expert_projects.items()],
+        "invitees": [{"email": e, "invitations": ids} for e, ids in invitee_invitations.items()],
+        # Accounts an admin may invite without colliding with seeded memberships.
+        "spare_emails": [_email("invitee", i) for i in range(invitees)],
+    }
+
+
+def main() -> None:
+    """Parse arguments, seed the configured database and write the manifest."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200, help="Member accounts")
+    parser.add_argument("--projects", type=int, default=50, help="Projects")
+    parser.add_argument("--experts-per-project", type=int, default=10, help="Experts per project")
+    parser.add_argument("--invitees", type=int, default=50, help="Invitation-only accounts")
+    parser.add_argument(
+        "--invitations-per-invitee", type=int, default=3, help="Pending invitations each"
+    )
+    parser.add_argument("--seed", type=int, default=20260218, help="Random seed")
+    parser.add_argument(
+        "--manifest", default="loadtest-manifest.json", help="Where to write the manifest"
+    )
+    args = parser.parse_args()
+
+    create_db_and_tables()
+    with Session(get_engine()) as session:
+        manifest = seed(
+            session,
+            users=args.users,
+            projects=args.projects,
+            experts_per_project=args.experts_per_project,
+            invitees=args.invitees,
+            invitations_per_invitee=args.invitations_per_invitee,
+            seed_value=args.seed,
+        )
+    Path(args.manifest).write_text(json.dumps(manifest, indent=2) + "\n", encoding="utf-8")
+    print(
+        f"Seeded {args.users + args.invitees} users, {args.projects} projects, "
+        f"{args.projects * args.experts_per_project} opinions -> {args.manifest}"
+    )
+
+
+if __name__ == "__main__":
+    main()
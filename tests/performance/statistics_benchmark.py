@@ -0,0 +1,87 @@
+"""Microbenchmark of the single-pass statistics engine against separate calls.
+
+Computes the full dashboard set -- BeCoMe result, centroid quartiles, 10%
+trimmed mean, per-component minimum/maximum and standard deviations -- on the
+seeded panels of :mod:`tests.performance.core_benchmark` in two ways:
+
+- ``naive``: one call per statistic (``calculate_compromise``,
+  ``statistics.quantiles``, a sorted slice for the trimmed mean, and
+  ``min``/``max``/``statistics.pstdev`` per component), each walking or
+  sorting the opinions again.
+- ``engine``: one ``StatisticsEngine.summarize`` call.
+
+Both produce the same numbers; the table reports the fastest time per call.
+
+Usage::
+
+    uv run python -m tests.performance.statistics_benchmark
+    uv run python -m tests.performance.statistics_benchmark --max-experts 1000000
+"""
+
+import argparse
+import statistics
+import tempfile
+from functools import partial
+from pathlib import Path
+
+from src.calculators.become_calculator import BeCoMeCalculator
+from src.calculators.statistics_engine import StatisticsEngine
+from src.models.expert_opinion import ExpertOpinion
+from src.models.statistics_summary import Statistic
+from tests.performance.core_benchmark import build_panel, panel_sizes, time_call
+
+_TRIM = 0.1
+
+
+def naive_statistics(calculator: BeCoMeCalculator, opinions: list[ExpertOpinion]) -> object:
+    """Compute the dashboard statistics with one call per statistic.
+
+    :param calculator: Calculator for the BeCoMe result
+    :param opinions: Expert opinions
+    :return: Tuple of every statistic
+    """
+    result = calculator.calculate_compromise(opinions)
+    centroids = sorted(op.centroid for op in opinions)
+    quartiles = statistics.quantiles(centroids, n=4, method="inclusive")
+    cut = int(len(centroids) * _TRIM)
+    trimmed = statistics.fmean(sorted(op.centroid for op in opinions)[cut : len(opinions) - cut])
+    components = [
+        [op.opinion.lower_bound for op in opinions],
+        [op.opinion.peak for op in opinions],
+        [op.opinion.upper_bound for op in opinions],
+        [op.centroid for op in opinions],
+    ]
+    extremes = [(min(values), max(values)) for values in components]
+    deviations = [statistics.pstdev(values) for values in components]
+    return result, quartiles, trimmed, extremes, deviations
+
+
+def main() -> None:
+    """Time both approaches per panel and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--max-experts", type=int, default=100_000, help="Largest panel size")
+    parser.add_argument("--repeat", type=int, default=5, help="Timings per case")
+    parser.add_argument("--min-time", type=float, default=0.05, help="Seconds per timing")
+    args = parser.parse_args()
+
+    calculator = BeCoMeCalculator()
+    engine = StatisticsEngine(set(Statistic) - {Statistic.DISPERSION}, trim_proportion=_TRIM)
+    print(f"{'panel':<20}{'naive ms':>12}{'engine ms':>12}{'speedup':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in panel_sizes(args.max_experts):
+            for distribution in ("uniform", "ties"):
+                opinions = build_panel(size, distribution, Path(tmp)).opinions
+                naive, _, _ = time_call(
+                    partial(naive_statistics, calculator, opinions), args.repeat, args.min_time
+                )
+                single, _, _ = time_call(
+                    partial(engine.summarize, opinions), args.repeat, args.min_time
+                )
+                print(
+                    f"{f'{distribution},n={size}':<20}{naive * 1e3:>12.4f}"
+                    f"{single * 1e3:>12.4f}{naive / single:>9.2f}x"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,14 @@
 """Shared constants and helpers used across unit and integration tests."""
 
+from collections.abc import Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
+from typing import Any
 from unittest.mock import patch
 
+from sqlalchemy import Engine, event
+
 # Shared test password constant to avoid coupling between helpers and tests
 DEFAULT_TEST_PASSWORD = "SecurePass123!"
 
@@ -34,3 +39,37 @@ def mock_datetime_offset(module_path: str, offset: timedelta):
     with patch(module_path, wraps=datetime) as mock_dt:
         mock_dt.now.return_value = datetime.now(UTC) - offset
         yield mock_dt
+
+
+@dataclass
+class StatementLog:
+    """SQL statements and commits recorded on an engine."""
+
+    statements: list[str] = field(default_factory=list)
+    parameters: list[Any] = field(default_factory=list)
+    commits: int = 0
+
+
+@contextmanager
+def record_statements(engine: Engine) -> Iterator[StatementLog]:
+    """Record every statement executed and every commit issued on ``engine``.
+
+    :param engine: Engine to listen on
+    :yields: Log filled while the block runs
+    """
+    log = StatementLog()
+
+    def on_execute(_conn, _cursor, statement, parameters, *_args) -> None:
+        log.statements.append(statement)
+        log.parameters.append(parameters)
+
+    def on_commit(_conn) -> None:
+        log.commits += 1
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    event.listen(engine, "commit", on_commit)
+    try:
+        yield log
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+        event.remove(engine, "commit", on_commit)
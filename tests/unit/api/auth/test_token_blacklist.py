@@ -201,6 +201,25 @@ class TestTokenBlacklistCleanupExpired:
         assert removed == 1
         assert jti not in TokenBlacklist._memory_store
 
+    def test_removes_at_most_limit_entries(self):
+        """
+        GIVEN five expired entries and one valid entry
+        WHEN cleanup runs with a limit of two
+        THEN two expired entries are removed and the rest stay
+        """
+        # GIVEN
+        for i in range(5):
+            TokenBlacklist._memory_store[f"expired-{i}"] = datetime.now(UTC) - timedelta(hours=1)
+        TokenBlacklist._memory_store["valid"] = datetime.now(UTC) + timedelta(hours=1)
+
+        # WHEN
+        removed = TokenBlacklist.cleanup_expired(limit=2)
+
+        # THEN
+        assert removed == 2
+        assert len(TokenBlacklist._memory_store) == 4
+        assert "valid" in TokenBlacklist._memory_store
+
 
 class TestTokenBlacklistReset:
     """Tests for TokenBlacklist.reset method."""
@@ -0,0 +1,147 @@
+"""Tests for the Prometheus request metrics middleware."""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from api.metrics import install_query_counter
+from api.middleware.metrics import MetricsMiddleware
+
+
+def _sample(name: str, labels: dict[str, str]) -> float:
+    """Read a sample from the default registry, treating absence as zero."""
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def client() -> TestClient:
+    """Minimal app wired with the metrics middleware."""
+    install_query_counter()
+    engine = create_engine("sqlite:///:memory:")
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    @app.get("/queries")
+    def queries():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+            conn.execute(text("SELECT 3"))
+        return {"ok": True}
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/metrics")
+    def scrape():
+        return {"ok": True}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestMetricsMiddleware:
+    """Tests for request latency, in-flight and DB query metrics."""
+
+    def test_labels_latency_by_route_template(self, client: TestClient):
+        """
+        GIVEN two requests to the same route with different path parameters
+        WHEN they are handled
+        THEN both are counted under the route template, not the raw path
+        """
+        # GIVEN
+        labels = {"method": "GET", "route": "/items/{item_id}", "status": "200"}
+        before = _sample("become_http_request_duration_seconds_count", labels)
+
+        # WHEN
+        client.get("/items/1")
+        client.get("/items/2")
+
+        # THEN
+        assert _sample("become_http_request_duration_seconds_count", labels) == before + 2
+
+    def test_labels_unmatched_paths(self, client: TestClient):
+        """
+        GIVEN a request to a path no route matches
+        WHEN it is handled
+        THEN it is counted under the "unmatched" route with its 404 status
+        """
+        # GIVEN
+        labels = {"method": "GET", "route": "unmatched", "status": "404"}
+        before = _sample("become_http_request_duration_seconds_count", labels)
+
+        # WHEN
+        client.get("/no-such-path/123")
+
+        # THEN
+        assert _sample("become_http_request_duration_seconds_count", labels) == before + 1
+
+    def test_counts_db_queries_per_request(self, client: TestClient):
+        """
+        GIVEN an endpoint that runs three statements
+        WHEN it is called
+        THEN the per-request query histogram observes three
+        """
+        # GIVEN
+        labels = {"method": "GET", "route": "/queries"}
+        before = _sample("become_http_request_db_queries_sum", labels)
+
+        # WHEN
+        client.get("/queries")
+
+        # THEN
+        assert _sample("become_http_request_db_queries_sum", labels) == before + 3
+
+    def test_in_flight_returns_to_baseline(self, client: TestClient):
+        """
+        GIVEN completed requests
+        WHEN they have finished
+        THEN the in-flight gauge is back where it started
+        """
+        # GIVEN
+        before = _sample("become_http_requests_in_flight", {"method": "GET"})
+
+        # WHEN
+        client.get("/items/1")
+        client.get("/boom")
+
+        # THEN
+        assert _sample("become_http_requests_in_flight", {"method": "GET"}) == before
+
+    def test_records_unhandled_error_as_500(self, client: TestClient):
+        """
+        GIVEN an endpoint that raises
+        WHEN it is handled
+        THEN the request is recorded with status 500
+        """
+        # GIVEN
+        labels = {"method": "GET", "route": "/boom", "status": "500"}
+        before = _sample("become_http_request_duration_seconds_count", labels)
+
+        # WHEN
+        client.get("/boom")
+
+        # THEN
+        assert _sample("become_http_request_duration_seconds_count", labels) == before + 1
+
+    def test_skips_scrape_endpoint(self, client: TestClient):
+        """
+        GIVEN a request to the metrics scrape path
+        WHEN it is handled
+        THEN it is not recorded
+        """
+        # GIVEN
+        labels = {"method": "GET", "route": "/metrics", "status": "200"}
+
+        # WHEN
+        client.get("/metrics")
+
+        # THEN
+        assert _sample("become_http_request_duration_seconds_count", labels) == 0.0
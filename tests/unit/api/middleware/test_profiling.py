@@ -0,0 +1,146 @@
+"""Tests for the per-request profiling middleware and profile endpoints."""
+
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.config import Environment, Settings
+from api.middleware import profiling as profiling_middleware
+from api.middleware.profiling import ProfilingMiddleware
+from api.middleware.request_logging import RequestLoggingMiddleware
+from api.profiling import release_profiling_slot, try_acquire_profiling_slot
+from api.routes import profiles as profiles_route
+
+
+@pytest.fixture
+def settings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Settings:
+    """Test settings storing profiles under a temporary directory."""
+    settings = Settings(secret_key="test-secret-key").model_copy(
+        update={"profiling_dir": str(tmp_path), "profiling_max_profiles": 5}
+    )
+    monkeypatch.setattr(profiling_middleware, "get_settings", lambda: settings)
+    monkeypatch.setattr(profiles_route, "get_settings", lambda: settings)
+    return settings
+
+
+@pytest.fixture
+def client(settings: Settings) -> TestClient:
+    """Minimal app wired with the profiling middleware inside request logging."""
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.include_router(profiles_route.router)
+
+    @app.get("/work")
+    def work():
+        return {"total": sum(range(10_000))}
+
+    return TestClient(app)
+
+
+class TestProfilingMiddleware:
+    """Tests for opt-in request profiling."""
+
+    def test_unprofiled_request_passes_through(self, client: TestClient, tmp_path: Path):
+        """
+        GIVEN a request without the X-Profile header
+        WHEN it is handled
+        THEN no profile is stored and no profile header is returned
+        """
+        # WHEN
+        response = client.get("/work")
+
+        # THEN
+        assert response.status_code == 200
+        assert "X-Profile-ID" not in response.headers
+        assert list(tmp_path.iterdir()) == []
+
+    def test_profiled_request_is_stored_under_request_id(self, client: TestClient):
+        """
+        GIVEN a request asking for CPU and allocation profiling with its own request ID
+        WHEN it is handled and its profile fetched
+        THEN the profile is stored under that ID with timings, call tree and allocations
+        """
+        # WHEN
+        response = client.get(
+            "/work", headers={"X-Profile": "cpu,alloc", "X-Request-ID": "profile-me"}
+        )
+        profile = client.get("/api/v1/debug/profiles/profile-me").json()
+
+        # THEN
+        assert response.status_code == 200
+        assert response.headers["X-Profile-ID"] == "profile-me"
+        assert profile["path"] == "/work"
+        assert profile["status"] == 200
+        assert profile["modes"] == ["alloc", "cpu"]
+        assert {"wall_ms", "db_ms", "python_ms", "cpu", "alloc"} <= profile.keys()
+        listed = client.get("/api/v1/debug/profiles").json()
+        assert [entry["request_id"] for entry in listed] == ["profile-me"]
+
+    def test_unsafe_request_id_is_retrievable_by_profile_id(self, client: TestClient):
+        """
+        GIVEN a client correlation ID with a path separator, a space and over 64 characters
+        WHEN its request is profiled
+        THEN X-Profile-ID carries the sanitised ID and both IDs fetch the profile
+        """
+        # GIVEN
+        request_id = "trace/" + "x" * 70 + " end"
+
+        # WHEN
+        response = client.get("/work", headers={"X-Profile": "cpu", "X-Request-ID": request_id})
+
+        # THEN
+        profile_id = response.headers["X-Profile-ID"]
+        assert profile_id == ("trace" + "x" * 70)[:64]
+        fetched = client.get(f"/api/v1/debug/profiles/{profile_id}")
+        assert fetched.status_code == 200
+        assert fetched.json()["request_id"] == request_id
+
+    def test_busy_worker_runs_request_unprofiled(self, client: TestClient, tmp_path: Path):
+        """
+        GIVEN another request already being profiled on this worker
+        WHEN a second request asks for profiling
+        THEN it is served unprofiled and marked busy
+        """
+        # GIVEN
+        assert try_acquire_profiling_slot()
+
+        # WHEN
+        try:
+            response = client.get("/work", headers={"X-Profile": "cpu"})
+        finally:
+            release_profiling_slot()
+
+        # THEN
+        assert response.status_code == 200
+        assert response.headers["X-Profile-Status"] == "busy"
+        assert list(tmp_path.iterdir()) == []
+
+    def test_production_requires_secret(
+        self,
+        client: TestClient,
+        settings: Settings,
+        tmp_path: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """
+        GIVEN the production profile with a profiling secret
+        WHEN a request asks for profiling without and with the secret
+        THEN only the request with the secret is profiled and may read profiles
+        """
+        # GIVEN
+        monkeypatch.setattr(settings, "environment", Environment.PROD)
+        monkeypatch.setattr(settings, "profiling_secret", "s3cret")  # pragma: allowlist secret
+        secret = {"X-Profile-Secret": "s3cret"}  # pragma: allowlist secret
+
+        # WHEN
+        anonymous = client.get("/work", headers={"X-Profile": "cpu"})
+        admin = client.get("/work", headers={"X-Profile": "cpu", "X-Request-ID": "prod", **secret})
+
+        # THEN
+        assert "X-Profile-ID" not in anonymous.headers
+        assert admin.headers["X-Profile-ID"] == "prod"
+        assert client.get("/api/v1/debug/profiles").status_code == 404
+        assert client.get("/api/v1/debug/profiles/prod", headers=secret).status_code == 200
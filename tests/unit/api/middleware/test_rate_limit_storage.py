@@ -0,0 +1,302 @@
+"""Tests for the GCRA rate limiter storages."""
+
+import pytest
+from limits import RateLimitItemPerMinute
+from limits.errors import ConfigurationError
+from limits.storage import storage_from_string
+from limits.strategies import MovingWindowRateLimiter
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
+
+from api.middleware import rate_limit_storage
+from api.middleware.rate_limit_storage import GCRAMemoryStorage, GCRASQLStorage
+
+_FIVE_PER_MINUTE = RateLimitItemPerMinute(5)
+
+
+class _Clock:
+    """Stand-in for the ``time`` module with a manually advanced clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000_000.0
+
+    def time(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch) -> _Clock:
+    """Freeze the storages' clock so windows advance only when a test says so."""
+    fake = _Clock()
+    monkeypatch.setattr(rate_limit_storage, "time", fake)
+    return fake
+
+
+@pytest.fixture
+def sql_engine():
+    """In-memory SQLite engine holding the rate_limit_buckets table."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(params=["memory", "sql"])
+def storage(request, sql_engine) -> GCRAMemoryStorage | GCRASQLStorage:
+    """Each GCRA backend, so behavioural tests run against both."""
+    if request.param == "memory":
+        return GCRAMemoryStorage()
+    return GCRASQLStorage(engine=sql_engine)
+
+
+class TestGCRABehaviour:
+    """Sliding-window semantics shared by both backends."""
+
+    def test_admits_burst_up_to_limit_then_rejects(self, storage, clock):
+        """
+        GIVEN a limit of 5 per minute
+        WHEN six hits arrive at the same instant
+        THEN the first five are admitted and the sixth is rejected
+        """
+        # GIVEN
+        limiter = MovingWindowRateLimiter(storage)
+
+        # WHEN
+        results = [limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7") for _ in range(6)]
+
+        # THEN
+        assert results == [True] * 5 + [False]
+
+    def test_frees_one_slot_per_interval(self, storage, clock):
+        """
+        GIVEN an exhausted limit of 5 per minute
+        WHEN twelve seconds pass
+        THEN exactly one more hit is admitted
+        """
+        # GIVEN
+        limiter = MovingWindowRateLimiter(storage)
+        for _ in range(5):
+            limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7")
+
+        # WHEN
+        clock.now += 12
+
+        # THEN
+        assert limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7")
+        assert not limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7")
+
+    def test_keys_are_independent(self, storage, clock):
+        """
+        GIVEN one client that exhausted its limit
+        WHEN another client hits
+        THEN the other client is admitted
+        """
+        # GIVEN
+        limiter = MovingWindowRateLimiter(storage)
+        for _ in range(5):
+            limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7")
+
+        # WHEN / THEN
+        assert limiter.hit(_FIVE_PER_MINUTE, "198.51.100.1")
+
+    def test_window_stats_report_remaining_and_reset(self, storage, clock):
+        """
+        GIVEN two hits against a limit of 5 per minute
+        WHEN the window stats are read
+        THEN three hits remain and the next slot frees 12 seconds after the first hit
+        """
+        # GIVEN
+        limiter = MovingWindowRateLimiter(storage)
+        limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7")
+        limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7")
+
+        # WHEN
+        stats = limiter.get_window_stats(_FIVE_PER_MINUTE, "203.0.113.7")
+
+        # THEN
+        assert stats.remaining == 3
+        assert stats.reset_time == pytest.approx(clock.now - 60 + 3 * 12)
+        assert limiter.test(_FIVE_PER_MINUTE, "203.0.113.7")
+
+    def test_rejects_cost_above_limit(self, storage, clock):
+        """
+        GIVEN a fresh key
+        WHEN a single hit costs more than the whole limit
+        THEN it is rejected without recording state
+        """
+        # GIVEN
+        limiter = MovingWindowRateLimiter(storage)
+
+        # WHEN
+        admitted = limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7", cost=6)
+
+        # THEN
+        assert not admitted
+        assert limiter.get_window_stats(_FIVE_PER_MINUTE, "203.0.113.7").remaining == 5
+
+    def test_clear_forgets_key(self, storage, clock):
+        """
+        GIVEN an exhausted key
+        WHEN it is cleared
+        THEN it is admitted again
+        """
+        # GIVEN
+        limiter = MovingWindowRateLimiter(storage)
+        for _ in range(5):
+            limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7")
+
+        # WHEN
+        limiter.clear(_FIVE_PER_MINUTE, "203.0.113.7")
+
+        # THEN
+        assert limiter.hit(_FIVE_PER_MINUTE, "203.0.113.7")
+
+
+class TestStrategy:
+    """Only the moving-window strategy can be configured."""
+
+    @pytest.mark.parametrize("uri", ["gcra-memory://", "gcra-sql://"])
+    @pytest.mark.parametrize("strategy", ["fixed-window", "sliding-window-counter"])
+    def test_rejects_other_strategies_at_construction(self, uri, strategy):
+        """
+        GIVEN a limiter configured with a strategy other than the moving window
+        WHEN its GCRA storage is built
+        THEN construction fails instead of every later request
+        """
+        with pytest.raises(ConfigurationError, match="moving-window"):
+            storage_from_string(uri, strategy=strategy)
+
+    @pytest.mark.parametrize("uri", ["gcra-memory://", "gcra-sql://"])
+    def test_counter_methods_raise_configuration_error(self, uri):
+        """
+        GIVEN a GCRA storage
+        WHEN a fixed-window counter method is called on it directly
+        THEN it fails with the same ConfigurationError as construction
+        """
+        # GIVEN
+        storage = storage_from_string(uri)
+
+        # WHEN / THEN
+        for call in (
+            lambda: storage.incr("key", 60),
+            lambda: storage.get("key"),
+            lambda: storage.get_expiry("key"),
+        ):
+            with pytest.raises(ConfigurationError, match="moving-window"):
+                call()
+
+    def test_builds_for_the_moving_window(self):
+        """The moving-window strategy builds the storage."""
+        # WHEN
+        storage = storage_from_string("gcra-memory://", strategy="moving-window")
+
+        # THEN
+        assert isinstance(storage, GCRAMemoryStorage)
+
+
+class TestGCRAMemoryStorage:
+    """Bounded memory of the in-process backend."""
+
+    def test_registers_uri_scheme(self):
+        """
+        GIVEN the gcra-memory URI
+        WHEN limits resolves it
+        THEN the in-process GCRA storage is built
+        """
+        # WHEN
+        storage = storage_from_string("gcra-memory://")
+
+        # THEN
+        assert isinstance(storage, GCRAMemoryStorage)
+
+    def test_sweep_drops_expired_keys(self, clock, monkeypatch):
+        """
+        GIVEN keys whose window has elapsed
+        WHEN the periodic sweep runs
+        THEN they are dropped and only live keys remain
+        """
+        # GIVEN
+        monkeypatch.setattr(rate_limit_storage, "_SWEEP_EVERY", 4)
+        storage = GCRAMemoryStorage()
+        storage.acquire_entry("old-1", 5, 60)
+        storage.acquire_entry("old-2", 5, 60)
+        clock.now += 61
+
+        # WHEN
+        storage.acquire_entry("live-1", 5, 60)
+        storage.acquire_entry("live-2", 5, 60)
+
+        # THEN
+        assert len(storage) == 2
+
+    def test_caps_keys_by_evicting_closest_to_expiry(self, clock):
+        """
+        GIVEN a storage capped at eight keys, all still live
+        WHEN a ninth key arrives
+        THEN the oldest keys are evicted and the table stays under the cap
+        """
+        # GIVEN
+        storage = GCRAMemoryStorage(max_keys=8)
+        for index in range(8):
+            storage.acquire_entry(f"key-{index}", 5, 60)
+            clock.now += 1
+
+        # WHEN
+        storage.acquire_entry("key-new", 5, 60)
+
+        # THEN
+        assert len(storage) <= 8
+        assert storage.get_moving_window("key-0", 5, 60)[1] == 0
+        assert storage.get_moving_window("key-7", 5, 60)[1] == 1
+
+
+class TestGCRASQLStorage:
+    """Cross-worker sharing of the SQL backend."""
+
+    def test_workers_share_counters(self, sql_engine, clock):
+        """
+        GIVEN two storages standing in for two workers on the same database
+        WHEN hits are spread across both
+        THEN the limit applies to their combined total
+        """
+        # GIVEN
+        worker_a = MovingWindowRateLimiter(GCRASQLStorage(engine=sql_engine))
+        worker_b = MovingWindowRateLimiter(GCRASQLStorage(engine=sql_engine))
+
+        # WHEN
+        results = [
+            (worker_a if index % 2 else worker_b).hit(_FIVE_PER_MINUTE, "203.0.113.7")
+            for index in range(6)
+        ]
+
+        # THEN
+        assert results == [True] * 5 + [False]
+
+    def test_sweep_deletes_expired_rows(self, sql_engine, clock, monkeypatch):
+        """
+        GIVEN a bucket whose window has elapsed
+        WHEN the periodic sweep runs
+        THEN its row is deleted
+        """
+        # GIVEN
+        monkeypatch.setattr(rate_limit_storage, "_SWEEP_EVERY", 2)
+        storage = GCRASQLStorage(engine=sql_engine)
+        storage.acquire_entry("old", 5, 60)
+        clock.now += 61
+
+        # WHEN
+        storage.acquire_entry("live", 5, 60)
+
+        # THEN
+        assert storage.reset() == 1
+
+    def test_check_reports_health(self, sql_engine):
+        """
+        GIVEN a reachable database
+        WHEN the storage is health-checked
+        THEN it reports healthy
+        """
+        # WHEN / THEN
+        assert GCRASQLStorage(engine=sql_engine).check()
@@ -1,10 +1,12 @@
 """Tests for request/response logging middleware."""
 
+import asyncio
 import logging
 from unittest.mock import patch
 
 import pytest
 from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
 from api.logging_context import get_request_id
@@ -33,6 +35,10 @@ def app() -> FastAPI:
     def health():
         return {"status": "ok"}
 
+    @application.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"first,", b"second"]), media_type="text/plain")
+
     return application
 
 
@@ -93,6 +99,19 @@ class TestRequestId:
         # THEN
         assert response.json()["request_id"] == response.headers["X-Request-ID"]
 
+    def test_adds_request_id_to_streaming_response(self, client: TestClient):
+        """
+        GIVEN an endpoint that streams its body in chunks
+        WHEN it is handled
+        THEN the full body arrives and the X-Request-ID header is set
+        """
+        # WHEN
+        response = client.get("/stream", headers={"X-Request-ID": "stream-1"})
+
+        # THEN
+        assert response.text == "first,second"
+        assert response.headers["X-Request-ID"] == "stream-1"
+
 
 class TestRequestLogging:
     """Tests for request/response log emission."""
@@ -175,3 +194,43 @@ class TestRequestLogging:
         # THEN
         serialized = str(mock_logger.info.call_args) + str(mock_logger.log.call_args)
         assert "super-secret-token" not in serialized
+
+    def test_logs_streaming_response_status(self, client: TestClient):
+        """
+        GIVEN an endpoint that streams its body
+        WHEN the response completes
+        THEN the response log carries the streamed status code
+        """
+        # WHEN
+        with patch("api.middleware.request_logging.logger") as mock_logger:
+            client.get("/stream")
+
+        # THEN
+        assert mock_logger.log.call_args[1]["extra"]["status_code"] == 200
+
+
+class TestNonHttpScopes:
+    """Tests for scopes the middleware does not handle."""
+
+    def test_passes_lifespan_scope_through(self):
+        """
+        GIVEN a lifespan scope
+        WHEN it reaches the middleware
+        THEN the downstream app receives it untouched and nothing is logged
+        """
+        # GIVEN
+        seen: list[dict] = []
+
+        async def downstream(scope, receive, send):
+            seen.append(scope)
+
+        middleware = RequestLoggingMiddleware(downstream)
+        scope = {"type": "lifespan"}
+
+        # WHEN
+        with patch("api.middleware.request_logging.logger") as mock_logger:
+            asyncio.run(middleware(scope, None, None))
+
+        # THEN
+        assert seen == [scope]
+        mock_logger.info.assert_not_called()
@@ -2,6 +2,7 @@
 
 import pytest
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
 from api.middleware.security_headers import SecurityHeadersMiddleware
@@ -17,6 +18,10 @@ def app_with_middleware() -> FastAPI:
     def test_endpoint():
         return {"status": "ok"}
 
+    @app.get("/stream")
+    def stream_endpoint():
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
     return app
 
 
@@ -139,3 +144,17 @@ class TestSecurityHeadersMiddleware:
         assert "default-src 'self'" in csp
         assert "frame-ancestors 'none'" in csp
         assert "script-src 'self'" in csp
+
+    def test_adds_headers_to_streaming_response(self, http_client: TestClient):
+        """
+        GIVEN an endpoint that streams its body in chunks
+        WHEN the response is returned
+        THEN the body is intact and the security headers are present
+        """
+        # WHEN
+        response = http_client.get("/stream")
+
+        # THEN
+        assert response.text == "abc"
+        assert response.headers.get("X-Frame-Options") == "DENY"
+        assert response.headers.get("Content-Security-Policy") is not None
@@ -1,9 +1,12 @@
 """Unit tests for CalculationService."""
 
+import json
 from datetime import UTC, datetime
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
 
+from sqlalchemy.dialects import sqlite
+
 from api.db.models import CalculationResult, ExpertOpinion, Project
 from api.services.calculation_service import CalculationService
 
@@ -55,6 +58,16 @@ class TestCalculationServiceGetResult:
         assert result is None
 
 
+def _returning(statement, **_kwargs) -> MagicMock:
+    """Answer an upsert with the row its RETURNING clause would yield.
+
+    :param statement: Upsert executed through ``session.scalars``
+    :return: Result whose ``one()`` is a CalculationResult built from the values
+    """
+    row = CalculationResult(**statement.compile(dialect=sqlite.dialect()).params)
+    return MagicMock(one=MagicMock(return_value=row))
+
+
 def _build_single_opinion_service(
     lower: float,
     peak: float,
@@ -62,6 +75,7 @@ def _build_single_opinion_service(
     *,
     scale_min: float = 0.0,
     scale_max: float = 100.0,
+    publisher: MagicMock | None = None,
 ) -> tuple[CalculationService, UUID]:
     """Build a CalculationService with one opinion and a mock session.
 
@@ -70,6 +84,7 @@ def _build_single_opinion_service(
     :param upper: Upper bound of fuzzy number
     :param scale_min: Project scale minimum
     :param scale_max: Project scale maximum
+    :param publisher: Result publisher (default: the live result hub)
     :return: Tuple of (service, project_id)
     """
     project_id = uuid4()
@@ -94,8 +109,9 @@ def _build_single_opinion_service(
     mock_session = MagicMock()
     mock_session.exec.return_value.all.return_value = [opinion]
     mock_session.exec.return_value.first.return_value = None
+    mock_session.scalars.side_effect = _returning
     mock_session.get.return_value = project
-    return CalculationService(mock_session), project_id
+    return CalculationService(mock_session, publisher=publisher), project_id
 
 
 class TestCalculationServiceRecalculate:
@@ -149,6 +165,57 @@ class TestCalculationServiceRecalculate:
         assert result.best_compromise_peak == 50.0
         assert result.best_compromise_upper == 80.0
 
+    def test_publishes_saved_result(self):
+        """Publishes the committed result as JSON for live subscribers."""
+        # GIVEN
+        publisher = MagicMock()
+        service, project_id = _build_single_opinion_service(20.0, 50.0, 80.0, publisher=publisher)
+
+        # WHEN
+        service.recalculate(project_id)
+
+        # THEN
+        publisher.publish.assert_called_once()
+        published_id, payload = publisher.publish.call_args.args
+        assert published_id == project_id
+        data = json.loads(payload)
+        assert data["best_compromise"]["peak"] == 50.0
+        assert data["num_experts"] == 1
+
+    def test_publishes_null_when_result_cleared(self):
+        """Publishes null when the last opinion is gone."""
+        # GIVEN
+        project_id = uuid4()
+        mock_session = MagicMock()
+        mock_session.exec.return_value.all.return_value = []
+        mock_session.exec.return_value.first.return_value = None
+        publisher = MagicMock()
+        service = CalculationService(mock_session, publisher=publisher)
+
+        # WHEN
+        service.recalculate(project_id)
+
+        # THEN
+        publisher.publish.assert_called_once_with(project_id, "null")
+
+    def test_coalesced_trigger_returns_stored_result(self):
+        """A trigger covered by another computation reads the stored result."""
+        # GIVEN
+        stored = MagicMock(spec=CalculationResult)
+        mock_session = MagicMock()
+        mock_session.exec.return_value.first.return_value = stored
+        coordinator = MagicMock()
+        coordinator.run.return_value = False
+        publisher = MagicMock()
+        service = CalculationService(mock_session, publisher=publisher, coordinator=coordinator)
+
+        # WHEN
+        result = service.recalculate(uuid4())
+
+        # THEN
+        assert result is stored
+        publisher.publish.assert_not_called()
+
     def test_calculates_with_multiple_opinions(self):
         """Creates result with correct calculation for multiple opinions."""
         # GIVEN
@@ -198,6 +265,7 @@ class TestCalculationServiceRecalculate:
         mock_session = MagicMock()
         mock_session.exec.return_value.all.return_value = opinions
         mock_session.exec.return_value.first.return_value = None
+        mock_session.scalars.side_effect = _returning
         mock_session.get.return_value = project
         service = CalculationService(mock_session)
 
@@ -207,7 +275,8 @@ class TestCalculationServiceRecalculate:
         # THEN
         assert result is not None
         assert result.num_experts == 3
-        mock_session.add.assert_called()
+        mock_session.scalars.assert_called_once()
+        mock_session.commit.assert_called_once()
 
     def test_adds_likert_interpretation_for_standard_scale(self):
         """Adds Likert interpretation for 0-100 scale projects."""
@@ -237,8 +306,8 @@ class TestCalculationServiceRecalculate:
         assert result.likert_value is None
         assert result.likert_decision is None
 
-    def test_updates_existing_result(self):
-        """Updates existing result instead of creating new."""
+    def test_overwrites_existing_result_with_one_upsert(self):
+        """Overwrites an existing result in one statement without reading it first."""
         # GIVEN
         project_id = uuid4()
         opinion = ExpertOpinion(
@@ -277,9 +346,9 @@ class TestCalculationServiceRecalculate:
         )
 
         mock_session = MagicMock()
-        # First call for opinions, second for existing result
         mock_session.exec.return_value.all.return_value = [opinion]
         mock_session.exec.return_value.first.return_value = existing_result
+        mock_session.scalars.side_effect = _returning
         mock_session.get.return_value = project
         service = CalculationService(mock_session)
 
@@ -287,9 +356,13 @@ class TestCalculationServiceRecalculate:
         result = service.recalculate(project_id)
 
         # THEN
-        assert result is existing_result
+        assert result is not None
         assert result.best_compromise_lower == 20.0
         assert result.best_compromise_peak == 50.0
         assert result.best_compromise_upper == 80.0
-        mock_session.add.assert_called()
-        mock_session.commit.assert_called()
+        assert not any(
+            "calculation_results" in str(call.args[0]) for call in mock_session.exec.call_args_list
+        )
+        mock_session.scalars.assert_called_once()
+        mock_session.add.assert_not_called()
+        mock_session.commit.assert_called_once()
@@ -1,5 +1,8 @@
 """Unit tests for DataExportService."""
 
+import io
+import json
+import zipfile
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -15,7 +18,11 @@ from api.db.models import (
     User,
 )
 from api.schemas.data_export import EXPORT_FORMAT_VERSION
-from api.services.data_export_service import DataExportService
+from api.services.data_export_service import (
+    STREAM_BATCH_SIZE,
+    STREAM_CHUNK_SIZE,
+    DataExportService,
+)
 
 
 @pytest.fixture
@@ -246,3 +253,103 @@ class TestDataExportServiceBuildExport:
 
         # THEN
         assert mock_logger.info.call_args[1]["extra"]["event"] == "data_export_generated"
+
+
+class TestDataExportServiceStreaming:
+    """Tests for DataExportService.stream_json and stream_zip."""
+
+    @pytest.fixture
+    def sections(
+        self,
+        project: Project,
+        result: CalculationResult,
+        membership: ProjectMember,
+        opinion: ExpertOpinion,
+        invitation: Invitation,
+        inviter: User,
+    ) -> list[list[tuple[object, ...]]]:
+        """Rows of the four section queries, one each."""
+        return [
+            [(project, result)],
+            [(membership, project)],
+            [(opinion, project)],
+            [(invitation, project, inviter)],
+        ]
+
+    def test_json_stream_matches_in_memory_export(self, user: User, sections):
+        """
+        GIVEN an account with one item in every section
+        WHEN the export is streamed as JSON
+        THEN the joined chunks parse to the in-memory document
+        """
+        # GIVEN
+        session = MagicMock()
+        session.exec.side_effect = [iter(rows) for rows in sections] + [
+            _exec_returning(rows) for rows in sections
+        ]
+        service = DataExportService(session)
+
+        # WHEN
+        streamed = json.loads(b"".join(service.stream_json(user)))
+        expected = service.build_export(user).model_dump(mode="json")
+
+        # THEN
+        del streamed["export_metadata"]["generated_at"], expected["export_metadata"]["generated_at"]
+        assert streamed == expected
+        assert list(streamed) == list(expected)
+
+    def test_zip_has_one_ndjson_file_per_section(self, user: User, sections):
+        """
+        GIVEN an account with one item in every section
+        WHEN the export is streamed as a ZIP archive
+        THEN it holds metadata, profile and one NDJSON line per item
+        """
+        # GIVEN
+        session = MagicMock()
+        session.exec.side_effect = [iter(rows) for rows in sections]
+        service = DataExportService(session)
+
+        # WHEN
+        archive = zipfile.ZipFile(io.BytesIO(b"".join(service.stream_zip(user))))
+
+        # THEN
+        assert archive.namelist() == [
+            "export_metadata.json",
+            "profile.json",
+            "owned_projects.ndjson",
+            "memberships.ndjson",
+            "opinions.ndjson",
+            "received_invitations.ndjson",
+        ]
+        assert json.loads(archive.read("profile.json"))["email"] == user.email
+        lines = archive.read("opinions.ndjson").decode().splitlines()
+        assert [json.loads(line)["position"] for line in lines] == ["Analyst"]
+        assert "super-secret-hash" not in archive.read("profile.json").decode()
+
+    @pytest.mark.parametrize("mode", ["stream_json", "stream_zip"])
+    def test_large_export_is_written_in_bounded_chunks(
+        self, user: User, project: Project, opinion: ExpertOpinion, mode: str
+    ):
+        """
+        GIVEN an account with thousands of opinions
+        WHEN the export is streamed
+        THEN it arrives in several chunks, none much larger than the chunk size,
+            and every section is read in batches
+        """
+        # GIVEN
+        session = MagicMock()
+        opinions = [
+            (opinion.model_copy(update={"position": uuid4().hex}), project) for _ in range(5000)
+        ]
+        session.exec.side_effect = [iter([]), iter([]), iter(opinions), iter([])]
+        service = DataExportService(session)
+
+        # WHEN
+        chunks = list(getattr(service, mode)(user))
+
+        # THEN
+        assert len(chunks) > 1
+        assert max(len(chunk) for chunk in chunks) < 2 * STREAM_CHUNK_SIZE
+        for call in session.exec.call_args_list:
+            options = call.args[0].get_execution_options()
+            assert options["yield_per"] == STREAM_BATCH_SIZE
@@ -5,6 +5,8 @@ from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
 
 from api.db.models import Invitation, MemberRole, Project, ProjectMember, User
 from api.exceptions import (
@@ -13,7 +15,34 @@ from api.exceptions import (
     UserAlreadyMemberError,
     UserNotFoundForInvitationError,
 )
+from api.schemas.internal import BulkInviteStatus
 from api.services.invitation_service import InvitationService
+from tests.shared.helpers import record_statements
+
+
+@pytest.fixture
+def session():
+    """In-memory SQLite session with all tables created."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as db_session:
+        yield db_session
+    engine.dispose()
+
+
+def _add_users(session: Session, *emails: str) -> list[User]:
+    """Persist and return users with the given emails."""
+    users = [
+        User(email=email, hashed_password="hash", first_name="U", last_name="Expert")
+        for email in emails
+    ]
+    session.add_all(users)
+    session.commit()
+    return users
 
 
 class TestInvitationServiceInviteByEmail:
@@ -456,3 +485,106 @@ class TestInvitationServiceGetProjectInvitations:
 
         # THEN
         assert len(result) == 2
+
+
+class TestInvitationServiceInviteMany:
+    """Tests for InvitationService.invite_many method."""
+
+    def test_reports_each_email_and_invites_the_rest(self, session):
+        """
+        GIVEN a project with a member, a pending invitation and two other registered users
+        WHEN all of them and an unknown email are invited in bulk
+        THEN each distinct email gets its status and only the two others are invited
+        """
+        # GIVEN
+        admin, member, pending, new_a, new_b = _add_users(
+            session,
+            "admin@example.com",
+            "member@example.com",
+            "pending@example.com",
+            "a@example.com",
+            "b@example.com",
+        )
+        project = Project(name="Panel", admin_id=admin.id)
+        session.add(project)
+        session.flush()
+        session.add(ProjectMember(project_id=project.id, user_id=member.id))
+        session.add(Invitation(project_id=project.id, invitee_id=pending.id, inviter_id=admin.id))
+        session.commit()
+        emails = [
+            "A@Example.com",
+            "member@example.com",
+            "pending@example.com",
+            "ghost@example.com",
+            "b@example.com",
+            "a@example.com",
+        ]
+
+        # WHEN
+        outcomes = InvitationService(session).invite_many(project.id, admin.id, emails)
+
+        # THEN
+        assert [(outcome.email, outcome.status) for outcome in outcomes] == [
+            ("a@example.com", BulkInviteStatus.INVITED),
+            ("member@example.com", BulkInviteStatus.ALREADY_MEMBER),
+            ("pending@example.com", BulkInviteStatus.ALREADY_INVITED),
+            ("ghost@example.com", BulkInviteStatus.NOT_FOUND),
+            ("b@example.com", BulkInviteStatus.INVITED),
+        ]
+        stored = {
+            invitation.invitee_id: invitation.id
+            for invitation in session.exec(
+                select(Invitation).where(Invitation.project_id == project.id)
+            )
+        }
+        assert stored.keys() == {pending.id, new_a.id, new_b.id}
+        assert outcomes[0].invitation_id == stored[new_a.id]
+        assert outcomes[4].invitation_id == stored[new_b.id]
+
+    def test_uses_three_queries_and_one_insert(self, session):
+        """
+        GIVEN a project and fifty registered users
+        WHEN all of them are invited in bulk
+        THEN three lookups and a single INSERT run, committed once
+        """
+        # GIVEN
+        emails = [f"expert{index}@example.com" for index in range(50)]
+        admin, *_ = _add_users(session, "admin@example.com", *emails)
+        project = Project(name="Panel", admin_id=admin.id)
+        session.add(project)
+        session.commit()
+        project_id, admin_id = project.id, admin.id
+
+        # WHEN
+        with record_statements(session.get_bind()) as log:
+            outcomes = InvitationService(session).invite_many(project_id, admin_id, emails)
+
+        # THEN
+        assert all(outcome.status is BulkInviteStatus.INVITED for outcome in outcomes)
+        assert len(log.statements) == 4
+        assert log.statements[-1].lstrip().upper().startswith("INSERT")
+        assert log.commits == 1
+
+    def test_skips_insert_when_nobody_can_be_invited(self, session):
+        """
+        GIVEN only unknown emails
+        WHEN they are invited in bulk
+        THEN all are reported not found and nothing is written
+        """
+        # GIVEN
+        (admin,) = _add_users(session, "admin@example.com")
+        project = Project(name="Panel", admin_id=admin.id)
+        session.add(project)
+        session.commit()
+        project_id, admin_id = project.id, admin.id
+
+        # WHEN
+        with record_statements(session.get_bind()) as log:
+            outcomes = InvitationService(session).invite_many(
+                project_id, admin_id, ["ghost@example.com"]
+            )
+
+        # THEN
+        assert outcomes[0].status is BulkInviteStatus.NOT_FOUND
+        assert not any(sql.lstrip().upper().startswith("INSERT") for sql in log.statements)
+        assert log.commits == 0
@@ -0,0 +1,250 @@
+"""Unit tests for background maintenance (lease election and scheduler)."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel, create_engine
+
+from api.config import Settings
+from api.services.maintenance import (
+    LeaseElection,
+    MaintenanceJob,
+    MaintenanceScheduler,
+    create_maintenance_scheduler,
+)
+
+
+class _Clock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engine():
+    """In-memory SQLite engine with all tables created."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def clock() -> _Clock:
+    return _Clock()
+
+
+def _backlog(rows: int) -> MagicMock:
+    """A purge callable draining ``rows`` rows, at most ``limit`` per call."""
+    remaining = [rows]
+
+    def purge(limit: int) -> int:
+        removed = min(limit, remaining[0])
+        remaining[0] -= removed
+        return removed
+
+    return MagicMock(side_effect=purge)
+
+
+def _scheduler(jobs: list[MaintenanceJob], election, batch_size: int = 10) -> MaintenanceScheduler:
+    return MaintenanceScheduler(
+        jobs, election, interval=60.0, batch_size=batch_size, batch_pause=0.0
+    )
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+class TestLeaseElection:
+    """Tests for LeaseElection on a shared database."""
+
+    def test_only_one_worker_holds_a_lease(self, engine, clock):
+        """
+        GIVEN two workers sharing the lease table
+        WHEN both try to take the same job's lease
+        THEN only the first gets it, while the other job's lease is still free
+        """
+        # GIVEN
+        first = LeaseElection(60.0, engine=engine, holder="worker-1", clock=clock)
+        second = LeaseElection(60.0, engine=engine, holder="worker-2", clock=clock)
+
+        # WHEN / THEN
+        assert first.acquire("purge")
+        assert not second.acquire("purge")
+        assert second.acquire("other")
+
+    def test_holder_renews_and_others_take_over_after_expiry(self, engine, clock):
+        """
+        GIVEN a lease held by one worker
+        WHEN the holder renews it, and later stops renewing
+        THEN the renewal extends it, and another worker takes over once it expires
+        """
+        # GIVEN
+        first = LeaseElection(60.0, engine=engine, holder="worker-1", clock=clock)
+        second = LeaseElection(60.0, engine=engine, holder="worker-2", clock=clock)
+        first.acquire("purge")
+
+        # WHEN
+        clock.now += 50.0
+        renewed = first.acquire("purge")
+        clock.now += 59.0
+        before_expiry = second.acquire("purge")
+        clock.now += 1.0
+        after_expiry = second.acquire("purge")
+
+        # THEN
+        assert renewed
+        assert not before_expiry
+        assert after_expiry
+        assert not first.acquire("purge")
+
+    def test_release_frees_the_lease(self, engine, clock):
+        """
+        GIVEN a lease held by one worker
+        WHEN it releases its leases
+        THEN another worker takes the lease at once
+        """
+        # GIVEN
+        first = LeaseElection(60.0, engine=engine, holder="worker-1", clock=clock)
+        second = LeaseElection(60.0, engine=engine, holder="worker-2", clock=clock)
+        first.acquire("purge")
+
+        # WHEN
+        first.release()
+
+        # THEN
+        assert second.acquire("purge")
+
+
+class TestMaintenanceScheduler:
+    """Tests for MaintenanceScheduler runs."""
+
+    def test_drains_backlog_in_batches(self):
+        """
+        GIVEN a shared job with 25 expired rows and a batch size of 10
+        WHEN the scheduler runs once as leader
+        THEN the job is called until a batch comes back short, renewing the lease each time
+        """
+        # GIVEN
+        purge = _backlog(25)
+        election = MagicMock()
+        election.acquire.return_value = True
+        scheduler = _scheduler([MaintenanceJob("drain", purge)], election)
+        before = _sample("become_maintenance_rows_purged_total", job="drain")
+
+        # WHEN
+        purged = asyncio.run(scheduler.run_once())
+
+        # THEN
+        assert purged == {"drain": 25}
+        assert [call.args[0] for call in purge.call_args_list] == [10, 10, 10]
+        assert election.acquire.call_count == 3
+        assert _sample("become_maintenance_rows_purged_total", job="drain") - before == 25
+        assert _sample("become_maintenance_job_duration_seconds_count", job="drain") >= 1
+
+    def test_skips_shared_job_without_the_lease(self):
+        """
+        GIVEN another worker holding the lease
+        WHEN the scheduler runs a shared job and a per-process job
+        THEN the shared job is skipped and the per-process one still runs
+        """
+        # GIVEN
+        shared = _backlog(5)
+        local = _backlog(3)
+        election = MagicMock()
+        election.acquire.return_value = False
+        scheduler = _scheduler(
+            [MaintenanceJob("shared", shared), MaintenanceJob("local", local, shared=False)],
+            election,
+        )
+        before = _sample("become_maintenance_runs_total", job="shared", outcome="skipped")
+
+        # WHEN
+        purged = asyncio.run(scheduler.run_once())
+
+        # THEN
+        assert purged == {"shared": 0, "local": 3}
+        shared.assert_not_called()
+        election.acquire.assert_called_once_with("shared")
+        after = _sample("become_maintenance_runs_total", job="shared", outcome="skipped")
+        assert after - before == 1
+
+    def test_failing_job_does_not_stop_the_others(self):
+        """
+        GIVEN a job whose purge raises
+        WHEN the scheduler runs it before a healthy job
+        THEN the failure is counted and the healthy job still runs
+        """
+        # GIVEN
+        broken = MagicMock(side_effect=RuntimeError("database gone"))
+        healthy = _backlog(2)
+        election = MagicMock()
+        election.acquire.return_value = True
+        scheduler = _scheduler(
+            [MaintenanceJob("broken", broken), MaintenanceJob("healthy", healthy)], election
+        )
+        before = _sample("become_maintenance_runs_total", job="broken", outcome="failed")
+
+        # WHEN
+        purged = asyncio.run(scheduler.run_once())
+
+        # THEN
+        assert purged == {"broken": 0, "healthy": 2}
+        assert (
+            _sample("become_maintenance_runs_total", job="broken", outcome="failed") - before == 1
+        )
+
+    def test_stop_ends_loop_and_releases_leases(self):
+        """
+        GIVEN a started scheduler waiting for its first run
+        WHEN it is stopped
+        THEN the loop ends without running a job and the leases are released
+        """
+        # GIVEN
+        purge = _backlog(1)
+        election = MagicMock()
+
+        async def start_then_stop() -> None:
+            scheduler = _scheduler([MaintenanceJob("idle", purge)], election)
+            scheduler.start()
+            await asyncio.sleep(0)
+            await scheduler.stop()
+
+        # WHEN
+        asyncio.run(start_then_stop())
+
+        # THEN
+        purge.assert_not_called()
+        election.release.assert_called_once()
+
+
+class TestCreateMaintenanceScheduler:
+    """Tests for building the scheduler from settings."""
+
+    def test_zero_interval_disables_maintenance(self):
+        """A zero interval turns the scheduler off."""
+        # GIVEN
+        settings = Settings(secret_key="test", maintenance_interval_seconds=0)
+
+        # WHEN / THEN
+        assert create_maintenance_scheduler(settings) is None
+
+    def test_builds_scheduler_by_default(self):
+        """The default settings run maintenance."""
+        # GIVEN
+        settings = Settings(secret_key="test")
+
+        # WHEN / THEN
+        assert isinstance(create_maintenance_scheduler(settings), MaintenanceScheduler)
@@ -1,10 +1,11 @@
 """Unit tests for OpinionService."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from unittest.mock import MagicMock
 from uuid import uuid4
 
 import pytest
+from sqlalchemy.dialects import sqlite
 
 from api.db.models import ExpertOpinion, Project, User
 from api.exceptions import OpinionNotFoundError, ValuesOutOfRangeError
@@ -105,14 +106,32 @@ class TestOpinionServiceGetUserOpinion:
         assert result is None
 
 
+def _returning_opinion(created_at: datetime, updated_at: datetime) -> MagicMock:
+    """Build a session whose upsert RETURNING yields an opinion with these timestamps.
+
+    :param created_at: Creation time of the returned row
+    :param updated_at: Last update time of the returned row
+    :return: Mock session
+    """
+    mock_session = MagicMock()
+
+    def returning(statement, **_kwargs) -> MagicMock:
+        values = statement.compile(dialect=sqlite.dialect()).params
+        row = ExpertOpinion(**{**values, "created_at": created_at, "updated_at": updated_at})
+        return MagicMock(one=MagicMock(return_value=row))
+
+    mock_session.scalars.side_effect = returning
+    return mock_session
+
+
 class TestOpinionServiceUpsertOpinion:
     """Tests for OpinionService.upsert_opinion method."""
 
     def test_creates_new_opinion(self):
-        """Creates new opinion when user has none."""
+        """Reports a created opinion when the returned row was never updated."""
         # GIVEN
-        mock_session = MagicMock()
-        mock_session.exec.return_value.first.return_value = None
+        now = datetime.now(UTC)
+        mock_session = _returning_opinion(created_at=now, updated_at=now)
         service = OpinionService(mock_session)
         project_id = uuid4()
         user_id = uuid4()
@@ -135,34 +154,21 @@ class TestOpinionServiceUpsertOpinion:
         assert result.opinion.lower_bound == 30.0
         assert result.opinion.peak == 60.0
         assert result.opinion.upper_bound == 90.0
-        mock_session.add.assert_called_once()
+        mock_session.scalars.assert_called_once()
+        mock_session.exec.assert_not_called()
         mock_session.commit.assert_called_once()
-        mock_session.refresh.assert_called_once()
 
     def test_updates_existing_opinion(self):
-        """Updates existing opinion when user already has one."""
+        """Reports an update when the returned row keeps an older creation time."""
         # GIVEN
-        project_id = uuid4()
-        user_id = uuid4()
-        existing = ExpertOpinion(
-            id=uuid4(),
-            project_id=project_id,
-            user_id=user_id,
-            position="Expert",
-            lower_bound=20.0,
-            peak=50.0,
-            upper_bound=80.0,
-            created_at=datetime.now(UTC),
-            updated_at=datetime.now(UTC),
-        )
-        mock_session = MagicMock()
-        mock_session.exec.return_value.first.return_value = existing
+        now = datetime.now(UTC)
+        mock_session = _returning_opinion(created_at=now - timedelta(days=1), updated_at=now)
         service = OpinionService(mock_session)
 
         # WHEN
         result = service.upsert_opinion(
-            project_id=project_id,
-            user_id=user_id,
+            project_id=uuid4(),
+            user_id=uuid4(),
             position="Senior Expert",
             lower_bound=40.0,
             peak=70.0,
@@ -175,9 +181,21 @@ class TestOpinionServiceUpsertOpinion:
         assert result.opinion.lower_bound == 40.0
         assert result.opinion.peak == 70.0
         assert result.opinion.upper_bound == 95.0
-        mock_session.add.assert_called_once()
         mock_session.commit.assert_called_once()
 
+    def test_leaves_commit_to_caller(self):
+        """With commit=False the write stays in the open transaction."""
+        # GIVEN
+        now = datetime.now(UTC)
+        mock_session = _returning_opinion(created_at=now, updated_at=now)
+        service = OpinionService(mock_session)
+
+        # WHEN
+        service.upsert_opinion(uuid4(), uuid4(), "Expert", 1.0, 2.0, 3.0, commit=False)
+
+        # THEN
+        mock_session.commit.assert_not_called()
+
 
 class TestOpinionServiceDeleteOpinion:
     """Tests for OpinionService.delete_opinion method."""
@@ -0,0 +1,167 @@
+"""Unit tests for bulk opinion import parsing and validation."""
+
+import json
+
+import pytest
+
+from api.services.opinion_import import (
+    MAX_IMPORT_ROWS,
+    ImportFormat,
+    ImportRow,
+    parse_import,
+    validate_rows,
+)
+
+_HEADER = "email,position,lower_bound,peak,upper_bound\n"
+
+
+def _record(email: str, position: str, lower: object = 1, peak: object = 2, upper: object = 3):
+    """Build a decoded import record."""
+    return {
+        "email": email,
+        "position": position,
+        "lower_bound": lower,
+        "peak": peak,
+        "upper_bound": upper,
+    }
+
+
+def _row(row: int, lower: float, peak: float, upper: float) -> ImportRow:
+    """Build a parsed record with the given values."""
+    return ImportRow(row, "e@example.com", "Expert", lower, peak, upper)
+
+
+class TestImportFormat:
+    """Tests for ImportFormat.from_content_type."""
+
+    @pytest.mark.parametrize(
+        ("content_type", "expected"),
+        [
+            ("text/csv", ImportFormat.CSV),
+            ("text/csv; charset=utf-8", ImportFormat.CSV),
+            ("application/json", ImportFormat.JSON),
+            ("application/x-ndjson", ImportFormat.NDJSON),
+            ("application/jsonl", ImportFormat.NDJSON),
+            ("text/xml", None),
+            (None, None),
+        ],
+    )
+    def test_resolves_media_type(self, content_type, expected):
+        """Maps supported media types and ignores parameters."""
+        # GIVEN / WHEN / THEN
+        assert ImportFormat.from_content_type(content_type) is expected
+
+
+class TestParseImport:
+    """Tests for parse_import."""
+
+    def test_parses_csv_records(self):
+        """Normalises emails, strips HTML from positions and converts numbers."""
+        # GIVEN
+        content = (_HEADER + " A@Example.com ,<i>Chair</i>,1,2.5,3\n").encode()
+
+        # WHEN
+        parsed = parse_import(content, ImportFormat.CSV)
+
+        # THEN
+        assert parsed.errors == []
+        assert parsed.rows == [ImportRow(1, "a@example.com", "Chair", 1.0, 2.5, 3.0)]
+
+    def test_rejects_csv_without_required_columns(self):
+        """A header without the required columns fails the whole file."""
+        # GIVEN
+        content = b"email,position\na@example.com,Chair\n"
+
+        # WHEN
+        parsed = parse_import(content, ImportFormat.CSV)
+
+        # THEN
+        assert parsed.rows == []
+        assert parsed.errors[0].row == 0
+        assert "lower_bound" in parsed.errors[0].message
+
+    def test_reports_bad_records_by_number(self):
+        """Each malformed record is reported against its own number."""
+        # GIVEN
+        incomplete = _record("d@example.com", "D")
+        del incomplete["lower_bound"]
+        records = [
+            _record("a@example.com", "A"),
+            _record("b@example.com", "B", lower=True),
+            _record("c@example.com", "<p></p>"),
+            ["not", "an", "object"],
+            incomplete,
+        ]
+
+        # WHEN
+        parsed = parse_import(json.dumps(records).encode(), ImportFormat.JSON)
+
+        # THEN
+        assert [row.row for row in parsed.rows] == [1]
+        assert [error.row for error in parsed.errors] == [2, 3, 4, 5]
+        assert "lower_bound must be a number" in parsed.errors[0].message
+        assert "Missing fields: lower_bound" in parsed.errors[3].message
+
+    def test_numbers_ndjson_by_non_blank_line(self):
+        """Blank lines are skipped and an undecodable line is reported."""
+        # GIVEN
+        record = json.dumps(_record("a@example.com", "A"))
+        content = f"{record}\n\n{{broken\n{record}\n".encode()
+
+        # WHEN
+        parsed = parse_import(content, ImportFormat.NDJSON)
+
+        # THEN
+        assert [row.row for row in parsed.rows] == [1, 3]
+        assert [error.row for error in parsed.errors] == [2]
+
+    def test_rejects_json_that_is_not_an_array(self):
+        """A JSON document must be an array of records."""
+        # GIVEN / WHEN
+        parsed = parse_import(b'{"email": "a@example.com"}', ImportFormat.JSON)
+
+        # THEN
+        assert parsed.errors[0].row == 0
+
+    def test_rejects_too_many_records(self):
+        """Files above the record limit are refused as a whole."""
+        # GIVEN
+        content = (_HEADER + "a@example.com,A,1,2,3\n" * (MAX_IMPORT_ROWS + 1)).encode()
+
+        # WHEN
+        parsed = parse_import(content, ImportFormat.CSV)
+
+        # THEN
+        assert parsed.rows == []
+        assert "limited" in parsed.errors[0].message
+
+
+class TestValidateRows:
+    """Tests for validate_rows."""
+
+    def test_accepts_valid_rows(self):
+        """Rows inside the scale and in order pass."""
+        # GIVEN
+        rows = [_row(1, 0.0, 50.0, 100.0), _row(2, 10.0, 10.0, 10.0)]
+
+        # WHEN / THEN
+        assert validate_rows(rows, 0.0, 100.0) == []
+
+    def test_reports_each_rule(self):
+        """Non-finite, disordered and out-of-scale rows get their own message."""
+        # GIVEN
+        rows = [
+            _row(1, 1.0, 2.0, 3.0),
+            _row(2, float("nan"), 2.0, 3.0),
+            _row(3, 5.0, 2.0, 3.0),
+            _row(4, -1.0, 2.0, 3.0),
+        ]
+
+        # WHEN
+        errors = validate_rows(rows, 0.0, 100.0)
+
+        # THEN
+        assert [error.row for error in errors] == [2, 3, 4]
+        assert "finite" in errors[0].message
+        assert "lower <= peak <= upper" in errors[1].message
+        assert "[0.0, 100.0]" in errors[2].message
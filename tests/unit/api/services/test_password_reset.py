@@ -216,3 +216,39 @@ class TestResetPassword:
         # WHEN / THEN
         with pytest.raises(InvalidResetTokenError):
             service.reset_password(raw, "NewSecurePass123!")
+
+
+class TestPurgeExpired:
+    """Tests for the batched purge of expired tokens."""
+
+    def _add_token(self, session: Session, user: User, index: int, expires_in: timedelta):
+        """Persist one token expiring after ``expires_in``."""
+        session.add(
+            PasswordResetToken(
+                user_id=user.id,
+                token_hash=_hash(f"purge-{index}"),
+                expires_at=utc_now() + expires_in,
+            )
+        )
+
+    def test_deletes_expired_tokens_in_batches(self, session):
+        """
+        GIVEN three expired tokens and one still valid
+        WHEN expired tokens are purged in batches of two
+        THEN the batches delete two and one, and only the valid token remains
+        """
+        # GIVEN
+        user = _make_user(session)
+        for index in range(3):
+            self._add_token(session, user, index, timedelta(hours=-1))
+        self._add_token(session, user, 3, timedelta(hours=1))
+        session.commit()
+        service = PasswordResetService(session)
+
+        # WHEN
+        batches = [service.purge_expired(limit=2) for _ in range(3)]
+
+        # THEN
+        assert batches == [2, 1, 0]
+        remaining = session.exec(select(PasswordResetToken)).all()
+        assert [token.token_hash for token in remaining] == [_hash("purge-3")]
@@ -0,0 +1,202 @@
+"""Unit tests for per-project recalculation coalescing."""
+
+import threading
+from uuid import uuid4
+
+import pytest
+from prometheus_client import REGISTRY
+
+from api.services.recalculation import RecalculationCoordinator
+
+
+def _outcomes() -> dict[str, float]:
+    """Read the recalculation counter for every outcome."""
+    return {
+        outcome: REGISTRY.get_sample_value("become_recalculations_total", {"outcome": outcome})
+        or 0.0
+        for outcome in ("fresh", "superseded", "coalesced")
+    }
+
+
+def _delta(before: dict[str, float]) -> dict[str, float]:
+    """Difference of the recalculation counter since ``before``."""
+    return {outcome: value - before[outcome] for outcome, value in _outcomes().items()}
+
+
+class TestRecalculationCoordinator:
+    """Tests for RecalculationCoordinator."""
+
+    def test_lone_trigger_computes_without_waiting(self):
+        """A trigger outside a burst computes at once and is fresh."""
+        # GIVEN
+        sleeps: list[float] = []
+        coordinator = RecalculationCoordinator(debounce=0.05, sleep=sleeps.append)
+        calls: list[int] = []
+        before = _outcomes()
+
+        # WHEN
+        computed = coordinator.run(uuid4(), lambda: calls.append(1))
+
+        # THEN
+        assert computed is True
+        assert calls == [1]
+        assert sleeps == []
+        assert _delta(before)["fresh"] == 1
+        assert coordinator.tracked_projects() == 0
+
+    def test_burst_waits_for_the_debounce_window(self):
+        """A trigger shortly after one still in progress waits the window once."""
+        # GIVEN
+        now = [100.0]
+        sleeps: list[float] = []
+        coordinator = RecalculationCoordinator(
+            debounce=0.05, clock=lambda: now[0], sleep=sleeps.append
+        )
+        project_id = uuid4()
+        running = threading.Event()
+        release = threading.Event()
+
+        def slow() -> None:
+            running.set()
+            release.wait(timeout=5)
+
+        first = threading.Thread(target=coordinator.run, args=(project_id, slow))
+        first.start()
+        assert running.wait(timeout=5)
+
+        # WHEN
+        now[0] += 0.01
+        second = threading.Thread(target=coordinator.run, args=(project_id, lambda: None))
+        second.start()
+        while coordinator._flights[project_id].requested < 2:
+            pass
+        release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+        # THEN
+        assert sleeps == [0.05]
+
+    def test_concurrent_triggers_collapse_into_one_computation(self):
+        """Triggers queued behind a running computation share the next one."""
+        # GIVEN
+        coordinator = RecalculationCoordinator(debounce=0.0)
+        project_id = uuid4()
+        first_running = threading.Event()
+        release_first = threading.Event()
+        calls: list[int] = []
+
+        def compute() -> None:
+            calls.append(1)
+            if len(calls) == 1:
+                first_running.set()
+                release_first.wait(timeout=5)
+
+        before = _outcomes()
+        first = threading.Thread(target=coordinator.run, args=(project_id, compute))
+        first.start()
+        assert first_running.wait(timeout=5)
+        waiters = [
+            threading.Thread(target=coordinator.run, args=(project_id, compute)) for _ in range(10)
+        ]
+        for thread in waiters:
+            thread.start()
+        while coordinator._flights[project_id].requested < 11:
+            pass
+
+        # WHEN
+        release_first.set()
+        for thread in [first, *waiters]:
+            thread.join(timeout=5)
+
+        # THEN
+        assert len(calls) == 2
+        assert _delta(before) == {"fresh": 1, "superseded": 1, "coalesced": 9}
+        assert coordinator.tracked_projects() == 0
+
+    def test_projects_do_not_block_each_other(self):
+        """A running computation of one project does not delay another."""
+        # GIVEN
+        coordinator = RecalculationCoordinator(debounce=0.0)
+        running = threading.Event()
+        release = threading.Event()
+
+        def slow() -> None:
+            running.set()
+            release.wait(timeout=5)
+
+        blocked = threading.Thread(target=coordinator.run, args=(uuid4(), slow))
+        blocked.start()
+        assert running.wait(timeout=5)
+
+        # WHEN
+        computed = coordinator.run(uuid4(), lambda: None)
+
+        # THEN
+        assert computed is True
+        release.set()
+        blocked.join(timeout=5)
+
+    def test_failed_computation_leaves_trigger_uncovered(self):
+        """A computation that raises does not cover its trigger."""
+        # GIVEN
+        coordinator = RecalculationCoordinator(debounce=0.0)
+        project_id = uuid4()
+
+        def fail() -> None:
+            raise RuntimeError("database unavailable")
+
+        # WHEN
+        with pytest.raises(RuntimeError):
+            coordinator.run(project_id, fail)
+
+        # THEN
+        assert coordinator.tracked_projects() == 0
+        assert coordinator.run(project_id, lambda: None) is True
+
+    def test_idle_project_leaves_pending_write_to_the_computation(self):
+        """An uncommitted write on an idle project is committed by the computation."""
+        # GIVEN
+        coordinator = RecalculationCoordinator(debounce=0.0)
+        commits: list[str] = []
+
+        # WHEN
+        computed = coordinator.run(
+            uuid4(), lambda: commits.append("result"), commit_pending=lambda: commits.append("own")
+        )
+
+        # THEN
+        assert computed is True
+        assert commits == ["result"]
+
+    def test_busy_project_commits_pending_write_before_queueing(self):
+        """With a computation running, the write is committed alone and then coalesced."""
+        # GIVEN
+        coordinator = RecalculationCoordinator(debounce=0.0)
+        project_id = uuid4()
+        running = threading.Event()
+        release = threading.Event()
+        events: list[str] = []
+
+        def slow() -> None:
+            running.set()
+            release.wait(timeout=5)
+            events.append("first")
+
+        first = threading.Thread(target=coordinator.run, args=(project_id, slow))
+        first.start()
+        assert running.wait(timeout=5)
+
+        def commit_pending() -> None:
+            events.append("own")
+            release.set()
+
+        # WHEN
+        computed = coordinator.run(
+            project_id, lambda: events.append("second"), commit_pending=commit_pending
+        )
+        first.join(timeout=5)
+
+        # THEN
+        assert computed is True
+        assert events == ["own", "first", "second"]
@@ -0,0 +1,111 @@
+"""Unit tests for the live result hub."""
+
+import asyncio
+import threading
+from uuid import uuid4
+
+from prometheus_client import REGISTRY
+
+from api.services.result_events import ResultHub
+
+
+def _open_streams() -> float:
+    """Read the open result stream gauge."""
+    return REGISTRY.get_sample_value("become_result_streams") or 0.0
+
+
+class TestResultHub:
+    """Tests for ResultHub fan-out."""
+
+    def test_delivers_to_every_subscriber_of_project(self):
+        """Every connection following a project receives its update."""
+        # GIVEN
+        hub = ResultHub()
+        project_id = uuid4()
+
+        async def scenario() -> list[str]:
+            first = hub.subscribe(project_id)
+            second = hub.subscribe(project_id)
+            hub.publish(project_id, '{"v": 1}')
+            return [
+                await asyncio.wait_for(first.get(), timeout=1),
+                await asyncio.wait_for(second.get(), timeout=1),
+            ]
+
+        # WHEN
+        received = asyncio.run(scenario())
+
+        # THEN
+        assert received == ['{"v": 1}', '{"v": 1}']
+
+    def test_ignores_other_projects(self):
+        """An update reaches only subscribers of its own project."""
+        # GIVEN
+        hub = ResultHub()
+
+        async def scenario() -> bool:
+            subscription = hub.subscribe(uuid4())
+            hub.publish(uuid4(), "null")
+            await asyncio.sleep(0)
+            return subscription.queue.empty()
+
+        # WHEN / THEN
+        assert asyncio.run(scenario())
+
+    def test_publish_from_worker_thread(self):
+        """Publishing from a threadpool thread wakes the event loop."""
+        # GIVEN
+        hub = ResultHub()
+        project_id = uuid4()
+
+        async def scenario() -> str:
+            subscription = hub.subscribe(project_id)
+            thread = threading.Thread(target=hub.publish, args=(project_id, "null"))
+            thread.start()
+            payload = await asyncio.wait_for(subscription.get(), timeout=1)
+            thread.join()
+            return payload
+
+        # WHEN / THEN
+        assert asyncio.run(scenario()) == "null"
+
+    def test_slow_subscriber_keeps_latest_updates(self):
+        """A full queue drops the oldest update instead of blocking."""
+        # GIVEN
+        hub = ResultHub()
+        project_id = uuid4()
+
+        async def scenario() -> list[str]:
+            subscription = hub.subscribe(project_id)
+            for version in range(10):
+                hub.publish(project_id, str(version))
+            await asyncio.sleep(0)
+            return [subscription.queue.get_nowait() for _ in range(subscription.queue.qsize())]
+
+        # WHEN
+        received = asyncio.run(scenario())
+
+        # THEN
+        assert received == ["6", "7", "8", "9"]
+
+    def test_close_is_idempotent_and_tracks_gauge(self):
+        """Closing twice unregisters once and restores the stream gauge."""
+        # GIVEN
+        hub = ResultHub()
+        project_id = uuid4()
+        before = _open_streams()
+
+        async def scenario() -> tuple[int, float]:
+            subscription = hub.subscribe(project_id)
+            opened = (hub.subscriber_count(project_id), _open_streams())
+            subscription.close()
+            subscription.close()
+            return opened
+
+        # WHEN
+        count, gauge = asyncio.run(scenario())
+
+        # THEN
+        assert (count, gauge) == (1, before + 1)
+        assert hub.subscriber_count(project_id) == 0
+        assert _open_streams() == before
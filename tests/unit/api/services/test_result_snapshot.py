@@ -0,0 +1,195 @@
+"""Unit tests for ResultSnapshotService and SnapshotCache."""
+
+import gzip
+import json
+
+import pytest
+from sqlalchemy import delete
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine
+
+from api.db.models import CalculationResult, ExpertOpinion, Project, ResultSnapshot, User
+from api.exceptions import ResultNotAvailableError, SnapshotNotFoundError
+from api.services.result_snapshot_service import ResultSnapshotService, SnapshotCache
+from tests.shared.helpers import record_statements
+
+
+@pytest.fixture
+def session():
+    """In-memory SQLite session with all tables created."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as db_session:
+        yield db_session
+    engine.dispose()
+
+
+def _project(session: Session, with_result: bool = True) -> tuple[Project, User]:
+    """Persist a project with one opinion and, optionally, its result."""
+    admin = User(email="admin@example.com", hashed_password="hash", first_name="A", last_name="B")
+    session.add(admin)
+    session.flush()
+    project = Project(name="Budget", admin_id=admin.id, scale_unit="%")
+    session.add(project)
+    session.flush()
+    session.add(
+        ExpertOpinion(
+            project_id=project.id,
+            user_id=admin.id,
+            position="Analyst",
+            lower_bound=10.0,
+            peak=20.0,
+            upper_bound=30.0,
+        )
+    )
+    if with_result:
+        session.add(
+            CalculationResult(
+                project_id=project.id,
+                best_compromise_lower=10.0,
+                best_compromise_peak=20.0,
+                best_compromise_upper=30.0,
+                arithmetic_mean_lower=10.0,
+                arithmetic_mean_peak=20.0,
+                arithmetic_mean_upper=30.0,
+                median_lower=10.0,
+                median_peak=20.0,
+                median_upper=30.0,
+                max_error=0.0,
+                num_experts=1,
+            )
+        )
+    session.commit()
+    return project, admin
+
+
+class TestSnapshotCache:
+    """Tests for the size-bounded LRU of snapshot blobs."""
+
+    def test_evicts_least_recently_used_over_the_bound(self):
+        """
+        GIVEN a cache bounded to two 4-byte blobs
+        WHEN a third blob is added after the first was read
+        THEN the second (least recently used) blob is evicted
+        """
+        # GIVEN
+        cache = SnapshotCache(max_bytes=8)
+        cache.put("a", b"aaaa")
+        cache.put("b", b"bbbb")
+        cache.get("a")
+
+        # WHEN
+        cache.put("c", b"cccc")
+
+        # THEN
+        assert cache.get("a") == b"aaaa"
+        assert cache.get("b") is None
+        assert cache.get("c") == b"cccc"
+
+    def test_does_not_cache_blob_over_the_bound(self):
+        """A blob larger than the whole cache is not kept."""
+        # GIVEN
+        cache = SnapshotCache(max_bytes=4)
+
+        # WHEN
+        cache.put("big", b"too large")
+
+        # THEN
+        assert cache.get("big") is None
+
+
+class TestResultSnapshotService:
+    """Tests for publishing and reading snapshots."""
+
+    def test_publish_stores_compressed_document(self, session):
+        """
+        GIVEN a project with a result
+        WHEN it is published twice
+        THEN each snapshot gets the next version and a gzip JSON document of its own
+        """
+        # GIVEN
+        project, admin = _project(session)
+        service = ResultSnapshotService(session, cache=SnapshotCache())
+
+        # WHEN
+        first = service.publish(project, admin.id)
+        second = service.publish(project, admin.id)
+
+        # THEN
+        assert (first.version, second.version) == (1, 2)
+        document = json.loads(gzip.decompress(first.content))
+        assert document["id"] == first.id
+        assert document["project"]["scale_unit"] == "%"
+        assert document["result"]["num_experts"] == 1
+        assert document["opinions"][0]["position"] == "Analyst"
+        assert "user_email" not in document["opinions"][0]
+
+    def test_publish_without_result_raises(self, session):
+        """Publishing a project that has no result raises ResultNotAvailableError."""
+        # GIVEN
+        project, admin = _project(session, with_result=False)
+        service = ResultSnapshotService(session, cache=SnapshotCache())
+
+        # WHEN / THEN
+        with pytest.raises(ResultNotAvailableError):
+            service.publish(project, admin.id)
+
+    def test_get_content_reads_blob_once(self, session):
+        """
+        GIVEN a published snapshot not yet in this worker's cache
+        WHEN its content is read twice
+        THEN only the first read loads the blob; the second only checks the row exists
+        """
+        # GIVEN
+        project, admin = _project(session)
+        snapshot = ResultSnapshotService(session, cache=SnapshotCache()).publish(project, admin.id)
+        snapshot_id, content = snapshot.id, snapshot.content
+        service = ResultSnapshotService(session, cache=SnapshotCache())
+
+        # WHEN
+        with record_statements(session.get_bind()) as first_read:
+            first = service.get_content(snapshot_id)
+        with record_statements(session.get_bind()) as second_read:
+            second = service.get_content(snapshot_id)
+
+        # THEN
+        assert first == second == content
+        assert len(first_read.statements) == 1
+        assert len(second_read.statements) == 1
+        assert "content" not in second_read.statements[0]
+
+    def test_get_content_of_unknown_snapshot_raises(self, session):
+        """Reading an id that was never published raises SnapshotNotFoundError."""
+        # GIVEN
+        service = ResultSnapshotService(session, cache=SnapshotCache())
+
+        # WHEN / THEN
+        with pytest.raises(SnapshotNotFoundError):
+            service.get_content("missing")
+
+    def test_cached_snapshot_of_deleted_project_is_gone(self, session):
+        """
+        GIVEN a snapshot cached by this worker
+        WHEN its project is deleted (possibly through another worker)
+        THEN reading it raises SnapshotNotFoundError and the blob leaves the cache
+        """
+        # GIVEN
+        project, admin = _project(session)
+        cache = SnapshotCache()
+        service = ResultSnapshotService(session, cache=cache)
+        snapshot_id = service.publish(project, admin.id).id
+        assert cache.get(snapshot_id) is not None
+
+        # WHEN (the test engine does not enforce ON DELETE CASCADE, so mimic it)
+        session.exec(delete(ResultSnapshot).where(ResultSnapshot.project_id == project.id))
+        session.delete(project)
+        session.commit()
+
+        # THEN
+        with pytest.raises(SnapshotNotFoundError):
+            service.get_content(snapshot_id)
+        assert cache.get(snapshot_id) is None
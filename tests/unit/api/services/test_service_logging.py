@@ -1,5 +1,6 @@
 """Tests that service-layer business operations emit logs."""
 
+import logging
 from unittest.mock import MagicMock, patch
 from uuid import uuid4
 
@@ -7,6 +8,7 @@ from api.db.models import MemberRole, Project, ProjectMember
 from api.schemas.project import ProjectCreate, ProjectUpdate
 from api.services.calculation_service import CalculationService
 from api.services.invitation_service import InvitationService
+from api.services.opinion_import import ParsedImport
 from api.services.opinion_service import OpinionService
 from api.services.project_service import ProjectService
 from api.services.user_service import UserService
@@ -127,6 +129,22 @@ class TestOpinionServiceLogging:
         # THEN
         assert mock_logger.info.call_args[1]["extra"]["event"] == "opinion_upserted"
 
+    def test_import_opinions_logs_counts(self, caplog):
+        """import_opinions logs an opinions_imported event with both counts."""
+        # GIVEN - a real record, so extra keys clashing with LogRecord fail loudly
+        session = MagicMock()
+        session.exec.return_value.all.return_value = []
+        service = OpinionService(session)
+        project = Project(id=uuid4(), name="P", admin_id=uuid4(), scale_min=0, scale_max=10)
+
+        # WHEN
+        with caplog.at_level(logging.INFO, logger="api.service.opinion"):
+            service.import_opinions(project, ParsedImport(rows=[], errors=[]))
+
+        # THEN
+        record = next(r for r in caplog.records if r.event == "opinions_imported")
+        assert (record.created_count, record.updated_count) == (0, 0)
+
     def test_delete_opinion_logs_event(self):
         """delete_opinion logs an opinion_deleted event."""
         # GIVEN
@@ -250,7 +268,10 @@ class TestCalculationServiceLogging:
         service = CalculationService(session)
 
         # WHEN
-        with patch("api.services.calculation_service.logger") as mock_logger:
+        with (
+            patch("api.services.calculation_service.CalculationResultResponse"),
+            patch("api.services.calculation_service.logger") as mock_logger,
+        ):
             service.recalculate(uuid4())
 
         # THEN
@@ -4,6 +4,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from botocore.exceptions import ClientError
+from prometheus_client import REGISTRY
 
 from api.services.storage.exceptions import (
     StorageConfigurationError,
@@ -138,6 +139,31 @@ class TestUpload:
         assert extra["size_bytes"] == len(b"image data")
         assert "duration_ms" in extra
 
+    def test_records_duration_metric_by_outcome(self):
+        """Successful and failed uploads are timed under their own outcome label."""
+        # GIVEN
+        client = MagicMock()
+        service = RailwayBucketStorageService(_settings(), client=client)
+        name = "become_storage_operation_duration_seconds_count"
+        ok_before = REGISTRY.get_sample_value(name, {"operation": "upload", "outcome": "ok"}) or 0
+        err_before = (
+            REGISTRY.get_sample_value(name, {"operation": "upload", "outcome": "error"}) or 0
+        )
+
+        # WHEN
+        service.upload(b"image data", "image/jpeg", "user-123")
+        client.put_object.side_effect = Exception("boom")
+        with pytest.raises(StorageUploadError):
+            service.upload(b"image data", "image/jpeg", "user-123")
+
+        # THEN
+        assert REGISTRY.get_sample_value(name, {"operation": "upload", "outcome": "ok"}) == (
+            ok_before + 1
+        )
+        assert REGISTRY.get_sample_value(name, {"operation": "upload", "outcome": "error"}) == (
+            err_before + 1
+        )
+
     def test_logs_failure_with_exc_info(self):
         """A failed upload logs an error carrying exc_info before raising."""
         # GIVEN
@@ -226,6 +252,27 @@ class TestOpen:
         assert mock_logger.info.call_args[1]["extra"]["event"] == "s3_open_miss"
         mock_logger.error.assert_not_called()
 
+    def test_records_miss_independently_of_logging(self):
+        """
+        GIVEN a bucket without the requested object
+        WHEN it is opened with the logger replaced by a mock
+        THEN the call is still timed once under the ``miss`` outcome
+        """
+        # GIVEN
+        client = MagicMock()
+        client.get_object.side_effect = _client_error("NoSuchKey")
+        service = RailwayBucketStorageService(_settings(), client=client)
+        name = "become_storage_operation_duration_seconds_count"
+        labels = {"operation": "open", "outcome": "miss"}
+        before = REGISTRY.get_sample_value(name, labels) or 0
+
+        # WHEN
+        with patch("api.services.storage.railway_bucket_storage_service.logger"):
+            service.open("profiles/user/missing.jpg")
+
+        # THEN
+        assert REGISTRY.get_sample_value(name, labels) == before + 1
+
     def test_logs_failure_with_exc_info(self):
         """A non-absence failure logs an error carrying exc_info."""
         # GIVEN
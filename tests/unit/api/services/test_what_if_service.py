@@ -0,0 +1,214 @@
+"""Unit tests for WhatIfService and WhatIfIndexCache."""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+from api.db.models import CalculationResult, ExpertOpinion, Project, User
+from api.services.result_events import ResultHub
+from api.services.what_if_service import WhatIfIndexCache, WhatIfService
+from src.calculators.what_if import WhatIfIndex
+from src.models.expert_opinion import ExpertOpinion as DomainExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+from tests.shared.helpers import record_statements
+
+
+@pytest.fixture
+def session():
+    """In-memory SQLite session with all tables created."""
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as db_session:
+        yield db_session
+    engine.dispose()
+
+
+def _project(session: Session) -> tuple[Project, User]:
+    """Persist a project with its admin's opinion."""
+    admin = User(email="admin@example.com", hashed_password="hash", first_name="A", last_name="B")
+    session.add(admin)
+    session.flush()
+    project = Project(name="Budget", admin_id=admin.id, scale_unit="%")
+    session.add(project)
+    session.flush()
+    session.add(
+        ExpertOpinion(
+            project_id=project.id,
+            user_id=admin.id,
+            position="Analyst",
+            lower_bound=10.0,
+            peak=20.0,
+            upper_bound=30.0,
+        )
+    )
+    session.commit()
+    return project, admin
+
+
+def _store_result(session: Session, project_id, calculated_at: datetime) -> None:
+    """Store (or restamp) the project's result as another worker would."""
+    result = session.exec(
+        select(CalculationResult).where(CalculationResult.project_id == project_id)
+    ).first()
+    if result is None:
+        result = CalculationResult(
+            project_id=project_id,
+            best_compromise_lower=10.0,
+            best_compromise_peak=20.0,
+            best_compromise_upper=30.0,
+            arithmetic_mean_lower=10.0,
+            arithmetic_mean_peak=20.0,
+            arithmetic_mean_upper=30.0,
+            median_lower=10.0,
+            median_peak=20.0,
+            median_upper=30.0,
+            max_error=0.0,
+            num_experts=1,
+        )
+    result.calculated_at = calculated_at
+    session.add(result)
+    session.commit()
+
+
+_V1 = datetime(2026, 1, 1, tzinfo=UTC)
+_V2 = datetime(2026, 1, 2, tzinfo=UTC)
+
+
+def _index(size: int) -> WhatIfIndex:
+    """Index of ``size`` identical opinions."""
+    opinion = FuzzyTriangleNumber(1.0, 2.0, 3.0)
+    return WhatIfIndex([DomainExpertOpinion(f"E{i}", opinion) for i in range(size)])
+
+
+class TestWhatIfIndexCache:
+    """Tests for the opinion-bounded LRU of what-if indexes."""
+
+    def test_evicts_least_recently_used_over_the_bound(self):
+        """
+        GIVEN a cache bounded to four opinions holding two 2-opinion indexes
+        WHEN a third index is added after the first was read
+        THEN the second (least recently used) index is evicted
+        """
+        # GIVEN
+        cache = WhatIfIndexCache(max_opinions=4)
+        first, second, third = uuid4(), uuid4(), uuid4()
+        cache.put(first, _index(2), _V1)
+        cache.put(second, _index(2), _V1)
+        cache.get(first, _V1)
+
+        # WHEN
+        cache.put(third, _index(2), _V1)
+
+        # THEN
+        assert cache.get(first, _V1) is not None
+        assert cache.get(second, _V1) is None
+        assert cache.get(third, _V1) is not None
+
+    def test_invalidate_drops_index(self):
+        """An invalidated project's index is no longer served."""
+        # GIVEN
+        cache = WhatIfIndexCache()
+        project_id = uuid4()
+        cache.put(project_id, _index(1), _V1)
+
+        # WHEN
+        cache.invalidate(project_id)
+
+        # THEN
+        assert cache.get(project_id, _V1) is None
+
+    def test_index_of_another_version_is_not_served(self):
+        """
+        GIVEN an index cached for one result version
+        WHEN it is looked up for a newer version
+        THEN it is dropped rather than served
+        """
+        # GIVEN
+        cache = WhatIfIndexCache()
+        project_id = uuid4()
+        cache.put(project_id, _index(1), _V1)
+
+        # WHEN
+        stale = cache.get(project_id, _V2)
+
+        # THEN
+        assert stale is None
+        assert cache.get(project_id, _V1) is None
+
+    def test_hub_updates_invalidate(self):
+        """A result published through the hub drops the project's index."""
+        # GIVEN
+        cache = WhatIfIndexCache()
+        hub = ResultHub()
+        hub.listen(lambda project_id, _payload: cache.invalidate(project_id))
+        project_id = uuid4()
+        cache.put(project_id, _index(1), _V1)
+
+        # WHEN
+        hub.publish(project_id, "null")
+
+        # THEN
+        assert cache.get(project_id, _V1) is None
+
+
+class TestWhatIfService:
+    """Tests for building and serving what-if indexes."""
+
+    def test_get_index_loads_opinions_once(self, session):
+        """
+        GIVEN a project whose index is not cached
+        WHEN its index is requested twice
+        THEN only the first request loads the opinions; the second checks the version
+        """
+        # GIVEN
+        project, admin = _project(session)
+        project_id, admin_id = project.id, admin.id
+        _store_result(session, project_id, _V1)
+        service = WhatIfService(session, cache=WhatIfIndexCache())
+
+        # WHEN
+        with record_statements(session.get_bind()) as first_read:
+            first = service.get_index(project_id)
+        with record_statements(session.get_bind()) as second_read:
+            second = service.get_index(project_id)
+
+        # THEN
+        assert first is second
+        assert len(first_read.statements) == 2
+        assert len(second_read.statements) == 1
+        assert first.current is not None
+        assert first.current.best_compromise == FuzzyTriangleNumber(10.0, 20.0, 30.0)
+        preview = first.replace(str(admin_id), FuzzyTriangleNumber(40.0, 50.0, 60.0))
+        assert preview.num_experts == 1
+
+    def test_result_stored_by_another_worker_rebuilds_index(self, session):
+        """
+        GIVEN a cached index and no hub notification reaching this worker
+        WHEN another worker changes an opinion and stores a new result
+        THEN the next request rebuilds the index from the new opinions
+        """
+        # GIVEN
+        project, _ = _project(session)
+        project_id = project.id
+        _store_result(session, project_id, _V1)
+        service = WhatIfService(session, cache=WhatIfIndexCache())
+        stale = service.get_index(project_id)
+
+        # WHEN
+        opinion = session.exec(select(ExpertOpinion)).one()
+        opinion.lower_bound, opinion.peak, opinion.upper_bound = 50.0, 60.0, 70.0
+        session.add(opinion)
+        _store_result(session, project_id, _V2)
+        index = service.get_index(project_id)
+
+        # THEN
+        assert index is not stale
+        assert index.current is not None
+        assert index.current.best_compromise == FuzzyTriangleNumber(50.0, 60.0, 70.0)
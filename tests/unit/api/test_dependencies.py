@@ -10,10 +10,12 @@ from api.config import Settings
 from api.dependencies import (
     AccessLevel,
     RequireProjectAccess,
+    get_calculation_service,
     get_email_service,
     get_password_reset_service,
     get_storage_service,
 )
+from api.services.database_aggregation import DatabaseAggregator
 from api.services.email.console_email_sender import ConsoleEmailSender
 from api.services.email.resend_email_sender import ResendEmailSender
 from api.services.password_reset_service import PasswordResetService
@@ -167,6 +169,31 @@ class TestGetPasswordResetService:
         assert result.session is mock_session
 
 
+class TestGetCalculationService:
+    """Tests for the get_calculation_service factory function."""
+
+    @pytest.mark.parametrize(
+        ("backend", "aggregator_type"),
+        [("python", type(None)), ("database", DatabaseAggregator)],
+    )
+    def test_selects_aggregation_backend(self, backend, aggregator_type):
+        """
+        GIVEN a configured calculation backend
+        WHEN get_calculation_service is called
+        THEN the service aggregates in the database only for "database"
+        """
+        # GIVEN
+        mock_settings = MagicMock(spec=Settings)
+        mock_settings.calculation_backend = backend
+
+        # WHEN
+        with patch("api.dependencies.get_settings", return_value=mock_settings):
+            result = get_calculation_service(MagicMock())
+
+        # THEN
+        assert isinstance(result._aggregator, aggregator_type)
+
+
 class TestRequireProjectAccess:
     """Tests for the parameterized project access dependency."""
 
@@ -0,0 +1,185 @@
+"""Tests for Prometheus metric helpers."""
+
+import pytest
+from prometheus_client import REGISTRY, Histogram
+from sqlalchemy import Engine, event, text
+from sqlmodel import create_engine
+
+from api.metrics import (
+    _count_query,
+    install_query_counter,
+    mark_worker_stopped,
+    multiprocess_enabled,
+    observe_seconds,
+    render_latest,
+    start_query_count,
+    stop_query_count,
+)
+
+_TEST_HISTOGRAM = Histogram("become_test_block_seconds", "Test-only histogram", ["block"])
+
+
+def _count(block: str) -> float:
+    """Return how many observations the test histogram holds for ``block``."""
+    value = REGISTRY.get_sample_value("become_test_block_seconds_count", {"block": block})
+    return value or 0.0
+
+
+class TestObserveSeconds:
+    """Tests for the timing context manager."""
+
+    def test_records_one_observation(self):
+        """
+        GIVEN a timed block
+        WHEN it completes
+        THEN exactly one observation is recorded under its labels
+        """
+        # GIVEN
+        before = _count("ok")
+
+        # WHEN
+        with observe_seconds(_TEST_HISTOGRAM, block="ok"):
+            pass
+
+        # THEN
+        assert _count("ok") == before + 1
+
+    def test_records_when_block_raises(self):
+        """
+        GIVEN a timed block that raises
+        WHEN the exception propagates
+        THEN the duration is still recorded
+        """
+        # GIVEN
+        before = _count("raises")
+
+        # WHEN
+        with pytest.raises(RuntimeError), observe_seconds(_TEST_HISTOGRAM, block="raises"):
+            raise RuntimeError("boom")
+
+        # THEN
+        assert _count("raises") == before + 1
+
+
+class TestQueryCounter:
+    """Tests for per-context database statement counting."""
+
+    @pytest.fixture
+    def engine(self):
+        """In-memory engine with the query counter installed."""
+        install_query_counter()
+        engine = create_engine("sqlite:///:memory:")
+        yield engine
+        engine.dispose()
+
+    def test_counts_statements_while_bound(self, engine):
+        """
+        GIVEN a bound query counter
+        WHEN two statements run
+        THEN the counter reports two
+        """
+        # GIVEN
+        counter, token = start_query_count()
+
+        # WHEN
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        stop_query_count(token)
+
+        # THEN
+        assert counter.count == 2
+
+    def test_ignores_statements_when_unbound(self, engine):
+        """
+        GIVEN no bound query counter
+        WHEN a statement runs
+        THEN nothing is counted and nothing fails
+        """
+        # GIVEN
+        counter, token = start_query_count()
+        stop_query_count(token)
+
+        # WHEN
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        # THEN
+        assert counter.count == 0
+
+    def test_install_is_idempotent(self):
+        """
+        GIVEN the listener is already installed
+        WHEN it is installed again
+        THEN it stays registered once
+        """
+        # WHEN
+        install_query_counter()
+        install_query_counter()
+
+        # THEN
+        assert event.contains(Engine, "before_cursor_execute", _count_query)
+
+
+class TestRendering:
+    """Tests for the Prometheus exposition output."""
+
+    def test_renders_text_format_in_single_process(self, monkeypatch):
+        """
+        GIVEN no multiprocess directory
+        WHEN metrics are rendered
+        THEN the default registry is exposed in the text format
+        """
+        # GIVEN
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+        # WHEN
+        payload, content_type = render_latest()
+
+        # THEN
+        assert content_type.startswith("text/plain")
+        assert b"become_http_request_duration_seconds" in payload
+        assert not multiprocess_enabled()
+
+    def test_aggregates_from_multiprocess_directory(self, monkeypatch, tmp_path):
+        """
+        GIVEN a multiprocess directory
+        WHEN metrics are rendered
+        THEN samples are aggregated from the directory rather than the local registry
+        """
+        # GIVEN
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        # WHEN
+        payload, _ = render_latest()
+
+        # THEN
+        assert multiprocess_enabled()
+        assert b"become_test_block_seconds" not in payload
+
+    def test_mark_worker_stopped_is_noop_without_directory(self, monkeypatch):
+        """
+        GIVEN no multiprocess directory
+        WHEN a worker stops
+        THEN nothing is raised
+        """
+        # GIVEN
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+        # WHEN / THEN
+        mark_worker_stopped()
+
+    def test_mark_worker_stopped_with_directory(self, monkeypatch, tmp_path):
+        """
+        GIVEN a multiprocess directory
+        WHEN a worker stops
+        THEN its live gauge files are cleaned up without error
+        """
+        # GIVEN
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        # WHEN
+        mark_worker_stopped()
+
+        # THEN
+        assert list(tmp_path.glob("gauge_live*")) == []
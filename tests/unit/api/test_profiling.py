@@ -0,0 +1,254 @@
+"""Tests for the per-request profiling helpers."""
+
+import json
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlmodel import create_engine
+
+from api.config import Environment, Settings
+from api.profiling import (
+    ProfileStore,
+    RequestProfiler,
+    StackSampler,
+    install_db_timer,
+    profiling_allowed,
+    requested_modes,
+)
+
+
+def _settings(environment: Environment, secret: str | None = None) -> Settings:
+    """Copy the test settings with another profile and profiling secret."""
+    return Settings(secret_key="test-secret-key").model_copy(
+        update={"environment": environment, "profiling_secret": secret}
+    )
+
+
+def _busy_loop(stop: threading.Event) -> None:
+    """Spin until told to stop, so the sampler sees a busy thread."""
+    while not stop.is_set():
+        sum(range(100))
+
+
+class TestRequestedModes:
+    """Tests for parsing the X-Profile header."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            (None, set()),
+            ("", set()),
+            ("cpu", {"cpu"}),
+            ("CPU, alloc", {"cpu", "alloc"}),
+            ("cpu,bogus", {"cpu"}),
+        ],
+    )
+    def test_keeps_known_modes_only(self, header: str | None, expected: set[str]):
+        """
+        GIVEN an X-Profile header value
+        WHEN it is parsed
+        THEN only known modes remain, case-insensitively
+        """
+        assert requested_modes(header) == expected
+
+
+class TestProfilingAllowed:
+    """Tests for the profiling gate."""
+
+    def test_open_outside_production(self):
+        """
+        GIVEN a non-production profile and no secret
+        WHEN the gate is checked
+        THEN profiling is allowed
+        """
+        assert profiling_allowed(_settings(Environment.DEV), None)
+
+    def test_production_requires_matching_secret(self):
+        """
+        GIVEN a production profile with a profiling secret
+        WHEN the gate is checked with no, a wrong and the right secret
+        THEN only the right secret is allowed
+        """
+        settings = _settings(Environment.PROD, "s3cret")  # pragma: allowlist secret
+
+        assert not profiling_allowed(settings, None)
+        assert not profiling_allowed(settings, "wrong")
+        assert profiling_allowed(settings, "s3cret")  # pragma: allowlist secret
+
+    def test_production_without_secret_is_closed(self):
+        """
+        GIVEN a production profile without a profiling secret
+        WHEN the gate is checked with an empty secret
+        THEN profiling is refused
+        """
+        assert not profiling_allowed(_settings(Environment.PROD), "")
+
+
+class TestStackSampler:
+    """Tests for the sampling CPU profiler."""
+
+    def test_builds_call_tree_from_busy_thread(self):
+        """
+        GIVEN a thread spinning in a known function
+        WHEN it is sampled several times
+        THEN the function appears in both the top list and the call tree
+        """
+        # GIVEN
+        stop = threading.Event()
+        worker = threading.Thread(target=_busy_loop, args=(stop,))
+        worker.start()
+        sampler = StackSampler()
+
+        # WHEN
+        try:
+            for _ in range(20):
+                sampler.sample_once()
+        finally:
+            stop.set()
+            worker.join()
+        report = sampler.report()
+
+        # THEN
+        assert report["ticks"] == 20
+        assert report["call_tree"]["samples"] == report["samples"] > 0
+
+        def names(node: dict) -> set[str]:
+            found = {node["name"]}
+            for child in node["children"]:
+                found |= names(child)
+            return found
+
+        assert any(name.startswith("_busy_loop ") for name in names(report["call_tree"]))
+
+    def test_skips_idle_threads(self):
+        """
+        GIVEN a thread blocked waiting on an event
+        WHEN it is sampled
+        THEN no sample is attributed to it
+        """
+        # GIVEN
+        stop = threading.Event()
+        waiter = threading.Thread(target=stop.wait)
+        waiter.start()
+        sampler = StackSampler()
+
+        # WHEN
+        try:
+            time.sleep(0.01)
+            sampler.sample_once()
+        finally:
+            stop.set()
+            waiter.join()
+
+        # THEN
+        assert not any("Event.wait" in "".join(stack) for stack in sampler.stacks)
+        assert all(not stack[-1].startswith("wait ") for stack in sampler.stacks)
+
+
+class TestRequestProfiler:
+    """Tests for the per-request profile document."""
+
+    def test_splits_db_time_from_python_time(self):
+        """
+        GIVEN a profiled block that runs two statements
+        WHEN the profile is assembled
+        THEN it counts both statements and wall time covers DB plus Python time
+        """
+        # GIVEN
+        install_db_timer()
+        engine = create_engine("sqlite:///:memory:")
+        profiler = RequestProfiler(frozenset({"cpu", "alloc"}))
+
+        # WHEN
+        profiler.start()
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            conn.execute(text("SELECT 2"))
+        payload = [bytearray(1024) for _ in range(200)]
+        profiler.stop()
+        profile = profiler.report(request_id="req-1")
+
+        # THEN
+        assert payload
+        assert profile["request_id"] == "req-1"
+        assert profile["db_queries"] == 2
+        assert profile["wall_ms"] == pytest.approx(
+            profile["db_ms"] + profile["python_ms"], abs=1e-2
+        )
+        assert profile["alloc"]["peak_kb"] > 0
+        assert profile["alloc"]["top"]
+        assert "call_tree" in profile["cpu"]
+
+    def test_statements_outside_profile_are_not_counted(self):
+        """
+        GIVEN a statement run before profiling starts
+        WHEN a profile without statements is assembled
+        THEN its query count is zero
+        """
+        # GIVEN
+        install_db_timer()
+        engine = create_engine("sqlite:///:memory:")
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        profiler = RequestProfiler(frozenset({"cpu"}))
+
+        # WHEN
+        profiler.start()
+        profiler.stop()
+
+        # THEN
+        assert profiler.report()["db_queries"] == 0
+
+
+class TestProfileStore:
+    """Tests for the on-disk ring buffer."""
+
+    def test_keeps_newest_profiles_only(self, tmp_path: Path):
+        """
+        GIVEN a store holding three profiles
+        WHEN a fourth and fifth are saved
+        THEN only the newest three remain and the oldest are gone
+        """
+        # GIVEN
+        store = ProfileStore(tmp_path, capacity=3)
+
+        # WHEN
+        for n in range(5):
+            store.save(f"req-{n}", {"request_id": f"req-{n}", "started_ns": n})
+
+        # THEN
+        assert [entry["request_id"] for entry in store.list()] == ["req-4", "req-3", "req-2"]
+        assert store.get("req-0") is None
+        assert store.get("req-4") == {"request_id": "req-4", "started_ns": 4}
+        assert len(list(tmp_path.iterdir())) == 3
+
+    def test_sanitises_request_id_in_file_name(self, tmp_path: Path):
+        """
+        GIVEN a client-supplied correlation ID containing path separators
+        WHEN its profile is saved
+        THEN the file stays inside the store directory
+        """
+        # GIVEN
+        store = ProfileStore(tmp_path, capacity=5)
+
+        # WHEN
+        path = store.save("../../etc/passwd", {"started_ns": 1})
+
+        # THEN
+        assert path.parent == tmp_path
+        assert json.loads(path.read_text(encoding="utf-8")) == {"started_ns": 1}
+
+    def test_get_accepts_the_raw_request_id(self, tmp_path: Path):
+        """A profile saved under an unsafe ID is found by that same raw ID."""
+        # GIVEN
+        store = ProfileStore(tmp_path, capacity=5)
+        store.save("span:1/" + "a" * 80, {"started_ns": 1})
+
+        # WHEN
+        profile = store.get("span:1/" + "a" * 80)
+
+        # THEN
+        assert profile == {"started_ns": 1}
@@ -0,0 +1,99 @@
+"""Tests for the conditional GET helpers."""
+
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException, Response
+from starlette.requests import Request
+
+from api.utils.conditional import check_not_modified, etag_matches, weak_etag
+
+
+def _request(headers: dict[str, str] | None = None) -> Request:
+    """Build a bare GET request carrying ``headers``."""
+    raw = [(name.lower().encode(), value.encode()) for name, value in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+class TestWeakEtag:
+    """Tests for weak_etag."""
+
+    def test_is_weak_and_deterministic(self):
+        """The same parts always give the same weak tag."""
+        # GIVEN / WHEN
+        first = weak_etag("result", 1, None)
+        second = weak_etag("result", 1, None)
+
+        # THEN
+        assert first == second
+        assert first.startswith('W/"')
+        assert first.endswith('"')
+
+    def test_changes_with_any_part(self):
+        """A different part gives a different tag."""
+        # GIVEN / WHEN / THEN
+        assert weak_etag("opinions", 2) != weak_etag("opinions", 3)
+        assert weak_etag("opinions", 2) != weak_etag("members", 2)
+
+
+class TestEtagMatches:
+    """Tests for etag_matches (weak comparison)."""
+
+    @pytest.mark.parametrize(
+        "header",
+        ['W/"abc"', '"abc"', '"xyz", W/"abc"', "*"],
+    )
+    def test_matches(self, header):
+        """Matches the tag with or without W/, within a list, and the wildcard."""
+        # GIVEN / WHEN / THEN
+        assert etag_matches(header, 'W/"abc"')
+
+    @pytest.mark.parametrize("header", [None, "", 'W/"abd"', '"ab"'])
+    def test_does_not_match(self, header):
+        """Missing or different tags do not match."""
+        # GIVEN / WHEN / THEN
+        assert not etag_matches(header, 'W/"abc"')
+
+
+class TestCheckNotModified:
+    """Tests for check_not_modified."""
+
+    def test_sets_validators_when_modified(self):
+        """A request without a matching tag gets the validators on its response."""
+        # GIVEN
+        response = Response()
+
+        # WHEN
+        check_not_modified(_request(), response, 'W/"abc"', datetime(2026, 1, 2, 3, 4, 5))
+
+        # THEN
+        assert response.headers["ETag"] == 'W/"abc"'
+        assert response.headers["Last-Modified"] == "Fri, 02 Jan 2026 03:04:05 GMT"
+        assert response.headers["Cache-Control"] == "private, no-cache"
+        assert response.headers["Vary"] == "Authorization"
+
+    def test_raises_304_when_tag_matches(self):
+        """A matching If-None-Match ends the request with 304 and the validators."""
+        # GIVEN
+        request = _request({"If-None-Match": 'W/"abc"'})
+
+        # WHEN
+        with pytest.raises(HTTPException) as exc_info:
+            check_not_modified(request, Response(), 'W/"abc"')
+
+        # THEN
+        assert exc_info.value.status_code == 304
+        assert exc_info.value.headers["ETag"] == 'W/"abc"'
+        assert "Last-Modified" not in exc_info.value.headers
+
+    def test_ignores_if_modified_since(self):
+        """If-Modified-Since alone never yields 304."""
+        # GIVEN
+        request = _request({"If-Modified-Since": "Fri, 02 Jan 2099 00:00:00 GMT"})
+        response = Response()
+
+        # WHEN
+        check_not_modified(request, response, 'W/"abc"', datetime(2026, 1, 2))
+
+        # THEN
+        assert response.headers["ETag"] == 'W/"abc"'
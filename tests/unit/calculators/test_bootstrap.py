@@ -0,0 +1,221 @@
+"""Unit tests for the vectorized bootstrap of the best compromise."""
+
+import importlib
+import sys
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.calculators.bootstrap import BootstrapAnalyzer, compromise_replicates
+from src.exceptions import EmptyOpinionsError
+from src.models.expert_opinion import ExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+from tests.unit.strategies import expert_opinions
+
+
+def _panel(calculator, opinions):
+    """Sorted opinions and their (lower, peak, upper, centroid) matrix."""
+    ordered = calculator.sort_by_centroid(opinions)
+    matrix = np.array(
+        [
+            (op.opinion.lower_bound, op.opinion.peak, op.opinion.upper_bound, op.centroid)
+            for op in ordered
+        ]
+    )
+    return ordered, matrix
+
+
+def _compromise_row(result):
+    """Best compromise of a BeCoMeResult as (lower, peak, upper, centroid)."""
+    fuzzy = result.best_compromise
+    return [fuzzy.lower_bound, fuzzy.peak, fuzzy.upper_bound, fuzzy.centroid]
+
+
+class TestNumpyRequirement:
+    """Tests for importing the module without numpy."""
+
+    def test_import_without_numpy_names_the_extra(self, monkeypatch):
+        """
+        GIVEN numpy is not installed
+        WHEN the module is imported
+        THEN ImportError names the ``numeric`` extra that provides it
+        """
+        # GIVEN
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        monkeypatch.delitem(sys.modules, "src.calculators.bootstrap")
+
+        # WHEN / THEN
+        with pytest.raises(ImportError, match=r"become\[numeric\]"):
+            importlib.import_module("src.calculators.bootstrap")
+
+
+class TestCompromiseReplicates:
+    """The vectorized kernel follows BeCoMeCalculator's definitions."""
+
+    @given(opinions=expert_opinions(min_size=1, max_size=12))
+    @settings(max_examples=100)
+    def test_identity_resample_matches_calculator(self, calculator, opinions) -> None:
+        """The identity resample reproduces the calculator's best compromise."""
+        # GIVEN
+        _, panel = _panel(calculator, opinions)
+        identity = np.arange(len(opinions))[None, :]
+
+        # WHEN
+        row = compromise_replicates(panel, identity)[0]
+
+        # THEN
+        expected = calculator.calculate_compromise(opinions)
+        assert list(row) == pytest.approx(_compromise_row(expected), rel=1e-12, abs=1e-9)
+
+    def test_identity_resample_is_exact_on_ties(self, calculator):
+        """
+        GIVEN an even panel whose centroids tie around the median
+        WHEN the identity resample is evaluated
+        THEN the kernel picks the same two median opinions as the calculator
+        """
+        # GIVEN
+        opinions = [
+            ExpertOpinion("E1", FuzzyTriangleNumber(0.0, 1.0, 2.0)),
+            ExpertOpinion("E2", FuzzyTriangleNumber(1.0, 1.0, 1.0)),
+            ExpertOpinion("E3", FuzzyTriangleNumber(0.0, 0.0, 3.0)),
+            ExpertOpinion("E4", FuzzyTriangleNumber(2.0, 2.0, 2.0)),
+        ]
+        _, panel = _panel(calculator, opinions)
+
+        # WHEN
+        row = compromise_replicates(panel, np.arange(4)[None, :])[0]
+
+        # THEN
+        assert list(row) == _compromise_row(calculator.calculate_compromise(opinions))
+
+    @given(
+        opinions=expert_opinions(min_size=2, max_size=8),
+        seed=st.integers(min_value=0, max_value=2**32 - 1),
+    )
+    @settings(max_examples=50)
+    def test_random_resamples_match_calculator(self, calculator, opinions, seed) -> None:
+        """Each resample equals the calculator run on the resampled panel."""
+        # GIVEN
+        ordered, panel = _panel(calculator, opinions)
+        rng = np.random.default_rng(seed)
+        draws = np.sort(rng.integers(0, len(opinions), size=(20, len(opinions))), axis=1)
+
+        # WHEN
+        rows = compromise_replicates(panel, draws)
+
+        # THEN
+        for row, draw in zip(rows, draws, strict=True):
+            if len(set(draw)) == 1:
+                continue  # a single repeated expert has no second median opinion
+            resampled = [ordered[index] for index in draw]
+            expected = calculator.calculate_compromise(resampled)
+            assert list(row) == pytest.approx(_compromise_row(expected), rel=1e-12, abs=1e-9)
+
+    def test_single_repeated_expert_uses_its_opinion(self, calculator):
+        """
+        GIVEN an even resample that repeats one expert
+        WHEN it is evaluated
+        THEN the compromise is that expert's opinion
+        """
+        # GIVEN
+        opinions = [
+            ExpertOpinion("E1", FuzzyTriangleNumber(1.0, 2.0, 3.0)),
+            ExpertOpinion("E2", FuzzyTriangleNumber(4.0, 5.0, 6.0)),
+        ]
+        _, panel = _panel(calculator, opinions)
+
+        # WHEN
+        row = compromise_replicates(panel, np.array([[1, 1]]))[0]
+
+        # THEN
+        assert list(row) == [4.0, 5.0, 6.0, 5.0]
+
+
+class TestBootstrapAnalyzer:
+    """Tests for the bootstrap intervals."""
+
+    def test_intervals_bracket_a_spread_panel(self, three_experts_opinions):
+        """
+        GIVEN three experts with spread opinions
+        WHEN the panel is bootstrapped
+        THEN every interval is ordered and the estimate is the calculator's result
+        """
+        # WHEN
+        result = BootstrapAnalyzer(resamples=2_000, seed=1).analyze(three_experts_opinions)
+
+        # THEN
+        assert result.resamples == 2_000
+        assert result.estimate.num_experts == 3
+        for interval in (result.lower_bound, result.peak, result.upper_bound, result.centroid):
+            assert interval.low < interval.high
+        assert result.centroid.low <= result.estimate.best_compromise.centroid
+        assert result.estimate.best_compromise.centroid <= result.centroid.high
+
+    def test_identical_opinions_give_degenerate_intervals(self):
+        """
+        GIVEN experts who all hold the same opinion
+        WHEN the panel is bootstrapped
+        THEN every interval collapses onto that opinion
+        """
+        # GIVEN
+        opinions = [ExpertOpinion(f"E{i}", FuzzyTriangleNumber(2.0, 4.0, 6.0)) for i in range(5)]
+
+        # WHEN
+        result = BootstrapAnalyzer(resamples=500).analyze(opinions)
+
+        # THEN
+        assert (result.lower_bound.low, result.lower_bound.high) == (2.0, 2.0)
+        assert (result.centroid.low, result.centroid.high) == (4.0, 4.0)
+
+    def test_same_seed_reproduces_regardless_of_workers(self, three_experts_opinions):
+        """
+        GIVEN one seed and chunking, evaluated in process and on a process pool
+        WHEN the panel is bootstrapped
+        THEN both runs return identical intervals
+        """
+        # WHEN
+        in_process = BootstrapAnalyzer(resamples=3_000, seed=42, chunk_size=1_000, workers=1)
+        pooled = BootstrapAnalyzer(resamples=3_000, seed=42, chunk_size=1_000, workers=2)
+
+        # THEN
+        assert in_process.analyze(three_experts_opinions) == pooled.analyze(three_experts_opinions)
+
+    def test_different_seeds_differ(self, three_experts_opinions):
+        """
+        GIVEN two different seeds
+        WHEN the panel is bootstrapped
+        THEN the intervals differ
+        """
+        first = BootstrapAnalyzer(resamples=500, seed=1).analyze(three_experts_opinions)
+        second = BootstrapAnalyzer(resamples=500, seed=2).analyze(three_experts_opinions)
+
+        assert first.centroid != second.centroid
+
+    def test_rejects_empty_panel(self):
+        """
+        GIVEN no opinions
+        WHEN the panel is bootstrapped
+        THEN EmptyOpinionsError is raised
+        """
+        with pytest.raises(EmptyOpinionsError):
+            BootstrapAnalyzer().analyze([])
+
+    @pytest.mark.parametrize(
+        ("kwargs", "message"),
+        [
+            ({"resamples": 0}, "resamples"),
+            ({"resamples": 100_001}, "resamples"),
+            ({"confidence": 1.0}, "confidence"),
+            ({"confidence": 0.0}, "confidence"),
+        ],
+    )
+    def test_rejects_out_of_range_parameters(self, kwargs, message):
+        """
+        GIVEN a resample count or confidence level out of range
+        WHEN the analyzer is created
+        THEN ValueError names the parameter
+        """
+        with pytest.raises(ValueError, match=message):
+            BootstrapAnalyzer(**kwargs)
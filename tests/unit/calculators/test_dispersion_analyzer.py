@@ -0,0 +1,150 @@
+"""Unit tests for the O(n log n) DispersionAnalyzer."""
+
+from itertools import combinations
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.calculators.dispersion_analyzer import DispersionAnalyzer
+from src.exceptions import EmptyOpinionsError
+from src.models.expert_opinion import ExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+from tests.unit.strategies import expert_opinions
+
+
+def _opinions(values: list[tuple[float, float, float]]) -> list[ExpertOpinion]:
+    """Build opinions from (lower, peak, upper) triples with sequential IDs."""
+    return [
+        ExpertOpinion(f"E{i + 1}", FuzzyTriangleNumber(*triple)) for i, triple in enumerate(values)
+    ]
+
+
+_SMALL_TRIPLES = st.lists(st.integers(min_value=0, max_value=4), min_size=3, max_size=3).map(
+    lambda values: tuple(float(v) for v in sorted(values))
+)
+
+
+class TestDispersionAnalyzer:
+    """Test cases for the dispersion metrics."""
+
+    def test_pairwise_metrics_of_three_experts(self):
+        """
+        GIVEN three experts, two overlapping and one apart
+        WHEN dispersion is analysed
+        THEN pairwise distance and overlap are averaged over the three pairs
+        """
+        # GIVEN
+        opinions = _opinions([(0.0, 1.0, 2.0), (1.0, 2.0, 3.0), (10.0, 11.0, 12.0)])
+
+        # WHEN
+        report = DispersionAnalyzer().analyze(opinions)
+
+        # THEN
+        assert report.num_experts == 3
+        assert report.mean_pairwise_distance == pytest.approx((1.0 + 10.0 + 9.0) / 3)
+        assert report.overlapping_pairs == pytest.approx(1 / 3)
+        assert report.mean_support_overlap == pytest.approx(1.0 / 3)
+        assert report.median_centroid == 2.0
+
+    def test_flags_outlier(self):
+        """
+        GIVEN six clustered experts and one far above them
+        WHEN dispersion is analysed
+        THEN only the far expert is flagged
+        """
+        # GIVEN
+        opinions = _opinions([(float(i), float(i) + 1, float(i) + 2) for i in range(6)])
+        opinions.append(ExpertOpinion("Far", FuzzyTriangleNumber(90.0, 95.0, 100.0)))
+
+        # WHEN
+        report = DispersionAnalyzer().analyze(opinions)
+
+        # THEN
+        assert [outlier.expert_id for outlier in report.outliers] == ["Far"]
+        assert report.outliers[0].score > 3.5
+
+    def test_falls_back_to_mean_deviation_when_mad_is_zero(self):
+        """
+        GIVEN most experts giving the same opinion and one differing
+        WHEN dispersion is analysed
+        THEN the MAD is 0 and the differing expert is still flagged
+        """
+        # GIVEN
+        opinions = _opinions([(25.0, 50.0, 75.0)] * 9 + [(75.0, 100.0, 100.0)])
+
+        # WHEN
+        report = DispersionAnalyzer().analyze(opinions)
+
+        # THEN
+        assert report.mad == 0.0
+        assert [outlier.expert_id for outlier in report.outliers] == ["E10"]
+
+    def test_identical_opinions_have_no_spread(self):
+        """Identical opinions have zero distance, full overlap and no outliers."""
+        # GIVEN
+        opinions = _opinions([(10.0, 20.0, 30.0)] * 4)
+
+        # WHEN
+        report = DispersionAnalyzer().analyze(opinions)
+
+        # THEN
+        assert report.mean_pairwise_distance == 0.0
+        assert report.overlapping_pairs == 1.0
+        assert report.mean_support_overlap == 20.0
+        assert report.outliers == ()
+
+    def test_single_expert(self, single_expert_opinion):
+        """A single expert has no pairs and no spread."""
+        # WHEN
+        report = DispersionAnalyzer().analyze(single_expert_opinion)
+
+        # THEN
+        assert report.mean_pairwise_distance == 0.0
+        assert report.overlapping_pairs == 1.0
+        assert report.mean_support_overlap == 0.0
+        assert report.outliers == ()
+
+    def test_empty_opinions_raise(self):
+        """Analysing no opinions raises EmptyOpinionsError."""
+        with pytest.raises(EmptyOpinionsError):
+            DispersionAnalyzer().analyze([])
+
+    def test_rejects_non_positive_threshold(self):
+        """A threshold of zero or below raises ValueError."""
+        with pytest.raises(ValueError, match="threshold"):
+            DispersionAnalyzer(threshold=0.0)
+
+
+class TestDispersionMatchesPairwise:
+    """The O(n log n) metrics equal the pair-by-pair definitions."""
+
+    @staticmethod
+    def _assert_matches_pairwise(opinions: list[ExpertOpinion]) -> None:
+        """Compare the report against an O(n²) loop over every pair."""
+        report = DispersionAnalyzer().analyze(opinions)
+        pairs = list(combinations([op.opinion for op in opinions], 2))
+        if not pairs:
+            return
+        distance = sum(abs(a.centroid - b.centroid) for a, b in pairs) / len(pairs)
+        intersections = [
+            min(a.upper_bound, b.upper_bound) - max(a.lower_bound, b.lower_bound) for a, b in pairs
+        ]
+        overlapping = sum(length >= 0 for length in intersections) / len(pairs)
+        overlap = sum(max(length, 0.0) for length in intersections) / len(pairs)
+
+        assert report.mean_pairwise_distance == pytest.approx(distance, rel=1e-9, abs=1e-6)
+        assert report.overlapping_pairs == overlapping
+        assert report.mean_support_overlap == pytest.approx(overlap, rel=1e-9, abs=1e-6)
+
+    @given(opinions=expert_opinions(min_size=1, max_size=12))
+    @settings(max_examples=100)
+    def test_matches_pairwise(self, opinions) -> None:
+        """Random panels agree with the pairwise loop."""
+        self._assert_matches_pairwise(opinions)
+
+    @given(triples=st.lists(_SMALL_TRIPLES, min_size=1, max_size=12))
+    @settings(max_examples=100)
+    def test_matches_pairwise_with_ties(self, triples) -> None:
+        """Touching and shared bounds count as overlapping, as in the pairwise loop."""
+        self._assert_matches_pairwise(_opinions(triples))
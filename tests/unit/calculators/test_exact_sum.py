@@ -0,0 +1,66 @@
+"""Unit tests for exact float sums."""
+
+import statistics
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.calculators.exact_sum import ExactSum
+
+_VALUES = st.lists(
+    st.floats(min_value=-1e12, max_value=1e12, allow_nan=False, allow_infinity=False),
+    min_size=2,
+    max_size=30,
+)
+
+
+class TestExactSum:
+    """Tests for ExactSum."""
+
+    def test_mean_is_correctly_rounded_where_naive_sum_is_not(self):
+        """
+        GIVEN values whose float sum loses the small one to cancellation
+        WHEN their mean is taken
+        THEN it equals statistics.mean, not sum / len
+        """
+        # GIVEN
+        values = [1e16, 1.0, -1e16]
+
+        # WHEN
+        mean = ExactSum(values).mean()
+
+        # THEN
+        assert sum(values) / len(values) == 0.0
+        assert mean == statistics.mean(values) == 1 / 3
+
+    def test_add_ratio_counts_a_group_sum(self):
+        """A pre-summed group of values counts as that many values."""
+        # GIVEN
+        exact = ExactSum([0.5])
+
+        # WHEN
+        exact.add_ratio(7, 4, count=3)
+
+        # THEN
+        assert exact.count == 4
+        assert exact.mean() == (0.5 + 7 / 4) / 4
+
+    @given(values=_VALUES, replacement=st.floats(min_value=-1e12, max_value=1e12))
+    @settings(max_examples=200)
+    def test_mean_replacing_matches_statistics_mean(self, values, replacement):
+        """
+        GIVEN any panel of finite values
+        WHEN one value is taken out, replaced, or a new one put in
+        THEN each mean equals statistics.mean of the changed values
+        """
+        # GIVEN
+        exact = ExactSum(values)
+
+        # WHEN / THEN
+        assert exact.mean() == statistics.mean(values)
+        assert exact.mean_replacing(values[0], None) == statistics.mean(values[1:])
+        assert exact.mean_replacing(values[0], replacement) == statistics.mean(
+            [replacement, *values[1:]]
+        )
+        assert exact.mean_replacing(None, replacement) == statistics.mean([*values, replacement])
+        assert exact.mean() == statistics.mean(values)
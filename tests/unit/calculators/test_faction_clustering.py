@@ -0,0 +1,294 @@
+"""Unit tests for the optimal one-dimensional faction clustering."""
+
+import importlib
+import random
+import sys
+from itertools import combinations
+
+import numpy as np
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.calculators import faction_clustering
+from src.calculators.faction_clustering import FactionAnalyzer, cluster_centroids
+from src.exceptions import EmptyOpinionsError
+from src.models.expert_opinion import ExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+from tests.reference.pendlers_case import PENDLERS_CASE
+from tests.unit.strategies import expert_opinions
+
+
+def _opinions(centroids: list[float]) -> list[ExpertOpinion]:
+    """Build crisp opinions at the given centroids with sequential IDs."""
+    return [
+        ExpertOpinion(f"E{i + 1}", FuzzyTriangleNumber(value, value, value))
+        for i, value in enumerate(centroids)
+    ]
+
+
+def _within(values: list[float], labels: list[int]) -> float:
+    """Sum of squared deviations from the cluster means."""
+    total = 0.0
+    for label in set(labels):
+        members = [v for v, lab in zip(values, labels, strict=True) if lab == label]
+        mean = sum(members) / len(members)
+        total += sum((v - mean) ** 2 for v in members)
+    return total
+
+
+def _brute_force(values: list[float], clusters: int) -> float:
+    """Least within-cluster sum of squares over every split of the sorted values."""
+    ordered = sorted(values)
+    best = float("inf")
+    for cuts in combinations(range(1, len(ordered)), clusters - 1):
+        bounds = (0, *cuts, len(ordered))
+        labels = [k for k in range(clusters) for _ in range(bounds[k + 1] - bounds[k])]
+        best = min(best, _within(ordered, labels))
+    return best
+
+
+def _quadratic_dp(values: list[float], clusters: int) -> float:
+    """Least within-cluster sum of squares by the plain O(k n²) recurrence."""
+    ordered = sorted(values)
+    size = len(ordered)
+    linear = [0.0]
+    square = [0.0]
+    for value in ordered:
+        linear.append(linear[-1] + value)
+        square.append(square[-1] + value * value)
+
+    def cost(start: int, stop: int) -> float:
+        run = linear[stop] - linear[start]
+        return square[stop] - square[start] - run * run / (stop - start)
+
+    previous = [cost(0, i + 1) for i in range(size)]
+    for layer in range(1, clusters):
+        previous = [
+            min(previous[j - 1] + cost(j, i + 1) for j in range(layer, i + 1))
+            if i >= layer
+            else float("inf")
+            for i in range(size)
+        ]
+    return previous[-1]
+
+
+class TestNumpyRequirement:
+    """Tests for importing the module without numpy."""
+
+    def test_import_without_numpy_names_the_extra(self, monkeypatch):
+        """
+        GIVEN numpy is not installed
+        WHEN the module is imported
+        THEN ImportError names the ``numeric`` extra that provides it
+        """
+        # GIVEN
+        monkeypatch.setitem(sys.modules, "numpy", None)
+        monkeypatch.delitem(sys.modules, "src.calculators.faction_clustering")
+
+        # WHEN / THEN
+        with pytest.raises(ImportError, match=r"become\[numeric\]"):
+            importlib.import_module("src.calculators.faction_clustering")
+
+
+class TestClusterCentroids:
+    """Test cases for the clustering of plain values."""
+
+    @given(
+        values=st.lists(st.integers(min_value=0, max_value=9), min_size=1, max_size=10),
+        clusters=st.integers(min_value=1, max_value=4),
+    )
+    @settings(max_examples=100)
+    def test_matches_brute_force(self, values, clusters) -> None:
+        """Small panels reach the least sum of squares over every split."""
+        # GIVEN
+        values = [float(v) for v in values]
+        clusters = min(clusters, len(set(values)))
+
+        # WHEN
+        clustering = cluster_centroids(values, clusters)
+
+        # THEN
+        assert clustering.num_clusters == clusters
+        assert clustering.within_sum_of_squares == pytest.approx(
+            _brute_force(values, clusters), abs=1e-9
+        )
+
+    @pytest.mark.parametrize("clusters", [2, 3, 5])
+    def test_matches_quadratic_recurrence(self, clusters):
+        """
+        GIVEN 300 random values, deep enough for many divide-and-conquer levels
+        WHEN they are clustered
+        THEN the cost equals the plain O(k n²) dynamic programme
+        """
+        # GIVEN
+        rng = random.Random(clusters)
+        values = [rng.gauss(rng.choice([10.0, 40.0, 90.0]), 8.0) for _ in range(300)]
+
+        # WHEN
+        clustering = cluster_centroids(values, clusters)
+
+        # THEN
+        assert clustering.within_sum_of_squares == pytest.approx(
+            _quadratic_dp(values, clusters), rel=1e-9
+        )
+
+    def test_labels_follow_input_order(self):
+        """Labels are per input value, numbered from the lowest cluster."""
+        # WHEN
+        clustering = cluster_centroids([90.0, 10.0, 12.0, 88.0], 2)
+
+        # THEN
+        assert clustering.labels.tolist() == [1, 0, 0, 1]
+
+    def test_uses_at_most_the_distinct_values(self):
+        """Asking for more clusters than distinct values returns one per value."""
+        # WHEN
+        clustering = cluster_centroids([5.0, 5.0, 7.0], 3)
+
+        # THEN
+        assert clustering.num_clusters == 2
+        assert clustering.within_sum_of_squares == 0.0
+
+    @pytest.mark.parametrize(
+        ("centers", "expected"),
+        [([50.0], 1), ([20.0, 70.0], 2), ([10.0, 50.0, 90.0], 3)],
+    )
+    def test_selects_number_of_camps(self, centers, expected):
+        """
+        GIVEN 300 values around one, two or three well separated centres
+        WHEN the number of clusters is chosen automatically
+        THEN it equals the number of centres
+        """
+        # GIVEN
+        rng = np.random.default_rng(7)
+        values = np.concatenate(
+            [rng.normal(center, 4.0, 300 // len(centers)) for center in centers]
+        )
+
+        # WHEN
+        clustering = cluster_centroids(values)
+
+        # THEN
+        assert clustering.num_clusters == expected
+
+    @pytest.mark.parametrize(
+        ("centers", "expected"),
+        [([50.0], 1), ([20.0, 70.0], 2), ([10.0, 50.0, 90.0], 3)],
+    )
+    def test_sketch_selects_number_of_camps(self, monkeypatch, centers, expected):
+        """
+        GIVEN more distinct values than the sketch holds
+        WHEN the number of clusters is chosen automatically
+        THEN the sketch picks the number of centres and that k is solved exactly
+        """
+        # GIVEN
+        monkeypatch.setattr(faction_clustering, "_SKETCH_SIZE", 64)
+        rng = np.random.default_rng(11)
+        values = np.concatenate(
+            [rng.normal(center, 4.0, 900 // len(centers)) for center in centers]
+        )
+
+        # WHEN
+        clustering = cluster_centroids(values)
+
+        # THEN
+        assert clustering.num_clusters == expected
+        assert clustering.within_sum_of_squares == pytest.approx(
+            cluster_centroids(values, expected).within_sum_of_squares, rel=1e-12
+        )
+
+    def test_coarse_scale_is_not_split_per_answer(self):
+        """Five Likert answers with a spread-out panel stay one cluster."""
+        # WHEN
+        clustering = cluster_centroids([0.0, 25.0, 25.0, 50.0, 50.0, 50.0, 75.0, 75.0, 100.0])
+
+        # THEN
+        assert clustering.num_clusters == 1
+
+    @pytest.mark.parametrize("values", [[], [[1.0, 2.0]], [1.0, float("nan")]])
+    def test_rejects_invalid_values(self, values):
+        """Empty, nested or non-finite values raise ValueError."""
+        with pytest.raises(ValueError, match="centroids"):
+            cluster_centroids(values)
+
+    @pytest.mark.parametrize(("clusters", "max_clusters"), [(0, 5), (21, 5), (None, 0)])
+    def test_rejects_cluster_counts_out_of_range(self, clusters, max_clusters):
+        """Cluster counts outside 1..20 raise ValueError."""
+        with pytest.raises(ValueError, match="clusters"):
+            cluster_centroids([1.0, 2.0], clusters, max_clusters)
+
+
+class TestFactionAnalyzer:
+    """Test cases for factions of expert opinions."""
+
+    def test_pendlers_case_splits_into_two_camps(self, calculator):
+        """
+        GIVEN the pendlers case, where the compromise hides opponents and supporters
+        WHEN it is split into two factions
+        THEN those who disagree and those who are neutral or agree form one each
+        """
+        # GIVEN
+        opinions = PENDLERS_CASE["opinions"]
+
+        # WHEN
+        report = FactionAnalyzer().analyze(opinions, clusters=2)
+
+        # THEN
+        low, high = report.factions
+        assert (low.lowest_centroid, low.highest_centroid) == (0.0, 25.0)
+        assert (high.lowest_centroid, high.highest_centroid) == (50.0, 100.0)
+        assert len(low.expert_ids) + len(high.expert_ids) == 22
+        camp = [op for op in opinions if op.centroid <= 25.0]
+        assert low.expert_ids == tuple(op.expert_id for op in camp)
+        assert low.result == calculator.calculate_compromise(camp)
+        assert report.selected is False
+        assert 0.0 < report.explained_variance < 1.0
+
+    def test_selects_factions_automatically(self):
+        """Two separated camps are found without naming the number."""
+        # GIVEN
+        opinions = _opinions([10.0, 12.0, 14.0, 11.0, 80.0, 82.0, 84.0, 83.0])
+
+        # WHEN
+        report = FactionAnalyzer().analyze(opinions)
+
+        # THEN
+        assert report.selected is True
+        assert report.num_factions == 2
+        assert report.factions[1].expert_ids == ("E5", "E6", "E7", "E8")
+        assert report.factions[1].result.num_experts == 4
+
+    def test_identical_opinions_form_one_faction(self):
+        """Identical opinions are one faction explaining all (zero) variance."""
+        # WHEN
+        report = FactionAnalyzer().analyze(_opinions([30.0] * 4))
+
+        # THEN
+        assert report.num_factions == 1
+        assert report.within_sum_of_squares == 0.0
+        assert report.explained_variance == 1.0
+
+    @given(opinions=expert_opinions(min_size=1, max_size=15))
+    @settings(max_examples=50)
+    def test_factions_cover_every_expert_once(self, calculator, opinions) -> None:
+        """Every expert is in exactly one faction, with that faction's result."""
+        # WHEN
+        report = FactionAnalyzer().analyze(opinions, clusters=3)
+
+        # THEN
+        members = [expert for faction in report.factions for expert in faction.expert_ids]
+        assert sorted(members) == sorted(op.expert_id for op in opinions)
+        for faction in report.factions:
+            group = [op for op in opinions if op.expert_id in faction.expert_ids]
+            assert faction.result == calculator.calculate_compromise(group)
+
+    def test_empty_opinions_raise(self):
+        """Analysing no opinions raises EmptyOpinionsError."""
+        with pytest.raises(EmptyOpinionsError):
+            FactionAnalyzer().analyze([])
+
+    def test_rejects_max_clusters_out_of_range(self):
+        """A max_clusters outside 1..20 raises ValueError."""
+        with pytest.raises(ValueError, match="max_clusters"):
+            FactionAnalyzer(max_clusters=0)
@@ -0,0 +1,133 @@
+"""Unit tests for the leave-one-out InfluenceAnalyzer."""
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.calculators.influence_analyzer import InfluenceAnalyzer
+from src.exceptions import InvalidOpinionError
+from src.models.expert_opinion import ExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+from tests.unit.strategies import expert_opinions
+
+
+def _opinions(values: list[tuple[float, float, float]]) -> list[ExpertOpinion]:
+    """Build opinions from (lower, peak, upper) triples with sequential IDs."""
+    return [
+        ExpertOpinion(f"E{i + 1}", FuzzyTriangleNumber(*triple)) for i, triple in enumerate(values)
+    ]
+
+
+_SMALL_TRIPLES = st.lists(st.integers(min_value=0, max_value=4), min_size=3, max_size=3).map(
+    lambda values: tuple(float(v) for v in sorted(values))
+)
+
+
+class TestInfluenceAnalyzer:
+    """Test cases for the influence ranking."""
+
+    def test_ranks_outlier_first(self):
+        """
+        GIVEN four clustered experts and one far above them
+        WHEN influence is analysed
+        THEN the outlier ranks first and pulls the compromise up
+        """
+        # GIVEN
+        opinions = _opinions(
+            [
+                (10.0, 11.0, 12.0),
+                (11.0, 12.0, 13.0),
+                (12.0, 13.0, 14.0),
+                (13.0, 14.0, 15.0),
+                (80.0, 90.0, 100.0),
+            ]
+        )
+
+        # WHEN
+        report = InfluenceAnalyzer().analyze(opinions)
+
+        # THEN
+        assert [entry.rank for entry in report.experts] == [1, 2, 3, 4, 5]
+        top = report.experts[0]
+        assert top.expert_id == "E5"
+        assert top.compromise_shift == pytest.approx(8.0)
+        assert top.influence == abs(top.compromise_shift)
+        assert top.result_without.num_experts == 4
+        assert report.baseline.num_experts == 5
+
+    def test_shifts_are_full_minus_without(self, three_experts_opinions, calculator):
+        """
+        GIVEN three experts
+        WHEN influence is analysed
+        THEN each shift is the baseline value minus the leave-one-out value
+        """
+        # WHEN
+        report = InfluenceAnalyzer().analyze(three_experts_opinions)
+
+        # THEN
+        baseline = calculator.calculate_compromise(three_experts_opinions)
+        for entry in report.experts:
+            without = entry.result_without
+            assert entry.lower_shift == pytest.approx(
+                baseline.best_compromise.lower_bound - without.best_compromise.lower_bound
+            )
+            assert entry.compromise_shift == pytest.approx(
+                baseline.best_compromise.centroid - without.best_compromise.centroid
+            )
+            assert entry.max_error_shift == pytest.approx(baseline.max_error - without.max_error)
+
+    def test_needs_two_opinions(self, single_expert_opinion):
+        """
+        GIVEN a single expert
+        WHEN influence is analysed
+        THEN InvalidOpinionError is raised
+        """
+        with pytest.raises(InvalidOpinionError, match="at least two"):
+            InfluenceAnalyzer().analyze(single_expert_opinion)
+
+    def test_needs_unique_expert_ids(self):
+        """
+        GIVEN two opinions under the same expert ID
+        WHEN influence is analysed
+        THEN InvalidOpinionError is raised
+        """
+        opinions = [
+            ExpertOpinion("E1", FuzzyTriangleNumber(1.0, 2.0, 3.0)),
+            ExpertOpinion("E1", FuzzyTriangleNumber(4.0, 5.0, 6.0)),
+        ]
+
+        with pytest.raises(InvalidOpinionError, match="unique"):
+            InfluenceAnalyzer().analyze(opinions)
+
+
+class TestInfluenceMatchesRecalculation:
+    """Leave-one-out results equal a full recalculation without the expert."""
+
+    @given(opinions=expert_opinions(min_size=2, max_size=12))
+    @settings(max_examples=100)
+    def test_matches_calculator(self, calculator, opinions) -> None:
+        """Every leave-one-out result is identical to BeCoMeCalculator's."""
+        # WHEN
+        report = InfluenceAnalyzer().analyze(opinions)
+
+        # THEN
+        by_expert = {entry.expert_id: entry.result_without for entry in report.experts}
+        for index, opinion in enumerate(opinions):
+            remaining = opinions[:index] + opinions[index + 1 :]
+            assert by_expert[opinion.expert_id] == calculator.calculate_compromise(remaining)
+
+    @given(triples=st.lists(_SMALL_TRIPLES, min_size=2, max_size=12))
+    @settings(max_examples=100)
+    def test_matches_calculator_with_tied_centroids(self, calculator, triples) -> None:
+        """Ties in centroid resolve to the same median opinions as the calculator."""
+        # GIVEN
+        opinions = _opinions(triples)
+
+        # WHEN
+        report = InfluenceAnalyzer().analyze(opinions)
+
+        # THEN
+        by_expert = {entry.expert_id: entry.result_without for entry in report.experts}
+        for index, opinion in enumerate(opinions):
+            remaining = opinions[:index] + opinions[index + 1 :]
+            assert by_expert[opinion.expert_id] == calculator.calculate_compromise(remaining)
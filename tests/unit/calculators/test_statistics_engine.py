@@ -0,0 +1,157 @@
+"""Unit tests for the single-pass StatisticsEngine."""
+
+import statistics
+
+import pytest
+from hypothesis import given, settings
+
+from src.calculators.statistics_engine import StatisticsEngine
+from src.exceptions import EmptyOpinionsError
+from src.models.expert_opinion import ExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+from src.models.statistics_summary import Statistic
+from tests.unit.strategies import expert_opinions
+
+
+def _opinions(values: list[tuple[float, float, float]]) -> list[ExpertOpinion]:
+    """Build opinions from (lower, peak, upper) triples with sequential IDs."""
+    return [
+        ExpertOpinion(f"E{i + 1}", FuzzyTriangleNumber(*triple)) for i, triple in enumerate(values)
+    ]
+
+
+class TestStatisticsEngine:
+    """Test cases for the configured statistics."""
+
+    def test_computes_every_statistic_by_default(self):
+        """
+        GIVEN five experts
+        WHEN they are summarized with the default configuration
+        THEN every statistic is present
+        """
+        # GIVEN
+        opinions = _opinions(
+            [(1.0, 2.0, 3.0), (2.0, 3.0, 4.0), (3.0, 4.0, 5.0), (4.0, 5.0, 6.0), (50.0, 60.0, 70.0)]
+        )
+
+        # WHEN
+        summary = StatisticsEngine().summarize(opinions)
+
+        # THEN
+        assert summary.num_experts == 5
+        assert summary.become is not None
+        assert (summary.quartiles.q1, summary.quartiles.q2, summary.quartiles.q3) == (
+            3.0,
+            4.0,
+            5.0,
+        )
+        assert summary.minimum == FuzzyTriangleNumber(1.0, 2.0, 3.0)
+        assert summary.maximum == FuzzyTriangleNumber(50.0, 60.0, 70.0)
+        assert summary.std_dev.peak == pytest.approx(statistics.pstdev([2, 3, 4, 5, 60]))
+
+    def test_computes_only_requested_statistics(self, three_experts_opinions):
+        """
+        GIVEN an engine configured for extremes only
+        WHEN opinions are summarized
+        THEN the other statistics are None
+        """
+        # WHEN
+        summary = StatisticsEngine([Statistic.MIN_MAX]).summarize(three_experts_opinions)
+
+        # THEN
+        assert summary.minimum == FuzzyTriangleNumber(3.0, 6.0, 9.0)
+        assert summary.maximum == FuzzyTriangleNumber(9.0, 12.0, 15.0)
+        assert summary.become is None
+        assert summary.quartiles is None
+        assert summary.trimmed_mean is None
+        assert summary.std_dev is None
+
+    def test_trimmed_mean_drops_both_tails(self):
+        """
+        GIVEN ten experts, one far above the rest
+        WHEN the 10% trimmed mean is computed
+        THEN the lowest and highest centroids are left out
+        """
+        # GIVEN
+        opinions = _opinions([(float(i), float(i), float(i)) for i in range(9)] + [(900.0,) * 3])
+
+        # WHEN
+        summary = StatisticsEngine([Statistic.TRIMMED_MEAN], trim_proportion=0.1).summarize(
+            opinions
+        )
+
+        # THEN
+        assert summary.trimmed_mean == statistics.fmean(range(1, 9))
+
+    def test_single_expert_quartiles(self, single_expert_opinion):
+        """A single expert's centroid is all three quartiles."""
+        # WHEN
+        summary = StatisticsEngine([Statistic.QUARTILES]).summarize(single_expert_opinion)
+
+        # THEN
+        assert (summary.quartiles.q1, summary.quartiles.q2, summary.quartiles.q3) == (
+            10.0,
+            10.0,
+            10.0,
+        )
+
+    def test_empty_opinions_raise(self):
+        """
+        GIVEN no opinions
+        WHEN they are summarized
+        THEN EmptyOpinionsError is raised
+        """
+        with pytest.raises(EmptyOpinionsError):
+            StatisticsEngine().summarize([])
+
+    @pytest.mark.parametrize("proportion", [-0.1, 0.5])
+    def test_rejects_trim_proportion_out_of_range(self, proportion):
+        """A trim proportion outside [0, 0.5) raises ValueError."""
+        with pytest.raises(ValueError, match="trim_proportion"):
+            StatisticsEngine(trim_proportion=proportion)
+
+    def test_sorts_at_most_once(self, three_experts_opinions, monkeypatch):
+        """
+        GIVEN an engine computing every statistic but the dispersion metrics
+        WHEN opinions are summarized
+        THEN sorted() is called exactly once
+        """
+        # GIVEN
+        calls = []
+        real_sorted = sorted
+
+        def counting_sorted(*args, **kwargs):
+            calls.append(args)
+            return real_sorted(*args, **kwargs)
+
+        monkeypatch.setattr("builtins.sorted", counting_sorted)
+
+        # WHEN
+        StatisticsEngine(set(Statistic) - {Statistic.DISPERSION}).summarize(three_experts_opinions)
+
+        # THEN
+        assert len(calls) == 1
+
+
+class TestStatisticsMatchSeparateCalls:
+    """Each statistic equals the one computed on its own."""
+
+    @given(opinions=expert_opinions(min_size=1, max_size=15))
+    @settings(max_examples=100)
+    def test_matches_separate_calls(self, calculator, opinions) -> None:
+        """BeCoMe, quartiles and deviations are identical to the separate calls."""
+        # WHEN
+        summary = StatisticsEngine().summarize(opinions)
+
+        # THEN
+        centroids = sorted(op.centroid for op in opinions)
+        assert summary.become == calculator.calculate_compromise(opinions)
+        if len(opinions) > 1:
+            quartiles = statistics.quantiles(centroids, n=4, method="inclusive")
+            assert [summary.quartiles.q1, summary.quartiles.q2, summary.quartiles.q3] == quartiles
+        assert summary.std_dev.centroid == statistics.pstdev(centroids)
+        assert summary.std_dev.lower_bound == statistics.pstdev(
+            op.opinion.lower_bound for op in opinions
+        )
+        assert summary.minimum.upper_bound == min(op.opinion.upper_bound for op in opinions)
+        assert summary.maximum.peak == max(op.opinion.peak for op in opinions)
@@ -0,0 +1,140 @@
+"""Unit tests for the O(log n) WhatIfIndex."""
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from src.calculators.what_if import WhatIfIndex
+from src.exceptions import InvalidOpinionError
+from src.models.expert_opinion import ExpertOpinion
+from src.models.fuzzy_number import FuzzyTriangleNumber
+from tests.unit.strategies import expert_opinions, fuzzy_numbers
+
+
+def _replaced(
+    opinions: list[ExpertOpinion], expert_id: str, opinion: FuzzyTriangleNumber
+) -> list[ExpertOpinion]:
+    """The panel with the expert's opinion replaced in place, or appended if new."""
+    changed = [
+        ExpertOpinion(expert_id, opinion) if op.expert_id == expert_id else op for op in opinions
+    ]
+    if all(op.expert_id != expert_id for op in opinions):
+        changed.append(ExpertOpinion(expert_id, opinion))
+    return changed
+
+
+_SMALL_FUZZY = st.lists(st.integers(min_value=0, max_value=4), min_size=3, max_size=3).map(
+    lambda values: FuzzyTriangleNumber(*(float(v) for v in sorted(values)))
+)
+
+
+class TestWhatIfIndex:
+    """Test cases for what-if previews."""
+
+    def test_replaces_opinion(self, calculator, three_experts_opinions):
+        """
+        GIVEN an index of three experts
+        WHEN one expert's opinion is previewed at a new value
+        THEN the result is that of the panel with the opinion replaced
+        """
+        # GIVEN
+        index = WhatIfIndex(three_experts_opinions)
+        expert_id = three_experts_opinions[0].expert_id
+        opinion = FuzzyTriangleNumber(40.0, 50.0, 60.0)
+
+        # WHEN
+        result = index.replace(expert_id, opinion)
+
+        # THEN
+        assert result == calculator.calculate_compromise(
+            _replaced(three_experts_opinions, expert_id, opinion)
+        )
+        assert result.num_experts == 3
+        assert index.current == calculator.calculate_compromise(three_experts_opinions)
+
+    def test_unknown_expert_is_added(self, calculator, three_experts_opinions):
+        """An expert without an opinion previews joining the panel."""
+        # GIVEN
+        index = WhatIfIndex(three_experts_opinions)
+        opinion = FuzzyTriangleNumber(0.0, 1.0, 2.0)
+
+        # WHEN
+        result = index.replace("Newcomer", opinion)
+
+        # THEN
+        assert result.num_experts == 4
+        assert result == calculator.calculate_compromise(
+            [*three_experts_opinions, ExpertOpinion("Newcomer", opinion)]
+        )
+
+    def test_empty_panel(self):
+        """An empty panel has no current result; a preview is the opinion alone."""
+        # GIVEN
+        index = WhatIfIndex([])
+        opinion = FuzzyTriangleNumber(10.0, 20.0, 30.0)
+
+        # WHEN
+        result = index.replace("E1", opinion)
+
+        # THEN
+        assert index.current is None
+        assert result.best_compromise == opinion
+        assert result.num_experts == 1
+
+    def test_index_is_unchanged_by_previews(self, three_experts_opinions):
+        """Previews do not accumulate: each starts from the indexed panel."""
+        # GIVEN
+        index = WhatIfIndex(three_experts_opinions)
+        expert_id = three_experts_opinions[1].expert_id
+        first = index.replace(expert_id, FuzzyTriangleNumber(0.0, 0.0, 0.0))
+
+        # WHEN
+        index.replace(expert_id, FuzzyTriangleNumber(90.0, 95.0, 100.0))
+
+        # THEN
+        assert index.replace(expert_id, FuzzyTriangleNumber(0.0, 0.0, 0.0)) == first
+
+    def test_rejects_duplicate_expert_ids(self):
+        """Two opinions of one expert raise InvalidOpinionError."""
+        opinion = FuzzyTriangleNumber(1.0, 2.0, 3.0)
+        with pytest.raises(InvalidOpinionError, match="unique"):
+            WhatIfIndex([ExpertOpinion("E1", opinion), ExpertOpinion("E1", opinion)])
+
+
+class TestWhatIfMatchesRecalculation:
+    """Every preview equals the calculator on the changed panel."""
+
+    @given(
+        opinions=expert_opinions(min_size=1, max_size=12),
+        opinion=fuzzy_numbers(),
+        data=st.data(),
+    )
+    @settings(max_examples=100)
+    def test_matches_recalculation(self, calculator, opinions, opinion, data) -> None:
+        """Random panels, replacing an existing expert or adding a new one."""
+        # GIVEN
+        expert_id = data.draw(st.sampled_from([*(op.expert_id for op in opinions), "New"]))
+
+        # WHEN
+        result = WhatIfIndex(opinions).replace(expert_id, opinion)
+
+        # THEN
+        assert result == calculator.calculate_compromise(_replaced(opinions, expert_id, opinion))
+
+    @given(
+        values=st.lists(_SMALL_FUZZY, min_size=1, max_size=12),
+        opinion=_SMALL_FUZZY,
+        data=st.data(),
+    )
+    @settings(max_examples=100)
+    def test_matches_recalculation_with_ties(self, calculator, values, opinion, data) -> None:
+        """Equal centroids are ordered by the expert's place, as in the stable sort."""
+        # GIVEN
+        opinions = [ExpertOpinion(f"E{i + 1}", value) for i, value in enumerate(values)]
+        expert_id = data.draw(st.sampled_from([*(op.expert_id for op in opinions), "New"]))
+
+        # WHEN
+        result = WhatIfIndex(opinions).replace(expert_id, opinion)
+
+        # THEN
+        assert result == calculator.calculate_compromise(_replaced(opinions, expert_id, opinion))
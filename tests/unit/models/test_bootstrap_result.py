@@ -0,0 +1,29 @@
+"""Unit tests for bootstrap result models."""
+
+import pytest
+from pydantic import ValidationError
+
+from src.models.bootstrap_result import ConfidenceInterval
+
+
+class TestConfidenceInterval:
+    """Test cases for ConfidenceInterval validation."""
+
+    def test_accepts_degenerate_interval(self):
+        """
+        GIVEN equal ends
+        WHEN the interval is created
+        THEN it is accepted
+        """
+        interval = ConfidenceInterval(low=1.5, high=1.5)
+
+        assert interval.low == interval.high == 1.5
+
+    def test_rejects_reversed_ends(self):
+        """
+        GIVEN a low end above the high end
+        WHEN the interval is created
+        THEN validation fails
+        """
+        with pytest.raises(ValidationError, match="reversed"):
+            ConfidenceInterval(low=2.0, high=1.0)
@@ -2,7 +2,7 @@
 
 import pytest
 
-from examples.utils.analysis import calculate_agreement_level
+from examples.utils.analysis import calculate_agreement_level, calculate_consensus_level
 from examples.utils.locales import CS_ANALYSIS
 
 
@@ -99,3 +99,36 @@ class TestCalculateAgreementLevelWithCzechLabels:
         assert (
             calculate_agreement_level(15.0, thresholds=(5.0, 10.0), labels=CS_ANALYSIS) == "nízká"
         )
+
+
+class TestCalculateConsensusLevel:
+    """Test cases for calculate_consensus_level function."""
+
+    @pytest.mark.parametrize(
+        "overlapping_pairs,expected_level",
+        [
+            (1.0, "good"),
+            (0.8, "good"),
+            (0.79, "moderate"),
+            (0.5, "moderate"),
+            (0.49, "low"),
+            (0.0, "low"),
+        ],
+    )
+    def test_consensus_levels_with_default_thresholds(
+        self, overlapping_pairs: float, expected_level: str
+    ) -> None:
+        """Higher shares of overlapping pairs mean better agreement."""
+        # WHEN
+        result = calculate_consensus_level(overlapping_pairs)
+
+        # THEN
+        assert result == expected_level
+
+    def test_consensus_level_with_czech_labels(self) -> None:
+        """Test consensus level uses the given locale labels."""
+        # WHEN
+        result = calculate_consensus_level(0.9, labels=CS_ANALYSIS)
+
+        # THEN
+        assert result == CS_ANALYSIS.good